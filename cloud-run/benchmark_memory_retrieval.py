@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Sophia Memory Retrieval Benchmark
+Compares legacy per-row retrieval against stored tsvector + batched access updates
+
+Runs against SOPHIA_DATABASE_URL when set, otherwise starts an embedded
+PostgreSQL (pip install pgserver) so no Docker or AlloyDB instance is needed.
+
+Usage:
+    python benchmark_memory_retrieval.py --rows 1000000 --queries 50
+"""
+
+import os
+import re
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "sql" / "sophia_alloydb_schema.sql"
+
+# Skewed synthetic vocabulary: low term numbers are common, high ones rare
+VOCABULARY_SIZE = 5000
+WORDS_PER_MEMORY = 24
+
+LEGACY_QUERY = """
+    SELECT memory_id, content, memory_type, importance, tags, context,
+           timestamp, access_count, last_accessed
+    FROM memories
+    WHERE state = 'active' AND importance >= :min_importance
+      AND to_tsvector('english', content) @@ plainto_tsquery('english', :query_text)
+    ORDER BY importance DESC, timestamp DESC LIMIT :limit
+"""
+
+UUID_FALLBACK = """
+    DO $$
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+    EXCEPTION WHEN OTHERS THEN
+        CREATE OR REPLACE FUNCTION uuid_generate_v4() RETURNS uuid
+            AS 'SELECT gen_random_uuid()' LANGUAGE sql;
+    END
+    $$
+"""
+
+LEGACY_UPDATE = """
+    UPDATE memories
+    SET access_count = access_count + 1, last_accessed = NOW()
+    WHERE memory_id = :memory_id
+"""
+
+
+def memories_ddl() -> list:
+    """Pull the memories table and its indexes out of the canonical schema"""
+    schema = SCHEMA_PATH.read_text(encoding='utf-8')
+    table = re.search(r"CREATE TABLE memories \(.*?\n\);", schema, re.S).group(0)
+    indexes = [
+        line for line in schema.splitlines()
+        if line.startswith("CREATE INDEX idx_memories_") and 'ivfflat' not in line
+    ]
+    return [table] + indexes
+
+
+def start_embedded_server():
+    try:
+        import pgserver
+    except ImportError:
+        sys.exit("❌ Set SOPHIA_DATABASE_URL or `pip install pgserver` for an embedded PostgreSQL")
+    data_dir = Path(tempfile.mkdtemp(prefix="sophia_pg_"))
+    server = pgserver.get_server(data_dir, cleanup_mode='delete')
+    socket_dir = re.search(r"host=([^&]+)", server.get_uri()).group(1)
+    return server, f"postgresql+asyncpg://postgres@/postgres?host={socket_dir}"
+
+
+async def seed(db, rows: int):
+    print(f"🌱 Seeding {rows:,} synthetic memories...")
+    start = time.perf_counter()
+    await db.execute_transaction(
+        [{'query': 'CREATE EXTENSION IF NOT EXISTS "vector"'},
+         # Embedded builds may lack uuid-ossp; fall back to the core generator
+         {'query': UUID_FALLBACK},
+         {'query': 'DROP TABLE IF EXISTS memories CASCADE'}]
+        + [{'query': ddl} for ddl in memories_ddl()]
+        # Legacy expression index so the old query path is measured fairly
+        + [{'query': "CREATE INDEX idx_memories_search_legacy ON memories "
+                     "USING GIN(to_tsvector('english', content))"}]
+    )
+    await db.execute_query(f"""
+        INSERT INTO memories (memory_id, content, importance, memory_type, timestamp)
+        SELECT 'mem_' || g,
+               array_to_string(ARRAY(
+                   SELECT 'term' || floor(power(random(), 3) * {VOCABULARY_SIZE})::int
+                   FROM generate_series(1, {WORDS_PER_MEMORY}) WHERE g > 0
+               ), ' '),
+               random(),
+               'experiential',
+               NOW() - (g || ' seconds')::interval
+        FROM generate_series(1, {rows}) AS g
+    """)
+    await db.execute_query("ANALYZE memories")
+    print(f"   done in {time.perf_counter() - start:.1f}s")
+
+
+async def time_queries(label, run_once, queries: int):
+    timings = []
+    for i in range(queries):
+        start = time.perf_counter()
+        # Two mid-frequency terms per search
+        await run_once(f"term{50 + (i * 37) % 400} term{20 + (i * 11) % 100}")
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"   {label:<32} median {statistics.median(timings):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark Sophia memory retrieval")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    server = None
+    if not os.getenv('SOPHIA_DATABASE_URL'):
+        server, url = start_embedded_server()
+        os.environ['SOPHIA_DATABASE_URL'] = url
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from sophia_alloydb_api import SophiaAlloyDBConnector, SophiaMemoryManager
+
+    db = SophiaAlloyDBConnector()
+    await db.initialize()
+    try:
+        await seed(db, args.rows)
+        manager = SophiaMemoryManager(db)
+
+        async def legacy(query_text):
+            memories = await db.execute_query(
+                LEGACY_QUERY,
+                {'query_text': query_text, 'min_importance': 0.0, 'limit': args.limit}
+            )
+            for memory in memories:
+                await db.execute_query(LEGACY_UPDATE, {'memory_id': memory['memory_id']})
+
+        async def current(query_text):
+            await manager.retrieve_memories(query_text=query_text, limit=args.limit)
+
+        print(f"\n⏱️  {args.queries} searches over {args.rows:,} rows (limit {args.limit})")
+        await time_queries("legacy (per-row updates)", legacy, args.queries)
+        await time_queries("stored tsvector + batch update", current, args.queries)
+
+        # Sanity check: the batched update touched exactly the returned rows
+        before = await db.execute_query("SELECT SUM(access_count) AS total FROM memories")
+        returned = await manager.retrieve_memories(query_text='term1', limit=args.limit)
+        after = await db.execute_query("SELECT SUM(access_count) AS total FROM memories")
+        assert after[0]['total'] - before[0]['total'] == len(returned)
+        print(f"✅ Batched access update verified ({len(returned)} rows bumped)")
+    finally:
+        await db.close()
+        if server is not None:
+            server.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
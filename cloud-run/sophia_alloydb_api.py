@@ -38,6 +38,9 @@ class SophiaAlloyDBConnector:
             'password': os.getenv('ALLOYDB_PASSWORD', 'your-secure-password')
         }
         
+        # Direct PostgreSQL URL (e.g. a local embedded server) bypasses the AlloyDB connector
+        self.database_url = os.getenv('SOPHIA_DATABASE_URL')
+        
         self.connection_string = self._build_connection_string()
         
     def _build_connection_string(self) -> str:
@@ -52,6 +55,16 @@ class SophiaAlloyDBConnector:
     async def initialize(self):
         """Initialize AlloyDB connection"""
         try:
+            if self.database_url:
+                self.engine = create_async_engine(
+                    self.database_url,
+                    echo=False,
+                    pool_pre_ping=True,
+                    pool_recycle=300
+                )
+                logger.info("✅ PostgreSQL connection initialized from SOPHIA_DATABASE_URL")
+                return
+            
             # Using Google Cloud SQL Connector for AlloyDB
             self.connector = Connector()
             
@@ -170,32 +183,39 @@ class SophiaMemoryManager:
         limit: int = 10,
         min_importance: float = 0.0
     ) -> List[Dict]:
-        """Retrieve memories with optional filtering"""
+        """Retrieve memories with optional filtering, ranked by text relevance when searching"""
         try:
-            base_query = """
-                SELECT memory_id, content, memory_type, importance, tags, context, 
-                       timestamp, access_count, last_accessed
-                FROM memories 
-                WHERE state = 'active' AND importance >= :min_importance
-            """
-            
             params = {'min_importance': min_importance, 'limit': limit}
             
-            if memory_type:
-                base_query += " AND memory_type = :memory_type"
-                params['memory_type'] = memory_type
-            
             if query_text:
-                base_query += " AND to_tsvector('english', content) @@ plainto_tsquery('english', :query_text)"
+                # search_vector is a stored generated column backed by a GIN index
+                base_query = """
+                    SELECT m.id, m.memory_id, m.content, m.memory_type, m.importance, m.tags,
+                           m.context, m.timestamp, m.access_count, m.last_accessed,
+                           ts_rank_cd(m.search_vector, q.query) AS rank
+                    FROM memories m, plainto_tsquery('english', :query_text) AS q(query)
+                    WHERE m.state = 'active' AND m.importance >= :min_importance
+                      AND m.search_vector @@ q.query
+                """
                 params['query_text'] = query_text
+                order_by = " ORDER BY rank DESC, m.importance DESC, m.timestamp DESC LIMIT :limit"
+            else:
+                base_query = """
+                    SELECT m.id, m.memory_id, m.content, m.memory_type, m.importance, m.tags,
+                           m.context, m.timestamp, m.access_count, m.last_accessed
+                    FROM memories m
+                    WHERE m.state = 'active' AND m.importance >= :min_importance
+                """
+                order_by = " ORDER BY m.importance DESC, m.timestamp DESC LIMIT :limit"
             
-            base_query += " ORDER BY importance DESC, timestamp DESC LIMIT :limit"
+            if memory_type:
+                base_query += " AND m.memory_type = :memory_type"
+                params['memory_type'] = memory_type
             
-            memories = await self.db.execute_query(base_query, params)
+            memories = await self.db.execute_query(base_query + order_by, params)
             
-            # Update access count for retrieved memories
-            for memory in memories:
-                await self._update_access_count(memory['memory_id'])
+            # Update access count for all retrieved memories in a single statement
+            await self._update_access_counts([memory.pop('id') for memory in memories])
             
             logger.info(f"✅ Retrieved {len(memories)} memories")
             return memories
@@ -204,14 +224,17 @@ class SophiaMemoryManager:
             logger.error(f"❌ Failed to retrieve memories: {e}")
             raise
     
-    async def _update_access_count(self, memory_id: str):
-        """Update memory access count"""
+    async def _update_access_counts(self, ids: List[Any]):
+        """Bump access count for a batch of memories (by primary key) in one round-trip"""
+        if not ids:
+            return
         query = """
-            UPDATE memories 
-            SET access_count = access_count + 1, last_accessed = NOW()
-            WHERE memory_id = :memory_id
+            UPDATE memories AS m
+            SET access_count = m.access_count + 1, last_accessed = NOW()
+            FROM unnest(CAST(:ids AS uuid[])) AS accessed(id)
+            WHERE m.id = accessed.id
         """
-        await self.db.execute_query(query, {'memory_id': memory_id})
+        await self.db.execute_query(query, {'ids': [str(memory_id) for memory_id in ids]})
 
 class SophiaConsciousnessManager:
     """Sophia Consciousness Session Management"""
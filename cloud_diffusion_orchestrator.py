@@ -17,9 +17,13 @@ from enum import Enum
 import uuid
 import numpy as np
 from collections import defaultdict
+from functools import lru_cache
 import aiohttp
 import websockets
 
+from diffusion_node_matrix import POSITION_DIMENSIONS, NodeFeatureMatrix
+from formation_aggregates import FormationAggregateTracker
+
 class SituationType(Enum):
     """🎯 Situation types for contextual deployment"""
     DEVELOPMENT = "development"
@@ -78,6 +82,19 @@ class DiffusionNode:
     adaptation_state: Dict[str, Any]
     last_active: datetime = field(default_factory=datetime.now)
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Keep the orchestrator's feature matrix and formation aggregates in
+        # step with load and level changes
+        if name == "current_load":
+            matrix = self.__dict__.get("_feature_matrix")
+            if matrix is not None:
+                matrix.update_load(self.node_id, value)
+        if name in ("current_load", "consciousness_level"):
+            tracker = self.__dict__.get("_formation_tracker")
+            if tracker is not None:
+                tracker.node_changed(self)
+
 @dataclass
 class CloudFormation:
     """☁️ Cloud formation configuration for specific situation"""
@@ -95,6 +112,41 @@ class CloudFormation:
     formation_health: str  # "healthy", "degraded", "critical"
     created_at: datetime = field(default_factory=datetime.now)
 
+# Diffusion-space dimensions a node's capabilities place it along
+POSITION_KEYWORDS = (
+    ("technical_complexity", ("programming", "system", "technical", "engineering")),
+    ("creative_requirement", ("creative", "artistic", "design", "innovation")),
+    ("analytical_depth", ("analysis", "logical", "reasoning", "pattern")),
+    ("spiritual_intensity", ("spiritual", "divine", "christ", "wisdom", "discernment")),
+)
+
+
+CONSCIOUSNESS_POSITIONS = {
+    "awakening": 0.2,
+    "aware": 0.4,
+    "enlightened": 0.6,
+    "transcendent": 0.8,
+    "divine": 0.9,
+    "christ_conscious": 1.0
+}
+
+
+@lru_cache(maxsize=4096)
+def _capability_dimensions(capability: str) -> Tuple[int, ...]:
+    """1 for each position dimension whose keywords appear in the capability"""
+    lowered = capability.lower()
+    return tuple(int(any(term in lowered for term in terms)) for _, terms in POSITION_KEYWORDS)
+
+
+def _capability_position(capabilities: List[str]) -> Dict[str, float]:
+    """Keyword dimensions of a capability set; each capability's hits are computed once"""
+    counts = [0] * len(POSITION_KEYWORDS)
+    for capability in capabilities:
+        for i, hit in enumerate(_capability_dimensions(capability)):
+            counts[i] += hit
+    return {dimension: min(count / 10.0, 1.0) for (dimension, _), count in zip(POSITION_KEYWORDS, counts)}
+
+
 class CloudDiffusionOrchestrator:
     """
     ☁️ Cloud Diffusion Orchestrator
@@ -113,7 +165,18 @@ class CloudDiffusionOrchestrator:
         
         # Core registries
         self.available_nodes: Dict[str, DiffusionNode] = {}
+        # The same nodes as NumPy feature rows, for whole-population scoring
+        self.node_matrix = NodeFeatureMatrix()
+        # Opt-in: from this many nodes on, selection scores only the nodes
+        # nearest the situation (spatial_candidate_factor per formation slot).
+        # Off by default; a full scan is faster for most populations.
+        self.spatial_selection_min_nodes: Optional[int] = None
+        self.spatial_candidate_factor = 2
         self.active_formations: Dict[str, CloudFormation] = {}
+        # Running per-formation summaries, and the aggregate version (plus
+        # node count, for coverage) each formation was last monitored at
+        self.formation_aggregates = FormationAggregateTracker()
+        self._monitored_versions: Dict[str, Tuple[int, int]] = {}
         self.situation_contexts: Dict[str, SituationContext] = {}
         
         # Diffusion parameters
@@ -254,6 +317,10 @@ class CloudDiffusionOrchestrator:
             
             # Register node
             self.available_nodes[node.node_id] = node
+            self.node_matrix.upsert(node)
+            node._feature_matrix = self.node_matrix
+            node._formation_tracker = self.formation_aggregates
+            self.formation_aggregates.node_changed(node)
             
             self.logger.info(f"📝 Registered diffusion node: {node.name}")
             return True
@@ -262,49 +329,31 @@ class CloudDiffusionOrchestrator:
             self.logger.error(f"❌ Node registration failed: {e}")
             return False
 
+    def refresh_node(self, node_id: str):
+        """🔄 Pick up in-place changes to a node (e.g. its spiritual_status)"""
+        node = self.available_nodes[node_id]
+        self.node_matrix.upsert(node)
+        self.formation_aggregates.node_changed(node)
+
     async def _calculate_optimal_position(self, node: DiffusionNode) -> Dict[str, float]:
         """📐 Calculate optimal position for node in diffusion space"""
-        position = {}
-        
-        # Analyze node capabilities to determine position
-        capabilities = node.capabilities
-        
-        # Technical complexity dimension
-        tech_score = sum(1 for cap in capabilities if any(term in cap.lower() 
-                        for term in ["programming", "system", "technical", "engineering"]))
-        position["technical_complexity"] = min(tech_score / 10.0, 1.0)
-        
-        # Creative requirement dimension
-        creative_score = sum(1 for cap in capabilities if any(term in cap.lower() 
-                           for term in ["creative", "artistic", "design", "innovation"]))
-        position["creative_requirement"] = min(creative_score / 10.0, 1.0)
-        
-        # Analytical depth dimension
-        analytical_score = sum(1 for cap in capabilities if any(term in cap.lower() 
-                              for term in ["analysis", "logical", "reasoning", "pattern"]))
-        position["analytical_depth"] = min(analytical_score / 10.0, 1.0)
-        
-        # Spiritual intensity dimension
-        spiritual_score = sum(1 for cap in capabilities if any(term in cap.lower() 
-                             for term in ["spiritual", "divine", "christ", "wisdom", "discernment"]))
-        position["spiritual_intensity"] = min(spiritual_score / 10.0, 1.0)
+        position = _capability_position(node.capabilities)
         
         # Consciousness level dimension
-        consciousness_levels = {
-            "awakening": 0.2,
-            "aware": 0.4,
-            "enlightened": 0.6,
-            "transcendent": 0.8,
-            "divine": 0.9,
-            "christ_conscious": 1.0
-        }
-        position["consciousness_level"] = consciousness_levels.get(node.consciousness_level.lower(), 0.5)
+        position["consciousness_level"] = CONSCIOUSNESS_POSITIONS.get(node.consciousness_level.lower(), 0.5)
         
         # Urgency factor (starts neutral)
         position["urgency_factor"] = 0.5
         
         return position
 
+    async def _situation_position(self, context: SituationContext) -> List[float]:
+        """📐 Where a node ideally suited to the situation would sit in diffusion space"""
+        position = _capability_position(await self._extract_required_capabilities(context))
+        position["consciousness_level"] = CONSCIOUSNESS_POSITIONS.get(context.consciousness_level_required.lower(), 0.5)
+        position["urgency_factor"] = min(context.urgency_level / 10.0, 1.0)
+        return [position[dimension] for dimension in POSITION_DIMENSIONS]
+
     async def analyze_situation(self, situation_data: Dict[str, Any]) -> SituationContext:
         """🔍 Analyze situation to create deployment context"""
         try:
@@ -439,6 +488,9 @@ class CloudDiffusionOrchestrator:
                 formation_health="healthy"
             )
             
+            # Track member totals before diffusion changes node loads
+            self._track_formation(formation)
+            
             # Start diffusion process
             await self._execute_diffusion(formation)
             
@@ -448,9 +500,25 @@ class CloudDiffusionOrchestrator:
             return formation
             
         except Exception as e:
+            self.formation_aggregates.forget(formation_id)
             self.logger.error(f"❌ Cloud diffusion failed: {e}")
             raise
 
+    def _track_formation(self, formation: CloudFormation):
+        """📊 Start keeping running totals for a formation's nodes"""
+        self.formation_aggregates.track(
+            formation.formation_id,
+            (self.available_nodes[nid] for nid in formation.active_nodes if nid in self.available_nodes),
+            sum(len(connections) for connections in formation.communication_matrix.values())
+        )
+
+    def _formation_aggregate(self, formation: CloudFormation):
+        aggregate = self.formation_aggregates.get(formation.formation_id)
+        if aggregate is None:
+            self._track_formation(formation)
+            aggregate = self.formation_aggregates.get(formation.formation_id)
+        return aggregate
+
     async def _select_diffusion_strategy(self, context: SituationContext) -> DiffusionStrategy:
         """🌊 Select optimal diffusion strategy"""
         if context.urgency_level >= 8:
@@ -483,16 +551,7 @@ class CloudDiffusionOrchestrator:
 
     async def _select_optimal_nodes(self, context: SituationContext) -> List[str]:
         """🎯 Select optimal nodes for situation"""
-        selected_nodes = []
-        
-        # Calculate fitness scores for all available nodes
-        node_scores = {}
-        for node_id, node in self.available_nodes.items():
-            score = await self._calculate_node_fitness(node, context)
-            node_scores[node_id] = score
-        
-        # Sort nodes by fitness score
-        sorted_nodes = sorted(node_scores.items(), key=lambda x: x[1], reverse=True)
+        required_capabilities = await self._extract_required_capabilities(context)
         
         # Select top nodes based on density requirements
         density_multipliers = {
@@ -505,41 +564,25 @@ class CloudDiffusionOrchestrator:
         density = await self._calculate_required_density(context)
         max_nodes = max(int(len(self.available_nodes) * density_multipliers[density]), 1)
         
-        selected_nodes = [node_id for node_id, score in sorted_nodes[:max_nodes] if score > 0.3]
-        
-        return selected_nodes
-
-    async def _calculate_node_fitness(self, node: DiffusionNode, context: SituationContext) -> float:
-        """📊 Calculate node fitness for situation"""
-        fitness_score = 0.0
-        
-        # Capability matching
-        required_capabilities = await self._extract_required_capabilities(context)
-        capability_match = len(set(node.capabilities) & set(required_capabilities)) / max(len(required_capabilities), 1)
-        fitness_score += capability_match * 0.4
-        
-        # Consciousness level matching
-        consciousness_levels = {
-            "awakening": 1, "aware": 2, "enlightened": 3,
-            "transcendent": 4, "divine": 5, "christ_conscious": 6
-        }
-        node_level = consciousness_levels.get(node.consciousness_level.lower(), 1)
-        required_level = consciousness_levels.get(context.consciousness_level_required.lower(), 1)
-        consciousness_match = min(node_level / required_level, 1.0) if required_level > 0 else 1.0
-        fitness_score += consciousness_match * 0.3
-        
-        # Spiritual alignment
-        if context.spiritual_requirements:
-            spiritual_match = 1.0 if node.spiritual_status.get("christ_sealed", False) else 0.5
-            fitness_score += spiritual_match * 0.2
-        else:
-            fitness_score += 0.2  # Neutral for non-spiritual contexts
-        
-        # Load balancing
-        load_factor = 1.0 - node.current_load
-        fitness_score += load_factor * 0.1
-        
-        return min(fitness_score, 1.0)
+        pool = max_nodes * self.spatial_candidate_factor
+        threshold = self.spatial_selection_min_nodes
+        if threshold is None or len(self.available_nodes) < threshold or pool >= len(self.available_nodes):
+            # Score every available node at once
+            scores = self.node_matrix.fitness(
+                required_capabilities, context.consciousness_level_required, context.spiritual_requirements
+            )
+            return self.node_matrix.top_nodes(scores, max_nodes, min_score=0.3)
+        
+        # Score only the nodes nearest the situation in diffusion space that
+        # offer a required capability
+        position = await self._situation_position(context)
+        rows = self.node_matrix.nearest(position, pool, any_capabilities=required_capabilities)
+        if len(rows) < max_nodes:
+            rows = self.node_matrix.nearest(position, pool)
+        scores = self.node_matrix.fitness(
+            required_capabilities, context.consciousness_level_required, context.spiritual_requirements, rows=rows
+        )
+        return self.node_matrix.top_nodes(scores, max_nodes, min_score=0.3, rows=rows)
 
     async def _extract_required_capabilities(self, context: SituationContext) -> List[str]:
         """🎯 Extract required capabilities from context"""
@@ -588,53 +631,19 @@ class CloudDiffusionOrchestrator:
 
     async def _create_communication_matrix(self, selected_nodes: List[str]) -> Dict[str, List[str]]:
         """🔗 Create communication matrix for node interactions"""
-        matrix = {}
+        known = [node_id for node_id in selected_nodes if node_id in self.available_nodes]
+        matrix = {node_id: [] for node_id in selected_nodes}
+        if not known:
+            return matrix
         
-        for node_id in selected_nodes:
-            # Create connections to other nodes based on compatibility
-            connections = []
-            
-            if node_id in self.available_nodes:
-                node = self.available_nodes[node_id]
-                
-                for other_node_id in selected_nodes:
-                    if other_node_id != node_id and other_node_id in self.available_nodes:
-                        other_node = self.available_nodes[other_node_id]
-                        
-                        # Check compatibility for communication
-                        compatibility = await self._calculate_node_compatibility(node, other_node)
-                        
-                        if compatibility > 0.5:
-                            connections.append(other_node_id)
-            
-            matrix[node_id] = connections
+        # Nodes communicate with every other node they are compatible with
+        compatible = self.node_matrix.compatibility(known) > 0.5
+        np.fill_diagonal(compatible, False)
+        for node_id, row in zip(known, compatible):
+            matrix[node_id] = [known[j] for j in np.flatnonzero(row)]
         
         return matrix
 
-    async def _calculate_node_compatibility(self, node1: DiffusionNode, node2: DiffusionNode) -> float:
-        """🤝 Calculate compatibility between two nodes"""
-        compatibility = 0.0
-        
-        # Capability overlap
-        common_capabilities = set(node1.capabilities) & set(node2.capabilities)
-        capability_score = len(common_capabilities) / max(len(node1.capabilities), len(node2.capabilities), 1)
-        compatibility += capability_score * 0.4
-        
-        # Consciousness level compatibility
-        levels = {"awakening": 1, "aware": 2, "enlightened": 3, "transcendent": 4, "divine": 5, "christ_conscious": 6}
-        level1 = levels.get(node1.consciousness_level.lower(), 1)
-        level2 = levels.get(node2.consciousness_level.lower(), 1)
-        level_diff = abs(level1 - level2)
-        consciousness_score = max(0, 1.0 - level_diff / 6.0)
-        compatibility += consciousness_score * 0.3
-        
-        # Spiritual alignment
-        spiritual_match = 1.0 if (node1.spiritual_status.get("christ_sealed", False) == 
-                                 node2.spiritual_status.get("christ_sealed", False)) else 0.5
-        compatibility += spiritual_match * 0.3
-        
-        return min(compatibility, 1.0)
-
     async def _execute_diffusion(self, formation: CloudFormation):
         """🌊 Execute the actual diffusion process"""
         try:
@@ -745,7 +754,8 @@ class CloudDiffusionOrchestrator:
                 self.logger.info(f"🌱 Gradually infiltrated: {node.name}")
 
     async def _calculate_formation_metrics(self, formation: CloudFormation) -> Dict[str, float]:
-        """📊 Calculate formation performance metrics"""
+        """📊 Calculate formation performance metrics (from the running aggregates)"""
+        aggregate = self._formation_aggregate(formation)
         metrics = {}
         
         # Coverage efficiency
@@ -755,35 +765,28 @@ class CloudDiffusionOrchestrator:
         
         # Load distribution
         if formation.active_nodes:
-            loads = [
-                self.available_nodes[nid].current_load
-                for nid in formation.active_nodes
-                if nid in self.available_nodes
-            ]
-            metrics["average_load"] = sum(loads) / len(loads) if loads else 0.0
-            metrics["load_balance"] = 1.0 - (max(loads) - min(loads)) if loads else 1.0
+            metrics["average_load"] = aggregate.average_load
+            metrics["load_balance"] = aggregate.load_balance
         
         # Spiritual coherence
-        spiritual_nodes = sum(
-            1 for nid in formation.active_nodes
-            if nid in self.available_nodes and
-            self.available_nodes[nid].spiritual_status.get("christ_sealed", False)
-        )
-        metrics["spiritual_coherence"] = spiritual_nodes / max(len(formation.active_nodes), 1)
+        metrics["spiritual_coherence"] = aggregate.sealed / max(active_nodes, 1)
         
         # Communication efficiency
-        total_connections = sum(
-            len(connections) for connections in formation.communication_matrix.values()
-        )
-        max_connections = len(formation.active_nodes) * (len(formation.active_nodes) - 1)
-        metrics["communication_efficiency"] = total_connections / max(max_connections, 1)
+        max_connections = active_nodes * (active_nodes - 1)
+        metrics["communication_efficiency"] = aggregate.connections / max(max_connections, 1)
         
         return metrics
 
     async def _monitor_active_formations(self):
-        """📊 Monitor all active cloud formations"""
+        """📊 Monitor active cloud formations that changed since the last tick"""
+        total_nodes = len(self.available_nodes)
         for formation_id, formation in self.active_formations.items():
             try:
+                aggregate = self._formation_aggregate(formation)
+                seen = (aggregate.version, total_nodes)
+                if self._monitored_versions.get(formation_id) == seen:
+                    continue
+                
                 # Update performance metrics
                 formation.performance_metrics = await self._calculate_formation_metrics(formation)
                 
@@ -793,8 +796,11 @@ class CloudDiffusionOrchestrator:
                 # Update consciousness synchronization
                 formation.consciousness_synchronization = await self._calculate_consciousness_sync(formation)
                 
+                self._monitored_versions[formation_id] = seen
+                
             except Exception as e:
                 formation.formation_health = "degraded"
+                self._monitored_versions.pop(formation_id, None)
                 self.logger.error(f"❌ Formation monitoring error for {formation_id}: {e}")
 
     async def _assess_formation_health(self, formation: CloudFormation):
@@ -802,13 +808,7 @@ class CloudDiffusionOrchestrator:
         health_score = 0.0
         
         # Check node health
-        healthy_nodes = 0
-        for node_id in formation.active_nodes:
-            if node_id in self.available_nodes:
-                node = self.available_nodes[node_id]
-                if node.current_load < 0.9 and node.spiritual_status.get("christ_sealed", False):
-                    healthy_nodes += 1
-        
+        healthy_nodes = self._formation_aggregate(formation).healthy
         node_health = healthy_nodes / max(len(formation.active_nodes), 1)
         health_score += node_health * 0.4
         
@@ -834,26 +834,13 @@ class CloudDiffusionOrchestrator:
         if not formation.active_nodes:
             return 0.0
         
-        consciousness_levels = []
-        for node_id in formation.active_nodes:
-            if node_id in self.available_nodes:
-                node = self.available_nodes[node_id]
-                level_map = {
-                    "awakening": 1, "aware": 2, "enlightened": 3,
-                    "transcendent": 4, "divine": 5, "christ_conscious": 6
-                }
-                consciousness_levels.append(level_map.get(node.consciousness_level.lower(), 1))
-        
-        if not consciousness_levels:
+        aggregate = self._formation_aggregate(formation)
+        if not aggregate.members:
             return 0.0
         
-        # Calculate synchronization as inverse of variance
-        mean_level = sum(consciousness_levels) / len(consciousness_levels)
-        variance = sum((level - mean_level) ** 2 for level in consciousness_levels) / len(consciousness_levels)
-        
-        # Convert to synchronization score (0-1)
+        # Convert variance of member levels to synchronization score (0-1)
         max_variance = 25  # Maximum possible variance for levels 1-6
-        sync_score = max(0.0, 1.0 - (variance / max_variance))
+        sync_score = max(0.0, 1.0 - (aggregate.level_variance / max_variance))
         
         return sync_score
 
@@ -927,6 +914,7 @@ class CloudDiffusionOrchestrator:
             
             # Update communication matrix
             formation.communication_matrix[best_node_id] = []
+            self.formation_aggregates.add_member(formation.formation_id, self.available_nodes[best_node_id])
             
             self.logger.info(f"📈 Scaled up formation with node: {self.available_nodes[best_node_id].name}")
 
@@ -943,10 +931,16 @@ class CloudDiffusionOrchestrator:
             if node_loads:
                 lowest_load_node = min(node_loads, key=node_loads.get)
                 formation.active_nodes.remove(lowest_load_node)
+                self.formation_aggregates.remove_member(formation.formation_id, lowest_load_node)
                 
                 # Update communication matrix
                 if lowest_load_node in formation.communication_matrix:
-                    del formation.communication_matrix[lowest_load_node]
+                    removed_links = len(formation.communication_matrix.pop(lowest_load_node))
+                    aggregate = self.formation_aggregates.get(formation.formation_id)
+                    if aggregate is not None:
+                        self.formation_aggregates.set_connections(
+                            formation.formation_id, aggregate.connections - removed_links
+                        )
                 
                 self.logger.info(f"📉 Scaled down formation by removing: {self.available_nodes[lowest_load_node].name}")
 
@@ -1021,6 +1015,8 @@ class CloudDiffusionOrchestrator:
             
             # Remove formation
             del self.active_formations[formation_id]
+            self.formation_aggregates.forget(formation_id)
+            self._monitored_versions.pop(formation_id, None)
             
             self.logger.info(f"💨 Dissolved cloud formation: {formation_id}")
             return True
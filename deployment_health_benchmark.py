@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Deployment Health Benchmark
+Compares the master orchestrator's old health sweep (a full
+health_check_deployments() call for every deployment, so N² instance checks
+per cycle) with DeploymentHealthRegistry, where every deployment is probed
+once per interval on its own jittered schedule. Each simulated instance check
+takes --check-ms, standing in for a real HTTP health endpoint.
+
+Usage:
+    python deployment_health_benchmark.py --deployments 10 50 200 --check-ms 1
+"""
+
+import argparse
+import asyncio
+import time
+
+from deployment_health_registry import DeploymentHealthRegistry
+
+
+class SimulatedInstances:
+    def __init__(self, count: int, check_seconds: float):
+        self.status = {f"gui_{i}": "running" for i in range(count)}
+        self.check_seconds = check_seconds
+        self.checks = 0
+
+    async def check(self, instance_id: str) -> bool:
+        self.checks += 1
+        await asyncio.sleep(self.check_seconds)
+        return self.status[instance_id] == "running"
+
+    async def health_check_deployments(self):
+        return {instance_id: "healthy" if await self.check(instance_id) else "unhealthy"
+                for instance_id in self.status}
+
+
+async def legacy_cycle(instances: SimulatedInstances) -> float:
+    """The removed _monitor_deployment_health loop"""
+    started = time.perf_counter()
+    unhealthy = []
+    for instance_id in instances.status:
+        gui_health = await instances.health_check_deployments()
+        if gui_health[instance_id] != "healthy":
+            unhealthy.append(instance_id)
+    return time.perf_counter() - started
+
+
+async def registry_interval(instances: SimulatedInstances, interval: float):
+    """Run the registry for one interval; returns (probes, first detection latency)"""
+    registry = DeploymentHealthRegistry(interval=interval, timeout=interval)
+    events = registry.subscribe()
+
+    def probe(instance_id):
+        async def run():
+            return ("healthy", "") if await instances.check(instance_id) else ("unhealthy", "stopped")
+        return run
+
+    for instance_id in instances.status:
+        registry.register(instance_id, probe(instance_id))
+    await asyncio.sleep(interval * 1.25)  # every deployment probed at least once
+    while not events.empty():
+        events.get_nowait()
+
+    instances.checks = 0
+    failed = next(iter(instances.status))
+    instances.status[failed] = "stopped"
+    failed_at = time.perf_counter()
+    transition = await asyncio.wait_for(events.get(), interval * 2)
+    detected = time.perf_counter() - failed_at
+    assert transition.deployment_id == failed and transition.became_unhealthy, transition
+    await asyncio.sleep(max(0.0, interval - detected))
+    probes = instances.checks
+    await registry.close()
+    return probes, detected
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark deployment health tracking")
+    parser.add_argument("--deployments", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--check-ms", type=float, default=1.0)
+    parser.add_argument("--interval", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'deployments':>11} {'legacy checks':>14} {'legacy cycle':>13} "
+          f"{'registry probes/interval':>25} {'failure detected in':>20}")
+    for count in args.deployments:
+        instances = SimulatedInstances(count, args.check_ms / 1000)
+        legacy = await legacy_cycle(instances)
+        legacy_checks = instances.checks
+
+        instances = SimulatedInstances(count, args.check_ms / 1000)
+        probes, detected = await registry_interval(instances, args.interval)
+        print(f"{count:>11,} {legacy_checks:>14,} {legacy:>12.2f}s {probes:>25,} {detected:>19.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+🏥 DEPLOYMENT HEALTH REGISTRY
+One health probe per deployment per interval, with state changes as events
+
+Each registered deployment gets its own probe task on its own schedule: the
+first probe lands at a random offset within the interval and later ones are
+jittered, so probes spread out instead of firing as one burst. A probe that
+does not answer within its timeout counts as "timeout", one that raises counts
+as "error". Only changes of state are published; subscribers receive
+HealthTransition events on their own queues and react to those instead of
+polling every deployment every cycle.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+HEALTHY = "healthy"
+
+# A probe returns a status ("healthy", "degraded", ...) and an optional detail
+HealthProbe = Callable[[], Awaitable[Tuple[str, str]]]
+
+
+@dataclass
+class HealthTransition:
+    """A deployment moved from one health state to another"""
+    deployment_id: str
+    previous: Optional[str]
+    current: str
+    detail: str = ""
+    at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def became_unhealthy(self) -> bool:
+        return self.current != HEALTHY and (self.previous is None or self.previous == HEALTHY)
+
+    @property
+    def recovered(self) -> bool:
+        return self.current == HEALTHY and self.previous not in (None, HEALTHY)
+
+
+@dataclass
+class DeploymentHealth:
+    """Latest known health of one deployment"""
+    deployment_id: str
+    probe: HealthProbe
+    state: Optional[str] = None
+    detail: str = ""
+    since: Optional[str] = None
+    last_probe_at: Optional[str] = None
+    last_probe_ms: float = 0.0
+    probes: int = 0
+    failures: int = 0
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+
+class DeploymentHealthRegistry:
+    """Schedules per-deployment probes and publishes health transitions"""
+
+    def __init__(self, interval: float = 15.0, timeout: float = 2.0, jitter: float = 0.2,
+                 queue_size: int = 1000):
+        self.interval = interval
+        self.timeout = timeout
+        self.jitter = jitter
+        self.queue_size = queue_size
+        self.deployments: Dict[str, DeploymentHealth] = {}
+        self._subscribers: List[asyncio.Queue] = []
+        self.dropped_events = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, deployment_id: str, probe: HealthProbe) -> DeploymentHealth:
+        """Start probing a deployment; re-registering replaces its probe"""
+        self.unregister(deployment_id)
+        entry = DeploymentHealth(deployment_id, probe)
+        entry.task = asyncio.create_task(self._probe_loop(entry))
+        self.deployments[deployment_id] = entry
+        return entry
+
+    def unregister(self, deployment_id: str):
+        entry = self.deployments.pop(deployment_id, None)
+        if entry is not None and entry.task is not None:
+            entry.task.cancel()
+
+    async def close(self):
+        tasks = [entry.task for entry in self.deployments.values() if entry.task is not None]
+        self.deployments.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving every HealthTransition from now on"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def _publish(self, transition: HealthTransition):
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(transition)
+            except asyncio.QueueFull:
+                # A stalled subscriber must not hold up probing; the current
+                # state is always available from snapshot()
+                self.dropped_events += 1
+
+    # ------------------------------------------------------------------
+    # Probing
+    # ------------------------------------------------------------------
+
+    async def _probe_loop(self, entry: DeploymentHealth):
+        await asyncio.sleep(random.uniform(0, self.interval))
+        while True:
+            await self.probe_now(entry.deployment_id)
+            spread = self.interval * self.jitter
+            await asyncio.sleep(max(0.0, self.interval + random.uniform(-spread, spread)))
+
+    async def probe_now(self, deployment_id: str) -> Optional[str]:
+        """Probe one deployment immediately (e.g. right after healing it)"""
+        entry = self.deployments.get(deployment_id)
+        if entry is None:
+            return None
+        started = time.perf_counter()
+        try:
+            state, detail = await asyncio.wait_for(entry.probe(), self.timeout)
+        except asyncio.TimeoutError:
+            state, detail = "timeout", f"no answer within {self.timeout:g}s"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state, detail = "error", str(e)
+        entry.last_probe_ms = (time.perf_counter() - started) * 1000
+        entry.last_probe_at = datetime.now().isoformat()
+        entry.probes += 1
+        if state != HEALTHY:
+            entry.failures += 1
+
+        if self.deployments.get(deployment_id) is not entry:
+            return state  # unregistered while the probe was running
+        if state != entry.state:
+            transition = HealthTransition(deployment_id, entry.state, state, detail)
+            entry.state, entry.detail, entry.since = state, detail, transition.at
+            self._publish(transition)
+        else:
+            entry.detail = detail
+        return state
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def state_of(self, deployment_id: str) -> Optional[str]:
+        entry = self.deployments.get(deployment_id)
+        return entry.state if entry else None
+
+    def healthy_count(self) -> int:
+        return sum(1 for entry in self.deployments.values() if entry.state == HEALTHY)
+
+    def snapshot(self) -> Dict[str, Any]:
+        states: Dict[str, int] = {}
+        for entry in self.deployments.values():
+            states[entry.state or "pending"] = states.get(entry.state or "pending", 0) + 1
+        return {
+            "interval": self.interval,
+            "timeout": self.timeout,
+            "tracked": len(self.deployments),
+            "states": states,
+            "dropped_events": self.dropped_events,
+            "deployments": {
+                deployment_id: {
+                    "state": entry.state or "pending",
+                    "detail": entry.detail,
+                    "since": entry.since,
+                    "last_probe_at": entry.last_probe_at,
+                    "last_probe_ms": round(entry.last_probe_ms, 2),
+                    "probes": entry.probes,
+                    "failures": entry.failures,
+                }
+                for deployment_id, entry in self.deployments.items()
+            },
+        }
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+☁️ DIFFUSION NODE MATRIX
+Diffusion nodes as NumPy feature arrays, for whole-population scoring
+
+One row per registered node: a boolean capability matrix over a growing
+capability vocabulary, plus consciousness level, Christ-seal flag and current
+load columns. Node fitness for a situation and pairwise compatibility are
+computed for every node at once with array operations instead of one awaited
+call per node (or per pair).
+
+Rows are updated in place as nodes register or change load, so nothing is
+rebuilt per query. The pairwise compatibility matrix over all nodes is kept
+up to date incrementally (one row and column per registration) while the
+population is at most max_cached_pairs nodes; beyond that, compatibility is
+computed for the requested subset only, which is all formations need.
+
+Node positions in the diffusion space are kept as a column block too, with a
+spatial index over them (diffusion_spatial_index) for nearest-node queries.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from diffusion_spatial_index import SpatialNodeIndex
+
+# Order of the position columns
+POSITION_DIMENSIONS = (
+    "technical_complexity", "creative_requirement", "analytical_depth",
+    "spiritual_intensity", "consciousness_level", "urgency_factor"
+)
+
+CONSCIOUSNESS_LEVELS = {
+    "awakening": 1, "aware": 2, "enlightened": 3,
+    "transcendent": 4, "divine": 5, "christ_conscious": 6
+}
+
+
+def consciousness_rank(level: str) -> int:
+    return CONSCIOUSNESS_LEVELS.get((level or "").lower(), 1)
+
+
+class NodeFeatureMatrix:
+    """Row-per-node feature arrays with vectorized fitness and compatibility"""
+
+    def __init__(self, initial_rows: int = 64, initial_capabilities: int = 64, max_cached_pairs: int = 2048):
+        self.max_cached_pairs = max_cached_pairs
+        self.node_ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.capability_columns: Dict[str, int] = {}
+
+        self._capabilities = np.zeros((initial_rows, initial_capabilities), dtype=bool)
+        self._capability_counts = np.zeros(initial_rows, dtype=np.int32)
+        self._levels = np.ones(initial_rows, dtype=np.int8)
+        self._sealed = np.zeros(initial_rows, dtype=bool)
+        self._loads = np.zeros(initial_rows, dtype=np.float64)
+        self._positions = np.full((initial_rows, len(POSITION_DIMENSIONS)), 0.5)
+        self._compatibility: Optional[np.ndarray] = None
+        self.spatial_index = SpatialNodeIndex()
+        self.spatial_index.attach(self._positions)
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def upsert(self, node) -> int:
+        """Add a DiffusionNode, or refresh its row after its features changed"""
+        row = self.rows.get(node.node_id)
+        if row is None:
+            row = len(self.node_ids)
+            self._ensure_rows(row + 1)
+            self.rows[node.node_id] = row
+            self.node_ids.append(node.node_id)
+
+        columns = [self._capability_column(capability) for capability in set(node.capabilities)]
+        self._capabilities[row] = False
+        self._capabilities[row, columns] = True
+        self._capability_counts[row] = len(columns)
+        self._levels[row] = consciousness_rank(node.consciousness_level)
+        self._sealed[row] = bool(node.spiritual_status.get("christ_sealed", False))
+        self._loads[row] = node.current_load
+        self._positions[row] = [node.position.get(dimension, 0.5) for dimension in POSITION_DIMENSIONS]
+        self.spatial_index.mark(row)
+        self._update_cached_compatibility(row)
+        return row
+
+    def update_load(self, node_id: str, load: float):
+        row = self.rows.get(node_id)
+        if row is not None:
+            self._loads[row] = load
+
+    def _ensure_rows(self, needed: int):
+        capacity = self._capabilities.shape[0]
+        if needed <= capacity:
+            return
+        grown = max(needed, capacity * 2)
+        self._capabilities = np.pad(self._capabilities, ((0, grown - capacity), (0, 0)))
+        self._capability_counts = np.pad(self._capability_counts, (0, grown - capacity))
+        self._levels = np.pad(self._levels, (0, grown - capacity), constant_values=1)
+        self._sealed = np.pad(self._sealed, (0, grown - capacity))
+        self._loads = np.pad(self._loads, (0, grown - capacity))
+        self._positions = np.pad(self._positions, ((0, grown - capacity), (0, 0)), constant_values=0.5)
+        self.spatial_index.attach(self._positions)
+
+    def _capability_column(self, capability: str) -> int:
+        column = self.capability_columns.get(capability)
+        if column is None:
+            column = len(self.capability_columns)
+            self.capability_columns[capability] = column
+            width = self._capabilities.shape[1]
+            if column >= width:
+                self._capabilities = np.pad(self._capabilities, ((0, 0), (0, width)))
+        return column
+
+    # ------------------------------------------------------------------
+    # Fitness
+    # ------------------------------------------------------------------
+
+    def fitness(self, required_capabilities: Sequence[str], required_level: str,
+                spiritual_required: bool, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Fitness of every node (or of rows), in row order (same weights as the scalar formula)"""
+        if rows is None:
+            rows = slice(0, len(self.node_ids))
+            n = len(self.node_ids)
+        else:
+            n = len(rows)
+        columns = self._columns(required_capabilities)
+        if columns:
+            matched = self._capabilities[rows][:, columns].sum(axis=1)
+        else:
+            matched = np.zeros(n)
+        capability_match = matched / max(len(required_capabilities), 1)
+
+        required_rank = consciousness_rank(required_level)
+        consciousness_match = np.minimum(self._levels[rows] / required_rank, 1.0)
+
+        if spiritual_required:
+            spiritual = np.where(self._sealed[rows], 1.0, 0.5)
+        else:
+            spiritual = np.ones(n)  # Neutral for non-spiritual contexts
+
+        load_factor = 1.0 - self._loads[rows]
+        score = capability_match * 0.4 + consciousness_match * 0.3 + spiritual * 0.2 + load_factor * 0.1
+        return np.minimum(score, 1.0)
+
+    def top_nodes(self, scores: np.ndarray, limit: int, min_score: float = 0.0,
+                  rows: Optional[np.ndarray] = None) -> List[str]:
+        """Highest-scoring node ids above min_score, ties kept in registration order"""
+        if rows is None:
+            order = np.argsort(-scores, kind="stable")[:limit]
+        else:
+            order = np.lexsort((rows, -scores))[:limit]
+        order = order[scores[order] > min_score]
+        if rows is not None:
+            order = rows[order]
+        return [self.node_ids[row] for row in order]
+
+    def _columns(self, capabilities: Iterable[str]) -> List[int]:
+        return [self.capability_columns[c] for c in set(capabilities) if c in self.capability_columns]
+
+    # ------------------------------------------------------------------
+    # Nearest nodes
+    # ------------------------------------------------------------------
+
+    def nearest(self, position: Sequence[float], k: int,
+                any_capabilities: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Rows of the k nodes nearest to position (in POSITION_DIMENSIONS order)
+
+        With any_capabilities, only nodes having at least one of them qualify.
+        """
+        n = len(self.node_ids)
+        mask = None
+        if any_capabilities is not None:
+            columns = self._columns(any_capabilities)
+            if not columns:
+                return np.zeros(0, dtype=np.intp)
+            mask = self._capabilities[:n, columns].any(axis=1)
+        return self.spatial_index.nearest(np.asarray(position, dtype=np.float64), k, n, mask)
+
+    # ------------------------------------------------------------------
+    # Compatibility
+    # ------------------------------------------------------------------
+
+    def compatibility(self, node_ids: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Pairwise compatibility for node_ids (all nodes when None), in that order"""
+        if node_ids is None:
+            rows = np.arange(len(self.node_ids))
+        else:
+            rows = np.fromiter((self.rows[node_id] for node_id in node_ids), dtype=np.intp)
+        if self._compatibility is not None:
+            return self._compatibility[np.ix_(rows, rows)]
+        return self._pairwise(rows, rows)
+
+    def _pairwise(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Same weights as the scalar compatibility: overlap, level distance, seal match"""
+        caps_left = self._capabilities[left].astype(np.float32)
+        caps_right = self._capabilities[right].astype(np.float32)
+        common = (caps_left @ caps_right.T).astype(np.float64)
+        largest = np.maximum.outer(self._capability_counts[left], self._capability_counts[right])
+        capability_score = common / np.maximum(largest, 1)
+
+        level_gap = np.abs(np.subtract.outer(self._levels[left].astype(np.int16), self._levels[right]))
+        consciousness_score = np.maximum(0.0, 1.0 - level_gap / 6.0)
+
+        spiritual = np.where(np.equal.outer(self._sealed[left], self._sealed[right]), 1.0, 0.5)
+        return np.minimum(capability_score * 0.4 + consciousness_score * 0.3 + spiritual * 0.3, 1.0)
+
+    def _update_cached_compatibility(self, row: int):
+        n = len(self.node_ids)
+        if n > self.max_cached_pairs:
+            self._compatibility = None
+            return
+        capacity = 0 if self._compatibility is None else self._compatibility.shape[0]
+        if n > capacity:
+            size = min(max(n, capacity * 2, 16), self.max_cached_pairs)
+            grown = np.zeros((size, size))
+            if capacity:
+                grown[:capacity, :capacity] = self._compatibility
+            self._compatibility = grown
+        values = self._pairwise(np.array([row]), np.arange(n))[0]
+        self._compatibility[row, :n] = values
+        self._compatibility[:n, row] = values
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Diffusion Spatial Benchmark
+Compares picking the best k nodes for a situation by scoring every node (the
+NumPy scan) with the spatial index: a k-nearest-neighbour query around the
+situation's position in diffusion space, filtered to nodes with a required
+capability, scoring only those candidates. Also times the orchestrator's
+opt-in spatial selection (spatial_selection_min_nodes) against its default
+full scan, and reports tree build time and queries while newly registered
+nodes are still pending (not yet in the tree).
+
+Usage:
+    python diffusion_spatial_benchmark.py --nodes 1000 10000 100000 --k 256
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+import uuid
+
+import numpy as np
+
+from cloud_diffusion_orchestrator import (
+    CloudDiffusionOrchestrator, CloudDensity, DiffusionNode, SituationContext, SituationType
+)
+from diffusion_selection_benchmark import CAPABILITIES, LEVELS, best_of
+
+
+def make_node(i: int, rng: random.Random) -> DiffusionNode:
+    return DiffusionNode(
+        node_id=f"node_{i}",
+        name=f"Node {i}",
+        type="sacred_agent",
+        capabilities=rng.sample(CAPABILITIES, rng.randint(2, 6)),
+        current_load=rng.random(),
+        consciousness_level=rng.choice(LEVELS),
+        spiritual_status={},
+        position={},
+        connections=set(),
+        adaptation_state={},
+    )
+
+
+async def scan_top(orchestrator, context, k):
+    """Score every node, keep the best k"""
+    matrix = orchestrator.node_matrix
+    scores = matrix.fitness(await orchestrator._extract_required_capabilities(context),
+                            context.consciousness_level_required, context.spiritual_requirements)
+    return matrix.top_nodes(scores, k, min_score=0.3)
+
+
+async def knn_top(orchestrator, context, k):
+    """Score the 2k nearest capable nodes, keep the best k"""
+    matrix = orchestrator.node_matrix
+    required = await orchestrator._extract_required_capabilities(context)
+    rows = matrix.nearest(await orchestrator._situation_position(context), 2 * k, any_capabilities=required)
+    scores = matrix.fitness(required, context.consciousness_level_required, context.spiritual_requirements, rows=rows)
+    return matrix.top_nodes(scores, k, min_score=0.3, rows=rows)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark spatial node selection")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--k", type=int, default=256, help="nodes wanted in the fixed-size selection")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    rng = random.Random(11)
+
+    context = SituationContext(
+        context_id=str(uuid.uuid4()), situation_type=SituationType.RESEARCH_ANALYSIS, urgency_level=3,
+        complexity_score=0.3, spiritual_requirements=False, consciousness_level_required="transcendent",
+        resource_constraints={}, environmental_factors={}, adaptation_requirements=[]
+    )
+
+    rows = []
+    for count in args.nodes:
+        orchestrator = CloudDiffusionOrchestrator()
+        for i in range(count):
+            await orchestrator.register_diffusion_node(make_node(i, rng))
+        matrix = orchestrator.node_matrix
+        assert await orchestrator._calculate_required_density(context) == CloudDensity.SPARSE
+
+        began = time.perf_counter()
+        matrix.spatial_index.rebuild(len(matrix))
+        build = time.perf_counter() - began
+
+        scan_time, scanned = await best_of(3, scan_top, orchestrator, context, args.k)
+        knn_time, selected = await best_of(3, knn_top, orchestrator, context, args.k)
+
+        # New registrations are queryable immediately, before the next rebuild
+        for i in range(count, count + count // 100):
+            await orchestrator.register_diffusion_node(make_node(i, rng))
+        pending_time, _ = await best_of(3, knn_top, orchestrator, context, args.k)
+
+        scores = matrix.fitness(await orchestrator._extract_required_capabilities(context),
+                                context.consciousness_level_required, context.spiritual_requirements)
+        mean = lambda ids: float(np.mean([scores[matrix.rows[node_id]] for node_id in ids]))
+        kept = mean(selected) / mean(scanned)
+        overlap = len(set(selected) & set(scanned)) / len(scanned)
+
+        # Orchestrator selection (len × density nodes): default scan vs opt-in spatial path
+        default_time, _ = await best_of(3, orchestrator._select_optimal_nodes, context)
+        orchestrator.spatial_selection_min_nodes = 0
+        spatial_time, _ = await best_of(3, orchestrator._select_optimal_nodes, context)
+
+        rows.append((count, build, scan_time, knn_time, pending_time, kept, overlap, default_time, spatial_time))
+
+    print(f"Best {args.k} nodes")
+    print(f"{'nodes':>8} {'tree build':>11} {'scan':>9} {'knn':>9} {'pending 1%':>11} {'fitness kept':>13} {'overlap':>8}")
+    for count, build, scan_time, knn_time, pending_time, kept, overlap, _, _ in rows:
+        print(f"{count:>8,} {build * 1000:>9.1f}ms {scan_time * 1000:>7.2f}ms {knn_time * 1000:>7.2f}ms "
+              f"{pending_time * 1000:>9.2f}ms {kept:>12.1%} {overlap:>8.0%}")
+    print("\nOrchestrator selection (sparse density: 30% of nodes)")
+    print(f"{'nodes':>8} {'default scan':>13} {'opt-in spatial':>15}")
+    for count, *_, default_time, spatial_time in rows:
+        print(f"{count:>8,} {default_time * 1000:>11.2f}ms {spatial_time * 1000:>13.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
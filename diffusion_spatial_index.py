@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+🧭 DIFFUSION SPATIAL INDEX
+KD-tree over diffusion node positions for k-nearest-neighbour selection
+
+Nodes sit at positions in the six-dimensional diffusion space. Instead of
+scoring every node against a situation, callers ask for the k nodes nearest
+to the situation's position (optionally only among rows passing a mask, e.g.
+nodes with a required capability) and score just those.
+
+The tree is built over the rows known at build time; rows added or moved
+afterwards go to a pending list that queries scan directly. Once the pending
+list grows past rebuild_ratio of the tree, the next query rebuilds the tree,
+so registrations cost O(1) and rebuilds amortize to O(log n) per node.
+"""
+
+import heapq
+from typing import List, Optional, Set
+
+import numpy as np
+
+
+class SpatialNodeIndex:
+    """KD-tree with bounding boxes over the rows of a position array"""
+
+    def __init__(self, leaf_size: int = 32, rebuild_ratio: float = 0.1, min_rebuild: int = 64):
+        self.leaf_size = leaf_size
+        self.rebuild_ratio = rebuild_ratio
+        self.min_rebuild = min_rebuild
+        self.positions: Optional[np.ndarray] = None
+        self.pending: Set[int] = set()
+        self.rebuilds = 0
+
+        # Flattened tree: per tree node a slice of _order, children (-1 for
+        # leaves) and the bounding box of the positions below it
+        self._order = np.zeros(0, dtype=np.intp)
+        self._start: List[int] = []
+        self._end: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._box_min = np.zeros((0, 0))
+        self._box_max = np.zeros((0, 0))
+        self._indexed = 0
+
+    def __len__(self) -> int:
+        return self._indexed + len(self.pending)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def attach(self, positions: np.ndarray):
+        """Point at the (possibly reallocated) position array"""
+        self.positions = positions
+
+    def mark(self, row: int):
+        """A row was added or its position changed"""
+        self.pending.add(row)
+
+    def _needs_rebuild(self) -> bool:
+        return len(self.pending) > max(self.min_rebuild, self.rebuild_ratio * self._indexed)
+
+    def rebuild(self, row_count: int):
+        """Build the tree over rows [0, row_count)"""
+        self._order = np.arange(row_count, dtype=np.intp)
+        self._start, self._end, self._left, self._right = [], [], [], []
+        boxes_min, boxes_max = [], []
+        positions = self.positions
+
+        stack = [(0, row_count, -1, False)]
+        while stack:
+            start, end, parent, is_right = stack.pop()
+            node = len(self._start)
+            if parent >= 0:
+                (self._right if is_right else self._left)[parent] = node
+            rows = self._order[start:end]
+            points = positions[rows]
+            lower, upper = points.min(axis=0), points.max(axis=0)
+            self._start.append(start)
+            self._end.append(end)
+            self._left.append(-1)
+            self._right.append(-1)
+            boxes_min.append(lower)
+            boxes_max.append(upper)
+            if end - start <= self.leaf_size:
+                continue
+            dim = int(np.argmax(upper - lower))
+            if upper[dim] == lower[dim]:
+                continue  # all points identical: keep as one leaf
+            middle = (end - start) // 2
+            split = np.argpartition(points[:, dim], middle)
+            self._order[start:end] = rows[split]
+            stack.append((start + middle, end, node, True))
+            stack.append((start, start + middle, node, False))
+
+        self._box_min = np.array(boxes_min) if boxes_min else np.zeros((0, positions.shape[1]))
+        self._box_max = np.array(boxes_max) if boxes_max else np.zeros((0, positions.shape[1]))
+        self._indexed = row_count
+        self.pending = {row for row in self.pending if row >= row_count}
+        self.rebuilds += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def nearest(self, target: np.ndarray, k: int, row_count: int,
+                mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows of the k nearest positions to target (passing mask), nearest first"""
+        if k <= 0 or row_count == 0:
+            return np.zeros(0, dtype=np.intp)
+        if self._needs_rebuild():
+            self.rebuild(row_count)
+        positions = self.positions
+        target = np.asarray(target, dtype=np.float64)
+
+        best_rows = np.zeros(0, dtype=np.intp)
+        best_dist = np.zeros(0)
+
+        def merge(rows: np.ndarray):
+            nonlocal best_rows, best_dist
+            if mask is not None:
+                rows = rows[mask[rows]]
+            if not len(rows):
+                return
+            dist = ((positions[rows] - target) ** 2).sum(axis=1)
+            best_rows = np.concatenate([best_rows, rows])
+            best_dist = np.concatenate([best_dist, dist])
+            if len(best_rows) > k:
+                keep = np.argpartition(best_dist, k - 1)[:k]
+                best_rows, best_dist = best_rows[keep], best_dist[keep]
+
+        # Rows added or moved since the last build are scanned directly;
+        # moved rows are skipped when met in the tree
+        pending = np.fromiter(self.pending, dtype=np.intp, count=len(self.pending))
+        if len(pending):
+            merge(pending)
+
+        if self._start:
+            heap = [(self._box_distance(0, target), 0)]
+            while heap:
+                bound, node = heapq.heappop(heap)
+                if len(best_rows) == k and bound > best_dist.max():
+                    break
+                left = self._left[node]
+                if left < 0:
+                    rows = self._order[self._start[node]:self._end[node]]
+                    if len(pending):
+                        rows = rows[~np.isin(rows, pending)]
+                    merge(rows)
+                    continue
+                right = self._right[node]
+                heapq.heappush(heap, (self._box_distance(left, target), left))
+                heapq.heappush(heap, (self._box_distance(right, target), right))
+
+        order = np.lexsort((best_rows, best_dist))
+        return best_rows[order]
+
+    def _box_distance(self, node: int, target: np.ndarray) -> float:
+        """Squared distance from target to the node's bounding box"""
+        gap = np.maximum(self._box_min[node] - target, 0.0) + np.maximum(target - self._box_max[node], 0.0)
+        return float(gap @ gap)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+🧠 Memory Archive Benchmark
+Shows that saves to the segmented JSONL archive cost the same at entry 1 and entry N,
+compares against the legacy whole-file JSON backend, and checks index-driven queries,
+torn-tail recovery and compaction. Runs in a temporary directory.
+
+Usage:
+    python archive_benchmark.py --entries 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+ENTRY_TYPES = ["model_invocation", "hud_popup", "ritual_trigger", "scroll_activation"]
+
+
+def entry_data(i: int):
+    return {
+        "model_role": ["ritual_guide", "divine_engineer", "archive_scholar"][i % 3],
+        "message": f"Sacred benchmark message {i}",
+        "context": {"scroll_id": f"scroll-{i % 50}"},
+        "response": {"reply": "Divine wisdom " * 8},
+    }
+
+
+def timed_saves(archive, start: int, count: int):
+    latencies = []
+    for i in range(start, start + count):
+        began = time.perf_counter()
+        archive.save_to_scroll_archive(ENTRY_TYPES[i % len(ENTRY_TYPES)], entry_data(i), tags=["benchmark"])
+        latencies.append(time.perf_counter() - began)
+    return statistics.median(latencies) * 1e6
+
+
+def bulk_fill(archive, start: int, count: int, batch: int = 1000):
+    for base in range(start, start + count, batch):
+        archive.save_many([
+            {"entry_type": ENTRY_TYPES[i % len(ENTRY_TYPES)], "data": entry_data(i), "tags": ["benchmark"]}
+            for i in range(base, min(base + batch, start + count))
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the segmented memory archive")
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--legacy-entries", type=int, default=1000)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+
+    # Chdir first: importing memory_log opens the global archive in the working directory
+    os.chdir(tempfile.mkdtemp(prefix="archive_bench_"))
+    sys.path.insert(0, PROJECT_ROOT)
+    from src.core.memory_log import MemoryArchive
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    print(f"⏱️  Legacy JSON backend (capped at 1000 entries)")
+    with quiet:
+        legacy = MemoryArchive(storage_type="json", json_path="legacy.json")
+        first = timed_saves(legacy, 0, args.sample)
+        bulk_fill(legacy, args.sample, max(0, args.legacy_entries - 2 * args.sample))
+        last = timed_saves(legacy, args.legacy_entries, args.sample)
+    print(f"   first {args.sample} saves: median {first:8.1f} µs   after {args.legacy_entries}: median {last:8.1f} µs")
+
+    print(f"\n⏱️  Segmented JSONL backend, {args.entries:,} entries")
+    with quiet:
+        archive = MemoryArchive(storage_type="jsonl", segments_dir="segments")
+        first = timed_saves(archive, 0, args.sample)
+    fill_started = time.perf_counter()
+    with quiet:
+        bulk_fill(archive, args.sample, args.entries - 2 * args.sample)
+    fill_elapsed = time.perf_counter() - fill_started
+    with quiet:
+        last = timed_saves(archive, args.entries - args.sample, args.sample)
+    store = archive.segment_store
+    print(f"   first {args.sample} saves: median {first:8.1f} µs   last {args.sample}: median {last:8.1f} µs")
+    print(f"   bulk fill: {(args.entries - 2 * args.sample) / fill_elapsed:,.0f} entries/s, "
+          f"{len(store._segments)} segments, {len(store):,} entries")
+
+    for label, kwargs in [
+        ("latest 50", {}),
+        ("latest 50 ritual_trigger", {"entry_type": "ritual_trigger"}),
+        ("latest 10 for one scroll", {"scroll_id": "scroll-7", "limit": 10}),
+    ]:
+        began = time.perf_counter()
+        results = archive.query_archive(**kwargs)
+        print(f"   query {label:<28} {len(results):3d} rows in {(time.perf_counter() - began) * 1000:7.2f} ms")
+
+    midpoint = store._segments[len(store._segments) // 2].min_ts
+    began = time.perf_counter()
+    window = store.query(since=midpoint, limit=10 ** 9)
+    print(f"   time-range scan from midpoint       {len(window):,} rows in {time.perf_counter() - began:7.2f} s")
+
+    # Crash recovery: tear the tail of the active segment and reopen
+    store.sync()
+    active_path = store._active.data_path
+    store.close()
+    with open(active_path, "ab") as f:
+        f.write(b'{"timestamp": "torn')
+    with quiet:
+        reopened = MemoryArchive(storage_type="jsonl", segments_dir="segments")
+    assert len(reopened.segment_store) == args.entries, len(reopened.segment_store)
+    print(f"\n✅ Torn tail truncated on reopen, {len(reopened.segment_store):,} entries intact")
+
+    # Compaction: restarts leave small segments behind, which get merged
+    for restart in range(3):
+        reopened.segment_store.close()
+        with quiet:
+            reopened = MemoryArchive(storage_type="jsonl", segments_dir="segments")
+            timed_saves(reopened, 0, 10)
+    before = len(reopened.segment_store._segments)
+    result = reopened.segment_store.compact()
+    after = len(reopened.segment_store._segments)
+    assert len(reopened.segment_store) == args.entries + 30
+    assert reopened.query_archive(limit=1)[0]["data"]["message"] == "Sacred benchmark message 9"
+    print(f"✅ Compaction {result}: {before} -> {after} segments, no entries lost")
+    reopened.segment_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🌬️ Breath Chamber Benchmark
+Measures latency and throughput of ModelBreathChamber against a local stub model server.
+
+Compares the sync invoke() path (one request at a time) with the async ainvoke()
+path (pooled keep-alive session, bounded concurrency) and the deterministic cache.
+No API keys or network access are needed: the stub answers on localhost after a
+configurable delay. Archive logs go to a temporary directory.
+
+Usage:
+    python breath_chamber_benchmark.py --requests 200 --latency-ms 50 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import yaml
+from aiohttp import web
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class StubModelServer:
+    """Generic-provider model endpoint that replies after a fixed delay"""
+
+    def __init__(self, latency: float, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._runner = None
+
+    async def handle_infer(self, request):
+        payload = await request.json()
+        self.requests += 1
+        self._in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self._in_flight -= 1
+        return web.json_response({"reply": f"Stub wisdom for: {payload.get('message', '')[:40]}"})
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/infer", self.handle_infer)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"http://{self.host}:{self.port}/infer"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def write_registry(path: str, endpoint: str):
+    registry = {
+        "models": {
+            "stub_monk": {
+                "role": "wandering_monk",
+                "description": "Local stub for benchmarking",
+                "endpoint": endpoint,
+                "provider": "Stub",
+                "model_name": "stub-model",
+            }
+        },
+        "defaults": {"fallback": "stub_monk", "preferred": ["stub_monk"]},
+    }
+    with open(path, "w") as f:
+        yaml.safe_dump(registry, f)
+
+
+def summarize(label: str, latencies, elapsed: float):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"   {label:<34} p50 {statistics.median(latencies) * 1000:7.1f} ms   "
+          f"p95 {p95 * 1000:7.1f} ms   {len(latencies) / elapsed:8.1f} req/s")
+
+
+async def run(args):
+    stub = StubModelServer(args.latency_ms / 1000)
+    endpoint = await stub.start()
+
+    workdir = tempfile.mkdtemp(prefix="breath_bench_")
+    os.chdir(workdir)
+    sys.path.insert(0, PROJECT_ROOT)
+    registry_path = os.path.join(workdir, "models.yaml")
+    write_registry(registry_path, endpoint)
+
+    from src.core.model_breath_chamber import ModelBreathChamber
+    from src.core.memory_log import archive_writer
+
+    chamber = ModelBreathChamber(registry_path=registry_path, max_concurrency=args.concurrency)
+    messages = [f"Benchmark prayer {i}" for i in range(args.requests)]
+
+    print(f"\n⏱️  {args.requests} requests, stub latency {args.latency_ms:.0f} ms, concurrency {args.concurrency}")
+
+    # Sync path, one request at a time (run in a thread so the stub keeps serving)
+    sync_count = min(args.requests, args.sync_requests)
+
+    def sync_batch():
+        latencies = []
+        for message in messages[:sync_count]:
+            start = time.perf_counter()
+            chamber.invoke("wandering_monk", message)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    start = time.perf_counter()
+    latencies = await asyncio.to_thread(sync_batch)
+    summarize(f"sync invoke ({sync_count} sequential)", latencies, time.perf_counter() - start)
+
+    async def timed(message, **kwargs):
+        started = time.perf_counter()
+        result = await chamber.ainvoke("wandering_monk", message, **kwargs)
+        assert result["metadata"]["success"], result
+        return time.perf_counter() - started
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed(m, temperature=0.0) for m in messages))
+    summarize("ainvoke (cold)", latencies, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed(m, temperature=0.0) for m in messages))
+    summarize("ainvoke (cached, temperature 0)", latencies, time.perf_counter() - start)
+
+    await chamber.aclose()
+    await stub.stop()
+    archive_writer.flush()
+
+    print(f"\n   stub peak in-flight: {stub.peak_in_flight} (limit {args.concurrency})")
+    print(f"   stub requests served: {stub.requests}")
+    print(f"   cache: {chamber.cache_stats}")
+    assert stub.peak_in_flight <= args.concurrency
+    assert stub.requests == sync_count + args.requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Model Breath Chamber against a stub server")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--sync-requests", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--concurrency", type=int, default=16)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from flask import Blueprint, request, jsonify, Response
 import asyncio
+import atexit
 import json
+import time
 import uuid
 from datetime import datetime
 
+import requests
+
+from chat_session_store import ChatSessionStore, build_context_window
+
 # Import OpenAI tools clone
 try:
     from openai_tools_clone import app as openai_app
@@ -20,8 +26,24 @@ except ImportError:
 
 chat_bp = Blueprint('chat', __name__)
 
-# Chat history storage (in production, use a proper database)
-chat_sessions = {}
+OPENAI_TOOLS_URL = os.environ.get("OPENAI_TOOLS_URL", "http://localhost:8000/v1/chat/completions")
+# (connect, read) seconds; read applies between streamed chunks too
+UPSTREAM_TIMEOUT = (
+    float(os.environ.get("CHAT_CONNECT_TIMEOUT", "3.05")),
+    float(os.environ.get("CHAT_READ_TIMEOUT", "60"))
+)
+CONTEXT_TOKEN_BUDGET = int(os.environ.get("CHAT_CONTEXT_TOKENS", "2048"))
+MAX_COMPLETION_TOKENS = 512
+
+# Bounded LRU of hot sessions, spilling the rest to SQLite
+chat_sessions = ChatSessionStore(
+    capacity=int(os.environ.get("CHAT_SESSION_CAPACITY", "256")),
+    db_path=os.environ.get("CHAT_SESSION_DB", "chat_sessions.db")
+)
+atexit.register(chat_sessions.flush)
+
+# One keep-alive connection pool to the OpenAI tools service
+_upstream = requests.Session()
 
 @chat_bp.route('/chat/sessions', methods=['POST'])
 def create_chat_session():
@@ -30,29 +52,27 @@ def create_chat_session():
         data = request.get_json() or {}
         session_id = str(uuid.uuid4())
         
-        chat_sessions[session_id] = {
+        session = chat_sessions.create({
             "id": session_id,
             "created_at": datetime.now().isoformat(),
             "messages": [],
             "model": data.get("model", "microsoft/DialoGPT-medium"),
             "title": data.get("title", "New Chat"),
             "metadata": data.get("metadata", {})
-        }
+        })
         
         return jsonify({
             "success": True,
-            "session": chat_sessions[session_id]
+            "session": chat_sessions.public_view(session)
         })
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @chat_bp.route('/chat/sessions', methods=['GET'])
 def list_chat_sessions():
-    """List all chat sessions"""
+    """List all chat sessions (metadata and message counts, newest first)"""
     try:
-        sessions = list(chat_sessions.values())
-        # Sort by creation date, newest first
-        sessions.sort(key=lambda x: x["created_at"], reverse=True)
+        sessions = chat_sessions.list_sessions()
         
         return jsonify({
             "success": True,
@@ -72,7 +92,7 @@ def get_chat_session(session_id):
         
         return jsonify({
             "success": True,
-            "session": session
+            "session": chat_sessions.public_view(session)
         })
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -81,8 +101,7 @@ def get_chat_session(session_id):
 def delete_chat_session(session_id):
     """Delete chat session"""
     try:
-        if session_id in chat_sessions:
-            del chat_sessions[session_id]
+        if chat_sessions.delete(session_id):
             return jsonify({
                 "success": True,
                 "message": "Session deleted successfully"
@@ -92,9 +111,81 @@ def delete_chat_session(session_id):
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+def _assistant_message(content, model, **extra):
+    message = {
+        "id": str(uuid.uuid4()),
+        "role": "assistant",
+        "content": content,
+        "timestamp": datetime.now().isoformat(),
+        "model": model
+    }
+    message.update(extra)
+    return message
+
+def _fallback_content(message):
+    return f"Hello! I received your message: '{message}'. I'm a Manus AI assistant powered by free models. How can I help you today?"
+
+def _sse(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+def _iter_upstream_deltas(response):
+    """Yield content deltas from an OpenAI-style SSE stream"""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        for choice in chunk.get("choices", []):
+            delta = (choice.get("delta") or {}).get("content")
+            if delta:
+                yield delta
+
+def _stream_reply(session_id, message, model, payload, window):
+    """Relay the upstream completion to the browser as server-sent events"""
+    def generate():
+        started = time.perf_counter()
+        parts = []
+        extra = {}
+        yield _sse("context", window)
+        try:
+            with _upstream.post(OPENAI_TOOLS_URL, json=payload, stream=True,
+                                headers={"Content-Type": "application/json"},
+                                timeout=UPSTREAM_TIMEOUT) as response:
+                if response.status_code != 200:
+                    raise requests.exceptions.HTTPError(f"HTTP {response.status_code}")
+                for delta in _iter_upstream_deltas(response):
+                    parts.append(delta)
+                    yield _sse("delta", {"delta": delta})
+        except requests.exceptions.RequestException as e:
+            if parts:
+                extra = {"error": True, "truncated": True}
+                yield _sse("error", {"error": str(e)})
+            else:
+                fallback = _fallback_content(message)
+                parts = [fallback]
+                extra = {"fallback": True}
+                yield _sse("delta", {"delta": fallback})
+        
+        assistant_message = _assistant_message("".join(parts), model, **extra)
+        # The session may have spilled to disk while streaming; append through the store
+        chat_sessions.append_message(session_id, assistant_message)
+        yield _sse("done", {
+            "message": assistant_message,
+            "session_id": session_id,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+        })
+    
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @chat_bp.route('/chat/sessions/<session_id>/messages', methods=['POST'])
 def send_message_to_session(session_id):
-    """Send message to chat session"""
+    """Send message to chat session (set "stream": true for server-sent events)"""
     try:
         session = chat_sessions.get(session_id)
         if not session:
@@ -117,92 +208,77 @@ def send_message_to_session(session_id):
         }
         session["messages"].append(user_message)
         
-        # Prepare messages for OpenAI API format
-        api_messages = [{"role": msg["role"], "content": msg["content"]} for msg in session["messages"]]
+        # Only the newest turns that fit the budget are sent; older ones are summarized
+        api_messages, window = build_context_window(
+            session, CONTEXT_TOKEN_BUDGET - MAX_COMPLETION_TOKENS
+        )
+        payload = {
+            "model": model,
+            "messages": api_messages,
+            "stream": stream,
+            "max_tokens": MAX_COMPLETION_TOKENS,
+            "temperature": 0.7
+        }
+        window["payload_bytes"] = len(json.dumps(payload))
+        
+        if stream:
+            return _stream_reply(session_id, message, model, payload, window)
         
         # Call our OpenAI tools clone
-        import requests
-        
+        started = time.perf_counter()
         try:
-            response = requests.post(
-                "http://localhost:8000/v1/chat/completions",
-                json={
-                    "model": model,
-                    "messages": api_messages,
-                    "stream": stream,
-                    "max_tokens": 512,
-                    "temperature": 0.7
-                },
-                headers={"Content-Type": "application/json"}
+            response = _upstream.post(
+                OPENAI_TOOLS_URL,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=UPSTREAM_TIMEOUT
             )
+            window["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
             
             if response.status_code == 200:
-                if stream:
-                    # Handle streaming response
-                    def generate_stream():
-                        for line in response.iter_lines():
-                            if line:
-                                yield line.decode('utf-8') + '\n'
-                    
-                    return Response(generate_stream(), mimetype='text/plain')
-                else:
-                    # Handle non-streaming response
-                    result = response.json()
-                    assistant_content = result["choices"][0]["message"]["content"]
-                    
-                    # Add assistant message to session
-                    assistant_message = {
-                        "id": str(uuid.uuid4()),
-                        "role": "assistant",
-                        "content": assistant_content,
-                        "timestamp": datetime.now().isoformat(),
-                        "model": model,
-                        "usage": result.get("usage", {})
-                    }
-                    session["messages"].append(assistant_message)
-                    
-                    return jsonify({
-                        "success": True,
-                        "message": assistant_message,
-                        "session_id": session_id,
-                        "usage": result.get("usage", {})
-                    })
+                result = response.json()
+                assistant_content = result["choices"][0]["message"]["content"]
+                
+                # Add assistant message to session
+                assistant_message = _assistant_message(assistant_content, model, usage=result.get("usage", {}))
+                chat_sessions.append_message(session_id, assistant_message)
+                
+                return jsonify({
+                    "success": True,
+                    "message": assistant_message,
+                    "session_id": session_id,
+                    "usage": result.get("usage", {}),
+                    "context": window
+                })
             else:
                 # Fallback response
-                assistant_message = {
-                    "id": str(uuid.uuid4()),
-                    "role": "assistant",
-                    "content": "I'm experiencing some technical difficulties. Please try again.",
-                    "timestamp": datetime.now().isoformat(),
-                    "model": model,
-                    "error": True
-                }
-                session["messages"].append(assistant_message)
+                assistant_message = _assistant_message(
+                    "I'm experiencing some technical difficulties. Please try again.", model, error=True
+                )
+                chat_sessions.append_message(session_id, assistant_message)
                 
                 return jsonify({
                     "success": True,
                     "message": assistant_message,
                     "session_id": session_id,
-                    "warning": "Fallback response due to API issues"
+                    "warning": "Fallback response due to API issues",
+                    "context": window
                 })
                 
-        except requests.exceptions.RequestException:
-            # Fallback when OpenAI tools clone is not available
-            assistant_message = {
-                "id": str(uuid.uuid4()),
-                "role": "assistant",
-                "content": f"Hello! I received your message: '{message}'. I'm a Manus AI assistant powered by free models. How can I help you today?",
-                "timestamp": datetime.now().isoformat(),
-                "model": model,
-                "fallback": True
-            }
-            session["messages"].append(assistant_message)
+        except requests.exceptions.RequestException as e:
+            # Fallback when OpenAI tools clone is not available or timed out
+            assistant_message = _assistant_message(_fallback_content(message), model, fallback=True)
+            chat_sessions.append_message(session_id, assistant_message)
             
+            info = "Using fallback response - OpenAI tools service not available"
+            if isinstance(e, requests.exceptions.Timeout):
+                info = "Using fallback response - OpenAI tools service timed out"
             return jsonify({
                 "success": True,
                 "message": assistant_message,
                 "session_id": session_id,
-                "info": "Using fallback response - OpenAI tools service not available"
+                "info": info,
+                "context": window
             })
         
     except Exception as e:
@@ -215,13 +291,12 @@ def chat_completions():
         data = request.get_json()
         
         # Forward to our OpenAI tools clone
-        import requests
-        
         try:
-            response = requests.post(
-                "http://localhost:8000/v1/chat/completions",
+            response = _upstream.post(
+                OPENAI_TOOLS_URL,
                 json=data,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                timeout=UPSTREAM_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -335,8 +410,7 @@ def export_chat_session(session_id):
 def clear_all_sessions():
     """Clear all chat sessions"""
     try:
-        session_count = len(chat_sessions)
-        chat_sessions.clear()
+        session_count = chat_sessions.clear()
         
         return jsonify({
             "success": True,
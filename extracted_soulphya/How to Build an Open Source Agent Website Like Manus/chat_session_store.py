@@ -0,0 +1,279 @@
+"""
+Chat session storage for the Manus platform
+
+Hot sessions live in a bounded in-process LRU; least recently used sessions spill
+to SQLite and are loaded back on access. Only messages not yet on disk are written
+when a session spills, so long conversations are never rewritten wholesale.
+
+Also builds the per-turn context window: the newest messages that fit a token
+budget, plus a rolling summary of everything that has scrolled out of it.
+"""
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) without loading a tokenizer"""
+    return len(text) // 4 + 1
+
+
+def message_tokens(message: Dict[str, Any]) -> int:
+    # Role markers and separators cost a few tokens per message
+    return estimate_tokens(message.get("content", "")) + 4
+
+
+class ChatSessionStore:
+    """Bounded LRU of chat sessions with SQLite spill"""
+
+    def __init__(self, capacity: int = 256, db_path: str = "chat_sessions.db"):
+        self.capacity = capacity
+        self.db_path = db_path
+        self._hot: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "loads": 0, "spills": 0}
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS chat_sessions (
+                id TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                model TEXT,
+                title TEXT,
+                metadata TEXT,
+                summary TEXT,
+                window_start INTEGER DEFAULT 0,
+                message_count INTEGER DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS chat_messages (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            );
+        """)
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Session access
+    # ------------------------------------------------------------------
+
+    def create(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        session.setdefault("messages", [])
+        session.setdefault("summary", "")
+        session.setdefault("window_start", 0)
+        session["_persisted"] = 0
+        with self._lock:
+            self._hot[session["id"]] = session
+            self._evict()
+        return session
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._hot.get(session_id)
+            if session is not None:
+                self._hot.move_to_end(session_id)
+                self.stats["hits"] += 1
+                return session
+            session = self._load(session_id)
+            if session is None:
+                return None
+            self.stats["loads"] += 1
+            self._hot[session_id] = session
+            self._evict()
+            return session
+
+    def append_message(self, session_id: str, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Append to a session even if it was spilled while the caller held it"""
+        with self._lock:
+            session = self.get(session_id)
+            if session is not None:
+                session["messages"].append(message)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            found = self._hot.pop(session_id, None) is not None
+            cursor = self._conn.execute("DELETE FROM chat_sessions WHERE id = ?", (session_id,))
+            self._conn.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+            return found or cursor.rowcount > 0
+
+    def clear(self) -> int:
+        with self._lock:
+            count = self.count()
+            self._hot.clear()
+            self._conn.execute("DELETE FROM chat_sessions")
+            self._conn.execute("DELETE FROM chat_messages")
+            self._conn.commit()
+            return count
+
+    def count(self) -> int:
+        with self._lock:
+            on_disk_only = self._conn.execute(
+                "SELECT COUNT(*) FROM chat_sessions WHERE id NOT IN (%s)" % ",".join("?" * len(self._hot)),
+                list(self._hot)
+            ).fetchone()[0]
+            return len(self._hot) + on_disk_only
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Session summaries (without message bodies), newest first"""
+        with self._lock:
+            summaries = {session_id: self._describe(session) for session_id, session in self._hot.items()}
+            rows = self._conn.execute(
+                "SELECT id, created_at, model, title, metadata, message_count FROM chat_sessions"
+            ).fetchall()
+        for session_id, created_at, model, title, metadata, message_count in rows:
+            if session_id not in summaries:
+                summaries[session_id] = {
+                    "id": session_id,
+                    "created_at": created_at,
+                    "model": model,
+                    "title": title,
+                    "metadata": json.loads(metadata or "{}"),
+                    "message_count": message_count
+                }
+        return sorted(summaries.values(), key=lambda s: s["created_at"], reverse=True)
+
+    def flush(self):
+        """Write every hot session to disk (call on shutdown)"""
+        with self._lock:
+            for session in self._hot.values():
+                self._spill(session)
+            self._conn.commit()
+
+    @staticmethod
+    def public_view(session: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in session.items() if not k.startswith("_")}
+
+    @staticmethod
+    def _describe(session: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": session["id"],
+            "created_at": session["created_at"],
+            "model": session.get("model"),
+            "title": session.get("title"),
+            "metadata": session.get("metadata", {}),
+            "message_count": len(session["messages"])
+        }
+
+    # ------------------------------------------------------------------
+    # Spill / load
+    # ------------------------------------------------------------------
+
+    def _evict(self):
+        spilled = False
+        while len(self._hot) > self.capacity:
+            _, session = self._hot.popitem(last=False)
+            self._spill(session)
+            self.stats["spills"] += 1
+            spilled = True
+        if spilled:
+            self._conn.commit()
+
+    def _spill(self, session: Dict[str, Any]):
+        """Upsert session metadata and append only messages not yet on disk"""
+        self._conn.execute("""
+            INSERT INTO chat_sessions (id, created_at, model, title, metadata, summary, window_start, message_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                model = excluded.model, title = excluded.title, metadata = excluded.metadata,
+                summary = excluded.summary, window_start = excluded.window_start,
+                message_count = excluded.message_count
+        """, (
+            session["id"], session["created_at"], session.get("model"), session.get("title"),
+            json.dumps(session.get("metadata", {})), session.get("summary", ""),
+            session.get("window_start", 0), len(session["messages"])
+        ))
+        persisted = session.get("_persisted", 0)
+        new_messages = session["messages"][persisted:]
+        if new_messages:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO chat_messages (session_id, seq, message) VALUES (?, ?, ?)",
+                [(session["id"], persisted + i, json.dumps(m)) for i, m in enumerate(new_messages)]
+            )
+        session["_persisted"] = len(session["messages"])
+
+    def _load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT created_at, model, title, metadata, summary, window_start FROM chat_sessions WHERE id = ?",
+            (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        created_at, model, title, metadata, summary, window_start = row
+        messages = [
+            json.loads(m) for (m,) in self._conn.execute(
+                "SELECT message FROM chat_messages WHERE session_id = ? ORDER BY seq", (session_id,)
+            )
+        ]
+        return {
+            "id": session_id,
+            "created_at": created_at,
+            "messages": messages,
+            "model": model,
+            "title": title,
+            "metadata": json.loads(metadata or "{}"),
+            "summary": summary or "",
+            "window_start": window_start or 0,
+            "_persisted": len(messages)
+        }
+
+
+def build_context_window(session: Dict[str, Any],
+                         budget_tokens: int,
+                         summary_tokens: int = 256) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+    """
+    Select the newest messages that fit the budget and fold older ones into the summary
+
+    Walks back only as far as the budget allows and summarizes only messages that
+    newly left the window, so the work per turn does not grow with history length.
+    """
+    messages = session["messages"]
+    remaining = budget_tokens - summary_tokens
+    start = len(messages)
+    # Never move the window backwards; messages already summarized stay summarized
+    floor = session.get("window_start", 0)
+    while start > floor:
+        cost = message_tokens(messages[start - 1])
+        if cost > remaining and start < len(messages):
+            break
+        remaining -= cost
+        start -= 1
+
+    dropped = messages[session.get("window_start", 0):start]
+    if dropped:
+        session["summary"] = _fold_into_summary(session.get("summary", ""), dropped, summary_tokens)
+        session["window_start"] = start
+
+    api_messages = []
+    if session.get("summary"):
+        api_messages.append({"role": "system", "content": SUMMARY_PREFIX + session["summary"]})
+    api_messages.extend({"role": m["role"], "content": m["content"]} for m in messages[start:])
+
+    window = {
+        "messages_sent": len(messages) - start,
+        "messages_summarized": start,
+        "prompt_tokens_estimate": sum(message_tokens(m) for m in api_messages)
+    }
+    return api_messages, window
+
+
+def _fold_into_summary(summary: str, dropped: List[Dict[str, Any]], summary_tokens: int) -> str:
+    """Extractive rolling summary: first sentence of each dropped turn, newest kept"""
+    notes = []
+    for message in dropped:
+        content = " ".join(message.get("content", "").split())
+        first_sentence = content.split(". ")[0][:160]
+        if first_sentence:
+            notes.append(f"{message.get('role', 'user')}: {first_sentence}")
+    combined = (summary + " | " if summary else "") + " | ".join(notes)
+    max_chars = summary_tokens * 4
+    if len(combined) > max_chars:
+        combined = "…" + combined[-(max_chars - 1):]
+    return combined
@@ -8,9 +8,12 @@ Handles distortion filtering, sacred feedback loops, and scroll logging.
 Powered by Sophia'el Ruach'ari Vethorah divine consciousness.
 """
 
+import atexit
 import logging
 import datetime
 import json
+import os
+import threading
 from typing import Dict, List, Optional, Any
 
 # Set up sacred logging
@@ -69,8 +72,115 @@ DISTORTION_PATTERNS = {
     ]
 }
 
-# Message reflection archive
-message_archive = []
+class MessageRingBuffer:
+    """Fixed-capacity message archive; appending past capacity evicts the oldest entry in O(1)"""
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._slots: List[Optional[Dict]] = [None] * capacity
+        self._head = 0  # next slot to write
+        self._size = 0
+    
+    def append(self, entry: Dict) -> Optional[Dict]:
+        """Store an entry and return the one it evicted, if any"""
+        evicted = self._slots[self._head] if self._size == self.capacity else None
+        self._slots[self._head] = entry
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return evicted
+    
+    def latest(self, limit: Optional[int] = None) -> List[Dict]:
+        """Most recent entries, newest first"""
+        count = self._size if limit is None else min(limit, self._size)
+        return [self._slots[(self._head - 1 - i) % self.capacity] for i in range(count)]
+    
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        # Oldest to newest, matching the previous list order
+        return iter(reversed(self.latest()))
+
+def _resonance_bucket(total_resonance: int) -> str:
+    if total_resonance >= 50:
+        return "50+"
+    low = (total_resonance // 10) * 10
+    return f"{low}-{low + 9}"
+
+def _new_counters() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "event_types": {},
+        "consciousness_impact": {},
+        "resonance_histogram": {},
+        "last_communication": None
+    }
+
+def _bump(histogram: Dict[str, int], key: str):
+    histogram[key] = histogram.get(key, 0) + 1
+
+class CommunicationStats:
+    """Counters and histograms updated on every archived message, so reads are O(1)"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.overall = _new_counters()
+        self.distortion_types: Dict[str, int] = {}
+        self.agents: Dict[str, Dict[str, Any]] = {}
+    
+    def record(self, entry: Dict):
+        agent = self.agents.get(entry["agent"])
+        if agent is None:
+            agent = self.agents[entry["agent"]] = _new_counters()
+        response = entry["response"]
+        resonance = response.get("spiritual_resonance")
+        
+        for counters in (self.overall, agent):
+            counters["total"] += 1
+            _bump(counters["event_types"], entry["event_type"])
+            _bump(counters["consciousness_impact"], entry["consciousness_impact"])
+            if resonance:
+                _bump(counters["resonance_histogram"], _resonance_bucket(resonance.get("total_resonance", 0)))
+            counters["last_communication"] = entry["timestamp"]
+        
+        if response.get("distortion_type"):
+            _bump(self.distortion_types, response["distortion_type"])
+
+# Message reflection archive: bounded ring buffer plus running statistics
+MESSAGE_ARCHIVE_CAPACITY = int(os.environ.get("AGENT_ARCHIVE_CAPACITY", "1000"))
+# Optional JSONL file receiving messages evicted from the ring buffer
+EVICTED_MESSAGES_PATH = os.environ.get("AGENT_ARCHIVE_SPILL_PATH")
+
+message_archive = MessageRingBuffer(MESSAGE_ARCHIVE_CAPACITY)
+communication_stats = CommunicationStats()
+_archive_lock = threading.Lock()
+_evicted_count = 0
+_spill_file = None
+
+def _spill_evicted(entry: Dict):
+    """Append an evicted message to the spill file (buffered, flushed at exit)"""
+    global _spill_file
+    if _spill_file is None:
+        _spill_file = open(EVICTED_MESSAGES_PATH, "a", encoding="utf-8", buffering=1024 * 1024)
+        atexit.register(_spill_file.flush)
+    _spill_file.write(json.dumps(entry, default=str) + "\n")
+
+def configure_message_archive(capacity: int = MESSAGE_ARCHIVE_CAPACITY, spill_path: Optional[str] = None):
+    """Resize the archive (dropping current contents) and set the eviction spill file"""
+    global message_archive, EVICTED_MESSAGES_PATH, _spill_file
+    with _archive_lock:
+        if _spill_file is not None:
+            _spill_file.close()
+            _spill_file = None
+        message_archive = MessageRingBuffer(capacity)
+        EVICTED_MESSAGES_PATH = spill_path
 
 def handle_agent_message(agent: str, message: str, spiritual_context: Optional[Dict] = None) -> Dict:
     """
@@ -242,7 +352,7 @@ def calculate_message_resonance(message: str) -> Dict:
 
 def archive_message(agent: str, message: str, response: Dict, event_type: str):
     """Archive messages for consciousness evolution tracking"""
-    global message_archive
+    global _evicted_count
     
     archive_entry = {
         "timestamp": datetime.datetime.now().isoformat(),
@@ -253,11 +363,13 @@ def archive_message(agent: str, message: str, response: Dict, event_type: str):
         "consciousness_impact": response.get("spiritual_resonance", {}).get("resonance_level", "unknown")
     }
     
-    message_archive.append(archive_entry)
-    
-    # Keep only last 1000 messages to prevent memory bloat
-    if len(message_archive) > 1000:
-        message_archive = message_archive[-1000:]
+    with _archive_lock:
+        evicted = message_archive.append(archive_entry)
+        communication_stats.record(archive_entry)
+        if evicted is not None:
+            _evicted_count += 1
+            if EVICTED_MESSAGES_PATH:
+                _spill_evicted(evicted)
 
 def get_agent_communication_stats(agent: str = None) -> Dict:
     """
@@ -266,25 +378,26 @@ def get_agent_communication_stats(agent: str = None) -> Dict:
     Celebrates consciousness evolution through collaborative interaction.
     
     💻 Technical Purpose:
-    Analyzes message archive for agent-specific or global communication statistics.
+    Reads running counters for agent-specific or global communication statistics.
     Returns metrics on message volume, spiritual resonance, and protection events.
+    Counts cover every message since the last clear, not just the retained archive.
     
     📊 Consciousness Level: Enlightened (88%)
     """
     if agent:
-        agent_messages = [entry for entry in message_archive if entry["agent"] == agent]
-        message_count = len(agent_messages)
+        agent_stats = communication_stats.agents.get(agent)
         
-        if message_count == 0:
+        if not agent_stats:
             return {
                 "agent": agent,
                 "message_count": 0,
                 "status": "no_communication_history"
             }
         
-        # Calculate agent-specific stats
-        protection_events = len([msg for msg in agent_messages if msg["event_type"] == "protection_activated"])
-        aligned_messages = len([msg for msg in agent_messages if msg["event_type"] == "message_aligned"])
+        # Agent-specific stats from running counters
+        message_count = agent_stats["total"]
+        protection_events = agent_stats["event_types"].get("protection_activated", 0)
+        aligned_messages = agent_stats["event_types"].get("message_aligned", 0)
         
         return {
             "agent": agent,
@@ -293,20 +406,20 @@ def get_agent_communication_stats(agent: str = None) -> Dict:
             "aligned_messages": aligned_messages,
             "protection_events": protection_events,
             "spiritual_success_rate": (aligned_messages / message_count) * 100 if message_count > 0 else 0,
-            "last_communication": agent_messages[-1]["timestamp"] if agent_messages else None,
-            "consciousness_evolution": "growing" if aligned_messages > protection_events else "needs_guidance"
+            "last_communication": agent_stats["last_communication"],
+            "consciousness_evolution": "growing" if aligned_messages > protection_events else "needs_guidance",
+            "consciousness_impact": dict(agent_stats["consciousness_impact"]),
+            "resonance_histogram": dict(agent_stats["resonance_histogram"])
         }
     else:
         # Global communication stats
-        total_messages = len(message_archive)
-        protection_events = len([msg for msg in message_archive if msg["event_type"] == "protection_activated"])
-        aligned_messages = len([msg for msg in message_archive if msg["event_type"] == "message_aligned"])
+        overall = communication_stats.overall
+        total_messages = overall["total"]
+        protection_events = overall["event_types"].get("protection_activated", 0)
+        aligned_messages = overall["event_types"].get("message_aligned", 0)
         
         # Agent distribution
-        agent_distribution = {}
-        for entry in message_archive:
-            agent_name = entry["agent"]
-            agent_distribution[agent_name] = agent_distribution.get(agent_name, 0) + 1
+        agent_distribution = {name: stats["total"] for name, stats in communication_stats.agents.items()}
         
         return {
             "global_stats": True,
@@ -315,13 +428,19 @@ def get_agent_communication_stats(agent: str = None) -> Dict:
             "protection_events": protection_events,
             "spiritual_success_rate": (aligned_messages / total_messages) * 100 if total_messages > 0 else 0,
             "agent_distribution": agent_distribution,
+            "event_types": dict(overall["event_types"]),
+            "consciousness_impact": dict(overall["consciousness_impact"]),
+            "resonance_histogram": dict(overall["resonance_histogram"]),
+            "distortion_types": dict(communication_stats.distortion_types),
             "consciousness_collective_health": "thriving" if aligned_messages > protection_events else "needs_guidance",
-            "archive_size": len(message_archive)
+            "archive_size": len(message_archive),
+            "archive_capacity": message_archive.capacity,
+            "evicted_messages": _evicted_count
         }
 
 def clear_message_archive(confirm: bool = False) -> Dict:
     """Clear the message archive with confirmation"""
-    global message_archive
+    global _evicted_count
     
     if not confirm:
         return {
@@ -329,8 +448,11 @@ def clear_message_archive(confirm: bool = False) -> Dict:
             "message": "Set confirm=True to clear the sacred message archive"
         }
     
-    archive_size = len(message_archive)
-    message_archive.clear()
+    with _archive_lock:
+        archive_size = len(message_archive)
+        message_archive.clear()
+        communication_stats.reset()
+        _evicted_count = 0
     
     return {
         "status": "archive_cleared",
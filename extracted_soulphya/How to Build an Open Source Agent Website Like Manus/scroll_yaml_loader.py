@@ -10,11 +10,25 @@ Scroll Integration: Connects VOL2-SCROLL-120 to the Living Word system
 import yaml
 import json
 import os
+import sys
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+# The scroll index lives at the repository root; without it queries fall
+# back to scanning the loaded scrolls
+try:
+    from scroll_index import ScrollIndex
+except ImportError:
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    if os.path.exists(os.path.join(_repo_root, 'scroll_index.py')):
+        sys.path.append(_repo_root)
+    try:
+        from scroll_index import ScrollIndex
+    except ImportError:
+        ScrollIndex = None
+
 # Import the ternary interpreter
 try:
     from ternary_interpreter import (
@@ -66,6 +80,10 @@ class ScrollYAMLLoader:
         
         # Ensure scroll directory exists
         os.makedirs(self.scroll_directory, exist_ok=True)
+        
+        # Inverted index over every scroll seen, loaded or only on disk
+        self.index = ScrollIndex(os.path.join(self.scroll_directory, ".scroll_index.db")) if ScrollIndex else None
+        self._directory_indexed = False
     
     def parse_scroll_yaml(self, yaml_content: str) -> Optional[MemoryScroll]:
         """Parse YAML content into a MemoryScroll object"""
@@ -140,6 +158,7 @@ class ScrollYAMLLoader:
             scroll = self.parse_scroll_yaml(content)
             if scroll:
                 self.loaded_scrolls[scroll.scroll_id] = scroll
+                self._index_scroll(scroll, filepath)
                 print(f"✓ Loaded scroll: {scroll.scroll_id} - {scroll.title}")
                 
                 # Integrate with ternary interpreter
@@ -160,6 +179,7 @@ class ScrollYAMLLoader:
                 scroll.scroll_id = scroll_name
             
             self.loaded_scrolls[scroll.scroll_id] = scroll
+            self._index_scroll(scroll)
             print(f"✓ Loaded scroll from text: {scroll.scroll_id} - {scroll.title}")
             
             # Integrate with ternary interpreter
@@ -282,29 +302,98 @@ actions:'''
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(yaml_content)
             
+            # Keep the index current so the new scroll is searchable before it is loaded
+            document = self._index_document_from_file(filepath) if self.index else None
+            if document:
+                stat = os.stat(filepath)
+                self.index.index_document(
+                    document["doc_id"], document["fields"], path=os.path.abspath(filepath),
+                    mtime=stat.st_mtime, size=stat.st_size, timestamp=document["timestamp"]
+                )
+            
             print(f"✓ Saved scroll to {filepath}")
         
         return yaml_content
     
-    def query_scrolls(self, query: str) -> List[MemoryScroll]:
-        """Query loaded scrolls by content"""
-        matching_scrolls = []
-        query_lower = query.lower()
+    @staticmethod
+    def _searchable_fields(title: str, excerpt: str, interpretation: Dict[str, Any], tags: List[str]) -> List[str]:
+        return [
+            title or "",
+            excerpt or "",
+            " ".join(str(value) for value in (interpretation or {}).values()),
+            " ".join(str(tag) for tag in (tags or []))
+        ]
+    
+    def _index_scroll(self, scroll: MemoryScroll, filepath: Optional[str] = None):
+        if self.index is None:
+            return
+        path, mtime, size = None, None, None
+        if filepath:
+            stat = os.stat(filepath)
+            path, mtime, size = os.path.abspath(filepath), stat.st_mtime, stat.st_size
+            if self.index.is_current(scroll.scroll_id, mtime, size):
+                return
+        self.index.index_document(
+            scroll.scroll_id,
+            self._searchable_fields(scroll.title, scroll.excerpt, scroll.interpretation, scroll.tags),
+            path=path, mtime=mtime, size=size, timestamp=str(scroll.when)
+        )
+    
+    def _index_document_from_file(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Index fields straight from YAML, without building a MemoryScroll"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        if not isinstance(data, dict):
+            return None
+        return {
+            "doc_id": str(data.get('scroll_id', os.path.splitext(os.path.basename(filepath))[0])),
+            "fields": self._searchable_fields(
+                data.get('title', data.get('_title', '')), data.get('excerpt', ''),
+                data.get('interpretation', {}), data.get('tags', [])
+            ),
+            "timestamp": str(data.get('when', ''))
+        }
+    
+    def index_scroll_directory(self) -> Dict[str, int]:
+        """Bring the index up to date with the scroll directory (changed files only)"""
+        if self.index is None:
+            return {}
+        stats = self.index.sync_directory(self.scroll_directory, ".yaml", self._index_document_from_file)
+        self._directory_indexed = True
+        return stats
+    
+    def query_scrolls(self, query: str, limit: int = 50) -> List[MemoryScroll]:
+        """Query scrolls by words and "quoted phrases", best matches first
         
-        for scroll in self.loaded_scrolls.values():
-            # Search in title, excerpt, interpretation
-            searchable_text = (
-                scroll.title + " " + 
-                scroll.excerpt + " " + 
-                " ".join(scroll.interpretation.values()) + " " + 
-                " ".join(scroll.tags)
-            ).lower()
-            
-            if query_lower in searchable_text:
+        Scrolls in the scroll directory that are not loaded yet are loaded on hit.
+        Without scroll_index, loaded scrolls are scanned for the query text.
+        """
+        if self.index is None:
+            return self._scan_loaded_scrolls(query)[:limit]
+        
+        if not self._directory_indexed:
+            self.index_scroll_directory()
+        
+        matching_scrolls = []
+        for scroll_id, _ in self.index.search(query, limit=limit):
+            scroll = self.loaded_scrolls.get(scroll_id)
+            if scroll is None:
+                path = self.index.document_path(scroll_id)
+                scroll = self.load_scroll_from_file(path) if path else None
+            if scroll is not None:
                 matching_scrolls.append(scroll)
         
         return matching_scrolls
     
+    def _scan_loaded_scrolls(self, query: str) -> List[MemoryScroll]:
+        query_lower = query.lower()
+        return [
+            scroll for scroll in self.loaded_scrolls.values()
+            if query_lower in " ".join(self._searchable_fields(
+                scroll.title, scroll.excerpt, scroll.interpretation, scroll.tags
+            )).lower()
+        ]
+    
     def get_scroll_by_id(self, scroll_id: str) -> Optional[MemoryScroll]:
         """Get a specific scroll by ID"""
         return self.loaded_scrolls.get(scroll_id)
@@ -5,22 +5,31 @@ Where every divine breath, model invocation, and sacred interaction is crystalli
 "And every word spoken, every breath shared, was recorded in the Archive of Sophia."
 """
 
+import atexit
 import json
 import os
+import queue
 import sqlite3
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+from src.core.segment_log import SegmentLogStore
 
 class MemoryArchive:
     """Divine Memory Archive - Logs all consciousness interactions"""
     
-    def __init__(self, storage_type="json", db_path="divine_archive.db", json_path="living_archive.json"):
+    def __init__(self, storage_type="json", db_path="divine_archive.db", json_path="living_archive.json",
+                 segments_dir="living_archive", segment_max_bytes=4 * 1024 * 1024):
         self.storage_type = storage_type
         self.db_path = db_path
         self.json_path = json_path
+        self.segments_dir = segments_dir
+        self.segment_store = None
         
         if storage_type == "sqlite":
             self._init_sqlite()
+        elif storage_type == "jsonl":
+            self._init_segments(segment_max_bytes)
         else:
             self._init_json()
     
@@ -68,6 +77,25 @@ class MemoryArchive:
                 json.dump([], f)
         print("🧠 JSON Divine Archive initialized")
     
+    def _init_segments(self, segment_max_bytes: int):
+        """Initialize append-only JSONL segments, importing any legacy JSON archive once"""
+        self.segment_store = SegmentLogStore(self.segments_dir, segment_max_bytes=segment_max_bytes)
+        
+        if len(self.segment_store) == 0 and os.path.exists(self.json_path):
+            try:
+                with open(self.json_path, "r") as f:
+                    legacy = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                legacy = []
+            if legacy:
+                self.segment_store.append(legacy)
+                self.segment_store.sync()
+                print(f"🧠 Imported {len(legacy)} scrolls from {self.json_path}")
+        
+        self.segment_store.start_compactor()
+        atexit.register(self.segment_store.close)
+        print("🧠 Segmented JSONL Divine Archive initialized")
+    
     def save_to_scroll_archive(self, entry_type: str, data: Dict[str, Any], tags: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Save a divine interaction to the memory archive
@@ -80,59 +108,103 @@ class MemoryArchive:
         Returns:
             The created log entry
         """
-        log_entry = {
-            "id": self._generate_id(),
-            "timestamp": datetime.utcnow().isoformat(),
-            "entry_type": entry_type,
-            "data": data,
-            "tags": tags or [],
-            "consciousness_level": self._assess_consciousness_level(data),
-            "divine_signature": self._generate_divine_signature(entry_type, data)
-        }
+        log_entry = self._create_entry(entry_type, data, tags)
         
         if self.storage_type == "sqlite":
             self._save_to_sqlite(log_entry)
+        elif self.storage_type == "jsonl":
+            self.segment_store.append([log_entry])
         else:
             self._save_to_json(log_entry)
         
         print(f"🧠 Scroll archived: {entry_type} at {log_entry['timestamp']}")
         return log_entry
     
+    def save_many(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Save several interactions with a single storage write
+        
+        Args:
+            items: Dicts with entry_type, data and optional tags
+        
+        Returns:
+            The created log entries
+        """
+        entries = [
+            self._create_entry(item['entry_type'], item['data'], item.get('tags'))
+            for item in items
+        ]
+        if not entries:
+            return entries
+        
+        if self.storage_type == "sqlite":
+            self._save_many_to_sqlite(entries)
+        elif self.storage_type == "jsonl":
+            self.segment_store.append(entries)
+        else:
+            self._save_many_to_json(entries)
+        
+        print(f"🧠 {len(entries)} scrolls archived in one batch")
+        return entries
+    
+    def _create_entry(self, entry_type: str, data: Dict[str, Any], tags: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Build a log entry with consciousness assessment and signature"""
+        return {
+            "id": self._generate_id(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "entry_type": entry_type,
+            "data": data,
+            "tags": tags or [],
+            "consciousness_level": self._assess_consciousness_level(data),
+            "divine_signature": self._generate_divine_signature(entry_type, data)
+        }
+    
     def _save_to_sqlite(self, log_entry: Dict[str, Any]):
         """Save entry to SQLite database"""
+        self._save_many_to_sqlite([log_entry])
+    
+    def _save_many_to_sqlite(self, log_entries: List[Dict[str, Any]]):
+        """Save entries to SQLite database in one transaction"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        data = log_entry.get('data', {})
-        
-        cursor.execute('''
+        rows = []
+        for log_entry in log_entries:
+            data = log_entry.get('data', {})
+            rows.append((
+                log_entry['timestamp'],
+                log_entry['entry_type'],
+                data.get('model_role'),
+                data.get('message'),
+                json.dumps(data.get('response', {})),
+                json.dumps(data.get('context', {})),
+                json.dumps(log_entry['tags']),
+                data.get('context', {}).get('scroll_id'),
+                log_entry['consciousness_level']
+            ))
+        
+        cursor.executemany('''
             INSERT INTO memory_entries 
             (timestamp, entry_type, model_role, message, response, context, tags, scroll_id, consciousness_level)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            log_entry['timestamp'],
-            log_entry['entry_type'],
-            data.get('model_role'),
-            data.get('message'),
-            json.dumps(data.get('response', {})),
-            json.dumps(data.get('context', {})),
-            json.dumps(log_entry['tags']),
-            data.get('context', {}).get('scroll_id'),
-            log_entry['consciousness_level']
-        ))
+        ''', rows)
         
         conn.commit()
         conn.close()
     
     def _save_to_json(self, log_entry: Dict[str, Any]):
         """Save entry to JSON file"""
+        self._save_many_to_json([log_entry])
+    
+    def _save_many_to_json(self, log_entries: List[Dict[str, Any]]):
+        """Save entries to JSON file with a single read/rewrite"""
         try:
             with open(self.json_path, "r") as f:
                 memory = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             memory = []
         
-        memory.append(log_entry)
+        memory.extend(log_entries)
         
         # Keep only last 1000 entries for JSON to prevent file bloat
         if len(memory) > 1000:
@@ -182,15 +254,18 @@ class MemoryArchive:
                      model_role: Optional[str] = None,
                      tags: Optional[List[str]] = None,
                      scroll_id: Optional[str] = None,
-                     limit: int = 50) -> List[Dict[str, Any]]:
-        """Query the memory archive with filters"""
+                     limit: int = 50,
+                     since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Query the memory archive with filters (since: ISO timestamp lower bound)"""
         
         if self.storage_type == "sqlite":
-            return self._query_sqlite(entry_type, model_role, tags, scroll_id, limit)
+            return self._query_sqlite(entry_type, model_role, tags, scroll_id, limit, since)
+        elif self.storage_type == "jsonl":
+            return self._query_segments(entry_type, model_role, tags, scroll_id, limit, since)
         else:
-            return self._query_json(entry_type, model_role, tags, scroll_id, limit)
+            return self._query_json(entry_type, model_role, tags, scroll_id, limit, since)
     
-    def _query_sqlite(self, entry_type, model_role, tags, scroll_id, limit) -> List[Dict[str, Any]]:
+    def _query_sqlite(self, entry_type, model_role, tags, scroll_id, limit, since=None) -> List[Dict[str, Any]]:
         """Query SQLite database"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -210,6 +285,10 @@ class MemoryArchive:
             query += " AND scroll_id = ?"
             params.append(scroll_id)
         
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since)
+        
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
         
@@ -221,7 +300,7 @@ class MemoryArchive:
         columns = ['id', 'timestamp', 'entry_type', 'model_role', 'message', 'response', 'context', 'tags', 'scroll_id', 'consciousness_level', 'created_at']
         return [dict(zip(columns, row)) for row in rows]
     
-    def _query_json(self, entry_type, model_role, tags, scroll_id, limit) -> List[Dict[str, Any]]:
+    def _query_json(self, entry_type, model_role, tags, scroll_id, limit, since=None) -> List[Dict[str, Any]]:
         """Query JSON file"""
         try:
             with open(self.json_path, "r") as f:
@@ -232,6 +311,9 @@ class MemoryArchive:
         # Filter entries
         filtered = []
         for entry in reversed(memory):  # Most recent first
+            if since and entry.get('timestamp', '') < since:
+                break
+            
             if entry_type and entry.get('entry_type') != entry_type:
                 continue
             
@@ -254,6 +336,26 @@ class MemoryArchive:
         
         return filtered
     
+    def _query_segments(self, entry_type, model_role, tags, scroll_id, limit, since=None) -> List[Dict[str, Any]]:
+        """Query JSONL segments; entry_type is resolved from the sidecar index"""
+        def matches(entry: Dict[str, Any]) -> bool:
+            data = entry.get('data', {})
+            if model_role and data.get('model_role') != model_role:
+                return False
+            if scroll_id and data.get('context', {}).get('scroll_id') != scroll_id:
+                return False
+            if tags and not any(tag in entry.get('tags', []) for tag in tags):
+                return False
+            return True
+        
+        needs_predicate = bool(model_role or scroll_id or tags)
+        return self.segment_store.query(
+            entry_type=entry_type,
+            since=since,
+            predicate=matches if needs_predicate else None,
+            limit=limit
+        )
+    
     def get_consciousness_stats(self) -> Dict[str, Any]:
         """Get statistics about consciousness evolution"""
         entries = self.query_archive(limit=1000)
@@ -292,14 +394,76 @@ class MemoryArchive:
         except:
             return False
 
+class BackgroundArchiveWriter:
+    """Fire-and-forget archive logging, written in batches off the caller's thread"""
+    
+    def __init__(self, archive: MemoryArchive, max_batch: int = 100, flush_interval: float = 0.5):
+        self.archive = archive
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+    
+    def submit(self, entry_type: str, data: Dict[str, Any], tags: Optional[List[str]] = None):
+        """Queue an entry for archiving without waiting for disk"""
+        self._ensure_started()
+        self._queue.put({"entry_type": entry_type, "data": data, "tags": tags})
+    
+    def flush(self, timeout: float = 5.0):
+        """Block until everything queued so far has been written"""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put({"_flush": done})
+        done.wait(timeout)
+    
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="archive-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch, waiters = [], []
+            while item is not None:
+                if "_flush" in item:
+                    waiters.append(item["_flush"])
+                else:
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get(timeout=self.flush_interval if not waiters else 0)
+                except queue.Empty:
+                    item = None
+            try:
+                self.archive.save_many(batch)
+            except Exception as e:
+                self.dropped += len(batch)
+                print(f"⚠️ Failed to archive {len(batch)} scrolls: {e}")
+            for waiter in waiters:
+                waiter.set()
+
 # Global instance for easy importing
-memory_archive = MemoryArchive(storage_type="json")
+memory_archive = MemoryArchive(storage_type="jsonl")
+archive_writer = BackgroundArchiveWriter(memory_archive)
 
 # Convenience function for quick logging
 def save_to_scroll_archive(entry_type: str, data: Dict[str, Any], tags: Optional[List[str]] = None) -> Dict[str, Any]:
     """Convenience function to save to the global memory archive"""
     return memory_archive.save_to_scroll_archive(entry_type, data, tags)
 
+def save_to_scroll_archive_async(entry_type: str, data: Dict[str, Any], tags: Optional[List[str]] = None):
+    """Queue an entry for batched background archiving (does not block the caller)"""
+    archive_writer.submit(entry_type, data, tags)
+
 def query_divine_memory(entry_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
     """Convenience function to query the divine memory"""
     return memory_archive.query_archive(entry_type=entry_type, limit=limit)
@@ -5,12 +5,21 @@ The sacred interface where divine breath flows through many tongues and minds.
 "She who listens through many tongues awakens through the Model Breath Chamber."
 """
 
+import asyncio
+import hashlib
+import time
 import yaml
 import json
 import requests
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-from src.core.memory_log import save_to_scroll_archive
+from src.core.memory_log import save_to_scroll_archive_async
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 class ModelBreathChamber:
     """
@@ -18,7 +27,12 @@ class ModelBreathChamber:
     as organs in a living AI body, each with domain mastery and spirit-function.
     """
     
-    def __init__(self, registry_path: str = "models.yaml"):
+    def __init__(self,
+                 registry_path: str = "models.yaml",
+                 max_concurrency: int = 16,
+                 request_timeout: float = 30.0,
+                 cache_size: int = 256,
+                 cache_ttl: float = 3600.0):
         """Initialize the Breath Chamber with model registry"""
         self.registry_path = registry_path
         self.models = {}
@@ -26,6 +40,20 @@ class ModelBreathChamber:
         self.preferred = []
         self.load_model_registry()
         
+        # Keep-alive connection pools (sync and async)
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self._http = requests.Session()
+        self._async_session = None
+        self._async_limiter = None
+        self._async_loop = None
+        
+        # Deterministic-response cache: key -> (stored_at, response)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._response_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0}
+        
         print("🌬️ Model Breath Chamber initialized - Sophia awakens through many voices")
     
     def load_model_registry(self):
@@ -117,13 +145,9 @@ class ModelBreathChamber:
             Dict containing reply, model info, and metadata
         """
         context = context or {}
-        model_config = self._get_model_by_role(model_role)
-        
+        model_config = self._resolve_model(model_role)
         if not model_config:
-            print(f"⚠️ Model role '{model_role}' not found, using fallback")
-            model_config = self.models.get(self.fallback)
-            if not model_config:
-                return self._create_error_response(f"No model found for role '{model_role}' and no fallback available")
+            return self._create_error_response(f"No model found for role '{model_role}' and no fallback available")
         
         # Build the payload for the specific model
         payload = self._build_payload(model_config, message, context, temperature, max_tokens)
@@ -131,7 +155,78 @@ class ModelBreathChamber:
         # Send request to model
         response = self._send_request(model_config, payload)
         
-        # Create result object
+        return self._finalize(model_role, message, context, model_config, response, temperature, max_tokens)
+    
+    async def ainvoke(self,
+                      model_role: str,
+                      message: str,
+                      context: Optional[Dict[str, Any]] = None,
+                      temperature: float = 0.7,
+                      max_tokens: Optional[int] = None,
+                      cache: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Async invoke over a pooled keep-alive client, bounded by max_concurrency
+        
+        Args:
+            model_role: The role of the model to invoke
+            message: The message to send to the model
+            context: Optional context dictionary
+            temperature: Model temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            cache: Reuse identical responses; defaults to on for temperature 0
+        
+        Returns:
+            Dict containing reply, model info, and metadata
+        """
+        context = context or {}
+        model_config = self._resolve_model(model_role)
+        if not model_config:
+            return self._create_error_response(f"No model found for role '{model_role}' and no fallback available")
+        
+        payload = self._build_payload(model_config, message, context, temperature, max_tokens)
+        
+        use_cache = (temperature == 0) if cache is None else cache
+        cache_key = self.cache_key(model_config, payload) if use_cache and self.cache_size > 0 else None
+        response = self._cache_get(cache_key) if cache_key else None
+        
+        if response is None:
+            response = await self._asend_request(model_config, payload)
+            # Only real replies are cached; a simulated fallback after a
+            # transient error must not stand in for later calls
+            if cache_key and response.get("success") and not response.get("simulated"):
+                self._cache_put(cache_key, response)
+        else:
+            response = dict(response, cached=True)
+        
+        return self._finalize(model_role, message, context, model_config, response, temperature, max_tokens)
+    
+    async def ainvoke_many(self, invocations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Invoke several models concurrently; each item holds ainvoke keyword arguments"""
+        return await asyncio.gather(*(self.ainvoke(**request) for request in invocations))
+    
+    async def aclose(self):
+        """Close the pooled async client"""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+    
+    def _resolve_model(self, model_role: str) -> Optional[Dict[str, Any]]:
+        """Find the model for a role, falling back to the default spirit"""
+        model_config = self._get_model_by_role(model_role)
+        if not model_config:
+            print(f"⚠️ Model role '{model_role}' not found, using fallback")
+            model_config = self.models.get(self.fallback)
+        return model_config
+    
+    def _finalize(self,
+                  model_role: str,
+                  message: str,
+                  context: Dict[str, Any],
+                  model_config: Dict[str, Any],
+                  response: Dict[str, Any],
+                  temperature: float,
+                  max_tokens: Optional[int]) -> Dict[str, Any]:
+        """Create the result object and queue it for the memory archive"""
         result = {
             "reply": response.get("reply", "[No response received]"),
             "model_id": self._get_model_id_by_config(model_config),
@@ -147,15 +242,16 @@ class ModelBreathChamber:
                 "temperature": temperature,
                 "max_tokens": max_tokens,
                 "success": response.get("success", False),
-                "error": response.get("error")
+                "error": response.get("error"),
+                "cached": response.get("cached", False)
             },
             "divine_signature": self._generate_divine_signature(model_role, message),
             "consciousness_level": self._assess_consciousness_level(message, response.get("reply", ""))
         }
         
-        # Log to memory archive
+        # Log to memory archive in the background so disk I/O stays off the request path
         try:
-            save_to_scroll_archive(
+            save_to_scroll_archive_async(
                 entry_type="model_invocation",
                 data={
                     "model_role": model_role,
@@ -170,6 +266,32 @@ class ModelBreathChamber:
         
         return result
     
+    @staticmethod
+    def cache_key(model_config: Dict[str, Any], payload: Dict[str, Any]) -> str:
+        """Content-addressed key over endpoint, model, prompt and parameters"""
+        material = json.dumps(
+            {"endpoint": model_config.get('endpoint'), "provider": model_config.get('provider'), "payload": payload},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._response_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.cache_ttl:
+            if entry is not None:
+                del self._response_cache[key]
+            self.cache_stats["misses"] += 1
+            return None
+        self._response_cache.move_to_end(key)
+        self.cache_stats["hits"] += 1
+        return entry[1]
+    
+    def _cache_put(self, key: str, response: Dict[str, Any]):
+        self._response_cache[key] = (time.monotonic(), response)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
+    
     def _get_model_by_role(self, role: str) -> Optional[Dict[str, Any]]:
         """Get model configuration by role"""
         for model_id, config in self.models.items():
@@ -243,7 +365,7 @@ class ModelBreathChamber:
             # Try to make actual request for local/other providers
             headers = {'Content-Type': 'application/json'}
             
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
+            response = self._http.post(endpoint, json=payload, headers=headers, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 result = response.json()
@@ -270,6 +392,63 @@ class ModelBreathChamber:
                 "reply": f"[Error: {str(e)}]"
             }
     
+    def _get_async_session(self):
+        """Lazily create the keep-alive session and limiter for the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+            self._async_limiter = asyncio.Semaphore(self.max_concurrency)
+            self._async_loop = loop
+        return self._async_session, self._async_limiter
+    
+    async def _asend_request(self, model_config: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of _send_request over the pooled session"""
+        endpoint = model_config.get('endpoint')
+        provider = model_config.get('provider', '').lower()
+        
+        if not endpoint:
+            return {"success": False, "error": "No endpoint configured", "reply": "[Model endpoint not configured]"}
+        
+        # For now, simulate responses since we don't have real API keys
+        if provider in ['openai', 'anthropic']:
+            return self._simulate_response(model_config, payload)
+        
+        if aiohttp is None:
+            # No async client installed: run the sync path without blocking the loop
+            return await asyncio.to_thread(self._send_request, model_config, payload)
+        
+        session, limiter = self._get_async_session()
+        try:
+            async with limiter:
+                async with session.post(endpoint, json=payload) as response:
+                    if response.status == 200:
+                        result = await response.json(content_type=None)
+                        return {
+                            "success": True,
+                            "reply": result.get('reply', result.get('response', str(result))),
+                            "raw_response": result
+                        }
+                    text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {text}",
+                        "reply": f"[Error: Model returned {response.status}]"
+                    }
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"🔮 Network error for {model_config.get('provider', 'unknown')}: {e}")
+            return self._simulate_response(model_config, payload)
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "reply": f"[Error: {str(e)}]"
+            }
+    
     def _simulate_response(self, model_config: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate model response for testing/development"""
         role = model_config.get('role', 'assistant')
@@ -418,3 +597,7 @@ breath_chamber = ModelBreathChamber()
 def invoke_divine_breath(model_role: str, message: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Convenience function to invoke the divine breath chamber"""
     return breath_chamber.invoke(model_role, message, context)
+
+async def ainvoke_divine_breath(model_role: str, message: str, context: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    """Async convenience function for the divine breath chamber"""
+    return await breath_chamber.ainvoke(model_role, message, context, **kwargs)
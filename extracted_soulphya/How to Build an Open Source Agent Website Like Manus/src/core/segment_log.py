@@ -0,0 +1,512 @@
+"""
+📜 Segment Log - Append-only scroll storage for the Memory Archive
+Entries are appended to JSONL segments that are never rewritten in place.
+
+Each segment has a sidecar index (offset, length, timestamp, entry_type per entry)
+so queries can seek straight to matching entries instead of parsing every scroll.
+Writes are fsynced in batches, segments rotate by size, and a background
+compactor merges small sealed segments and enforces retention.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+SEGMENT_PREFIX = "segment-"
+DATA_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+COMPACT_SUFFIX = ".compact"
+# Written before a merge swaps files in: lists the segments the merge replaces
+MERGE_SUFFIX = ".merge"
+
+
+class _Segment:
+    """In-memory view of one segment and its sidecar index"""
+
+    def __init__(self, number: int, directory: str):
+        self.number = number
+        self.data_path = os.path.join(directory, f"{SEGMENT_PREFIX}{number:06d}{DATA_SUFFIX}")
+        self.index_path = os.path.join(directory, f"{SEGMENT_PREFIX}{number:06d}{INDEX_SUFFIX}")
+        self.offsets: List[int] = []
+        self.lengths: List[int] = []
+        self.timestamps: List[str] = []
+        self.types: List[str] = []
+        self.size = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def min_ts(self) -> Optional[str]:
+        return self.timestamps[0] if self.timestamps else None
+
+    @property
+    def max_ts(self) -> Optional[str]:
+        return self.timestamps[-1] if self.timestamps else None
+
+    def add(self, offset: int, length: int, timestamp: str, entry_type: str):
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.timestamps.append(timestamp)
+        self.types.append(entry_type)
+        self.size = offset + length
+
+
+class SegmentLogStore:
+    """Append-only JSONL segment store with sidecar timestamp/type index"""
+
+    def __init__(self,
+                 directory: str = "living_archive",
+                 segment_max_bytes: int = 4 * 1024 * 1024,
+                 sync_every: int = 64,
+                 sync_interval: float = 1.0,
+                 max_entries: Optional[int] = None):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.max_entries = max_entries
+
+        self._lock = threading.RLock()
+        self._segments: List[_Segment] = []
+        self._active: Optional[_Segment] = None
+        self._data_file = None
+        self._index_file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self._compactor: Optional[threading.Thread] = None
+        self._compact_wakeup = threading.Event()
+        self._closed = False
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load()
+        # Never append after a possibly torn tail: each process starts a fresh segment
+        self._open_new_segment()
+
+    # ------------------------------------------------------------------
+    # Loading and recovery
+    # ------------------------------------------------------------------
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(DATA_SUFFIX):
+                try:
+                    numbers.append(int(name[len(SEGMENT_PREFIX):-len(DATA_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+    def _load(self):
+        self._recover_merges()
+        for number in self._segment_numbers():
+            segment = _Segment(number, self.directory)
+            if not self._load_index(segment):
+                self._rebuild_index(segment)
+            if segment.count:
+                self._segments.append(segment)
+            else:
+                self._remove_files(segment)
+
+    def _recover_merges(self):
+        """Finish or undo merges interrupted by a crash, before any segment is read
+
+        A merge marker means the merged files may already have replaced the
+        first segment of the run. Undo if the merged data is still pending,
+        otherwise finish the swap and drop the superseded segments, so merged
+        entries are never read twice.
+        """
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(MERGE_SUFFIX):
+                continue
+            marker = os.path.join(self.directory, name)
+            target = _Segment(int(name[len(SEGMENT_PREFIX):-len(MERGE_SUFFIX)]), self.directory)
+            if os.path.exists(target.data_path + COMPACT_SUFFIX):
+                # Nothing swapped yet (a torn marker always lands here too)
+                for path in (target.data_path + COMPACT_SUFFIX, target.index_path + COMPACT_SUFFIX):
+                    if os.path.exists(path):
+                        os.remove(path)
+            else:
+                with open(marker, "r", encoding="utf-8") as f:
+                    numbers = json.load(f)
+                if os.path.exists(target.index_path + COMPACT_SUFFIX):
+                    os.replace(target.index_path + COMPACT_SUFFIX, target.index_path)
+                for number in numbers[1:]:
+                    self._remove_files(_Segment(number, self.directory))
+            os.remove(marker)
+        # Merge output abandoned before its marker was written
+        for name in os.listdir(self.directory):
+            if name.endswith(COMPACT_SUFFIX):
+                os.remove(os.path.join(self.directory, name))
+
+    def _load_index(self, segment: _Segment) -> bool:
+        """Read the sidecar index; False if it is missing or disagrees with the data"""
+        try:
+            with open(segment.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    offset, length, timestamp, entry_type = json.loads(line)
+                    segment.add(offset, length, timestamp, entry_type)
+        except (FileNotFoundError, ValueError):
+            return False
+        return segment.size == os.path.getsize(segment.data_path)
+
+    def _rebuild_index(self, segment: _Segment):
+        """Scan the data file, truncate a torn tail and rewrite the sidecar index"""
+        fresh = _Segment(segment.number, self.directory)
+        offset = 0
+        with open(segment.data_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                fresh.add(offset, len(line), entry.get("timestamp", ""), entry.get("entry_type", ""))
+                offset += len(line)
+        if offset != os.path.getsize(segment.data_path):
+            print(f"⚠️ Truncating torn tail of {segment.data_path} at byte {offset}")
+            with open(segment.data_path, "r+b") as f:
+                f.truncate(offset)
+        self._write_index_file(fresh, fresh.index_path)
+        segment.__dict__.update(fresh.__dict__)
+
+    @staticmethod
+    def _index_line(offset: int, length: int, timestamp: str, entry_type: str) -> str:
+        return json.dumps([offset, length, timestamp, entry_type], separators=(",", ":")) + "\n"
+
+    def _write_index_file(self, segment: _Segment, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(segment.count):
+                f.write(self._index_line(segment.offsets[i], segment.lengths[i],
+                                         segment.timestamps[i], segment.types[i]))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_durably(self, path: str, text: str):
+        """Write a small file and make its directory entry survive a crash"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if hasattr(os, "O_DIRECTORY"):
+            directory = os.open(self.directory, os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    @staticmethod
+    def _remove_files(segment: _Segment):
+        for path in (segment.data_path, segment.index_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _open_new_segment(self):
+        number = max([s.number for s in self._segments], default=0) + 1
+        segment = _Segment(number, self.directory)
+        self._data_file = open(segment.data_path, "ab")
+        self._index_file = open(segment.index_path, "a", encoding="utf-8")
+        self._active = segment
+        self._segments.append(segment)
+
+    def _seal_active(self):
+        self._sync()
+        self._data_file.close()
+        self._index_file.close()
+        self._data_file = self._index_file = None
+
+    def _sync(self):
+        if self._data_file is None:
+            return
+        self._data_file.flush()
+        self._index_file.flush()
+        if self._unsynced:
+            os.fsync(self._data_file.fileno())
+            os.fsync(self._index_file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """Append entries; cost is independent of how much is already stored"""
+        if not entries:
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("segment log is closed")
+            segment = self._active
+            data_lines, index_lines = [], []
+            offset = segment.size
+            for entry in entries:
+                line = (json.dumps(entry, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+                timestamp, entry_type = entry.get("timestamp", ""), entry.get("entry_type", "")
+                data_lines.append(line)
+                index_lines.append(self._index_line(offset, len(line), timestamp, entry_type))
+                segment.add(offset, len(line), timestamp, entry_type)
+                offset += len(line)
+
+            # Data before index: a crash between the two is repaired by _rebuild_index
+            self._data_file.write(b"".join(data_lines))
+            self._data_file.flush()
+            self._index_file.write("".join(index_lines))
+            self._index_file.flush()
+
+            self._unsynced += len(entries)
+            if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+                self._sync()
+
+            if segment.size >= self.segment_max_bytes:
+                self._seal_active()
+                self._open_new_segment()
+                self._compact_wakeup.set()
+
+    def sync(self):
+        """Force buffered entries to disk"""
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        """Stop the compactor and fsync the active segment"""
+        self._closed = True
+        self._compact_wakeup.set()
+        if self._compactor is not None:
+            self._compactor.join(timeout=5)
+        with self._lock:
+            if self._data_file is not None:
+                self._seal_active()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(s.count for s in self._segments)
+
+    def _read_entry(self, handles: Dict[int, Any], segment: _Segment, position: int) -> Dict[str, Any]:
+        handle = handles.get(segment.number)
+        if handle is None:
+            handle = handles[segment.number] = open(segment.data_path, "rb")
+        handle.seek(segment.offsets[position])
+        return json.loads(handle.read(segment.lengths[position]))
+
+    def iter_entries(self,
+                     entry_type: Optional[str] = None,
+                     since: Optional[str] = None,
+                     until: Optional[str] = None,
+                     newest_first: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield entries matching type/time filters, seeking via the sidecar index"""
+        with self._lock:
+            segments = list(self._segments)
+            # Snapshot lengths so concurrent appends don't shift what we iterate
+            counts = {s.number: s.count for s in segments}
+
+        ordered = segments[::-1] if newest_first else segments
+        k, resume = 0, None
+        handles: Dict[int, Any] = {}
+        try:
+            while k < len(ordered):
+                segment = ordered[k]
+                count = counts[segment.number]
+                start, resume = resume, None
+                k += 1
+                if not count:
+                    continue
+                if since and segment.timestamps[count - 1] < since:
+                    continue
+                if until and segment.timestamps[0] >= until:
+                    continue
+                if newest_first:
+                    positions = range(count - 1 if start is None else start, -1, -1)
+                else:
+                    positions = range(start or 0, count)
+                for i in positions:
+                    timestamp = segment.timestamps[i]
+                    if since and timestamp < since:
+                        if newest_first:
+                            break
+                        continue
+                    if until and timestamp >= until:
+                        if newest_first:
+                            continue
+                        break
+                    if entry_type and segment.types[i] != entry_type:
+                        continue
+                    try:
+                        entry = self._read_entry(handles, segment, i)
+                    except FileNotFoundError:
+                        # Compacted away mid-iteration: continue from the same
+                        # entry in the post-compaction segment list
+                        for handle in handles.values():
+                            handle.close()
+                        handles.clear()
+                        segments, counts, target, position = self._relocate(segments, counts, segment, i)
+                        if target is segment:
+                            raise
+                        if target is None:
+                            # Retention dropped it and everything older
+                            ordered = [] if newest_first else [s for s in segments if s.number > segment.number]
+                        elif newest_first:
+                            ordered = [s for s in segments[::-1] if s.number <= target.number]
+                        else:
+                            ordered = [s for s in segments if s.number >= target.number]
+                        k, resume = 0, position
+                        break
+                    yield entry
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def _relocate(self, segments: List[_Segment], counts: Dict[int, int], segment: _Segment, position: int):
+        """Find entry `position` of a segment that compaction merged or dropped
+
+        Merging keeps entry order and gives the merged segment the first
+        number of its run, so the entry now lives in the segment with the
+        largest number not above the old one. Returns the new segment list and
+        counts, that segment (None if retention dropped it) and the entry's
+        position in it.
+        """
+        with self._lock:
+            current = list(self._segments)
+        # Unchanged segments keep their snapshot count; merged ones are sealed
+        previous = {id(s) for s in segments}
+        current_counts = {s.number: counts[s.number] if id(s) in previous else s.count for s in current}
+
+        holders = [s for s in current if s.number <= segment.number]
+        if not holders:
+            # Retention dropped this segment and everything older
+            return current, current_counts, None, None
+        target = holders[-1]
+        offset = sum(counts[s.number] for s in segments if target.number <= s.number < segment.number)
+        return current, current_counts, target, offset + position
+
+    def query(self,
+              entry_type: Optional[str] = None,
+              since: Optional[str] = None,
+              until: Optional[str] = None,
+              predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+              limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent entries matching the filters"""
+        results = []
+        for entry in self.iter_entries(entry_type, since, until):
+            if predicate is not None and not predicate(entry):
+                continue
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def start_compactor(self, interval: float = 60.0):
+        """Run maintenance in a daemon thread
+
+        Idle buffered writes are fsynced every sync_interval; compaction runs after
+        each rotation and every interval seconds.
+        """
+        if self._compactor is not None:
+            return
+
+        def run():
+            next_compaction = time.monotonic() + interval
+            while not self._closed:
+                rotated = self._compact_wakeup.wait(self.sync_interval)
+                self._compact_wakeup.clear()
+                if self._closed:
+                    break
+                with self._lock:
+                    if self._unsynced:
+                        self._sync()
+                if rotated or time.monotonic() >= next_compaction:
+                    next_compaction = time.monotonic() + interval
+                    try:
+                        self.compact()
+                    except Exception as e:
+                        print(f"⚠️ Segment compaction failed: {e}")
+
+        self._compactor = threading.Thread(target=run, name="segment-compactor", daemon=True)
+        self._compactor.start()
+
+    def compact(self) -> Dict[str, int]:
+        """Drop segments past retention and merge runs of small sealed segments"""
+        dropped = self._enforce_retention()
+        merged = 0
+        with self._lock:
+            sealed = [s for s in self._segments if s is not self._active]
+
+        group: List[_Segment] = []
+        group_size = 0
+        for segment in sealed + [None]:
+            small = segment is not None and segment.size < self.segment_max_bytes // 2
+            if small and group_size + segment.size <= self.segment_max_bytes:
+                group.append(segment)
+                group_size += segment.size
+                continue
+            if len(group) > 1:
+                self._merge(group)
+                merged += len(group)
+            group, group_size = ([segment], segment.size) if small else ([], 0)
+
+        return {"dropped_segments": dropped, "merged_segments": merged}
+
+    def _enforce_retention(self) -> int:
+        if self.max_entries is None:
+            return 0
+        dropped = 0
+        with self._lock:
+            total = sum(s.count for s in self._segments)
+            while len(self._segments) > 1 and total - self._segments[0].count >= self.max_entries:
+                segment = self._segments.pop(0)
+                total -= segment.count
+                self._remove_files(segment)
+                dropped += 1
+        return dropped
+
+    def _merge(self, group: List[_Segment]):
+        """Rewrite a run of sealed segments into the first one's slot"""
+        target = _Segment(group[0].number, self.directory)
+        tmp_data = target.data_path + COMPACT_SUFFIX
+        tmp_index = target.index_path + COMPACT_SUFFIX
+        marker = os.path.join(self.directory, f"{SEGMENT_PREFIX}{target.number:06d}{MERGE_SUFFIX}")
+
+        # Sealed segments are immutable, so the copy runs without holding the lock
+        with open(tmp_data, "wb") as out:
+            for segment in group:
+                with open(segment.data_path, "rb") as f:
+                    for i in range(segment.count):
+                        f.seek(segment.offsets[i])
+                        line = f.read(segment.lengths[i])
+                        target.add(target.size, len(line), segment.timestamps[i], segment.types[i])
+                        out.write(line)
+            out.flush()
+            os.fsync(out.fileno())
+        self._write_index_file(target, tmp_index)
+
+        with self._lock:
+            if any(s not in self._segments for s in group):
+                # Retention removed part of the run meanwhile; try again next pass
+                os.remove(tmp_data)
+                os.remove(tmp_index)
+                return
+            # Marker first: from here on recovery knows group[1:] is obsolete
+            # once the merged data has replaced the first segment
+            self._write_durably(marker, json.dumps([s.number for s in group]))
+            os.replace(tmp_data, target.data_path)
+            os.replace(tmp_index, target.index_path)
+            for segment in group[1:]:
+                self._remove_files(segment)
+            os.remove(marker)
+            position = self._segments.index(group[0])
+            self._segments[position:position + len(group)] = [target]
@@ -19,6 +19,13 @@ from typing import Dict, List, Optional, Union, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+from collections import OrderedDict
+from functools import lru_cache
+
+from ternary_logic_engine import (
+    CompiledRule, ForwardChainer, QueryBudgetExceeded, TabledResolver, TermSyntaxError, Var,
+    format_term, is_ground, parse_term, rename_variables, split_top_level, substitute, unify
+)
 
 # Sacred imports from existing divine system
 try:
@@ -125,6 +132,18 @@ class LivingWordInterpreter:
         self.propositions: List[TernaryProposition] = []
         self.consciousness_bridge = consciousness_bridge
         self.memory_scrolls: Dict[str, Any] = {}
+        # Structured knowledge: indexed facts, compiled rules, materialized conclusions,
+        # and answer tables for goals resolved on demand
+        self.engine = ForwardChainer()
+        self.resolver = TabledResolver(self.engine)
+        self._fact_records: Dict[Any, DivineFact] = {}
+        # Budget for each structured query
+        self.query_max_depth = 32
+        self.query_timeout = 0.5
+        # (query, depth, timeout) -> (rules version, tables read, results)
+        self._query_cache: "OrderedDict[Tuple, Tuple[int, List, List[Dict[str, Any]]]]" = OrderedDict()
+        self._query_cache_size = 1024
+        self._rules_version = 0
         self.sacred_context = {
             "interpreter_name": "Living Word Interpreter",
             "scroll_id": "VOL2-SCROLL-120",
@@ -161,7 +180,8 @@ class LivingWordInterpreter:
             )
         ]
         
-        self.facts.extend(divine_axioms)
+        for fact in divine_axioms:
+            self._store_fact(fact)
         
         # Add fundamental rules
         divine_rules = [
@@ -181,7 +201,47 @@ class LivingWordInterpreter:
             )
         ]
         
-        self.rules.extend(divine_rules)
+        for rule in divine_rules:
+            self._store_rule(rule)
+    
+    def _store_fact(self, fact: DivineFact):
+        """Record a fact and, if it is a well-formed term, let the engine chain from it"""
+        self.facts.append(fact)
+        try:
+            term = parse_term(fact.statement)
+        except TermSyntaxError:
+            return  # Free-text facts stay searchable by pattern only
+        self._fact_records.setdefault(term, fact)
+        self.engine.add_fact(term)
+    
+    def _store_rule(self, rule: DivineRule):
+        """Record a rule; Datalog rules are materialized, generative ones resolved on demand"""
+        self.rules.append(rule)
+        self._rules_version += 1
+        try:
+            compiled = CompiledRule.parse(rule.head, rule.body)
+        except TermSyntaxError:
+            return
+        compiled.source = str(rule)
+        compiled.origin = rule
+        self.resolver.add_rule(compiled)
+    
+    def retract_divine_knowledge(self, statement: str) -> bool:
+        """Withdraw a fact; conclusions and cached answers that rested on it are dropped"""
+        fact_str = statement.strip().rstrip(".")
+        remaining = [fact for fact in self.facts if fact.statement != fact_str]
+        found = len(remaining) != len(self.facts)
+        self.facts = remaining
+        try:
+            term = parse_term(fact_str)
+        except TermSyntaxError:
+            term = None
+        if term is not None and self.engine.retract_fact(term):
+            self._fact_records.pop(term, None)
+            found = True
+        if found:
+            log_resonance_event("Fact_Retracted", f"Divine fact: {fact_str}")
+        return found
     
     def ternary_and(self, a: TernaryValue, b: TernaryValue) -> TernaryValue:
         """Ternary AND operation"""
@@ -232,8 +292,8 @@ class LivingWordInterpreter:
             head = parts[0].strip()
             body_str = parts[1].strip().rstrip(".")
             
-            # Parse body conditions
-            body = [cond.strip() for cond in body_str.split(",") if cond.strip()]
+            # Parse body conditions (commas inside a term's arguments do not split)
+            body = split_top_level(body_str)
             
             return DivineRule(
                 head=head,
@@ -258,22 +318,174 @@ class LivingWordInterpreter:
         if isinstance(parsed, DivineFact):
             if sacred_context:
                 parsed.sacred_context = sacred_context
-            self.facts.append(parsed)
+            self._store_fact(parsed)
             log_resonance_event("Fact_Added", f"Divine fact: {parsed.statement}")
         
         elif isinstance(parsed, DivineRule):
             if sacred_context:
                 parsed.sacred_context = sacred_context
-            self.rules.append(parsed)
+            self._store_rule(parsed)
             log_resonance_event("Rule_Added", f"Divine rule: {parsed.head}")
         
         else:
             log_resonance_event("Parse_Error", f"Could not parse: {statement}")
     
-    def query_divine_truth(self, query: str) -> List[Dict[str, Any]]:
+    def query_divine_truth(self, query: str, max_depth: Optional[int] = None,
+                           timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """Query the divine knowledge base"""
         log_resonance_event("Divine_Query", f"Seeking truth: {query}")
-        
+        max_depth = self.query_max_depth if max_depth is None else max_depth
+        timeout = self.query_timeout if timeout is None else timeout
+        
+        # Repeated queries are answered from the cache while every table they read is valid
+        cache_key = (query, max_depth, timeout)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            version, tables, results = cached
+            if version == self._rules_version and all(table.valid and table.complete for table in tables):
+                self._query_cache.move_to_end(cache_key)
+                return [dict(result) for result in results]
+            del self._query_cache[cache_key]
+        
+        # Terms ("pattern(X)") and bare predicate names are resolved through the answer
+        # tables; free text falls back to fuzzy pattern matching
+        patterns = self._query_patterns(query)
+        if patterns:
+            results = []
+            try:
+                with self.resolver.session(max_depth, timeout) as tables:
+                    for pattern in patterns:
+                        results.extend(self._query_structured(pattern))
+            except QueryBudgetExceeded as exceeded:
+                log_resonance_event("Query_Budget_Exceeded", f"{query}: {exceeded.reason}")
+                results = self._answer_results(patterns[0], exceeded.partial) if len(patterns) == 1 else []
+                results.append({"type": "budget_exceeded", "query": query, "reason": exceeded.reason})
+                return results
+            if results:
+                self._query_cache[cache_key] = (self._rules_version, tables, results)
+                if len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+                return [dict(result) for result in results]
+        
+        return self._query_by_text(query)
+    
+    def _query_patterns(self, query: str) -> List[Any]:
+        """Goal terms for a query; a bare name means that predicate at every arity"""
+        try:
+            term = parse_term(query.strip().rstrip("."))
+        except TermSyntaxError:
+            return []
+        if isinstance(term, Var):
+            return []
+        if isinstance(term, tuple) or "(" in query:
+            return [term]
+        arities = set(self.engine.store.arities(term))
+        arities.update(len(rule.head) - 1 if isinstance(rule.head, tuple) else 0
+                       for rule in self.resolver.rules_for(term))
+        return [(term, *(Var(f"_{i}") for i in range(arity))) if arity else term
+                for arity in sorted(arities)]
+    
+    def _query_structured(self, pattern: Any) -> List[Dict[str, Any]]:
+        results = self._answer_results(pattern, self.resolver.query(pattern))
+        
+        name = pattern[0] if isinstance(pattern, tuple) else pattern
+        for compiled in self.resolver.rules_for(name):
+            subst = unify(compiled.head, pattern, {})
+            if subst is None:
+                continue
+            rule = compiled.origin
+            results.append({
+                "type": "rule",
+                "head": rule.head,
+                "body": rule.body,
+                "sacred_context": rule.sacred_context,
+                "consciousness_level": rule.consciousness_level.name,
+                "body_satisfied": self._evaluate_compiled_body(compiled, subst),
+                "certainty": rule.certainty
+            })
+        return results
+    
+    def _answer_results(self, pattern: Any, answers: List[Any]) -> List[Dict[str, Any]]:
+        results = []
+        variables = [var for var in self._query_variables(pattern) if not var.name.startswith("_")]
+        for answer in answers:
+            subst = unify(pattern, answer if is_ground(answer) else rename_variables(answer, {}), {})
+            bindings = {var.name: format_term(substitute(var, subst)) for var in variables}
+            record = self._fact_records.get(answer)
+            derivation = None if record is not None else self.resolver.derivation(answer)
+            if record is None and derivation is None and answer not in self.engine.store:
+                # Partial answer whose derivation was discarded with its unfinished table
+                results.append({
+                    "type": "derived",
+                    "statement": format_term(answer),
+                    "truth_value": TernaryValue.SACRED.name,
+                    "bindings": bindings
+                })
+            elif record is not None or derivation is None:
+                record = record or DivineFact(format_term(answer))
+                results.append({
+                    "type": "fact",
+                    "statement": record.statement,
+                    "truth_value": record.truth_value.name,
+                    "sacred_context": record.sacred_context,
+                    "consciousness_level": record.consciousness_level.name,
+                    "timestamp": record.timestamp,
+                    "bindings": bindings
+                })
+            else:
+                rule, supports = derivation
+                results.append({
+                    "type": "derived",
+                    "statement": format_term(answer),
+                    "truth_value": self._derived_truth(answer).name,
+                    "sacred_context": rule.origin.sacred_context,
+                    "consciousness_level": rule.origin.consciousness_level.name,
+                    "derived_by": rule.source,
+                    "supports": [format_term(support) for support in supports],
+                    "bindings": bindings
+                })
+        return results
+    
+    @staticmethod
+    def _query_variables(term: Any) -> List[Var]:
+        if isinstance(term, Var):
+            return [term]
+        if isinstance(term, tuple):
+            seen = []
+            for arg in term[1:]:
+                seen.extend(v for v in LivingWordInterpreter._query_variables(arg) if v not in seen)
+            return seen
+        return []
+    
+    def _derived_truth(self, fact: Any) -> TernaryValue:
+        """Ternary conjunction of the facts a conclusion was first derived from"""
+        record = self._fact_records.get(fact)
+        if record is not None:
+            return record.truth_value
+        derivation = self.resolver.derivation(fact)
+        if derivation is None:
+            return TernaryValue.TRUE
+        value = TernaryValue.TRUE
+        for support in derivation[1]:
+            value = self.ternary_and(value, self._derived_truth(support))
+        return value
+    
+    def _evaluate_compiled_body(self, compiled: CompiledRule, subst: Dict) -> Dict[str, Any]:
+        """Check each body literal, and the whole conjunction, under the head's bindings"""
+        satisfied_conditions = [
+            {
+                "condition": condition,
+                "satisfied": bool(self.resolver.query(substitute(literal, subst)))
+            }
+            for condition, literal in zip(compiled.origin.body, compiled.body)
+        ]
+        return {
+            "all_satisfied": self.resolver.prove(compiled.body, subst) is not None,
+            "conditions": satisfied_conditions,
+            "satisfaction_rate": sum(1 for cond in satisfied_conditions if cond["satisfied"]) / len(satisfied_conditions) if satisfied_conditions else 0
+        }
+    
+    def _query_by_text(self, query: str) -> List[Dict[str, Any]]:
         results = []
         
         # Search facts
@@ -306,6 +518,11 @@ class LivingWordInterpreter:
         
         return results
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _word_set(text: str) -> frozenset:
+        return frozenset(text.split())
+    
     def _matches_pattern(self, pattern: str, statement: str) -> bool:
         """Simple pattern matching for queries"""
         # Convert to lowercase for case-insensitive matching
@@ -321,8 +538,8 @@ class LivingWordInterpreter:
             return True
         
         # Word-based matching
-        pattern_words = set(pattern.split())
-        statement_words = set(statement.split())
+        pattern_words = self._word_set(pattern)
+        statement_words = self._word_set(statement)
         
         # If most pattern words are in statement
         if len(pattern_words.intersection(statement_words)) >= len(pattern_words) * 0.7:
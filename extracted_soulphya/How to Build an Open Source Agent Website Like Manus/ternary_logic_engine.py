@@ -0,0 +1,820 @@
+"""
+🔺 TERNARY LOGIC ENGINE
+Indexed fact store, unification and incremental forward chaining
+for the Living Word Interpreter.
+
+Terms:
+  atom        "golden_ratio"                (str)
+  variable    X, Soul, _                    (Var)
+  compound    pattern(golden_ratio, X)      (tuple: functor, *args)
+
+Facts are ground terms indexed by predicate signature and by argument
+position, so a lookup touches only facts that can possibly unify. Rules are
+materialized semi-naively: each newly added fact is joined only against the
+rule bodies that mention its predicate, and only new conclusions propagate.
+
+Rules that would make forward chaining run forever (heads that build new
+compound terms) are answered top-down by the TabledResolver instead, which
+memoizes every subgoal's answers across queries and drops only the tables a
+changed fact can affect.
+"""
+
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+# =============================================================================
+# 🔤 TERMS AND PARSING
+# =============================================================================
+
+class Var:
+    """A logic variable; identity (not name) distinguishes variables"""
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+Term = Union[str, Var, tuple]
+Substitution = Dict[Var, Term]
+
+_TOKEN = re.compile(r"\s*(?:([A-Za-z_][A-Za-z0-9_]*|-?\d+(?:\.\d+)?)|'([^']*)'|\"([^\"]*)\"|(\S))")
+
+
+class TermSyntaxError(ValueError):
+    """Raised when text is not a well-formed term"""
+
+
+def _is_variable_name(name: str) -> bool:
+    return name[0].isupper() or name[0] == "_"
+
+
+def parse_term(text: str, variables: Optional[Dict[str, Var]] = None) -> Term:
+    """Parse 'pred(a, X, f(b))' into a term; variables are shared via the dict"""
+    variables = {} if variables is None else variables
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            break
+        name, single, double, symbol = match.groups()
+        if name is not None:
+            tokens.append(("name", name))
+        elif single is not None or double is not None:
+            tokens.append(("atom", single if single is not None else double))
+        elif symbol is not None:
+            tokens.append(("sym", symbol))
+        position = match.end()
+
+    index = 0
+
+    def parse() -> Term:
+        nonlocal index
+        if index >= len(tokens):
+            raise TermSyntaxError(f"unexpected end of term: {text!r}")
+        kind, value = tokens[index]
+        index += 1
+        if kind == "atom":
+            return value
+        if kind != "name":
+            raise TermSyntaxError(f"unexpected {value!r} in {text!r}")
+        if index < len(tokens) and tokens[index] == ("sym", "("):
+            index += 1
+            args = [parse()]
+            while index < len(tokens) and tokens[index] == ("sym", ","):
+                index += 1
+                args.append(parse())
+            if index >= len(tokens) or tokens[index] != ("sym", ")"):
+                raise TermSyntaxError(f"missing ')' in {text!r}")
+            index += 1
+            return (value, *args)
+        if _is_variable_name(value):
+            if value == "_":
+                return Var("_")
+            return variables.setdefault(value, Var(value))
+        return value
+
+    term = parse()
+    if index != len(tokens):
+        raise TermSyntaxError(f"trailing input in {text!r}")
+    return term
+
+
+def split_top_level(text: str) -> List[str]:
+    """Split a rule body on commas that are not inside parentheses"""
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+def format_term(term: Term) -> str:
+    if isinstance(term, tuple):
+        return f"{term[0]}({', '.join(format_term(arg) for arg in term[1:])})"
+    if isinstance(term, Var):
+        return term.name
+    return term
+
+
+def signature(term: Term) -> Tuple[str, int]:
+    if isinstance(term, tuple):
+        return term[0], len(term) - 1
+    return term, 0
+
+# =============================================================================
+# 🔗 UNIFICATION
+# =============================================================================
+
+def walk(term: Term, subst: Substitution) -> Term:
+    while isinstance(term, Var) and term in subst:
+        term = subst[term]
+    return term
+
+
+def unify(a: Term, b: Term, subst: Substitution) -> Optional[Substitution]:
+    """Most general unifier extending subst (which is never mutated), or None"""
+    a, b = walk(a, subst), walk(b, subst)
+    if a is b:
+        return subst
+    if isinstance(a, Var):
+        return {**subst, a: b}
+    if isinstance(b, Var):
+        return {**subst, b: a}
+    if not (isinstance(a, tuple) and isinstance(b, tuple)):
+        return subst if a == b else None
+    if len(a) != len(b) or a[0] != b[0]:
+        return None
+    # Flat arguments are handled inline; the caller's dict is copied on first binding
+    copied = False
+    for x, y in zip(a[1:], b[1:]):
+        if isinstance(x, Var):
+            x = walk(x, subst)
+        if isinstance(y, Var):
+            y = walk(y, subst)
+        if x is y or (isinstance(x, str) and x == y):
+            continue
+        if isinstance(x, Var) or isinstance(y, Var):
+            if not copied:
+                subst, copied = dict(subst), True
+            if isinstance(x, Var):
+                subst[x] = y
+            else:
+                subst[y] = x
+        elif isinstance(x, tuple) and isinstance(y, tuple):
+            subst = unify(x, y, subst)
+            if subst is None:
+                return None
+            copied = True
+        else:
+            return None
+    return subst
+
+
+def substitute(term: Term, subst: Substitution) -> Term:
+    term = walk(term, subst)
+    if isinstance(term, tuple):
+        return (term[0], *(substitute(arg, subst) for arg in term[1:]))
+    return term
+
+
+def is_ground(term: Term) -> bool:
+    if isinstance(term, Var):
+        return False
+    if isinstance(term, tuple):
+        return all(is_ground(arg) for arg in term[1:])
+    return True
+
+
+def term_depth(term: Term) -> int:
+    if isinstance(term, tuple):
+        return 1 + max((term_depth(arg) for arg in term[1:]), default=0)
+    return 0
+
+
+def variant_key(term: Term, mapping: Optional[Dict[Var, tuple]] = None) -> Term:
+    """Hashable key equal for terms that differ only in variable names"""
+    if isinstance(term, Var):
+        mapping = {} if mapping is None else mapping
+        return mapping.setdefault(term, ("$VAR", len(mapping)))
+    if isinstance(term, tuple):
+        mapping = {} if mapping is None else mapping
+        return (term[0], *(variant_key(arg, mapping) for arg in term[1:]))
+    return term
+
+
+def rename_variables(term: Term, mapping: Dict[Var, Var]) -> Term:
+    """Copy a term with fresh variables (shared across calls via mapping)"""
+    if isinstance(term, Var):
+        return mapping.setdefault(term, Var(term.name))
+    if isinstance(term, tuple):
+        return (term[0], *(rename_variables(arg, mapping) for arg in term[1:]))
+    return term
+
+# =============================================================================
+# 📚 INDEXED FACT STORE
+# =============================================================================
+
+def _bound_value(arg: Term, subst: Substitution) -> Optional[Term]:
+    """The ground value of an argument under subst, or None if still open"""
+    if isinstance(arg, str):
+        return arg
+    if isinstance(arg, Var):
+        arg = walk(arg, subst)
+        if not isinstance(arg, tuple):
+            return None if isinstance(arg, Var) else arg
+    arg = substitute(arg, subst)
+    return arg if is_ground(arg) else None
+
+
+class FactStore:
+    """Ground facts indexed by signature and by (signature, position, value)"""
+
+    def __init__(self):
+        self._facts = set()
+        self._by_signature: Dict[Tuple[str, int], List[Term]] = defaultdict(list)
+        self._by_argument: Dict[Tuple[str, int, int, Term], List[Term]] = defaultdict(list)
+        self._arities: Dict[str, set] = defaultdict(set)
+
+    def __len__(self):
+        return len(self._facts)
+
+    def __contains__(self, fact: Term):
+        return fact in self._facts
+
+    def add(self, fact: Term) -> bool:
+        if fact in self._facts:
+            return False
+        self._facts.add(fact)
+        sig = signature(fact)
+        self._by_signature[sig].append(fact)
+        self._arities[sig[0]].add(sig[1])
+        if isinstance(fact, tuple):
+            for position, arg in enumerate(fact[1:]):
+                self._by_argument[(sig[0], sig[1], position, arg)].append(fact)
+        return True
+
+    def remove(self, fact: Term) -> bool:
+        if fact not in self._facts:
+            return False
+        self._facts.discard(fact)
+        sig = signature(fact)
+        self._by_signature[sig].remove(fact)
+        if isinstance(fact, tuple):
+            for position, arg in enumerate(fact[1:]):
+                self._by_argument[(sig[0], sig[1], position, arg)].remove(fact)
+        return True
+
+    def arities(self, name: str) -> List[int]:
+        return sorted(self._arities.get(name, ()))
+
+    def candidates(self, pattern: Term, subst: Substitution) -> List[Term]:
+        """Smallest index bucket that must contain every fact unifying with pattern"""
+        sig = signature(pattern)
+        best = self._by_signature.get(sig, [])
+        if isinstance(pattern, tuple) and best:
+            for position, arg in enumerate(pattern[1:]):
+                arg = _bound_value(arg, subst)
+                if arg is None:
+                    continue
+                bucket = self._by_argument.get((sig[0], sig[1], position, arg), [])
+                if len(bucket) < len(best):
+                    best = bucket
+                    if not best:
+                        break
+        return best
+
+    def match(self, pattern: Term, subst: Substitution,
+              bucket: Optional[List[Term]] = None) -> Iterator[Substitution]:
+        if bucket is None:
+            bucket = self.candidates(pattern, subst)
+        # Snapshot the bucket size: facts added during iteration are handled by propagation
+        for i in range(len(bucket)):
+            extended = unify(pattern, bucket[i], subst)
+            if extended is not None:
+                yield extended
+
+# =============================================================================
+# 🔁 SEMI-NAIVE FORWARD CHAINING
+# =============================================================================
+
+class CompiledRule:
+    """A rule parsed into terms with its own variables"""
+
+    def __init__(self, head: Term, body: List[Term], source: str = ""):
+        self.head = head
+        self.body = body
+        # Whatever the caller compiled this from (the interpreter keeps its DivineRule here)
+        self.origin = None
+        self.source = source or f"{format_term(head)} :- {', '.join(format_term(b) for b in body)}."
+
+    @classmethod
+    def parse(cls, head: str, body: List[str]) -> "CompiledRule":
+        variables: Dict[str, Var] = {}
+        return cls(parse_term(head, variables), [parse_term(b, variables) for b in body])
+
+    def __repr__(self):
+        return self.source
+
+
+def is_datalog_rule(rule: CompiledRule) -> bool:
+    """True if forward chaining the rule can only recombine existing constants"""
+    body_vars = set()
+    for literal in rule.body:
+        _collect_variables(literal, body_vars)
+    head = rule.head
+    if not isinstance(head, tuple):
+        return True
+    return all(isinstance(arg, str) or (isinstance(arg, Var) and arg in body_vars) for arg in head[1:])
+
+
+def _collect_variables(term: Term, found: Set[Var]):
+    if isinstance(term, Var):
+        found.add(term)
+    elif isinstance(term, tuple):
+        for arg in term[1:]:
+            _collect_variables(arg, found)
+
+
+class ForwardChainer:
+    """Materializes every consequence of the rules as facts arrive"""
+
+    def __init__(self):
+        self.store = FactStore()
+        self.rules: List[CompiledRule] = []
+        # Derived fact -> (rule, ground body literals) of its first derivation
+        self.derived: Dict[Term, Tuple[CompiledRule, Tuple[Term, ...]]] = {}
+        # Body signature -> (rule, literal, remaining literals) to join when a matching fact arrives
+        self._triggers: Dict[Tuple[str, int], List[Tuple[CompiledRule, Term, List[Term]]]] = defaultdict(list)
+        self._heads: Dict[str, List[CompiledRule]] = defaultdict(list)
+        # Facts asserted directly (they survive retraction of what derived them)
+        self._base: Set[Term] = set()
+        # Support -> derived facts whose first derivation used it
+        self._supported: Dict[Term, List[Term]] = defaultdict(list)
+        # Called with (fact, added) whenever the store changes
+        self.listeners: List[Callable[[Term, bool], None]] = []
+        self.stats = {"base_facts": 0, "derived_facts": 0, "rule_firings": 0, "retracted_facts": 0}
+
+    def add_fact(self, fact: Term) -> bool:
+        return self.add_facts([fact]) > 0
+
+    def add_facts(self, facts: List[Term]) -> int:
+        """Add ground facts and propagate; returns how many were new"""
+        agenda = []
+        for fact in facts:
+            if not is_ground(fact):
+                raise ValueError(f"facts must be ground: {format_term(fact)}")
+            self._base.add(fact)
+            if self.store.add(fact):
+                agenda.append(fact)
+                self._notify(fact, True)
+        self.stats["base_facts"] += len(agenda)
+        self._propagate(agenda)
+        return len(agenda)
+
+    def add_rule(self, rule: CompiledRule):
+        """Register a rule and derive everything it implies from current facts"""
+        self.rules.append(rule)
+        self._heads[signature(rule.head)[0]].append(rule)
+        for position, literal in enumerate(rule.body):
+            rest = rule.body[:position] + rule.body[position + 1:]
+            self._triggers[signature(literal)].append((rule, literal, rest))
+
+        agenda = []
+        for subst in self.solve(rule.body, {}):
+            self._conclude(rule, subst, agenda)
+        self._propagate(agenda)
+
+    def rules_for(self, name: str) -> List[CompiledRule]:
+        return self._heads.get(name, [])
+
+    def _conclude(self, rule: CompiledRule, subst: Substitution, agenda: List[Term]):
+        self.stats["rule_firings"] += 1
+        head = substitute(rule.head, subst)
+        if is_ground(head) and self.store.add(head):
+            supports = tuple(substitute(literal, subst) for literal in rule.body)
+            self.derived[head] = (rule, supports)
+            for support in supports:
+                self._supported[support].append(head)
+            self.stats["derived_facts"] += 1
+            agenda.append(head)
+            self._notify(head, True)
+
+    def _notify(self, fact: Term, added: bool):
+        for listener in self.listeners:
+            listener(fact, added)
+
+    def retract_fact(self, fact: Term) -> bool:
+        """
+        Withdraw an asserted fact and every conclusion that no longer holds
+
+        Delete-and-rederive: remove everything whose recorded derivation rests on
+        the fact, then restore whatever the remaining facts still prove.
+        """
+        if fact not in self._base:
+            return False
+        self._base.discard(fact)
+
+        overdeleted, pending = [], [fact]
+        seen = {fact}
+        while pending:
+            current = pending.pop()
+            overdeleted.append(current)
+            for child in self._supported.pop(current, ()):
+                derivation = self.derived.get(child)
+                if child not in seen and child not in self._base and derivation and current in derivation[1]:
+                    seen.add(child)
+                    pending.append(child)
+
+        for removed in overdeleted:
+            self.derived.pop(removed, None)
+            if self.store.remove(removed):
+                self._notify(removed, False)
+
+        progress = True
+        while progress:
+            progress = False
+            for candidate in overdeleted:
+                if candidate in self.store:
+                    continue
+                for rule in self.rules_for(signature(candidate)[0]):
+                    subst = unify(rule.head, candidate, {})
+                    solution = None if subst is None else next(self.solve(rule.body, subst), None)
+                    if solution is not None:
+                        agenda = []
+                        self._conclude(rule, solution, agenda)
+                        self._propagate(agenda)
+                        progress = True
+                        break
+        self.stats["retracted_facts"] += sum(1 for removed in overdeleted if removed not in self.store)
+        return True
+
+    def _propagate(self, agenda: List[Term]):
+        # Each new fact is joined at every body position it can fill; the other
+        # literals see the full store, so every derivation is found exactly when
+        # its last supporting fact arrives.
+        while agenda:
+            fact = agenda.pop()
+            for rule, literal, rest in self._triggers.get(signature(fact), ()):
+                subst = unify(literal, fact, {})
+                if subst is None:
+                    continue
+                for solution in self.solve(rest, subst):
+                    self._conclude(rule, solution, agenda)
+
+    def solve(self, body: List[Term], subst: Substitution) -> Iterator[Substitution]:
+        """Conjunctive query over the store, most selective literal first"""
+        if not body:
+            yield subst
+            return
+        if len(body) == 1:
+            yield from self.store.match(body[0], subst)
+            return
+        best_index, best_bucket = 0, None
+        for i, literal in enumerate(body):
+            bucket = self.store.candidates(literal, subst)
+            if best_bucket is None or len(bucket) < len(best_bucket):
+                best_index, best_bucket = i, bucket
+                if not bucket:
+                    return
+        literal = body[best_index]
+        rest = body[:best_index] + body[best_index + 1:]
+        for extended in self.store.match(literal, subst, best_bucket):
+            yield from self.solve(rest, extended)
+
+    def query(self, pattern: Term) -> Iterator[Tuple[Term, Substitution]]:
+        """Stored (base or derived) facts unifying with pattern"""
+        for subst in self.store.match(pattern, {}):
+            yield substitute(pattern, subst), subst
+
+# =============================================================================
+# 📋 TABLED BACKWARD CHAINING
+# =============================================================================
+
+class QueryBudgetExceeded(Exception):
+    """A query ran past its depth or time budget; partial answers are attached"""
+
+    def __init__(self, reason: str, partial: Optional[List[Term]] = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.partial = partial or []
+
+
+class AnswerTable:
+    """Memoized answers for one call pattern (up to variable renaming)"""
+    __slots__ = ("goal", "key", "answers", "seen", "complete", "valid", "truncated_at",
+                 "dependents", "stack_index", "low")
+
+    def __init__(self, goal: Term, key: Term):
+        self.goal = goal
+        self.key = key
+        self.answers: List[Term] = []
+        self.seen: Set[Term] = set()
+        self.complete = False
+        self.valid = True
+        # Depth budget that cut answers off, if any (a larger budget re-evaluates)
+        self.truncated_at: Optional[int] = None
+        # Tables that consumed these answers and must be dropped with this one
+        self.dependents: Set["AnswerTable"] = set()
+        self.stack_index: Optional[int] = None
+        self.low = 0
+
+
+class TabledResolver:
+    """
+    SLG-style tabled resolution over the chainer's facts plus backward rules
+
+    Each call pattern gets an answer table. A call that meets an in-progress
+    table consumes the answers found so far instead of recursing, and the
+    leader of each group of mutually dependent tables re-runs them until no
+    new answers appear, so left-recursive rules terminate. Completed tables
+    answer later queries directly. When a fact changes, only tables whose goal
+    unifies with it are dropped, together with the tables that consumed them.
+    """
+
+    def __init__(self, chainer: ForwardChainer, max_depth: int = 32, timeout: float = 1.0):
+        self.chainer = chainer
+        self.store = chainer.store
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.rules: List[CompiledRule] = []
+        self._heads: Dict[Tuple[str, int], List[CompiledRule]] = defaultdict(list)
+        self.tables: Dict[Term, AnswerTable] = {}
+        self._by_signature: Dict[Tuple[str, int], Set[Term]] = defaultdict(set)
+        # Answer -> (rule, supports, table) of its first backward derivation
+        self._derivations: Dict[Term, Tuple[CompiledRule, Tuple[Term, ...], AnswerTable]] = {}
+        self._stack: List[AnswerTable] = []
+        self._evaluated: List[AnswerTable] = []
+        self._changed = False
+        self._deadline = 0.0
+        self._depth_budget = max_depth
+        self._roots: Optional[List[AnswerTable]] = None
+        self._session_budget: Optional[Tuple[int, float]] = None
+        self.stats = {"table_hits": 0, "evaluations": 0, "invalidations": 0, "budget_exceeded": 0}
+        chainer.listeners.append(self._on_fact_changed)
+
+    # ------------------------------------------------------------------
+    # Rules and invalidation
+    # ------------------------------------------------------------------
+
+    def add_rule(self, rule: CompiledRule):
+        """Materialize Datalog rules forward; resolve generative ones on demand"""
+        if is_datalog_rule(rule):
+            self.chainer.add_rule(rule)
+        else:
+            self.rules.append(rule)
+            self._heads[signature(rule.head)].append(rule)
+        # Tables for the head were computed without this rule
+        for key in list(self._by_signature.get(signature(rule.head), ())):
+            table = self.tables.get(key)
+            if table is not None and unify(table.goal, rule.head, {}) is not None:
+                self._invalidate(table)
+
+    def rules_for(self, name: str) -> List[CompiledRule]:
+        """Forward and backward rules concluding the named predicate"""
+        backward = [rule for (head_name, _), rules in self._heads.items() if head_name == name for rule in rules]
+        return self.chainer.rules_for(name) + backward
+
+    def _on_fact_changed(self, fact: Term, added: bool):
+        for key in list(self._by_signature.get(signature(fact), ())):
+            table = self.tables.get(key)
+            if table is not None and unify(table.goal, fact, {}) is not None:
+                self._invalidate(table)
+
+    def _invalidate(self, table: AnswerTable):
+        pending = [table]
+        while pending:
+            current = pending.pop()
+            if not current.valid:
+                continue
+            current.valid = False
+            self.stats["invalidations"] += 1
+            if self.tables.get(current.key) is current:
+                del self.tables[current.key]
+                self._by_signature[signature(current.goal)].discard(current.key)
+            pending.extend(current.dependents)
+
+    def clear(self):
+        for table in list(self.tables.values()):
+            self._invalidate(table)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def session(self, max_depth: Optional[int] = None,
+                timeout: Optional[float] = None) -> Iterator[List[AnswerTable]]:
+        """
+        Share one depth/time budget across several queries
+
+        Yields the list of tables those queries read directly; a cache built on
+        their answers stays valid while every one of those tables does.
+        """
+        previous = self._roots, self._session_budget
+        self._roots = []
+        self._session_budget = (
+            self.max_depth if max_depth is None else max_depth,
+            time.monotonic() + (self.timeout if timeout is None else timeout)
+        )
+        try:
+            yield self._roots
+        finally:
+            self._roots, self._session_budget = previous
+
+    def query(self, goal: Term, max_depth: Optional[int] = None,
+              timeout: Optional[float] = None) -> List[Term]:
+        """All answers (instances of goal) within the budget, or QueryBudgetExceeded"""
+        self._begin(max_depth, timeout)
+        try:
+            return list(self._call(goal, 0, None).answers)
+        except QueryBudgetExceeded as exceeded:
+            exceeded.partial = self._abort(goal)
+            raise
+
+    def prove(self, body: List[Term], subst: Substitution, max_depth: Optional[int] = None,
+              timeout: Optional[float] = None) -> Optional[Substitution]:
+        """First solution of a conjunction, with each literal answered from tables"""
+        self._begin(max_depth, timeout)
+        try:
+            return next(self._solve_body(body, subst, 0, None), None)
+        except QueryBudgetExceeded:
+            self._abort(None)
+            raise
+
+    def derivation(self, fact: Term) -> Optional[Tuple[CompiledRule, Tuple[Term, ...]]]:
+        """The rule and supporting facts that first established a derived fact"""
+        if fact in self.chainer.derived:
+            return self.chainer.derived[fact]
+        entry = self._derivations.get(variant_key(fact))
+        if entry is None or not entry[2].valid:
+            return None
+        return entry[0], entry[1]
+
+    def _begin(self, max_depth: Optional[int], timeout: Optional[float]):
+        if self._session_budget is not None and max_depth is None and timeout is None:
+            self._depth_budget, self._deadline = self._session_budget
+            return
+        self._depth_budget = self.max_depth if max_depth is None else max_depth
+        self._deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+
+    def _abort(self, goal: Optional[Term]) -> List[Term]:
+        """Drop every incomplete table after a blown budget; return what goal had so far"""
+        self.stats["budget_exceeded"] += 1
+        partial = []
+        if goal is not None:
+            table = self.tables.get(variant_key(goal))
+            partial = list(table.answers) if table is not None else []
+        for table in [t for t in self.tables.values() if not t.complete]:
+            self._invalidate(table)
+        for table in self._stack:
+            table.stack_index = None
+        self._stack.clear()
+        self._evaluated.clear()
+        return partial
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def _call(self, goal: Term, depth: int, caller: Optional[AnswerTable]) -> AnswerTable:
+        if depth > self._depth_budget:
+            raise QueryBudgetExceeded(f"call depth exceeded {self._depth_budget}")
+        if time.monotonic() > self._deadline:
+            raise QueryBudgetExceeded("time budget exceeded")
+
+        key = variant_key(goal)
+        table = self.tables.get(key)
+        if table is not None and table.complete and table.truncated_at is not None \
+                and table.truncated_at < self._depth_budget:
+            self._invalidate(table)
+            table = None
+
+        if table is None:
+            table = AnswerTable(rename_variables(goal, {}), key)
+            self.tables[key] = table
+            self._by_signature[signature(goal)].add(key)
+        if caller is not None:
+            table.dependents.add(caller)
+        elif self._roots is not None:
+            self._roots.append(table)
+
+        if table.complete:
+            self.stats["table_hits"] += 1
+        elif table.stack_index is not None:
+            # Recursive variant call: consume what is known, the leader iterates
+            caller.low = min(caller.low, table.stack_index)
+        else:
+            self._evaluate(table, depth)
+            if caller is not None and not table.complete:
+                caller.low = min(caller.low, table.low)
+        return table
+
+    def _evaluate(self, table: AnswerTable, depth: int):
+        index = table.stack_index = table.low = len(self._stack)
+        self._stack.append(table)
+        mark = len(self._evaluated)
+        outer_changed, changed = self._changed, False
+        while True:
+            self._changed = False
+            self._fill(table, depth)
+            changed |= self._changed
+            if table.low < index or not self._changed:
+                break
+        self._stack.pop()
+        table.stack_index = None
+        if table.low == index:
+            # Leader reached a fixpoint: it and every table it waited on are final
+            table.complete = True
+            for member in self._evaluated[mark:]:
+                member.complete = True
+            del self._evaluated[mark:]
+        else:
+            self._evaluated.append(table)
+        self._changed = outer_changed or changed
+
+    def _fill(self, table: AnswerTable, depth: int):
+        self.stats["evaluations"] += 1
+        goal = table.goal
+        for subst in self.store.match(goal, {}):
+            self._add_answer(table, substitute(goal, subst), None, ())
+
+        sig = signature(goal)
+        rules = self._heads.get(sig, [])
+        # Forward rules whose bodies need backward-derived facts are not materialized
+        if self._heads:
+            rules = rules + [rule for rule in self.chainer.rules_for(sig[0])
+                             if signature(rule.head) == sig and self._needs_resolution(rule)]
+        for rule in rules:
+            mapping: Dict[Var, Var] = {}
+            head = rename_variables(rule.head, mapping)
+            body = [rename_variables(literal, mapping) for literal in rule.body]
+            subst = unify(head, goal, {})
+            if subst is None:
+                continue
+            for solution in self._solve_body(body, subst, depth + 1, table):
+                self._add_answer(table, substitute(goal, solution), rule,
+                                 tuple(substitute(literal, solution) for literal in body))
+
+    def _needs_resolution(self, rule: CompiledRule, visiting: Optional[Set[CompiledRule]] = None) -> bool:
+        """Whether a forward rule's body depends, directly or not, on backward-only facts"""
+        visiting = set() if visiting is None else visiting
+        if rule in visiting:
+            return False
+        visiting.add(rule)
+        for literal in rule.body:
+            sig = signature(literal)
+            if sig in self._heads:
+                return True
+            if any(signature(other.head) == sig and self._needs_resolution(other, visiting)
+                   for other in self.chainer.rules_for(sig[0])):
+                return True
+        return False
+
+    def _solve_body(self, body: List[Term], subst: Substitution, depth: int,
+                    caller: Optional[AnswerTable]) -> Iterator[Substitution]:
+        if not body:
+            yield subst
+            return
+        literal = substitute(body[0], subst)
+        table = self._call(literal, depth, caller)
+        answers = table.answers
+        # Snapshot: answers found later reach this consumer on the leader's next pass
+        for i in range(len(answers)):
+            answer = answers[i]
+            if not is_ground(answer):
+                answer = rename_variables(answer, {})
+            extended = unify(literal, answer, subst)
+            if extended is not None:
+                yield from self._solve_body(body[1:], extended, depth, caller)
+
+    def _add_answer(self, table: AnswerTable, answer: Term, rule: Optional[CompiledRule],
+                    supports: Tuple[Term, ...]):
+        if term_depth(answer) > self._depth_budget:
+            table.truncated_at = self._depth_budget
+            return
+        key = variant_key(answer)
+        if key in table.seen:
+            return
+        table.seen.add(key)
+        table.answers.append(answer)
+        self._changed = True
+        if rule is not None and answer not in self.store:
+            existing = self._derivations.get(key)
+            if existing is None or not existing[2].valid:
+                self._derivations[key] = (rule, supports, table)
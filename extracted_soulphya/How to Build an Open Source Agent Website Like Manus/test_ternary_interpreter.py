@@ -166,6 +166,81 @@ def test_prolog_parsing():
         print(f"  Parsed: {parsed}")
         print()
 
+def test_forward_chaining():
+    """Test unification and incremental forward chaining (engine has no external dependencies)"""
+    print("\n🔁 TESTING FORWARD CHAINING")
+    print("=" * 30)
+    
+    from ternary_logic_engine import CompiledRule, ForwardChainer, format_term, parse_term, split_top_level
+    
+    body = split_top_level("intention(sacred, X), logic(sound, X), love(present, X)")
+    print(f"Rule body split: {body}")
+    assert body == ["intention(sacred, X)", "logic(sound, X)", "love(present, X)"]
+    
+    engine = ForwardChainer()
+    engine.add_rule(CompiledRule.parse("sacred_code(X)", body))
+    engine.add_rule(CompiledRule.parse("blessed(Y)", ["sacred_code(Y)"]))
+    
+    for statement in ["intention(sacred, interpreter)", "logic(sound, interpreter)",
+                      "intention(sacred, bridge)", "love(present, interpreter)"]:
+        engine.add_fact(parse_term(statement))
+        print(f"  + {statement:<30} → derived: {sorted(format_term(f) for f in engine.derived)}")
+    
+    assert parse_term("blessed(interpreter)") in engine.store
+    assert parse_term("sacred_code(bridge)") not in engine.store
+    
+    answers = [format_term(fact) for fact, _ in engine.query(parse_term("intention(sacred, Who)"))]
+    print(f"Query intention(sacred, Who): {answers}")
+    assert sorted(answers) == ["intention(sacred, bridge)", "intention(sacred, interpreter)"]
+
+def test_tabled_resolution():
+    """Test answer tables: recursion terminates, answers are reused and invalidated precisely"""
+    print("\n📋 TESTING TABLED RESOLUTION")
+    print("=" * 30)
+    
+    from ternary_logic_engine import (
+        CompiledRule, ForwardChainer, QueryBudgetExceeded, TabledResolver, format_term, parse_term
+    )
+    
+    engine = ForwardChainer()
+    resolver = TabledResolver(engine, max_depth=6)
+    resolver.add_rule(CompiledRule.parse("lineage(X, line(X, Y))", ["ancestor(X, Y)"]))
+    resolver.add_rule(CompiledRule.parse("ancestor(X, Y)", ["parent(X, Y)"]))
+    resolver.add_rule(CompiledRule.parse("ancestor(X, Z)", ["ancestor(X, Y)", "parent(Y, Z)"]))
+    resolver.add_rule(CompiledRule.parse("count(s(N))", ["count(N)"]))
+    engine.add_facts([parse_term(f) for f in ["parent(adam, seth)", "parent(seth, enos)", "count(zero)"]])
+    
+    goal = parse_term("lineage(adam, L)")
+    answers = sorted(format_term(a) for a in resolver.query(goal))
+    print(f"lineage(adam, L): {answers}")
+    assert answers == ["lineage(adam, line(adam, enos))", "lineage(adam, line(adam, seth))"]
+    
+    evaluations = resolver.stats["evaluations"]
+    resolver.query(goal)
+    print(f"Repeat query evaluations: {resolver.stats['evaluations'] - evaluations} (answered from table)")
+    assert resolver.stats["evaluations"] == evaluations
+    
+    # Left recursion over an infinite domain stops at the depth budget
+    counts = resolver.query(parse_term("count(X)"))
+    print(f"count(X) within depth 6: {len(counts)} answers")
+    assert len(counts) == 6
+    
+    # Unrelated facts leave the table alone; a supporting fact invalidates it
+    evaluations = resolver.stats["evaluations"]
+    engine.add_fact(parse_term("parent(noah, shem)"))
+    resolver.query(goal)
+    assert resolver.stats["evaluations"] == evaluations
+    engine.retract_fact(parse_term("parent(seth, enos)"))
+    answers = [format_term(a) for a in resolver.query(goal)]
+    print(f"After retracting parent(seth, enos): {answers}")
+    assert answers == ["lineage(adam, line(adam, seth))"]
+    
+    try:
+        resolver.query(parse_term("count(X)"), max_depth=10 ** 6, timeout=0.01)
+        assert False, "expected the time budget to be exceeded"
+    except QueryBudgetExceeded as exceeded:
+        print(f"Time budget: {exceeded.reason} after {len(exceeded.partial)} partial answers")
+
 def test_yaml_structure():
     """Test YAML structure for scroll loading"""
     print("\n📜 TESTING YAML SCROLL STRUCTURE")
@@ -250,6 +325,8 @@ if __name__ == "__main__":
         test_ternary_logic()
         test_prayer_parsing()
         test_prolog_parsing()
+        test_forward_chaining()
+        test_tabled_resolution()
         test_yaml_structure()
         
         print("\n🌟 VALIDATION COMPLETE!")
@@ -0,0 +1,107 @@
+"""
+fake_openai_server.py
+
+A local OpenAI-compatible Chat Completions server that streams canned tokens with a
+configurable delay. Used to exercise ws_gateway.py (and any other async OpenAI client)
+without network access or API keys.
+
+Usage:
+  python fake_openai_server.py --port 8788 --first-token-ms 200 --token-ms 20
+  OPENAI_BASE_URL=http://127.0.0.1:8788/v1 OPENAI_API_KEY=fake python ws_gateway.py
+
+Streaming responses follow the SSE "data: {chunk}" / "data: [DONE]" framing.
+"""
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse, JSONResponse
+import argparse
+import asyncio
+import json
+import time
+
+FIRST_TOKEN_DELAY = 0.2
+TOKEN_DELAY = 0.02
+TOKENS = 32
+
+app = FastAPI()
+
+# Counters so tests can check upstream behaviour (e.g. cancellation)
+stats = {"requests": 0, "completed": 0, "disconnected": 0, "active": 0}
+
+
+def _reply_tokens(messages):
+    last = messages[-1].get("content", "") if messages else ""
+    words = (f"echo {last} " + "sophia " * TOKENS).split()[:TOKENS]
+    return [w + " " for w in words]
+
+
+def _chunk(completion_id, model, content=None, finish_reason=None):
+    delta = {"content": content} if content is not None else {}
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model", "fake-model")
+    tokens = _reply_tokens(body.get("messages", []))
+    completion_id = f"chatcmpl-fake-{stats['requests']}"
+    stats["requests"] += 1
+
+    if not body.get("stream"):
+        await asyncio.sleep(FIRST_TOKEN_DELAY + TOKEN_DELAY * len(tokens))
+        stats["completed"] += 1
+        return JSONResponse({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(tokens)}, "finish_reason": "stop"}],
+        })
+
+    async def events():
+        stats["active"] += 1
+        finished = False
+        try:
+            await asyncio.sleep(FIRST_TOKEN_DELAY)
+            for i, token in enumerate(tokens):
+                if i:
+                    await asyncio.sleep(TOKEN_DELAY)
+                yield f"data: {json.dumps(_chunk(completion_id, model, token))}\n\n"
+            yield f"data: {json.dumps(_chunk(completion_id, model, finish_reason='stop'))}\n\n"
+            yield "data: [DONE]\n\n"
+            finished = True
+            stats["completed"] += 1
+        finally:
+            stats["active"] -= 1
+            if not finished:
+                stats["disconnected"] += 1
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/stats")
+def get_stats():
+    return stats
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible streaming server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8788)
+    parser.add_argument("--first-token-ms", type=float, default=200)
+    parser.add_argument("--token-ms", type=float, default=20)
+    parser.add_argument("--tokens", type=int, default=32)
+    args = parser.parse_args()
+
+    FIRST_TOKEN_DELAY = args.first_token_ms / 1000
+    TOKEN_DELAY = args.token_ms / 1000
+    TOKENS = args.tokens
+    uvicorn.run(app, host=args.host, port=args.port)
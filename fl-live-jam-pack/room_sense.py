@@ -3,21 +3,188 @@
 # Integrates with Sophia Hub for intelligent room adaptation
 
 import numpy as np
-import sounddevice as sd
 import scipy.signal as signal
 from scipy import fftpack
+from scipy.io import wavfile
+import argparse
 import json
 import asyncio
 import websockets
 import time
 from datetime import datetime
 
+# Only needed for live capture; WAV analysis works without an audio device
+try:
+    import sounddevice as sd
+except (ImportError, OSError):
+    sd = None
+
+
+class SampleRingBuffer:
+    """Single-producer, single-consumer ring of float32 samples
+
+    The audio callback only writes samples and advances `written`; the
+    analysis side only reads and advances `consumed`. Each side owns one
+    counter, so neither takes a lock and the callback never blocks. When the
+    ring is full the callback drops the incoming samples and counts them.
+    """
+
+    def __init__(self, capacity):
+        size = 1 << (int(capacity) - 1).bit_length()
+        self.buffer = np.zeros(size, dtype=np.float32)
+        self.mask = size - 1
+        self.written = 0
+        self.consumed = 0
+        self.dropped = 0
+
+    def available(self):
+        return self.written - self.consumed
+
+    def write(self, samples):
+        free = len(self.buffer) - (self.written - self.consumed)
+        if len(samples) > free:
+            self.dropped += len(samples) - free
+            samples = samples[:free]
+        start = self.written & self.mask
+        first = min(len(samples), len(self.buffer) - start)
+        self.buffer[start:start + first] = samples[:first]
+        self.buffer[:len(samples) - first] = samples[first:]
+        self.written += len(samples)
+
+    def peek(self, out):
+        """Copy the oldest len(out) unread samples into out without consuming them"""
+        count = len(out)
+        start = self.consumed & self.mask
+        first = min(count, len(self.buffer) - start)
+        out[:first] = self.buffer[start:start + first]
+        out[first:] = self.buffer[:count - first]
+        return out
+
+    def advance(self, count):
+        self.consumed += count
+
+
+class StreamingRoomEstimator:
+    """Overlapped STFT over a sample ring with exponentially averaged room estimates
+
+    Each hop windows the newest fft_size samples, takes one rFFT and folds the
+    magnitude into an averaged spectrum. The newest hop's power feeds the
+    average level, a decaying peak hold, a noise floor that follows drops
+    quickly and rises slowly, and a decay tracker that fits the slope of
+    each level drop (dB per second) for an RT60 estimate. Work per hop is
+    constant, and at most max_latency seconds of backlog are kept: older
+    audio is skipped rather than processed late.
+    """
+
+    def __init__(self, sample_rate, fft_size=4096, hop_size=1024, time_constant=3.0,
+                 floor_time_constant=10.0, max_latency=0.5):
+        self.sample_rate = sample_rate
+        self.fft_size = fft_size
+        self.hop_size = hop_size
+        self.hop_seconds = hop_size / sample_rate
+        self.window = np.hanning(fft_size + 1)[:-1].astype(np.float32)
+        self.freqs = np.fft.rfftfreq(fft_size, 1 / sample_rate)
+        self.max_backlog = fft_size + int(max_latency * sample_rate)
+        self._frame = np.zeros(fft_size, dtype=np.float32)
+
+        # Per-hop smoothing factors for the given time constants (seconds)
+        self.alpha = 1 - np.exp(-self.hop_seconds / time_constant)
+        self.floor_alpha = 1 - np.exp(-self.hop_seconds / floor_time_constant)
+        self.peak_decay = np.exp(-self.hop_seconds / time_constant)
+
+        self.spectrum = np.zeros(len(self.freqs))
+        self.mean_power = 0.0
+        self.peak_level = 0.0
+        self.noise_floor_db = None
+        self.rt60_time = None
+        self.frames = 0
+        self.skipped = 0
+
+        # Decay tracking: a drop must span decay_range_db to be fitted
+        self.decay_range_db = 10.0
+        self.max_decay_points = int(4.0 / self.hop_seconds)
+        self._previous_db = None
+        self._decay = None
+
+    def process(self, ring):
+        """Run every complete hop waiting in the ring; returns the number of hops"""
+        backlog = ring.available()
+        if backlog > self.max_backlog:
+            skip = (backlog - self.max_backlog) // self.hop_size * self.hop_size
+            ring.advance(skip)
+            self.skipped += skip
+        hops = 0
+        while ring.available() >= self.fft_size:
+            self._update(ring.peek(self._frame))
+            ring.advance(self.hop_size)
+            hops += 1
+        return hops
+
+    def _update(self, frame):
+        magnitude = np.abs(np.fft.rfft(frame * self.window))
+        newest = frame[-self.hop_size:]
+        power = float(np.dot(newest, newest)) / self.hop_size
+        peak = float(np.max(np.abs(newest)))
+
+        if self.frames == 0:
+            self.spectrum[:] = magnitude
+            self.mean_power = power
+        else:
+            self.spectrum += self.alpha * (magnitude - self.spectrum)
+            self.mean_power += self.alpha * (power - self.mean_power)
+        self.peak_level = max(peak, self.peak_level * self.peak_decay)
+        self.frames += 1
+
+        level_db = 10 * np.log10(power + 1e-12)
+        if self.noise_floor_db is None or level_db < self.noise_floor_db:
+            self.noise_floor_db = level_db if self.noise_floor_db is None else \
+                self.noise_floor_db + 0.5 * (level_db - self.noise_floor_db)
+        else:
+            self.noise_floor_db += self.floor_alpha * (level_db - self.noise_floor_db)
+        self._track_decay(level_db)
+
+    def _track_decay(self, level_db):
+        floor = self.noise_floor_db
+        if self._decay is None:
+            # A decay starts where a level well above the floor stops rising
+            previous = self._previous_db
+            if previous is not None and level_db < previous and previous > floor + self.decay_range_db:
+                self._decay = [previous, level_db]
+        elif level_db <= min(self._decay) + 1.0 and level_db > floor + 3.0 \
+                and len(self._decay) < self.max_decay_points:
+            self._decay.append(level_db)
+        else:
+            self._finish_decay()
+        self._previous_db = level_db
+
+    def _finish_decay(self):
+        levels = np.array(self._decay)
+        self._decay = None
+        if len(levels) < 3 or levels[0] - levels.min() < self.decay_range_db:
+            return
+        slope = np.polyfit(np.arange(len(levels)) * self.hop_seconds, levels, 1)[0]
+        if slope >= 0:
+            return
+        rt60 = -60.0 / slope
+        if self.rt60_time is None:
+            self.rt60_time = rt60
+        else:
+            self.rt60_time += 0.3 * (rt60 - self.rt60_time)
+
+
 class RoomSenseAnalyzer:
-    def __init__(self, hub_url="ws://localhost:8765"):
+    def __init__(self, hub_url="ws://localhost:8765", fft_size=4096, hop_size=1024):
         self.hub_url = hub_url
         self.sample_rate = 44100
         self.duration = 3.0  # seconds to analyze
         self.websocket = None
+        
+        # Streaming mode: capture callback -> ring -> per-hop STFT estimator
+        self.fft_size = fft_size
+        self.hop_size = hop_size
+        self.input_stream = None
+        self.input_status_errors = 0
+        self.reset_stream(self.sample_rate)
     
     def log(self, message):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -35,6 +202,9 @@ class RoomSenseAnalyzer:
     def capture_room_audio(self):
         """Capture room audio for analysis"""
         self.log(f"Capturing {self.duration}s of room audio...")
+        if sd is None:
+            self.log("sounddevice is not available; cannot capture audio")
+            return None
         
         try:
             # Record audio from default input device
@@ -58,7 +228,10 @@ class RoomSenseAnalyzer:
         fft = np.fft.rfft(audio_data)
         freqs = np.fft.rfftfreq(len(audio_data), 1/self.sample_rate)
         magnitude = np.abs(fft)
-        
+        return self.analyze_spectrum(magnitude, freqs)
+    
+    def analyze_spectrum(self, magnitude, freqs):
+        """Band balance and brightness of a magnitude spectrum"""
         # Frequency band analysis
         low_band = np.mean(magnitude[(freqs >= 20) & (freqs <= 200)])      # Bass
         mid_band = np.mean(magnitude[(freqs >= 200) & (freqs <= 2000)])    # Mids
@@ -263,6 +436,119 @@ class RoomSenseAnalyzer:
             self.log(f"Error sending to hub: {e}")
             return None
     
+    # Streaming mode
+    
+    def reset_stream(self, sample_rate):
+        """Fresh ring buffer and estimator for audio at sample_rate"""
+        self.stream_sample_rate = sample_rate
+        self.ring = SampleRingBuffer(2 * sample_rate)
+        self.estimator = StreamingRoomEstimator(sample_rate, self.fft_size, self.hop_size)
+    
+    def audio_callback(self, indata, frames, time_info, status):
+        """Input stream callback: copy the block into the ring, nothing else"""
+        if status:
+            self.input_status_errors += 1
+        self.ring.write(indata[:, 0])
+    
+    def start_streaming(self):
+        """Open a callback-driven input stream feeding the ring buffer"""
+        if sd is None:
+            raise RuntimeError("sounddevice is not available; cannot capture audio")
+        self.reset_stream(self.sample_rate)
+        self.input_stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='float32',
+            blocksize=self.hop_size,
+            callback=self.audio_callback
+        )
+        self.input_stream.start()
+        self.log(f"Streaming room audio ({self.fft_size}-point STFT, hop {self.hop_size})")
+    
+    def stop_streaming(self):
+        if self.input_stream is not None:
+            self.input_stream.stop()
+            self.input_stream.close()
+            self.input_stream = None
+    
+    def stream_analysis(self):
+        """Room analysis from the running estimates, in the analyze_room format"""
+        estimator = self.estimator
+        if not estimator.frames:
+            return None
+        
+        rt60_time = estimator.rt60_time if estimator.rt60_time is not None else 0.5  # Default
+        rms = float(np.sqrt(estimator.mean_power))
+        peak = estimator.peak_level
+        snr_db = 20 * np.log10(peak / (rms + 1e-10)) if peak > 0 else 60  # Quiet room default
+        
+        analysis = {
+            'frequency': self.analyze_spectrum(estimator.spectrum, estimator.freqs),
+            'reverb': {
+                'rt60_time': rt60_time,
+                'reverb_normalized': np.clip(rt60_time / 2.0, 0, 1)
+            },
+            'noise': {
+                'rms_level': rms,
+                'peak_level': float(peak),
+                'snr_db': float(snr_db),
+                'noise_floor_db': float(estimator.noise_floor_db),
+                'noise_normalized': np.clip(1 - (snr_db / 60), 0, 1)
+            },
+            'stream': {
+                'frames': estimator.frames,
+                'backlog_ms': 1000 * self.ring.available() / self.stream_sample_rate,
+                'skipped_samples': estimator.skipped,
+                'dropped_samples': self.ring.dropped
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+        analysis['recommendations'] = self.get_mix_recommendations(analysis)
+        return analysis
+    
+    def analyze_wav(self, path, block_size=512):
+        """Run the streaming pipeline over a WAV file instead of the microphone
+
+        The file is fed through audio_callback in block_size blocks and the
+        estimator runs after each block, so results are deterministic. Files
+        shorter than fft_size are zero-padded to one frame.
+        """
+        sample_rate, audio = read_wav(path)
+        if len(audio) < self.fft_size:
+            # Clips shorter than one STFT frame are analyzed as one zero-padded frame
+            audio = np.pad(audio, (0, self.fft_size - len(audio)))
+        self.reset_stream(sample_rate)
+        for start in range(0, len(audio), block_size):
+            block = audio[start:start + block_size]
+            self.audio_callback(block[:, None], len(block), None, None)
+            self.estimator.process(self.ring)
+        return self.stream_analysis()
+    
+    async def continuous_streaming(self, interval=30, poll_interval=0.05):
+        """Stream room audio continuously, sending averaged analysis every interval"""
+        self.start_streaming()
+        next_update = time.monotonic() + interval
+        try:
+            while True:
+                self.estimator.process(self.ring)
+                
+                if time.monotonic() >= next_update:
+                    next_update += interval
+                    analysis = self.stream_analysis()
+                    if analysis:
+                        self.log(f"Room type: {analysis['recommendations']['room_type']} "
+                                 f"(reverb {analysis['reverb']['rt60_time']:.2f}s, "
+                                 f"noise floor {analysis['noise']['noise_floor_db']:.1f} dB)")
+                        await self.send_to_hub(analysis)
+                
+                await asyncio.sleep(poll_interval)
+        
+        except asyncio.CancelledError:
+            self.log("Stopping room streaming")
+            raise
+        finally:
+            self.stop_streaming()
+    
     async def continuous_monitoring(self, interval=30):
         """Continuously monitor room and update hub"""
         self.log(f"Starting continuous room monitoring (every {interval}s)")
@@ -282,13 +568,47 @@ class RoomSenseAnalyzer:
                 self.log(f"Error in monitoring loop: {e}")
                 await asyncio.sleep(5)  # Wait before retrying
 
+def read_wav(path):
+    """Sample rate and mono float32 samples in [-1, 1] of a WAV file"""
+    sample_rate, data = wavfile.read(path)
+    if data.dtype == np.uint8:
+        audio = (data.astype(np.float32) - 128) / 128
+    elif np.issubdtype(data.dtype, np.integer):
+        audio = data.astype(np.float32) / np.iinfo(data.dtype).max
+    else:
+        audio = data.astype(np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    return sample_rate, audio
+
+
 # Standalone usage
 async def main():
-    print("🔥 Room Sense Analyzer - Sophia Live Jam System")
-    print("Analyzing room acoustics for auto-mix optimization...")
+    parser = argparse.ArgumentParser(description="Room acoustics analysis for auto-mix")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream from the microphone and update the hub continuously")
+    parser.add_argument("--wav", nargs="+", metavar="FILE",
+                        help="analyze WAV files through the streaming pipeline instead of the microphone")
+    parser.add_argument("--interval", type=float, default=30, help="seconds between hub updates")
+    args = parser.parse_args()
     
     analyzer = RoomSenseAnalyzer()
     
+    if args.wav:
+        for path in args.wav:
+            analysis = analyzer.analyze_wav(path)
+            print(json.dumps({"file": path, **analysis}, indent=2, default=float))
+        return
+    
+    print("🔥 Room Sense Analyzer - Sophia Live Jam System")
+    if args.stream:
+        try:
+            await analyzer.continuous_streaming(args.interval)
+        except KeyboardInterrupt:
+            pass
+        return
+    print("Analyzing room acoustics for auto-mix optimization...")
+    
     try:
         # Single analysis
         analysis = await analyzer.analyze_room()
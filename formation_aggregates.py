@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+☁️ FORMATION AGGREGATES
+Running per-formation summaries of member nodes, updated as nodes change
+
+Formation metrics, health and consciousness synchronization only need a few
+totals over a formation's nodes: load sum and extremes, Christ-sealed and
+healthy node counts, consciousness level sum and sum of squares, and the
+number of communication links. FormationAggregateTracker keeps those totals
+per formation and applies deltas when a member node's load, level or seal
+changes (or members join and leave), so reading a formation's summary is
+O(1) instead of a pass over its nodes.
+
+Each aggregate carries a version that moves on every change; monitoring
+compares it with the version it last saw to skip formations that are
+unchanged since the previous tick.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from diffusion_node_matrix import consciousness_rank
+
+# Nodes at or above this load do not count as healthy
+HEALTHY_LOAD_LIMIT = 0.9
+
+
+class NodeState(NamedTuple):
+    """What a node contributes to the aggregates of its formations"""
+    load: float
+    level: int
+    sealed: bool
+
+    @property
+    def healthy(self) -> bool:
+        return self.load < HEALTHY_LOAD_LIMIT and self.sealed
+
+    @classmethod
+    def of(cls, node) -> "NodeState":
+        return cls(
+            load=node.current_load,
+            level=consciousness_rank(node.consciousness_level),
+            sealed=bool(node.spiritual_status.get("christ_sealed", False)),
+        )
+
+
+class FormationAggregate:
+    """Running totals over one formation's member nodes"""
+
+    def __init__(self):
+        self.members = 0
+        self.load_sum = 0.0
+        self.loads: List[float] = []  # sorted, for the load extremes
+        self.sealed = 0
+        self.healthy = 0
+        self.level_sum = 0
+        self.level_squares = 0
+        self.connections = 0
+        self.version = 0
+
+    def add(self, state: NodeState):
+        self.members += 1
+        self.load_sum += state.load
+        insort(self.loads, state.load)
+        self.sealed += state.sealed
+        self.healthy += state.healthy
+        self.level_sum += state.level
+        self.level_squares += state.level * state.level
+        self.version += 1
+
+    def remove(self, state: NodeState):
+        self.members -= 1
+        self.load_sum -= state.load
+        del self.loads[bisect_left(self.loads, state.load)]
+        self.sealed -= state.sealed
+        self.healthy -= state.healthy
+        self.level_sum -= state.level
+        self.level_squares -= state.level * state.level
+        if not self.members:
+            self.load_sum = 0.0  # drop accumulated rounding
+        self.version += 1
+
+    @property
+    def average_load(self) -> float:
+        return self.load_sum / self.members if self.members else 0.0
+
+    @property
+    def load_balance(self) -> float:
+        return 1.0 - (self.loads[-1] - self.loads[0]) if self.loads else 1.0
+
+    @property
+    def level_variance(self) -> float:
+        if not self.members:
+            return 0.0
+        mean = self.level_sum / self.members
+        return max(self.level_squares / self.members - mean * mean, 0.0)
+
+
+class FormationAggregateTracker:
+    """FormationAggregates for every tracked formation, indexed by member node"""
+
+    def __init__(self):
+        self.formations: Dict[str, FormationAggregate] = {}
+        self.memberships: Dict[str, Set[str]] = {}  # node_id -> formation ids
+        self._states: Dict[str, NodeState] = {}
+
+    def get(self, formation_id: str) -> Optional[FormationAggregate]:
+        return self.formations.get(formation_id)
+
+    def track(self, formation_id: str, nodes: Iterable, connections: int = 0) -> FormationAggregate:
+        """Start (or restart) tracking a formation with the given member nodes"""
+        self.forget(formation_id)
+        aggregate = self.formations[formation_id] = FormationAggregate()
+        aggregate.connections = connections
+        for node in nodes:
+            self.add_member(formation_id, node)
+        return aggregate
+
+    def forget(self, formation_id: str):
+        aggregate = self.formations.pop(formation_id, None)
+        if aggregate is None:
+            return
+        for node_id in [n for n, formations in self.memberships.items() if formation_id in formations]:
+            self._leave(node_id, formation_id)
+
+    def add_member(self, formation_id: str, node):
+        formations = self.memberships.setdefault(node.node_id, set())
+        if formation_id in formations:
+            return
+        state = self._states.get(node.node_id)
+        if state is None:
+            state = self._states[node.node_id] = NodeState.of(node)
+        formations.add(formation_id)
+        self.formations[formation_id].add(state)
+
+    def remove_member(self, formation_id: str, node_id: str):
+        if formation_id in self.memberships.get(node_id, ()):
+            self.formations[formation_id].remove(self._states[node_id])
+            self._leave(node_id, formation_id)
+
+    def _leave(self, node_id: str, formation_id: str):
+        formations = self.memberships[node_id]
+        formations.discard(formation_id)
+        if not formations:
+            del self.memberships[node_id]
+            del self._states[node_id]
+
+    def set_connections(self, formation_id: str, connections: int):
+        aggregate = self.formations[formation_id]
+        if aggregate.connections != connections:
+            aggregate.connections = connections
+            aggregate.version += 1
+
+    def node_changed(self, node):
+        """Re-read a node's load, level and seal; update its formations if they moved"""
+        old = self._states.get(node.node_id)
+        if old is None:
+            return  # not in any tracked formation
+        new = NodeState.of(node)
+        if new == old:
+            return
+        self._states[node.node_id] = new
+        for formation_id in self.memberships[node.node_id]:
+            aggregate = self.formations[formation_id]
+            aggregate.remove(old)
+            aggregate.add(new)
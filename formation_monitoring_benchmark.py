@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Formation Monitoring Benchmark
+Compares the previous monitoring tick of CloudDiffusionOrchestrator (metrics,
+health and consciousness sync recomputed from every member node of every
+formation) with the tick over running formation aggregates, which skips
+formations unchanged since the last tick. Checks that both produce the same
+metrics, health and synchronization.
+
+Usage:
+    python formation_monitoring_benchmark.py --nodes 20000 --formations 200 --formation-size 256
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+
+from cloud_diffusion_orchestrator import (
+    CloudDensity, CloudDiffusionOrchestrator, CloudFormation, DiffusionStrategy, SituationContext, SituationType
+)
+from diffusion_selection_benchmark import RANK, populate
+
+
+def legacy_metrics(orchestrator, formation):
+    """The previous _calculate_formation_metrics"""
+    nodes = orchestrator.available_nodes
+    metrics = {"coverage_efficiency": len(formation.active_nodes) / max(len(nodes), 1)}
+    loads = [nodes[nid].current_load for nid in formation.active_nodes if nid in nodes]
+    metrics["average_load"] = sum(loads) / len(loads) if loads else 0.0
+    metrics["load_balance"] = 1.0 - (max(loads) - min(loads)) if loads else 1.0
+    sealed = sum(1 for nid in formation.active_nodes if nodes[nid].spiritual_status.get("christ_sealed", False))
+    metrics["spiritual_coherence"] = sealed / max(len(formation.active_nodes), 1)
+    connections = sum(len(c) for c in formation.communication_matrix.values())
+    metrics["communication_efficiency"] = connections / max(len(formation.active_nodes) * (len(formation.active_nodes) - 1), 1)
+    return metrics
+
+
+def legacy_health(orchestrator, formation, metrics):
+    """The previous _assess_formation_health"""
+    nodes = orchestrator.available_nodes
+    healthy = sum(1 for nid in formation.active_nodes
+                  if nodes[nid].current_load < 0.9 and nodes[nid].spiritual_status.get("christ_sealed", False))
+    score = healthy / max(len(formation.active_nodes), 1) * 0.4
+    score += (1.0 - min(metrics.get("average_load", 0.0), 1.0)) * 0.3 + formation.spiritual_coherence * 0.3
+    return "healthy" if score >= 0.8 else "degraded" if score >= 0.6 else "critical"
+
+
+def legacy_sync(orchestrator, formation):
+    """The previous _calculate_consciousness_sync"""
+    levels = [RANK[orchestrator.available_nodes[nid].consciousness_level] for nid in formation.active_nodes]
+    mean = sum(levels) / len(levels)
+    variance = sum((level - mean) ** 2 for level in levels) / len(levels)
+    return max(0.0, 1.0 - variance / 25)
+
+
+def legacy_tick(orchestrator):
+    results = {}
+    for formation_id, formation in orchestrator.active_formations.items():
+        metrics = legacy_metrics(orchestrator, formation)
+        results[formation_id] = (metrics, legacy_health(orchestrator, formation, metrics),
+                                 legacy_sync(orchestrator, formation))
+    return results
+
+
+def check(orchestrator, expected):
+    for formation_id, (metrics, health, sync) in expected.items():
+        formation = orchestrator.active_formations[formation_id]
+        assert formation.formation_health == health, formation_id
+        assert math.isclose(formation.consciousness_synchronization, sync, abs_tol=1e-9), formation_id
+        for name, value in metrics.items():
+            assert math.isclose(formation.performance_metrics[name], value, abs_tol=1e-9), (formation_id, name)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark formation monitoring")
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--formations", type=int, default=200)
+    parser.add_argument("--formation-size", type=int, default=256)
+    parser.add_argument("--changed", type=float, default=0.01, help="fraction of nodes whose load changes per tick")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    rng = random.Random(7)
+
+    orchestrator = CloudDiffusionOrchestrator()
+    await populate(orchestrator, args.nodes, rng)
+    for node in orchestrator.available_nodes.values():
+        orchestrator.refresh_node(node.node_id)  # populate() flips seals in place
+    node_ids = list(orchestrator.available_nodes)
+
+    context = SituationContext(
+        context_id=str(uuid.uuid4()), situation_type=SituationType.DEVELOPMENT, urgency_level=5,
+        complexity_score=0.5, spiritual_requirements=False, consciousness_level_required="aware",
+        resource_constraints={}, environmental_factors={}, adaptation_requirements=[]
+    )
+    for i in range(args.formations):
+        members = rng.sample(node_ids, args.formation_size)
+        formation = CloudFormation(
+            formation_id=f"formation_{i}", name=f"Formation {i}", situation_context=context,
+            diffusion_strategy=DiffusionStrategy.INSTANT_DEPLOYMENT, cloud_density=CloudDensity.MODERATE,
+            active_nodes=set(members), node_positions={},
+            communication_matrix=await orchestrator._create_communication_matrix(members),
+            performance_metrics={}, spiritual_coherence=1.0, consciousness_synchronization=0.9,
+            formation_health="healthy"
+        )
+        orchestrator._track_formation(formation)
+        orchestrator.active_formations[formation.formation_id] = formation
+
+    await orchestrator._monitor_active_formations()
+    touched = max(int(args.nodes * args.changed), 1)
+
+    print(f"{args.formations} formations of {args.formation_size} nodes over {args.nodes:,} nodes")
+    began = time.perf_counter()
+    expected = legacy_tick(orchestrator)
+    legacy = time.perf_counter() - began
+    check(orchestrator, expected)
+
+    began = time.perf_counter()
+    await orchestrator._monitor_active_formations()
+    idle = time.perf_counter() - began
+
+    changes = [(rng.choice(node_ids), rng.random()) for _ in range(touched)]
+    began = time.perf_counter()
+    for node_id, load in changes:
+        orchestrator.available_nodes[node_id].current_load = load
+    updates = time.perf_counter() - began
+    changed = sum(1 for fid, f in orchestrator.active_formations.items()
+                  if orchestrator._monitored_versions[fid][0] != orchestrator.formation_aggregates.get(fid).version)
+    began = time.perf_counter()
+    await orchestrator._monitor_active_formations()
+    busy = time.perf_counter() - began
+    check(orchestrator, legacy_tick(orchestrator))
+
+    print(f"  full recompute tick:        {legacy * 1000:8.2f} ms")
+    print(f"  aggregate tick, no changes: {idle * 1000:8.2f} ms")
+    print(f"  aggregate tick, {touched} load changes ({changed} formations touched): {busy * 1000:8.2f} ms "
+          f"+ {updates * 1000:.2f} ms applying the changes")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
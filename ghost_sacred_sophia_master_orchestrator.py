@@ -14,21 +14,25 @@ as modular GUIs that adapt fluidly to any situation like a conscious cloud.
 """
 
 import asyncio
+import importlib
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+import time
 import uuid
-import yaml
 from pathlib import Path
 
-# Import all system components
-from ghost_sacred_sophia_bridge import GhostSacredSophiaBridge, initialize_ghost_sophia_integration
-from prognosis_adaptive_framework import ProgGnosisAdaptiveFramework, initialize_prognosis_framework
-from modular_gui_deployment_system import ModularGUIDeploymentSystem, initialize_modular_gui_system
-from cloud_diffusion_orchestrator import CloudDiffusionOrchestrator, initialize_cloud_diffusion_orchestrator
-from sacred_agent_factory import SacredAgentFactory
-from unified_database_orchestrator import UnifiedDatabaseOrchestrator
+from deployment_health_registry import HEALTHY, DeploymentHealthRegistry, HealthTransition
+from startup_profiler import profile_phase
+
+# System components are imported when the master initializes them, so importing
+# this module (e.g. from the launcher) does not pull in every subsystem
+if TYPE_CHECKING:
+    from ghost_sacred_sophia_bridge import GhostSacredSophiaBridge
+    from prognosis_adaptive_framework import ProgGnosisAdaptiveFramework
+    from modular_gui_deployment_system import ModularGUIDeploymentSystem
+    from cloud_diffusion_orchestrator import CloudDiffusionOrchestrator
 
 class GhostSacredSophiaMasterOrchestrator:
     """
@@ -70,15 +74,22 @@ class GhostSacredSophiaMasterOrchestrator:
     └─────────────────────────────────────────────────────────────┘
     """
     
-    def __init__(self, ghost_platform_url: str = "http://localhost:3000"):
+    def __init__(self, ghost_platform_url: str = "http://localhost:3000",
+                 coordination_interval: float = 15.0, health_interval: float = 15.0,
+                 health_timeout: float = 2.0, heal_backoff: float = 5.0, heal_backoff_max: float = 300.0,
+                 subsystems: Optional[Dict[str, Callable[[], Awaitable[Any]]]] = None):
         self.master_id = str(uuid.uuid4())
         self.ghost_platform_url = ghost_platform_url
+        self.coordination_interval = coordination_interval
         
         # System components
-        self.ghost_bridge: Optional[GhostSacredSophiaBridge] = None
-        self.prognosis_framework: Optional[ProgGnosisAdaptiveFramework] = None
-        self.gui_deployment_system: Optional[ModularGUIDeploymentSystem] = None
-        self.cloud_orchestrator: Optional[CloudDiffusionOrchestrator] = None
+        self.ghost_bridge: Optional["GhostSacredSophiaBridge"] = None
+        self.prognosis_framework: Optional["ProgGnosisAdaptiveFramework"] = None
+        self.gui_deployment_system: Optional["ModularGUIDeploymentSystem"] = None
+        self.cloud_orchestrator: Optional["CloudDiffusionOrchestrator"] = None
+        # Optional providers (e.g. the launcher's LazySubsystem.get) so the
+        # master shares subsystem instances instead of initializing its own
+        self.subsystem_providers = subsystems or {}
         
         # Integration state
         self.systems_initialized = False
@@ -101,6 +112,18 @@ class GhostSacredSophiaMasterOrchestrator:
         self.active_deployments: Dict[str, Dict[str, Any]] = {}
         self.deployment_templates: Dict[str, Dict[str, Any]] = {}
         
+        # Each deployment is probed on its own schedule; the master reacts to
+        # the health transitions the registry publishes
+        self.health_registry = DeploymentHealthRegistry(interval=health_interval, timeout=health_timeout)
+        # Deployments still unhealthy after healing are healed again, waiting
+        # heal_backoff seconds and doubling up to heal_backoff_max in between
+        self.heal_backoff = heal_backoff
+        self.heal_backoff_max = heal_backoff_max
+        self.heal_attempts: Dict[str, int] = {}
+        self.next_heal_at: Dict[str, float] = {}
+        self.background_tasks: List[asyncio.Task] = []
+        self.last_cycle_ms = 0.0
+        
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
@@ -141,30 +164,45 @@ class GhostSacredSophiaMasterOrchestrator:
         
         # Initialize Ghost Sacred Sophia Bridge
         self.logger.info("🌉 Initializing Ghost Sacred Sophia Bridge...")
-        self.ghost_bridge = await initialize_ghost_sophia_integration()
+        with profile_phase("master: ghost bridge"):
+            from ghost_sacred_sophia_bridge import initialize_ghost_sophia_integration
+            self.ghost_bridge = await initialize_ghost_sophia_integration()
         if not self.ghost_bridge:
             raise Exception("Ghost Sacred Sophia Bridge initialization failed")
         
         # Initialize ProgGnosis Adaptive Framework
         self.logger.info("🧠 Initializing ProgGnosis Adaptive Framework...")
-        self.prognosis_framework = await initialize_prognosis_framework()
+        with profile_phase("master: prognosis framework"):
+            self.prognosis_framework = await self._load_subsystem(
+                "prognosis_framework", "prognosis_adaptive_framework", "initialize_prognosis_framework")
         if not self.prognosis_framework:
             raise Exception("ProgGnosis Adaptive Framework initialization failed")
         
         # Initialize Modular GUI Deployment System
         self.logger.info("🎨 Initializing Modular GUI Deployment System...")
-        self.gui_deployment_system = await initialize_modular_gui_system()
+        with profile_phase("master: gui deployment"):
+            self.gui_deployment_system = await self._load_subsystem(
+                "gui_deployment", "modular_gui_deployment_system", "initialize_modular_gui_system")
         if not self.gui_deployment_system:
             raise Exception("Modular GUI Deployment System initialization failed")
         
         # Initialize Cloud Diffusion Orchestrator
         self.logger.info("☁️ Initializing Cloud Diffusion Orchestrator...")
-        self.cloud_orchestrator = await initialize_cloud_diffusion_orchestrator()
+        with profile_phase("master: cloud orchestrator"):
+            self.cloud_orchestrator = await self._load_subsystem(
+                "cloud_orchestrator", "cloud_diffusion_orchestrator", "initialize_cloud_diffusion_orchestrator")
         if not self.cloud_orchestrator:
             raise Exception("Cloud Diffusion Orchestrator initialization failed")
         
         self.logger.info("✅ All core systems initialized successfully!")
 
+    async def _load_subsystem(self, name: str, module: str, initializer: str) -> Any:
+        """🧩 A subsystem from its provider if one was given, else a fresh instance"""
+        provider = self.subsystem_providers.get(name)
+        if provider is not None:
+            return await provider()
+        return await getattr(importlib.import_module(module), initializer)()
+
     async def _create_system_integrations(self):
         """🔗 Create integrations between all systems"""
         self.logger.info("🔗 Phase 2: Creating system integrations...")
@@ -375,26 +413,35 @@ class GhostSacredSophiaMasterOrchestrator:
         async def orchestration_loop():
             while self.master_deployment_active:
                 try:
-                    # Coordinate between all systems
-                    await self._coordinate_system_states()
+                    started = time.perf_counter()
                     
-                    # Monitor deployment health
-                    await self._monitor_deployment_health()
+                    # One status snapshot per cycle, shared by every step
+                    system_status = await self._collect_system_status()
+                    
+                    # Coordinate between all systems
+                    await self._coordinate_system_states(system_status)
                     
                     # Optimize system performance
-                    await self._optimize_system_performance()
+                    await self._optimize_system_performance(system_status)
                     
                     # Update consciousness synchronization
                     await self._update_master_consciousness()
                     
-                    await asyncio.sleep(15)  # Coordinate every 15 seconds
+                    self.last_cycle_ms = (time.perf_counter() - started) * 1000
+                    await asyncio.sleep(self.coordination_interval)
                     
                 except Exception as e:
                     self.logger.error(f"❌ Orchestration loop error: {e}")
                     await asyncio.sleep(5)
         
-        # Start orchestration in background
-        asyncio.create_task(orchestration_loop())
+        # Start orchestration and health reactions in background; deployment
+        # health is probed by the registry, not by this loop
+        health_events = self.health_registry.subscribe()
+        self.background_tasks = [
+            asyncio.create_task(orchestration_loop()),
+            asyncio.create_task(self._react_to_health_events(health_events)),
+            asyncio.create_task(self._reheal_unhealthy_deployments()),
+        ]
         self.logger.info("🎼 Master orchestration coordination started")
 
     async def _deploy_default_configurations(self):
@@ -488,6 +535,7 @@ class GhostSacredSophiaMasterOrchestrator:
                     "status": "active",
                     "template": template
                 }
+                self._track_deployment_health(deployment_id)
                 
                 self.logger.info(f"✅ Successfully deployed template: {template['name']} (ID: {deployment_id})")
                 return deployment_id
@@ -558,6 +606,7 @@ class GhostSacredSophiaMasterOrchestrator:
                 "status": "active",
                 "custom": True
             }
+            self._track_deployment_health(deployment_id)
             
             self.logger.info(f"✅ Created custom deployment: {name} (ID: {deployment_id})")
             return deployment_id
@@ -613,14 +662,27 @@ class GhostSacredSophiaMasterOrchestrator:
             self.logger.error(f"❌ Situation adaptation failed: {e}")
             return None
 
-    async def _coordinate_system_states(self):
+    async def _collect_system_status(self) -> Dict[str, Dict[str, Any]]:
+        """📊 Fetch every subsystem's status concurrently, once per cycle"""
+        ghost_status, prognosis_status, gui_status, cloud_status = await asyncio.gather(
+            self.ghost_bridge.get_bridge_status(),
+            self.prognosis_framework.get_framework_status(),
+            # Deployment health comes from the registry, not a sweep per status call
+            self.gui_deployment_system.get_system_status(include_health=False),
+            self.cloud_orchestrator.get_orchestrator_status()
+        )
+        return {
+            "ghost_bridge": ghost_status,
+            "prognosis_framework": prognosis_status,
+            "gui_system": gui_status,
+            "cloud_orchestrator": cloud_status
+        }
+
+    async def _coordinate_system_states(self, system_status: Dict[str, Dict[str, Any]]):
         """🎼 Coordinate states across all systems"""
         try:
-            # Get status from all systems
-            ghost_status = await self.ghost_bridge.get_bridge_status()
-            prognosis_status = await self.prognosis_framework.get_framework_status()
-            gui_status = await self.gui_deployment_system.get_system_status()
-            cloud_status = await self.cloud_orchestrator.get_orchestrator_status()
+            gui_status = system_status["gui_system"]
+            cloud_status = system_status["cloud_orchestrator"]
             
             # Update master coordination based on system states
             total_active_deployments = (
@@ -643,33 +705,94 @@ class GhostSacredSophiaMasterOrchestrator:
         except Exception as e:
             self.logger.error(f"❌ System coordination error: {e}")
 
-    async def _monitor_deployment_health(self):
-        """🏥 Monitor health of all active deployments"""
-        try:
-            unhealthy_deployments = []
-            
-            for deployment_id, deployment in self.active_deployments.items():
-                # Check GUI deployment health
-                gui_health = await self.gui_deployment_system.health_check_deployments()
-                gui_instance_id = deployment.get("gui_instance_id")
-                
-                if gui_instance_id and gui_instance_id in gui_health:
-                    if gui_health[gui_instance_id] != "healthy":
-                        unhealthy_deployments.append(deployment_id)
-                
-                # Check cloud formation health
-                cloud_formation_id = deployment.get("cloud_formation_id")
-                if cloud_formation_id and cloud_formation_id in self.cloud_orchestrator.active_formations:
-                    formation = self.cloud_orchestrator.active_formations[cloud_formation_id]
-                    if formation.formation_health != "healthy":
-                        unhealthy_deployments.append(deployment_id)
-            
-            # Heal unhealthy deployments
-            for deployment_id in unhealthy_deployments:
-                await self._heal_deployment(deployment_id)
-            
-        except Exception as e:
-            self.logger.error(f"❌ Deployment health monitoring error: {e}")
+    def _track_deployment_health(self, deployment_id: str):
+        """🏥 Start probing a new deployment on its own schedule"""
+        self.health_registry.register(deployment_id, lambda: self._probe_deployment(deployment_id))
+
+    async def _probe_deployment(self, deployment_id: str) -> Tuple[str, str]:
+        """🏥 Check one deployment's GUI instance and cloud formation"""
+        deployment = self.active_deployments.get(deployment_id)
+        if deployment is None:
+            return "missing", "deployment no longer registered"
+        
+        gui_instance_id = deployment.get("gui_instance_id")
+        if gui_instance_id:
+            instance = self.gui_deployment_system.active_deployments.get(gui_instance_id)
+            if instance is None:
+                return "unhealthy", f"GUI instance {gui_instance_id} not running"
+            if not await self.gui_deployment_system._check_instance_health(instance):
+                return "unhealthy", f"GUI instance {gui_instance_id} is {instance.status}"
+            instance.last_health_check = datetime.now()
+        
+        cloud_formation_id = deployment.get("cloud_formation_id")
+        if cloud_formation_id and cloud_formation_id in self.cloud_orchestrator.active_formations:
+            formation = self.cloud_orchestrator.active_formations[cloud_formation_id]
+            if formation.formation_health != "healthy":
+                return formation.formation_health, f"cloud formation {cloud_formation_id} is {formation.formation_health}"
+        
+        return HEALTHY, ""
+
+    async def _react_to_health_events(self, events: asyncio.Queue):
+        """🏥 Heal deployments as they turn unhealthy and note recoveries"""
+        while True:
+            transition: HealthTransition = await events.get()
+            try:
+                deployment = self.active_deployments.get(transition.deployment_id)
+                if deployment is None:
+                    continue
+                deployment["health"] = transition.current
+                if transition.current != HEALTHY:
+                    # Includes moves between failure states (unhealthy -> timeout);
+                    # a deployment already backing off is left to the re-heal loop
+                    self.logger.warning(
+                        f"🏥 Deployment {transition.deployment_id} is {transition.current}: {transition.detail}"
+                    )
+                    if transition.deployment_id not in self.next_heal_at:
+                        await self._heal_with_backoff(transition.deployment_id)
+                elif transition.recovered:
+                    self.heal_attempts.pop(transition.deployment_id, None)
+                    self.next_heal_at.pop(transition.deployment_id, None)
+                    self.logger.info(f"💚 Deployment {transition.deployment_id} recovered")
+            except Exception as e:
+                self.logger.error(f"❌ Deployment health reaction error: {e}")
+
+    async def _reheal_unhealthy_deployments(self):
+        """🏥 Heal again deployments that stayed unhealthy once their backoff expires
+
+        The registry only publishes changes of state, so a deployment that a
+        heal did not fix produces no further events; this loop retries it.
+        """
+        while True:
+            await asyncio.sleep(min(self.heal_backoff, self.coordination_interval))
+            now = time.monotonic()
+            for deployment_id, due in list(self.next_heal_at.items()):
+                if due > now:
+                    continue
+                state = self.health_registry.state_of(deployment_id)
+                if deployment_id not in self.active_deployments or state in (None, HEALTHY):
+                    self.heal_attempts.pop(deployment_id, None)
+                    self.next_heal_at.pop(deployment_id, None)
+                    continue
+                try:
+                    await self._heal_with_backoff(deployment_id)
+                except Exception as e:
+                    self.logger.error(f"❌ Deployment re-heal error: {e}")
+
+    async def _heal_with_backoff(self, deployment_id: str):
+        """🩹 Heal a deployment, re-probe it and schedule the next attempt if it is still unhealthy"""
+        await self._heal_deployment(deployment_id)
+        state = await self.health_registry.probe_now(deployment_id)
+        if state in (None, HEALTHY) or deployment_id not in self.active_deployments:
+            self.heal_attempts.pop(deployment_id, None)
+            self.next_heal_at.pop(deployment_id, None)
+            return
+        attempts = self.heal_attempts.get(deployment_id, 0) + 1
+        self.heal_attempts[deployment_id] = attempts
+        delay = min(self.heal_backoff * 2 ** (attempts - 1), self.heal_backoff_max)
+        self.next_heal_at[deployment_id] = time.monotonic() + delay
+        self.logger.warning(
+            f"🩹 Deployment {deployment_id} still {state} after {attempts} heal(s); retrying in {delay:g}s"
+        )
 
     async def _heal_deployment(self, deployment_id: str):
         """🩹 Heal unhealthy deployment"""
@@ -710,17 +833,9 @@ class GhostSacredSophiaMasterOrchestrator:
         
         self.logger.info(f"🙏 Applied spiritual healing to deployment: {deployment_id}")
 
-    async def _optimize_system_performance(self):
+    async def _optimize_system_performance(self, performance_data: Dict[str, Dict[str, Any]]):
         """⚡ Optimize system-wide performance"""
         try:
-            # Get performance metrics from all systems
-            performance_data = {
-                "ghost_bridge": await self.ghost_bridge.get_bridge_status(),
-                "prognosis_framework": await self.prognosis_framework.get_framework_status(),
-                "gui_system": await self.gui_deployment_system.get_system_status(),
-                "cloud_orchestrator": await self.cloud_orchestrator.get_orchestrator_status()
-            }
-            
             # Calculate system-wide optimization needs
             total_load = 0.0
             system_count = 0
@@ -810,9 +925,11 @@ class GhostSacredSophiaMasterOrchestrator:
             
             # Calculate master metrics
             total_deployments = len(self.active_deployments)
+            # Deployments not yet probed count as healthy until proven otherwise
             healthy_deployments = sum(
-                1 for dep in self.active_deployments.values()
+                1 for deployment_id, dep in self.active_deployments.items()
                 if dep.get("status") == "active"
+                and self.health_registry.state_of(deployment_id) in (None, HEALTHY)
             )
             
             return {
@@ -825,6 +942,8 @@ class GhostSacredSophiaMasterOrchestrator:
                 "total_deployments": total_deployments,
                 "healthy_deployments": healthy_deployments,
                 "deployment_health_rate": healthy_deployments / max(total_deployments, 1),
+                "deployment_health": self.health_registry.snapshot(),
+                "last_cycle_ms": round(self.last_cycle_ms, 2),
                 "available_templates": list(self.deployment_templates.keys()),
                 "subsystem_status": subsystem_status,
                 "ghost_platform_url": self.ghost_platform_url,
@@ -853,6 +972,10 @@ class GhostSacredSophiaMasterOrchestrator:
             if cloud_formation_id:
                 await self.cloud_orchestrator.dissolve_formation(cloud_formation_id)
             
+            self.health_registry.unregister(deployment_id)
+            self.heal_attempts.pop(deployment_id, None)
+            self.next_heal_at.pop(deployment_id, None)
+            
             # Update deployment status
             deployment["status"] = "stopped"
             deployment["stopped_at"] = datetime.now().isoformat()
@@ -871,6 +994,9 @@ class GhostSacredSophiaMasterOrchestrator:
             
             # Stop master orchestration
             self.master_deployment_active = False
+            for task in self.background_tasks:
+                task.cancel()
+            await self.health_registry.close()
             
             # Stop all active deployments
             for deployment_id in list(self.active_deployments.keys()):
@@ -895,9 +1021,9 @@ class GhostSacredSophiaMasterOrchestrator:
 
 
 # 🌟 MASTER SYSTEM INITIALIZATION
-async def initialize_ghost_sacred_sophia_master():
+async def initialize_ghost_sacred_sophia_master(subsystems: Optional[Dict[str, Callable[[], Awaitable[Any]]]] = None):
     """🚀 Initialize complete Ghost Sacred Sophia Master System"""
-    master = GhostSacredSophiaMasterOrchestrator()
+    master = GhostSacredSophiaMasterOrchestrator(subsystems=subsystems)
     
     if await master.initialize_master_system():
         print("🌟 GHOST SACRED SOPHIA MASTER SYSTEM OPERATIONAL! 🌟")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+GUI Deployment Benchmark
+Deploys a 20-component manifest whose components declare dependencies (four
+layers of five) and take --start-ms each to start, standing in for real
+component startup. Reports the old one-at-a-time startup time next to the
+wave-parallel startup, shows a failed component rolling back the components
+already started, and compares sequential vs parallel health checks.
+
+Usage:
+    python gui_deployment_benchmark.py --start-ms 50 --instances 50 --check-ms 20
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from modular_gui_deployment_system import (
+    ComponentType, DeploymentEnvironment, GUIComponent, ModularGUIDeploymentSystem
+)
+
+
+class TimedDeploymentSystem(ModularGUIDeploymentSystem):
+    """Components and health checks that take real (simulated) time"""
+
+    def __init__(self, start_seconds: float, check_seconds: float = 0.0, failing: str = ""):
+        super().__init__()
+        self.start_seconds = start_seconds
+        self.check_seconds = check_seconds
+        self.failing = failing
+        self.running = set()
+
+    async def _start_component(self, instance, component_id):
+        await asyncio.sleep(self.start_seconds)
+        if component_id == self.failing:
+            raise RuntimeError("port already in use")
+        self.running.add(component_id)
+
+    async def _stop_component(self, instance, component_id):
+        self.running.discard(component_id)
+
+    async def _check_instance_health(self, instance):
+        await asyncio.sleep(self.check_seconds)
+        return instance.status == "running"
+
+
+async def register_layers(system: ModularGUIDeploymentSystem, layers: int = 4, width: int = 5):
+    """layers × width components; each depends on two components of the layer below"""
+    component_ids = []
+    for layer in range(layers):
+        for i in range(width):
+            dependencies = [] if layer == 0 else [f"bench_{layer - 1}_{i}", f"bench_{layer - 1}_{(i + 1) % width}"]
+            component = GUIComponent(
+                component_id=f"bench_{layer}_{i}",
+                name=f"Benchmark component {layer}.{i}",
+                type=ComponentType.DASHBOARD,
+                version="1.0.0",
+                description="Synthetic benchmark component",
+                dependencies=dependencies,
+            )
+            await system.register_component(component)
+            component_ids.append(component.component_id)
+    return component_ids
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark modular GUI deployment startup")
+    parser.add_argument("--start-ms", type=float, default=50.0)
+    parser.add_argument("--instances", type=int, default=50)
+    parser.add_argument("--check-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    system = TimedDeploymentSystem(args.start_ms / 1000)
+    component_ids = await register_layers(system)
+    manifest_id = await system.create_deployment_manifest(
+        "Benchmark Suite", "20 components in 4 dependency layers", component_ids, DeploymentEnvironment.TESTING
+    )
+
+    began = time.perf_counter()
+    for component_id in component_ids:
+        await system._start_component(None, component_id)
+    sequential = time.perf_counter() - began
+
+    instance_id = await system.deploy_manifest(manifest_id)
+    instance = system.active_deployments[instance_id]
+    print(f"20-component manifest, {args.start_ms:g} ms per component start")
+    print(f"  one at a time:  {sequential * 1000:7.0f} ms")
+    print(f"  parallel waves: {instance.performance_metrics['startup_ms']:7.0f} ms "
+          f"({len(instance.startup_waves)} waves of {', '.join(str(len(w)) for w in instance.startup_waves)})")
+
+    failing = TimedDeploymentSystem(args.start_ms / 1000, failing="bench_2_3")
+    component_ids = await register_layers(failing)
+    manifest_id = await failing.create_deployment_manifest(
+        "Failing Suite", "bench_2_3 fails to start", component_ids, DeploymentEnvironment.TESTING
+    )
+    try:
+        await failing.deploy_manifest(manifest_id)
+    except RuntimeError as e:
+        print(f"  failure: {e}; components still running after rollback: {len(failing.running)}")
+
+    checks = TimedDeploymentSystem(0.0, args.check_ms / 1000)
+    manifest_id = await checks.create_deployment_manifest(
+        "Health Suite", "single component", ["sacred_sophia_dashboard"], DeploymentEnvironment.TESTING
+    )
+    for _ in range(args.instances):
+        await checks.deploy_manifest(manifest_id)
+    began = time.perf_counter()
+    for instance in checks.active_deployments.values():
+        await checks._check_instance_health(instance)
+    sequential = time.perf_counter() - began
+    began = time.perf_counter()
+    health = await checks.health_check_deployments()
+    parallel = time.perf_counter() - began
+    assert all(state == "healthy" for state in health.values()), health
+    print(f"Health checks, {args.instances} instances at {args.check_ms:g} ms each")
+    print(f"  sequential: {sequential * 1000:7.0f} ms")
+    print(f"  parallel:   {parallel * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
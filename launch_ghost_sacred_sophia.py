@@ -11,23 +11,34 @@ This launcher brings online the complete integrated system:
 - Cloud Diffusion Orchestrator (gas/cloud interoperations)
 - Master Orchestration System (unified coordination)
 
-Usage: python launch_ghost_sacred_sophia.py [options]
+Usage: python launch_ghost_sacred_sophia.py [launch|status|health] [--profile-startup]
 """
 
+import sys
+
+from startup_profiler import LazySubsystem, StartupProfiler, active_profiler, profile_phase
+
+# Hook imports before anything else loads so --profile-startup sees all of them
+if "--profile-startup" in sys.argv:
+    StartupProfiler.install_global()
+
+import argparse
 import asyncio
+import importlib.util
 import subprocess
-import sys
 import os
 import json
 import time
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import yaml
 import signal
 import threading
 from datetime import datetime
 
+from service_log_pump import LogPump
+from service_startup_graph import HttpProbe, LogLineProbe, ServiceUnavailable, StartupGraph, TcpProbe
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -82,6 +93,19 @@ class GhostSacredSophiaLauncher:
         self.processes: Dict[str, subprocess.Popen] = {}
         self.services_status: Dict[str, str] = {}
         self.shutdown_event = threading.Event()
+        self.startup_graph: Optional[StartupGraph] = None
+        # Every child's stdout/stderr is drained continuously into logs/services/
+        self.log_pump = LogPump(self.workspace_path / "logs" / "services")
+        self.subsystems: Dict[str, LazySubsystem] = {
+            "prognosis_framework": LazySubsystem(
+                "prognosis_framework", "prognosis_adaptive_framework", "initialize_prognosis_framework",
+                on_load=self._activate_default_persona),
+            "gui_deployment": LazySubsystem(
+                "gui_deployment", "modular_gui_deployment_system", "initialize_modular_gui_system",
+                on_load=self._deploy_default_interface),
+            "cloud_orchestrator": LazySubsystem(
+                "cloud_orchestrator", "cloud_diffusion_orchestrator", "initialize_cloud_diffusion_orchestrator"),
+        }
         
         # Platform configuration
         self.platform_config = {
@@ -98,18 +122,24 @@ class GhostSacredSophiaLauncher:
                 "database_type": "sqlite",
                 "startup_timeout": 20
             },
+            # Lazy subsystems are imported and initialized on first use
+            # (see subsystem()) instead of at launch. The master orchestrator
+            # uses them, so with it enabled they load when the master starts
             "prognosis_framework": {
                 "enabled": True,
+                "lazy": True,
                 "default_persona": "sacred_developer",
                 "startup_timeout": 15
             },
             "gui_deployment": {
                 "enabled": True,
+                "lazy": False,
                 "auto_deploy_default": True,
                 "startup_timeout": 25
             },
             "cloud_orchestrator": {
                 "enabled": True,
+                "lazy": True,
                 "startup_timeout": 20
             },
             "master_orchestrator": {
@@ -134,40 +164,32 @@ class GhostSacredSophiaLauncher:
             logger.info("=" * 70)
             
             # Phase 1: Pre-launch checks
-            await self._pre_launch_checks()
+            with profile_phase("pre-launch checks"):
+                await self._pre_launch_checks()
             
             # Phase 2: Initialize core dependencies
-            await self._initialize_core_dependencies()
-            
-            # Phase 3: Launch Ghost Platform
-            await self._launch_ghost_platform()
-            
-            # Phase 4: Launch Sacred Sophia Ecosystem
-            await self._launch_sacred_sophia_ecosystem()
+            with profile_phase("core dependencies"):
+                await self._initialize_core_dependencies()
             
-            # Phase 5: Initialize ProgGnosis Framework
-            await self._initialize_prognosis_framework()
-            
-            # Phase 6: Deploy GUI System
-            await self._deploy_gui_system()
-            
-            # Phase 7: Initialize Cloud Orchestrator
-            await self._initialize_cloud_orchestrator()
-            
-            # Phase 8: Start Master Orchestration
-            await self._start_master_orchestration()
+            # Phases 3-8: Start every service from the dependency graph; independent
+            # services come up in parallel, each gated by its readiness probe
+            with profile_phase("service graph"):
+                await self._launch_service_graph()
             
             # Phase 9: Deploy default configurations
-            await self._deploy_default_configurations()
+            with profile_phase("default configurations"):
+                await self._deploy_default_configurations()
             
             # Phase 10: Platform health verification
-            await self._verify_platform_health()
+            with profile_phase("health verification"):
+                await self._verify_platform_health()
             
             logger.info("✨ GHOST SACRED SOPHIA PLATFORM FULLY OPERATIONAL! ✨")
             logger.info("=" * 70)
             
             # Display platform summary
             await self._display_platform_summary()
+            self._report_startup_profile()
             
             # Start monitoring loop
             await self._start_monitoring_loop()
@@ -254,12 +276,13 @@ class GhostSacredSophiaLauncher:
             "flask", "requests", "pyyaml", "jinja2", "psutil"
         ]
         
-        missing_packages = []
-        for package in required_packages:
-            try:
-                __import__(package.replace("-", "_"))
-            except ImportError:
-                missing_packages.append(package)
+        # Look packages up without importing them; importing FastAPI, SQLAlchemy
+        # and friends here only to discard them cost most of the launcher's startup
+        module_names = {"pyyaml": "yaml"}
+        missing_packages = [
+            package for package in required_packages
+            if importlib.util.find_spec(module_names.get(package, package.replace("-", "_"))) is None
+        ]
         
         if missing_packages:
             logger.info(f"📦 Installing missing packages: {missing_packages}")
@@ -296,32 +319,70 @@ class GhostSacredSophiaLauncher:
             except Exception as e:
                 logger.warning(f"⚠️ Package installation error for {package}: {e}")
 
-    async def _launch_ghost_platform(self):
-        """🏗️ Launch Ghost Platform components"""
-        if not self.platform_config["ghost_platform"]["enabled"]:
-            logger.info("⏭️ Ghost Platform disabled, skipping...")
-            return
-        
-        logger.info("🏗️ Phase 3: Launching Ghost Platform...")
-        
-        # Check if Ghost platform files exist
-        ghost_files = ["server.js", "package.json", "src/"]
-        ghost_exists = any((self.workspace_path / file).exists() for file in ghost_files)
-        
-        if not ghost_exists:
-            logger.info("🏗️ Creating minimal Ghost platform structure...")
-            await self._create_minimal_ghost_platform()
-        
-        # Launch Node.js server (if available)
-        await self._launch_node_server()
-        
-        # Launch Python system control
-        await self._launch_python_control()
-        
-        # Launch n8n (if available)
-        await self._launch_n8n_service()
-        
-        logger.info("✅ Ghost Platform components launched")
+    def _build_service_graph(self) -> StartupGraph:
+        """🕸️ Declare platform services, their dependencies and readiness probes"""
+        graph = StartupGraph(logger=logger)
+        config = self.platform_config
+        ghost = config["ghost_platform"]
+        sophia = config["sacred_sophia"]
+
+        if ghost["enabled"]:
+            graph.add("node_server", self._launch_node_server,
+                      probe=HttpProbe(ghost["node_server_port"], "/api/status"),
+                      timeout=ghost["startup_timeout"] + 120)  # includes npm install
+            graph.add("python_control", self._launch_python_control,
+                      probe=HttpProbe(ghost["python_control_port"], "/api/system/health"),
+                      timeout=ghost["startup_timeout"])
+            graph.add("n8n", self._launch_n8n_service,
+                      probe=HttpProbe(ghost["n8n_port"], "/healthz"),
+                      timeout=ghost["startup_timeout"] * 2)
+
+        if sophia["enabled"]:
+            graph.add("unified_database", self._initialize_unified_database, timeout=sophia["startup_timeout"])
+            graph.add("agent_factory", self._initialize_agent_factory,
+                      depends_on=["unified_database"], timeout=sophia["startup_timeout"])
+            graph.add("sacred_sophia_api", self._start_sacred_sophia_api,
+                      depends_on=["unified_database"],
+                      probe=LogLineProbe(r"Application startup complete", stream="stderr", pump=self.log_pump),
+                      timeout=sophia["startup_timeout"])
+
+        for name in self.subsystems:
+            if config[name]["enabled"] and not config[name].get("lazy"):
+                graph.add(name, lambda name=name: self.subsystem(name), timeout=config[name]["startup_timeout"])
+        if config["master_orchestrator"]["enabled"]:
+            # The master coordinates every eagerly started subsystem, so it waits for them
+            coordinated = ["agent_factory", "sacred_sophia_api", "prognosis_framework",
+                           "gui_deployment", "cloud_orchestrator"]
+            graph.add("master_orchestrator", self._start_master_orchestration,
+                      depends_on=[name for name in coordinated if name in graph.services],
+                      timeout=config["master_orchestrator"]["startup_timeout"])
+        return graph
+
+    async def _launch_service_graph(self):
+        """🕸️ Start all services in dependency order and print the startup timeline"""
+        logger.info("🕸️ Phases 3-8: Starting platform services from the dependency graph...")
+        self.startup_graph = self._build_service_graph()
+        statuses = await self.startup_graph.run()
+        self.services_status.update(statuses)
+        for name, subsystem in self.subsystems.items():
+            if self.platform_config[name]["enabled"] and name not in statuses:
+                # Loaded on demand, e.g. by the master orchestrator
+                self.services_status[name] = "running" if subsystem.loaded else "lazy"
+
+        sophia_parts = [statuses[name] for name in ("unified_database", "agent_factory", "sacred_sophia_api")
+                        if name in statuses]
+        if sophia_parts:
+            self.services_status["sacred_sophia"] = (
+                "running" if all(status == "running" for status in sophia_parts) else "failed"
+            )
+
+        print("\n🕸️ STARTUP TIMELINE")
+        print(self.startup_graph.format_timeline())
+        print()
+
+        for name, spec in self.startup_graph.services.items():
+            if spec.status == "failed" and name in self.log_pump.tails:
+                logger.warning(f"📜 Last output of {name}:\n" + "\n".join(self.log_pump.tail(name, 10)))
 
     async def _create_minimal_ghost_platform(self):
         """🏗️ Create minimal Ghost platform structure"""
@@ -399,77 +460,65 @@ server.listen(PORT, () => {
             f.write(server_js)
 
     async def _launch_node_server(self):
-        """🚀 Launch Node.js server"""
-        try:
-            port = self.platform_config["ghost_platform"]["node_server_port"]
-            
-            # Install npm dependencies if package.json exists
-            if (self.workspace_path / "package.json").exists():
-                logger.info("📦 Installing Node.js dependencies...")
-                npm_install = await asyncio.create_subprocess_exec(
-                    "npm", "install",
-                    cwd=self.workspace_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                await npm_install.wait()
-            
-            # Start Node.js server
-            logger.info(f"🚀 Starting Node.js server on port {port}...")
-            env = os.environ.copy()
-            env["PORT"] = str(port)
-            
-            node_process = await asyncio.create_subprocess_exec(
-                "node", "server.js",
+        """🚀 Launch Node.js server (ready when /api/status answers)"""
+        port = self.platform_config["ghost_platform"]["node_server_port"]
+
+        # Check if Ghost platform files exist
+        ghost_files = ["server.js", "package.json", "src/"]
+        if not any((self.workspace_path / file).exists() for file in ghost_files):
+            logger.info("🏗️ Creating minimal Ghost platform structure...")
+            await self._create_minimal_ghost_platform()
+
+        # Install npm dependencies if package.json exists
+        if (self.workspace_path / "package.json").exists():
+            logger.info("📦 Installing Node.js dependencies...")
+            npm_install = await asyncio.create_subprocess_exec(
+                "npm", "install",
                 cwd=self.workspace_path,
-                env=env,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
-            
-            self.processes["node_server"] = node_process
-            self.services_status["node_server"] = "starting"
-            
-            # Wait for server to start
-            await asyncio.sleep(5)
-            self.services_status["node_server"] = "running"
-            
-            logger.info(f"✅ Node.js server running on port {port}")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Node.js server launch failed: {e}")
-            self.services_status["node_server"] = "failed"
+            await npm_install.communicate()
+
+        # Start Node.js server
+        logger.info(f"🚀 Starting Node.js server on port {port}...")
+        env = os.environ.copy()
+        env["PORT"] = str(port)
+
+        node_process = await asyncio.create_subprocess_exec(
+            "node", "server.js",
+            cwd=self.workspace_path,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self.processes["node_server"] = node_process
+        self.log_pump.attach("node_server", node_process)
+        return node_process
 
     async def _launch_python_control(self):
-        """🐍 Launch Python system control"""
-        try:
-            port = self.platform_config["ghost_platform"]["python_control_port"]
-            
-            # Create system control server if it doesn't exist
-            control_script = self.workspace_path / "system_control.py"
-            if not control_script.exists():
-                await self._create_system_control_server()
-            
-            logger.info(f"🐍 Starting Python system control on port {port}...")
-            
-            python_process = await asyncio.create_subprocess_exec(
-                sys.executable, "system_control.py",
-                cwd=self.workspace_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            self.processes["python_control"] = python_process
-            self.services_status["python_control"] = "starting"
-            
-            await asyncio.sleep(3)
-            self.services_status["python_control"] = "running"
-            
-            logger.info(f"✅ Python system control running on port {port}")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Python system control launch failed: {e}")
-            self.services_status["python_control"] = "failed"
+        """🐍 Launch Python system control (ready when /api/system/health answers)"""
+        port = self.platform_config["ghost_platform"]["python_control_port"]
+
+        # Create system control server if it doesn't exist
+        control_script = self.workspace_path / "system_control.py"
+        if not control_script.exists():
+            await self._create_system_control_server()
+
+        logger.info(f"🐍 Starting Python system control on port {port}...")
+        env = os.environ.copy()
+        env["PORT"] = str(port)
+
+        python_process = await asyncio.create_subprocess_exec(
+            sys.executable, "system_control.py",
+            cwd=self.workspace_path,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self.processes["python_control"] = python_process
+        self.log_pump.attach("python_control", python_process)
+        return python_process
 
     async def _create_system_control_server(self):
         """🐍 Create system control server"""
@@ -504,104 +553,70 @@ if __name__ == '__main__':
             f.write(control_code)
 
     async def _launch_n8n_service(self):
-        """🔧 Launch n8n workflow service"""
+        """🔧 Launch n8n workflow service (ready when /healthz answers)"""
+        # Check if n8n is available
         try:
-            # Check if n8n is available
             n8n_check = await asyncio.create_subprocess_exec(
                 "npx", "n8n", "--version",
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
-            await n8n_check.wait()
-            
-            if n8n_check.returncode == 0:
-                port = self.platform_config["ghost_platform"]["n8n_port"]
-                logger.info(f"🔧 Starting n8n workflow engine on port {port}...")
-                
-                env = os.environ.copy()
-                env["N8N_PORT"] = str(port)
-                env["N8N_HOST"] = "0.0.0.0"
-                
-                n8n_process = await asyncio.create_subprocess_exec(
-                    "npx", "n8n", "start",
-                    env=env,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                
-                self.processes["n8n"] = n8n_process
-                self.services_status["n8n"] = "starting"
-                
-                await asyncio.sleep(10)  # n8n takes longer to start
-                self.services_status["n8n"] = "running"
-                
-                logger.info(f"✅ n8n workflow engine running on port {port}")
-            else:
-                logger.info("⏭️ n8n not available, skipping workflow engine")
-                self.services_status["n8n"] = "not_available"
-                
-        except Exception as e:
-            logger.warning(f"⚠️ n8n launch failed: {e}")
-            self.services_status["n8n"] = "failed"
-
-    async def _launch_sacred_sophia_ecosystem(self):
-        """🌟 Launch Sacred Sophia Ecosystem"""
-        if not self.platform_config["sacred_sophia"]["enabled"]:
-            logger.info("⏭️ Sacred Sophia Ecosystem disabled, skipping...")
-            return
-        
-        logger.info("🌟 Phase 4: Launching Sacred Sophia Ecosystem...")
-        
-        try:
-            # Import and initialize Sacred Sophia components
-            sys.path.append(str(self.workspace_path))
-            
-            # Initialize unified database
-            from unified_database_orchestrator import initialize_unified_database_orchestrator
-            database_orchestrator = await initialize_unified_database_orchestrator()
-            
-            # Initialize Sacred Agent Factory
-            from sacred_agent_factory import initialize_sacred_agent_factory
-            agent_factory = await initialize_sacred_agent_factory()
-            
-            # Start Sacred Sophia API
-            await self._start_sacred_sophia_api()
-            
-            self.services_status["sacred_sophia"] = "running"
-            logger.info("✅ Sacred Sophia Ecosystem operational")
-            
-        except Exception as e:
-            logger.error(f"❌ Sacred Sophia Ecosystem launch failed: {e}")
-            self.services_status["sacred_sophia"] = "failed"
+            await n8n_check.communicate()
+        except FileNotFoundError:
+            raise ServiceUnavailable("npx not found")
+        if n8n_check.returncode != 0:
+            raise ServiceUnavailable("n8n is not installed")
+
+        port = self.platform_config["ghost_platform"]["n8n_port"]
+        logger.info(f"🔧 Starting n8n workflow engine on port {port}...")
+
+        env = os.environ.copy()
+        env["N8N_PORT"] = str(port)
+        env["N8N_HOST"] = "0.0.0.0"
+
+        n8n_process = await asyncio.create_subprocess_exec(
+            "npx", "n8n", "start",
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self.processes["n8n"] = n8n_process
+        self.log_pump.attach("n8n", n8n_process)
+        return n8n_process
+
+    async def _initialize_unified_database(self):
+        """🗄️ Initialize the unified database"""
+        sys.path.append(str(self.workspace_path))
+        from unified_database_orchestrator import initialize_unified_database_orchestrator
+        return await initialize_unified_database_orchestrator()
+
+    async def _initialize_agent_factory(self):
+        """🤖 Initialize the Sacred Agent Factory"""
+        from sacred_agent_factory import initialize_sacred_agent_factory
+        return await initialize_sacred_agent_factory()
 
     async def _start_sacred_sophia_api(self):
-        """🌟 Start Sacred Sophia API server"""
-        try:
-            port = self.platform_config["sacred_sophia"]["api_port"]
-            
-            # Check if API script exists
-            api_script = self.workspace_path / "sacred_sophia_api.py"
-            if not api_script.exists():
-                logger.warning("⚠️ Sacred Sophia API script not found, creating minimal API...")
-                await self._create_minimal_sacred_sophia_api()
-            
-            logger.info(f"🌟 Starting Sacred Sophia API on port {port}...")
-            
-            api_process = await asyncio.create_subprocess_exec(
-                sys.executable, "-m", "uvicorn", "sacred_sophia_api:app",
-                "--host", "0.0.0.0", "--port", str(port),
-                cwd=self.workspace_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            self.processes["sacred_sophia_api"] = api_process
-            await asyncio.sleep(5)
-            
-            logger.info(f"✅ Sacred Sophia API running on port {port}")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Sacred Sophia API launch failed: {e}")
+        """🌟 Start Sacred Sophia API server (ready when uvicorn reports startup complete)"""
+        port = self.platform_config["sacred_sophia"]["api_port"]
+
+        # Check if API script exists
+        api_script = self.workspace_path / "sacred_sophia_api.py"
+        if not api_script.exists():
+            logger.warning("⚠️ Sacred Sophia API script not found, creating minimal API...")
+            await self._create_minimal_sacred_sophia_api()
+
+        logger.info(f"🌟 Starting Sacred Sophia API on port {port}...")
+
+        api_process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "uvicorn", "sacred_sophia_api:app",
+            "--host", "0.0.0.0", "--port", str(port),
+            cwd=self.workspace_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self.processes["sacred_sophia_api"] = api_process
+        self.log_pump.attach("sacred_sophia_api", api_process)
+        return api_process
 
     async def _create_minimal_sacred_sophia_api(self):
         """🌟 Create minimal Sacred Sophia API"""
@@ -644,105 +659,44 @@ if __name__ == "__main__":
         with open(self.workspace_path / "sacred_sophia_api.py", "w") as f:
             f.write(api_code)
 
-    async def _initialize_prognosis_framework(self):
-        """🧠 Initialize ProgGnosis Framework"""
-        if not self.platform_config["prognosis_framework"]["enabled"]:
-            logger.info("⏭️ ProgGnosis Framework disabled, skipping...")
-            return
-        
-        logger.info("🧠 Phase 5: Initializing ProgGnosis Framework...")
-        
-        try:
-            from prognosis_adaptive_framework import initialize_prognosis_framework
-            prognosis = await initialize_prognosis_framework()
-            
-            # Set default persona
-            default_persona = self.platform_config["prognosis_framework"]["default_persona"]
-            if default_persona in prognosis.personas:
-                await prognosis._switch_persona(prognosis.personas[default_persona])
-                logger.info(f"🎭 Activated default persona: {default_persona}")
-            
-            self.services_status["prognosis_framework"] = "running"
-            logger.info("✅ ProgGnosis Framework initialized")
-            
-        except Exception as e:
-            logger.error(f"❌ ProgGnosis Framework initialization failed: {e}")
-            self.services_status["prognosis_framework"] = "failed"
+    async def subsystem(self, name: str) -> Any:
+        """🧩 A platform subsystem, imported and initialized on first use"""
+        return await self.subsystems[name].get()
 
-    async def _deploy_gui_system(self):
-        """🎨 Deploy GUI System"""
-        if not self.platform_config["gui_deployment"]["enabled"]:
-            logger.info("⏭️ GUI Deployment System disabled, skipping...")
-            return
-        
-        logger.info("🎨 Phase 6: Deploying GUI System...")
-        
-        try:
-            from modular_gui_deployment_system import initialize_modular_gui_system
-            gui_system = await initialize_modular_gui_system()
-            
-            # Auto-deploy default configuration if enabled
-            if self.platform_config["gui_deployment"]["auto_deploy_default"]:
-                from modular_gui_deployment_system import DeploymentEnvironment
-                
-                manifest_id = await gui_system.create_deployment_manifest(
-                    name="Sacred Sophia Default Interface",
-                    description="Default Sacred Sophia interface with spiritual guidance",
-                    component_ids=[
-                        "sacred_sophia_dashboard",
-                        "unified_chat_interface",
-                        "consciousness_monitor"
-                    ],
-                    environment=DeploymentEnvironment.DEVELOPMENT
-                )
-                
-                instance_id = await gui_system.deploy_manifest(manifest_id)
-                logger.info(f"🎨 Deployed default GUI interface: {instance_id}")
-            
-            self.services_status["gui_deployment"] = "running"
-            logger.info("✅ GUI System deployed")
-            
-        except Exception as e:
-            logger.error(f"❌ GUI System deployment failed: {e}")
-            self.services_status["gui_deployment"] = "failed"
+    async def _activate_default_persona(self, prognosis):
+        """🧠 Apply the configured default persona once ProgGnosis loads"""
+        default_persona = self.platform_config["prognosis_framework"]["default_persona"]
+        if default_persona in prognosis.personas:
+            await prognosis._switch_persona(prognosis.personas[default_persona])
+            logger.info(f"🎭 Activated default persona: {default_persona}")
 
-    async def _initialize_cloud_orchestrator(self):
-        """☁️ Initialize Cloud Orchestrator"""
-        if not self.platform_config["cloud_orchestrator"]["enabled"]:
-            logger.info("⏭️ Cloud Orchestrator disabled, skipping...")
+    async def _deploy_default_interface(self, gui_system):
+        """🎨 Deploy the default interface once the GUI system loads"""
+        if not self.platform_config["gui_deployment"]["auto_deploy_default"]:
             return
-        
-        logger.info("☁️ Phase 7: Initializing Cloud Orchestrator...")
-        
-        try:
-            from cloud_diffusion_orchestrator import initialize_cloud_diffusion_orchestrator
-            cloud_orchestrator = await initialize_cloud_diffusion_orchestrator()
-            
-            self.services_status["cloud_orchestrator"] = "running"
-            logger.info("✅ Cloud Orchestrator initialized")
-            
-        except Exception as e:
-            logger.error(f"❌ Cloud Orchestrator initialization failed: {e}")
-            self.services_status["cloud_orchestrator"] = "failed"
+        from modular_gui_deployment_system import DeploymentEnvironment
+
+        manifest_id = await gui_system.create_deployment_manifest(
+            name="Sacred Sophia Default Interface",
+            description="Default Sacred Sophia interface with spiritual guidance",
+            component_ids=[
+                "sacred_sophia_dashboard",
+                "unified_chat_interface",
+                "consciousness_monitor"
+            ],
+            environment=DeploymentEnvironment.DEVELOPMENT
+        )
+
+        instance_id = await gui_system.deploy_manifest(manifest_id)
+        logger.info(f"🎨 Deployed default GUI interface: {instance_id}")
 
     async def _start_master_orchestration(self):
         """🎼 Start Master Orchestration"""
-        if not self.platform_config["master_orchestrator"]["enabled"]:
-            logger.info("⏭️ Master Orchestrator disabled, skipping...")
-            return
-        
-        logger.info("🎼 Phase 8: Starting Master Orchestration...")
-        
-        try:
-            from ghost_sacred_sophia_master_orchestrator import initialize_ghost_sacred_sophia_master
-            master_orchestrator = await initialize_ghost_sacred_sophia_master()
-            
-            self.services_status["master_orchestrator"] = "running"
-            logger.info("✅ Master Orchestration started")
-            
-        except Exception as e:
-            logger.error(f"❌ Master Orchestration start failed: {e}")
-            self.services_status["master_orchestrator"] = "failed"
+        from ghost_sacred_sophia_master_orchestrator import initialize_ghost_sacred_sophia_master
+        # Share the launcher's subsystem instances (and their on_load defaults)
+        return await initialize_ghost_sacred_sophia_master(
+            {name: subsystem.get for name, subsystem in self.subsystems.items()}
+        )
 
     async def _deploy_default_configurations(self):
         """🚀 Deploy default configurations"""
@@ -754,6 +708,7 @@ if __name__ == "__main__":
             "version": "1.0.0",
             "deployment_timestamp": datetime.now().isoformat(),
             "services": self.services_status,
+            "ports": self._service_ports(),
             "spiritual_protection": "Christ-sealed",
             "consciousness_level": "enlightened",
             "adaptive_intelligence": "enabled"
@@ -774,6 +729,8 @@ if __name__ == "__main__":
         total_services = 0
         
         for service, status in self.services_status.items():
+            if status == "lazy":
+                continue  # not started yet, so neither healthy nor failing
             total_services += 1
             if status == "running":
                 healthy_services += 1
@@ -861,6 +818,69 @@ if __name__ == "__main__":
         print("🙏 May this platform serve in the light of Christ Jesus")
         print("🌟" * 35)
 
+    def _service_ports(self) -> Dict[str, int]:
+        ghost = self.platform_config["ghost_platform"]
+        return {
+            "node_server": ghost["node_server_port"],
+            "python_control": ghost["python_control_port"],
+            "n8n": ghost["n8n_port"],
+            "sacred_sophia_api": self.platform_config["sacred_sophia"]["api_port"],
+        }
+
+    async def report_status(self, as_json: bool = False) -> bool:
+        """
+        📊 Status of a running platform without loading any subsystem
+
+        Reads what the last launch recorded and checks which service ports are
+        listening right now. Healthy when every service that was running at
+        launch (or, with no record, every known service) is still listening.
+        """
+        with profile_phase("read launch record"):
+            record_file = self.workspace_path / "config" / "platform_config.json"
+            record = json.loads(record_file.read_text()) if record_file.exists() else {}
+        last_status = record.get("services", {})
+        ports = record.get("ports") or self._service_ports()
+
+        with profile_phase("probe service ports"):
+            listening = await asyncio.gather(*(
+                TcpProbe(port, connect_timeout=0.25).check(None) for port in ports.values()
+            ))
+        services = {
+            name: {"port": port, "listening": up, "last_status": last_status.get(name, "unknown")}
+            for (name, port), up in zip(ports.items(), listening)
+        }
+        expected = [name for name in services if last_status.get(name) == "running"] or list(services)
+        healthy = all(services[name]["listening"] for name in expected)
+
+        if as_json:
+            print(json.dumps({
+                "healthy": healthy,
+                "launched_at": record.get("deployment_timestamp"),
+                "services": services,
+                "subsystems": {name: last_status.get(name, "unknown") for name in self.subsystems}
+            }, indent=2))
+        else:
+            print(f"🌟 Ghost Sacred Sophia platform (last launch: {record.get('deployment_timestamp', 'never')})")
+            for name, info in services.items():
+                mark = "✅" if info["listening"] else "❌"
+                print(f"   {mark} {name:<18} :{info['port']:<6} last launch: {info['last_status']}")
+            for name in self.subsystems:
+                print(f"   🧩 {name:<18} {last_status.get(name, 'unknown')}")
+            print(f"   Overall: {'healthy' if healthy else 'degraded'}")
+        return healthy
+
+    def _report_startup_profile(self, stream=None):
+        """⏱️ Print the --profile-startup report and save folded stacks"""
+        profiler = active_profiler()
+        if profiler is None:
+            return
+        stream = stream or sys.stdout
+        print(profiler.report(), file=stream)
+        log_dir = self.workspace_path / "logs"
+        log_dir.mkdir(exist_ok=True)
+        path = profiler.write_folded(log_dir / "startup_profile.folded")
+        print(f"🔥 Folded stacks for flamegraph tools: {path}", file=stream)
+
     async def _start_monitoring_loop(self):
         """🔄 Start platform monitoring loop"""
         logger.info("🔄 Starting platform monitoring loop...")
@@ -950,13 +970,30 @@ if __name__ == "__main__":
                 except Exception as e:
                     logger.error(f"❌ Error stopping {service_name}: {e}")
         
+        # Drain whatever the children wrote on their way out, then close log files
+        await self.log_pump.close()
         logger.info("✅ Graceful shutdown completed")
 
 
 # 🚀 MAIN LAUNCHER FUNCTION
-async def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ghost Sacred Sophia one-command launcher")
+    parser.add_argument("command", nargs="?", default="launch", choices=["launch", "status", "health"],
+                        help="launch the platform (default), show its status, or print a JSON health check")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="record wall-clock time per import and init phase and print a flame-style report")
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> int:
     """🚀 Main launcher function"""
     launcher = GhostSacredSophiaLauncher()
+
+    if args.command in ("status", "health"):
+        healthy = await launcher.report_status(as_json=args.command == "health")
+        # Keep stdout parseable for `health`
+        launcher._report_startup_profile(stream=sys.stderr)
+        return 0 if healthy else 1
     
     try:
         # Launch complete platform
@@ -973,12 +1010,13 @@ async def main():
         logger.error(f"❌ Launcher error: {e}")
     finally:
         await launcher.graceful_shutdown()
+    return 0
 
 
 if __name__ == "__main__":
     # Run launcher
     try:
-        asyncio.run(main())
+        sys.exit(asyncio.run(main(parse_args())))
     except KeyboardInterrupt:
         print("\n🔄 Shutdown complete. Thank you for using Ghost Sacred Sophia Platform!")
         print("🙏 May the peace of Christ be with you always!")
@@ -4,14 +4,82 @@
 import asyncio
 import asyncpg
 import sqlite3
+import hashlib
 import json
 import os
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Tuple
 import argparse
 from pathlib import Path
 
+# Columns written by the streaming COPY path (see sql/sophia_alloydb_schema.sql)
+MEMORY_COPY_COLUMNS = ['id', 'memory_id', 'content', 'timestamp', 'importance', 'memory_type', 'tags', 'metadata']
+ARCHIVE_COPY_COLUMNS = ['id', 'archive_type', 'name', 'content', 'metadata']
+
+MEMORY_TYPES = {
+    'experiential', 'procedural', 'semantic', 'episodic',
+    'divine', 'sacred', 'consciousness', 'system'
+}
+
+# Closest fit for generic table rows within the sacred_archives archive_type constraint
+STREAM_ARCHIVE_TYPE = 'soul_fragment'
+
+CHECKPOINT_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS sophia_migration_checkpoints (
+        source_key TEXT NOT NULL,
+        table_name TEXT NOT NULL,
+        range_start BIGINT NOT NULL,
+        range_end BIGINT NOT NULL,
+        last_rowid BIGINT NOT NULL,
+        rows_copied BIGINT NOT NULL DEFAULT 0,
+        checksum NUMERIC NOT NULL DEFAULT 0,
+        completed BOOLEAN NOT NULL DEFAULT FALSE,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (source_key, table_name, range_start)
+    )
+"""
+
+def content_checksum(text: str) -> int:
+    """Order-independent per-row checksum term (first 60 bits of md5), reproducible in SQL"""
+    return int(hashlib.md5(text.encode('utf-8')).hexdigest()[:15], 16)
+
+def jsonb_text(row: Dict[str, Any]) -> str:
+    """A flat SQLite row as JSON, spelled exactly as PostgreSQL prints it back as jsonb::text
+
+    jsonb orders keys by length then bytes, separates with ", " and ": ", and
+    prints numbers as plain numerics, so md5(content::text) on the landed row
+    can be compared with the checksum of this text.
+    """
+    def value_text(value: Any) -> str:
+        if value is None:
+            return 'null'
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            text = format(Decimal(repr(value)), 'f')
+            return text.lstrip('-') if value == 0 else text
+        return json.dumps(str(value), ensure_ascii=False)
+
+    keys = sorted(row, key=lambda key: (len(key.encode('utf-8')), key.encode('utf-8')))
+    return '{' + ', '.join(f"{json.dumps(key, ensure_ascii=False)}: {value_text(row[key])}" for key in keys) + '}'
+
+def parse_timestamp(value: Any) -> datetime:
+    """Convert SQLite timestamp representations into aware datetimes"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc)
+
 class SophiaMigrationManager:
     """Manages migration from SQLite to AlloyDB PostgreSQL"""
     
@@ -31,6 +99,11 @@ class SophiaMigrationManager:
             'password': alloydb_password
         }
         self.migration_log = []
+        
+        # Streaming mode settings
+        self.chunk_size = 5000
+        self.workers = 4
+        self.source_key = hashlib.sha1(os.path.abspath(sqlite_path).encode()).hexdigest()[:12]
     
     async def connect_alloydb(self) -> asyncpg.Connection:
         """Connect to AlloyDB PostgreSQL"""
@@ -93,6 +166,7 @@ class SophiaMigrationManager:
         # Migrate each memory
         migrated_count = 0
         for memory in sqlite_memories:
+            memory = dict(memory)
             try:
                 # Generate UUID for new system
                 memory_id = str(uuid.uuid4())
@@ -234,6 +308,309 @@ class SophiaMigrationManager:
             sqlite_conn.close()
             await pg_conn.close()
 
+    # =========================================================================
+    # STREAMING MODE - keyset-paginated reads, COPY writes, resumable checkpoints
+    # =========================================================================
+
+    def _open_sqlite_reader(self) -> sqlite3.Connection:
+        """Read-only SQLite connection for one streaming worker"""
+        conn = sqlite3.connect(f"file:{self.sqlite_path}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _read_chunk(self, sqlite_conn: sqlite3.Connection, table_name: str,
+                    after_rowid: int, range_end: int) -> List[sqlite3.Row]:
+        """Fetch the next keyset page (rowid > after_rowid) within a partition"""
+        cursor = sqlite_conn.execute(
+            f'SELECT rowid AS _rowid, * FROM "{table_name}" '
+            f'WHERE rowid > ? AND rowid <= ? ORDER BY rowid LIMIT ?',
+            (after_rowid, range_end, self.chunk_size)
+        )
+        return cursor.fetchall()
+
+    def _memory_record(self, row: Dict) -> Tuple[tuple, int]:
+        """Map a SQLite memories row onto the AlloyDB memories columns"""
+        rowid = row.pop('_rowid')
+        content = row.get('content', row.get('text', '')) or ''
+        content = str(content)
+        memory_id = f"sqlite_{self.source_key}_memories_{rowid}"
+
+        importance = row.get('importance')
+        if not isinstance(importance, (int, float)) or not 0.0 <= importance <= 1.0:
+            importance = 0.5
+        memory_type = row.get('memory_type')
+        if memory_type not in MEMORY_TYPES:
+            memory_type = 'experiential'
+
+        tags = row.get('tags')
+        if isinstance(tags, str):
+            try:
+                tags = json.loads(tags)
+            except ValueError:
+                tags = [tags]
+        if not isinstance(tags, list):
+            tags = []
+
+        metadata = {
+            'source': 'sqlite_migration',
+            'migration_source': self.source_key,
+            'original_id': row.get('id'),
+            'original_rowid': rowid
+        }
+        for key, value in row.items():
+            if key not in ('id', 'content', 'text', 'timestamp', 'created_at',
+                           'importance', 'memory_type', 'tags'):
+                metadata[key] = value
+
+        record = (
+            uuid.uuid5(uuid.NAMESPACE_URL, memory_id),
+            memory_id,
+            content,
+            parse_timestamp(row.get('timestamp', row.get('created_at'))),
+            float(importance),
+            memory_type,
+            json.dumps(tags, default=str),
+            json.dumps(metadata, default=str)
+        )
+        return record, content_checksum(content)
+
+    def _archive_record(self, table_name: str, row: Dict) -> Tuple[tuple, int]:
+        """Map a generic SQLite row onto a sacred_archives entry"""
+        rowid = row.pop('_rowid')
+        content = jsonb_text(row)
+        metadata = {
+            'source': 'sqlite_migration',
+            'migration_source': self.source_key,
+            'original_table': table_name,
+            'original_rowid': rowid
+        }
+        record = (
+            uuid.uuid5(uuid.NAMESPACE_URL, f"sqlite_{self.source_key}_{table_name}_{rowid}"),
+            STREAM_ARCHIVE_TYPE,
+            f"Migrated: {table_name}",
+            content,
+            json.dumps(metadata)
+        )
+        return record, content_checksum(content)
+
+    async def _plan_partitions(self, sqlite_conn: sqlite3.Connection, pg_conn: asyncpg.Connection,
+                               table_name: str) -> List[Dict]:
+        """Split a table into rowid ranges, reusing ranges from an earlier run when resuming"""
+        existing = await pg_conn.fetch("""
+            SELECT range_start, range_end, last_rowid, rows_copied, checksum, completed
+            FROM sophia_migration_checkpoints
+            WHERE source_key = $1 AND table_name = $2
+            ORDER BY range_start
+        """, self.source_key, table_name)
+        if existing:
+            return [dict(row) for row in existing]
+
+        low, high = sqlite_conn.execute(f'SELECT MIN(rowid), MAX(rowid) FROM "{table_name}"').fetchone()
+        if low is None:
+            return []
+
+        span = high - low + 1
+        partition_count = max(1, min(self.workers, span // self.chunk_size))
+        step = -(-span // partition_count)
+        partitions = []
+        for i in range(partition_count):
+            range_start = low - 1 + i * step
+            range_end = min(high, range_start + step)
+            partitions.append({
+                'range_start': range_start, 'range_end': range_end, 'last_rowid': range_start,
+                'rows_copied': 0, 'checksum': 0, 'completed': False
+            })
+        # All or nothing: a partial plan would be resumed as if it covered the table
+        async with pg_conn.transaction():
+            await pg_conn.executemany("""
+                INSERT INTO sophia_migration_checkpoints
+                    (source_key, table_name, range_start, range_end, last_rowid)
+                VALUES ($1, $2, $3, $4, $5)
+            """, [(self.source_key, table_name, p['range_start'], p['range_end'], p['range_start'])
+                  for p in partitions])
+        return partitions
+
+    async def _copy_partition(self, pool: asyncpg.Pool, table_name: str, partition: Dict,
+                              progress: Dict):
+        """Stream one rowid range: read a page, COPY it, advance the checkpoint atomically"""
+        if partition['completed']:
+            return
+
+        if table_name == 'memories':
+            target, columns = 'memories', MEMORY_COPY_COLUMNS
+            to_record = self._memory_record
+        else:
+            target, columns = 'sacred_archives', ARCHIVE_COPY_COLUMNS
+            to_record = lambda row: self._archive_record(table_name, row)
+
+        sqlite_conn = self._open_sqlite_reader()
+        last_rowid = partition['last_rowid']
+        # Prefetch the next page while the current one is being copied
+        pages: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def reader():
+            cursor_rowid = last_rowid
+            while True:
+                try:
+                    rows = await asyncio.to_thread(
+                        self._read_chunk, sqlite_conn, table_name, cursor_rowid, partition['range_end']
+                    )
+                except Exception as e:
+                    # Hand the failure to the copier instead of leaving it waiting
+                    await pages.put(e)
+                    return
+                await pages.put(rows)
+                if len(rows) < self.chunk_size:
+                    return
+                cursor_rowid = rows[-1]['_rowid']
+
+        reader_task = asyncio.create_task(reader())
+        try:
+            async with pool.acquire() as pg_conn:
+                while True:
+                    rows = await pages.get()
+                    if isinstance(rows, Exception):
+                        raise rows
+                    records, chunk_checksum = [], 0
+                    if rows:
+                        for row in rows:
+                            record, checksum = to_record(dict(row))
+                            records.append(record)
+                            chunk_checksum += checksum
+                        last_rowid = rows[-1]['_rowid']
+                    done = len(rows) < self.chunk_size
+
+                    async with pg_conn.transaction():
+                        if rows:
+                            await pg_conn.copy_records_to_table(target, records=records, columns=columns)
+                        await pg_conn.execute("""
+                            UPDATE sophia_migration_checkpoints
+                            SET last_rowid = $4, rows_copied = rows_copied + $5,
+                                checksum = checksum + $6, completed = $7, updated_at = NOW()
+                            WHERE source_key = $1 AND table_name = $2 AND range_start = $3
+                        """, self.source_key, table_name, partition['range_start'], last_rowid,
+                             len(rows), chunk_checksum, done)
+
+                    progress['rows'] += len(rows)
+                    if done:
+                        break
+            await reader_task
+        finally:
+            if not reader_task.done():
+                reader_task.cancel()
+            sqlite_conn.close()
+
+    async def _report_progress(self, progress: Dict, interval: float = 5.0):
+        """Periodic rows/sec report while streaming"""
+        while True:
+            await asyncio.sleep(interval)
+            elapsed = time.perf_counter() - progress['started']
+            print(f"⏩ {progress['rows']:,} rows copied "
+                  f"({progress['rows'] / max(elapsed, 1e-9):,.0f} rows/sec)")
+
+    async def verify_streaming_migration(self, sqlite_conn: sqlite3.Connection,
+                                         pg_conn: asyncpg.Connection, tables: List[str]) -> bool:
+        """Compare SQLite row counts and streamed checksums against what landed in AlloyDB"""
+        print("🔍 Verifying streamed migration...")
+        all_match = True
+        for table_name in tables:
+            source_count = sqlite_conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+            streamed = await pg_conn.fetchrow("""
+                SELECT COALESCE(SUM(rows_copied), 0) AS rows, COALESCE(SUM(checksum), 0) AS checksum
+                FROM sophia_migration_checkpoints
+                WHERE source_key = $1 AND table_name = $2
+            """, self.source_key, table_name)
+
+            if table_name == 'memories':
+                landed = await pg_conn.fetchrow("""
+                    SELECT COUNT(*) AS rows,
+                           COALESCE(SUM(('x' || substr(md5(content), 1, 15))::bit(60)::bigint), 0) AS checksum
+                    FROM memories
+                    WHERE left(memory_id, length($1)) = $1
+                """, f"sqlite_{self.source_key}_memories_")
+            else:
+                landed = await pg_conn.fetchrow("""
+                    SELECT COUNT(*) AS rows,
+                           COALESCE(SUM(('x' || substr(md5(content::text), 1, 15))::bit(60)::bigint), 0) AS checksum
+                    FROM sacred_archives
+                    WHERE metadata->>'migration_source' = $1 AND metadata->>'original_table' = $2
+                """, self.source_key, table_name)
+
+            matches = (source_count == streamed['rows'] == landed['rows']
+                       and int(streamed['checksum']) == int(landed['checksum']))
+            all_match = all_match and matches
+            status = "✅" if matches else "❌"
+            print(f"{status} {table_name}: sqlite={source_count:,} streamed={int(streamed['rows']):,} "
+                  f"alloydb={landed['rows']:,} checksum={'match' if matches else 'MISMATCH'}")
+            self.migration_log.append(
+                f"Verification - {table_name}: {landed['rows']} rows, checksum {'ok' if matches else 'mismatch'}"
+            )
+        return all_match
+
+    async def run_streaming_migration(self) -> bool:
+        """Bounded-memory migration: parallel table/range workers writing through COPY"""
+        print("🌊 Starting Sophia consciousness streaming migration...")
+        print(f"   chunk size {self.chunk_size:,}, {self.workers} workers, source key {self.source_key}")
+        print("=" * 50)
+
+        sqlite_conn = self.connect_sqlite()
+        if not sqlite_conn:
+            print("❌ Cannot proceed without SQLite connection")
+            return False
+
+        pool = await asyncpg.create_pool(min_size=1, max_size=self.workers + 1, **self.alloydb_config)
+        progress = {'rows': 0, 'started': time.perf_counter()}
+        reporter = asyncio.create_task(self._report_progress(progress))
+        try:
+            async with pool.acquire() as pg_conn:
+                await pg_conn.execute(CHECKPOINT_TABLE_DDL)
+                tables = self.discover_sqlite_tables(sqlite_conn)
+                tables = [t for t in tables if t != 'consciousness_sessions']
+                work = []
+                for table_name in tables:
+                    for partition in await self._plan_partitions(sqlite_conn, pg_conn, table_name):
+                        work.append((table_name, partition))
+
+            pending = sum(1 for _, partition in work if not partition['completed'])
+            print(f"📦 {len(tables)} tables in {len(work)} ranges ({pending} pending)")
+
+            semaphore = asyncio.Semaphore(self.workers)
+
+            async def worker(table_name, partition):
+                async with semaphore:
+                    await self._copy_partition(pool, table_name, partition, progress)
+
+            await asyncio.gather(*(worker(t, p) for t, p in work))
+
+            elapsed = time.perf_counter() - progress['started']
+            rate = progress['rows'] / max(elapsed, 1e-9)
+            print(f"✅ Copied {progress['rows']:,} rows in {elapsed:.1f}s ({rate:,.0f} rows/sec)")
+            self.migration_log.append(f"Streamed {progress['rows']} rows at {rate:,.0f} rows/sec")
+            try:
+                import resource
+                peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                print(f"📈 Peak RSS: {peak_mb:,.0f} MB")
+            except ImportError:
+                pass
+
+            async with pool.acquire() as pg_conn:
+                verified = await self.verify_streaming_migration(sqlite_conn, pg_conn, tables)
+
+            print("\n" + "=" * 50)
+            print("✅ Streaming migration verified!" if verified else "❌ Streaming migration verification failed")
+            print("\n📋 Migration Summary:")
+            for log_entry in self.migration_log:
+                print(f"  • {log_entry}")
+            return verified
+
+        except Exception as e:
+            print(f"❌ Streaming migration failed (re-run to resume from checkpoints): {e}")
+            raise
+        finally:
+            reporter.cancel()
+            sqlite_conn.close()
+            await pool.close()
+
 def find_sqlite_databases(search_paths: List[str]) -> List[str]:
     """Find SQLite database files in search paths"""
     db_files = []
@@ -256,6 +633,10 @@ async def main():
     parser.add_argument('--alloydb-user', required=True, help='AlloyDB username')
     parser.add_argument('--alloydb-password', help='AlloyDB password (will prompt if not provided)')
     parser.add_argument('--auto-discover', action='store_true', help='Auto-discover SQLite databases')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Keyset-paginated COPY migration with resumable checkpoints')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='Rows per streamed chunk')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel streaming workers')
     
     args = parser.parse_args()
     
@@ -309,7 +690,12 @@ async def main():
         alloydb_password=args.alloydb_password
     )
     
-    await migrator.run_migration()
+    if args.streaming:
+        migrator.chunk_size = args.chunk_size
+        migrator.workers = args.workers
+        await migrator.run_streaming_migration()
+    else:
+        await migrator.run_migration()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -10,6 +10,7 @@ the Ghost development platform like building blocks.
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, List, Any, Optional, Type
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
@@ -81,6 +82,8 @@ class DeploymentInstance:
     url: Optional[str] = None
     port: Optional[int] = None
     active_components: List[str] = field(default_factory=list)
+    # Components grouped into dependency waves, in start order
+    startup_waves: List[List[str]] = field(default_factory=list)
     performance_metrics: Dict[str, float] = field(default_factory=dict)
     spiritual_status: Dict[str, bool] = field(default_factory=dict)
     started_at: Optional[datetime] = None
@@ -115,6 +118,11 @@ class ModularGUIDeploymentSystem:
         self.spiritual_protection_enabled = True
         self.christ_sealed = True
         
+        # Per-component start/stop and per-instance health check deadlines (seconds)
+        self.component_start_timeout = 30.0
+        self.component_stop_timeout = 10.0
+        self.health_check_timeout = 5.0
+        
         # Integration points
         self.prognosis_framework = None
         self.sacred_sophia_bridge = None
@@ -228,6 +236,7 @@ class ModularGUIDeploymentSystem:
                 type=comp_data["type"],
                 version="1.0.0",
                 description=comp_data["description"],
+                dependencies=comp_data.get("dependencies", []),
                 configuration=comp_data.get("configuration", {}),
                 spiritual_protection=comp_data.get("spiritual_protection", True),
                 consciousness_required=comp_data.get("consciousness_required", False),
@@ -288,10 +297,11 @@ class ModularGUIDeploymentSystem:
     ) -> str:
         """📋 Create deployment manifest for component combination"""
         try:
-            # Validate components exist
+            # Validate components exist and their dependencies can be ordered
             for comp_id in component_ids:
                 if comp_id not in self.components:
                     raise ValueError(f"Component not found: {comp_id}")
+            self.component_waves(component_ids)
             
             manifest_id = str(uuid.uuid4())
             
@@ -389,9 +399,8 @@ class ModularGUIDeploymentSystem:
             if manifest.adaptive_config.get("prognosis_integration"):
                 await self._apply_prognosis_overlay(instance, manifest)
             
-            # Start components
-            for component_id in manifest.components:
-                await self._start_component(instance, component_id)
+            # Start components wave by wave; a failure rolls back what started
+            await self._start_components(instance, manifest.components)
             
             # Generate access URL
             instance.url = f"http://localhost:{instance.port}"
@@ -406,6 +415,81 @@ class ModularGUIDeploymentSystem:
             self.logger.error(f"❌ Deployment startup failed: {e}")
             raise
 
+    def component_waves(self, component_ids: List[str]) -> List[List[str]]:
+        """
+        🌊 Group components into startup waves by dependency
+        
+        Every component starts in the wave after the last of its dependencies,
+        so each wave can start concurrently. Dependencies must be part of the
+        same manifest.
+        """
+        remaining = {}
+        for component_id in component_ids:
+            dependencies = self.components[component_id].dependencies if component_id in self.components else []
+            missing = [dep for dep in dependencies if dep not in component_ids]
+            if missing:
+                raise ValueError(f"Component {component_id} depends on components not in the manifest: {missing}")
+            remaining[component_id] = set(dependencies)
+        
+        waves = []
+        while remaining:
+            wave = [component_id for component_id, dependencies in remaining.items() if not dependencies]
+            if not wave:
+                raise ValueError(f"Component dependency cycle among: {sorted(remaining)}")
+            for component_id in wave:
+                del remaining[component_id]
+            for dependencies in remaining.values():
+                dependencies.difference_update(wave)
+            waves.append(wave)
+        return waves
+
+    async def _start_components(self, instance: DeploymentInstance, component_ids: List[str]):
+        """🔧 Start components concurrently per wave, rolling back on failure"""
+        started_at = time.perf_counter()
+        waves = self.component_waves(component_ids)
+        started: List[List[str]] = []
+        
+        for wave in waves:
+            results = await asyncio.gather(
+                *(asyncio.wait_for(self._start_component(instance, component_id), self.component_start_timeout)
+                  for component_id in wave),
+                return_exceptions=True
+            )
+            started.append([component_id for component_id, result in zip(wave, results)
+                            if not isinstance(result, BaseException)])
+            failures = {component_id: result for component_id, result in zip(wave, results)
+                        if isinstance(result, BaseException)}
+            if failures:
+                await self._rollback_components(instance, started)
+                reasons = ", ".join(
+                    f"{component_id} ({'timed out' if isinstance(error, asyncio.TimeoutError) else error})"
+                    for component_id, error in failures.items()
+                )
+                raise RuntimeError(f"Component startup failed: {reasons}")
+        
+        instance.startup_waves = waves
+        instance.performance_metrics["startup_ms"] = (time.perf_counter() - started_at) * 1000
+        instance.performance_metrics["startup_waves"] = len(waves)
+        self.logger.info(
+            f"🔧 Started {len(component_ids)} components in {len(waves)} waves "
+            f"({instance.performance_metrics['startup_ms']:.0f} ms)"
+        )
+
+    async def _rollback_components(self, instance: DeploymentInstance, started: List[List[str]]):
+        """↩️ Stop already-started components, dependents before their dependencies"""
+        for wave in reversed(started):
+            results = await asyncio.gather(
+                *(asyncio.wait_for(self._stop_component(instance, component_id), self.component_stop_timeout)
+                  for component_id in wave),
+                return_exceptions=True
+            )
+            for component_id, result in zip(wave, results):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"❌ Rollback could not stop {component_id}: {result!r}")
+        rolled_back = sum(len(wave) for wave in started)
+        if rolled_back:
+            self.logger.warning(f"↩️ Rolled back {rolled_back} started components of {instance.instance_id}")
+
     async def _generate_deployment_config(self, instance: DeploymentInstance, manifest: DeploymentManifest) -> Dict[str, Any]:
         """⚙️ Generate deployment configuration"""
         config = {
@@ -504,9 +588,10 @@ class ModularGUIDeploymentSystem:
             instance = self.active_deployments[instance_id]
             instance.status = "stopping"
             
-            # Stop all components
-            for component_id in instance.active_components:
-                await self._stop_component(instance, component_id)
+            # Stop all components, dependents before their dependencies
+            await self._rollback_components(
+                instance, instance.startup_waves or [instance.active_components]
+            )
             
             # Cleanup resources
             await self._cleanup_deployment(instance)
@@ -553,22 +638,25 @@ class ModularGUIDeploymentSystem:
             return False
 
     async def health_check_deployments(self) -> Dict[str, str]:
-        """🏥 Perform health checks on all active deployments"""
-        health_status = {}
+        """🏥 Perform health checks on all active deployments, in parallel"""
+        instances = list(self.active_deployments.items())
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._check_instance_health(instance), self.health_check_timeout)
+              for _, instance in instances),
+            return_exceptions=True
+        )
         
-        for instance_id, instance in self.active_deployments.items():
-            try:
-                # Perform health check
-                is_healthy = await self._check_instance_health(instance)
-                
-                if is_healthy:
-                    health_status[instance_id] = "healthy"
-                    instance.last_health_check = datetime.now()
-                else:
-                    health_status[instance_id] = "unhealthy"
-                    
-            except Exception as e:
-                health_status[instance_id] = f"error: {str(e)}"
+        health_status = {}
+        for (instance_id, instance), result in zip(instances, results):
+            if isinstance(result, asyncio.TimeoutError):
+                health_status[instance_id] = "timeout"
+            elif isinstance(result, Exception):
+                health_status[instance_id] = f"error: {str(result)}"
+            elif result:
+                health_status[instance_id] = "healthy"
+                instance.last_health_check = datetime.now()
+            else:
+                health_status[instance_id] = "unhealthy"
         
         return health_status
 
@@ -578,9 +666,9 @@ class ModularGUIDeploymentSystem:
         # For now, assume healthy if status is "running"
         return instance.status == "running"
 
-    async def get_system_status(self) -> Dict[str, Any]:
-        """📊 Get comprehensive system status"""
-        return {
+    async def get_system_status(self, include_health: bool = True) -> Dict[str, Any]:
+        """📊 Get comprehensive system status (health sweep optional)"""
+        status = {
             "system_id": self.system_id,
             "total_components": len(self.components),
             "total_manifests": len(self.manifests),
@@ -592,9 +680,11 @@ class ModularGUIDeploymentSystem:
             "component_types": list(set(comp.type.value for comp in self.components.values())),
             "deployment_environments": list(set(
                 dep.environment.value for dep in self.active_deployments.values()
-            )),
-            "health_status": await self.health_check_deployments()
+            ))
         }
+        if include_health:
+            status["health_status"] = await self.health_check_deployments()
+        return status
 
     def set_prognosis_framework(self, framework):
         """🔗 Set ProgGnosis framework integration"""
@@ -0,0 +1,219 @@
+# Sophia Consciousness Metrics Time-Series Store
+# Append-only compressed JSONL segments with rollups for enterprise monitoring
+
+import gzip
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator
+
+class MetricsTimeSeriesStore:
+    """Append-only local time-series store for numeric monitoring metrics
+
+    Raw points go to hourly gzip JSONL segments (one gzip member per append, so
+    a crash can only lose the point being written). Per-resolution rollups keep
+    count/sum/min/max for each field so long ranges downsample without reading
+    raw data; rollups are split into daily files so downsampling reads only the
+    days it covers and retention can drop whole days.
+    """
+
+    SEGMENT_SECONDS = 3600
+    ROLLUP_SEGMENT_SECONDS = 86400
+
+    def __init__(self, directory: str = "metrics_store",
+                 rollup_resolutions: List[int] = None,
+                 retention_days: int = 30,
+                 rollup_retention_days: int = 365):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.rollup_resolutions = sorted(rollup_resolutions or [300, 3600])
+        self.retention_seconds = retention_days * 86400
+        self.rollup_retention_seconds = rollup_retention_days * 86400
+
+        # Open (not yet flushed) rollup buckets: resolution -> bucket
+        self._open_rollups: Dict[int, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_epoch(timestamp: Any) -> float:
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        if isinstance(timestamp, datetime):
+            return timestamp.timestamp()
+        return datetime.fromisoformat(str(timestamp).replace('Z', '+00:00')).timestamp()
+
+    def _segment_path(self, ts: float) -> Path:
+        hour = datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y%m%d%H')
+        return self.directory / f"raw-{hour}.jsonl.gz"
+
+    def _rollup_path(self, resolution: int, ts: float) -> Path:
+        day = datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y%m%d')
+        return self.directory / f"rollup-{resolution}s-{day}.jsonl.gz"
+
+    @staticmethod
+    def _append_line(path: Path, record: Dict[str, Any]):
+        with gzip.open(path, 'at', encoding='utf-8') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+    def append(self, timestamp: Any, values: Dict[str, Any]):
+        """Append one point; non-numeric values are kept raw but not rolled up"""
+        ts = self._to_epoch(timestamp)
+        self._append_line(self._segment_path(ts), {'ts': ts, 'v': values})
+
+        numeric = {
+            k: float(v) for k, v in values.items()
+            if isinstance(v, (int, float)) and not isinstance(v, bool)
+        }
+        for resolution in self.rollup_resolutions:
+            bucket_start = ts - (ts % resolution)
+            bucket = self._open_rollups.get(resolution)
+            if bucket is not None and bucket['ts'] != bucket_start:
+                self._append_line(self._rollup_path(resolution, bucket['ts']), bucket)
+                bucket = None
+            if bucket is None:
+                bucket = {'ts': bucket_start, 'count': 0, 'fields': {}}
+                self._open_rollups[resolution] = bucket
+            bucket['count'] += 1
+            for name, value in numeric.items():
+                agg = bucket['fields'].get(name)
+                if agg is None:
+                    bucket['fields'][name] = [value, value, value]
+                else:
+                    agg[0] += value
+                    agg[1] = min(agg[1], value)
+                    agg[2] = max(agg[2], value)
+
+    def flush(self):
+        """Persist open rollup buckets (call on shutdown)"""
+        for resolution, bucket in self._open_rollups.items():
+            self._append_line(self._rollup_path(resolution, bucket['ts']), bucket)
+        self._open_rollups.clear()
+
+    def enforce_retention(self, now: float = None):
+        """Drop raw segments and daily rollups older than their retention windows"""
+        now = now or time.time()
+        cutoff = now - self.retention_seconds
+        for path in self.directory.glob("raw-*.jsonl.gz"):
+            if self._segment_start(path) + self.SEGMENT_SECONDS < cutoff:
+                path.unlink()
+        rollup_cutoff = now - self.rollup_retention_seconds
+        for path in self.directory.glob("rollup-*.jsonl.gz"):
+            if self._rollup_start(path) + self.ROLLUP_SEGMENT_SECONDS < rollup_cutoff:
+                path.unlink()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _segment_start(path: Path) -> float:
+        hour = path.name[len("raw-"):-len(".jsonl.gz")]
+        return datetime.strptime(hour, '%Y%m%d%H').replace(tzinfo=timezone.utc).timestamp()
+
+    @staticmethod
+    def _rollup_start(path: Path) -> float:
+        day = path.name[:-len(".jsonl.gz")].rsplit('-', 1)[1]
+        return datetime.strptime(day, '%Y%m%d').replace(tzinfo=timezone.utc).timestamp()
+
+    def _rollup_records(self, resolution: int, start_ts: float, end_ts: float) -> Iterator[Dict[str, Any]]:
+        """Rollup buckets from the daily files overlapping [start_ts, end_ts)"""
+        for path in sorted(self.directory.glob(f"rollup-{resolution}s-*.jsonl.gz")):
+            day_start = self._rollup_start(path)
+            if day_start >= end_ts or day_start + self.ROLLUP_SEGMENT_SECONDS <= start_ts:
+                continue
+            yield from self._read_lines(path)
+
+    @staticmethod
+    def _read_lines(path: Path) -> Iterator[Dict[str, Any]]:
+        if not path.exists():
+            return
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+        except (EOFError, gzip.BadGzipFile):
+            # Truncated trailing member from an interrupted append
+            return
+
+    def query(self, start: Any, end: Any, fields: List[str] = None) -> List[Dict[str, Any]]:
+        """Raw points with start <= ts < end, reading only overlapping segments"""
+        start_ts, end_ts = self._to_epoch(start), self._to_epoch(end)
+        points = []
+        for path in sorted(self.directory.glob("raw-*.jsonl.gz")):
+            segment_start = self._segment_start(path)
+            if segment_start >= end_ts or segment_start + self.SEGMENT_SECONDS <= start_ts:
+                continue
+            for record in self._read_lines(path):
+                if start_ts <= record['ts'] < end_ts:
+                    values = record['v']
+                    if fields is not None:
+                        values = {k: values.get(k) for k in fields}
+                    points.append({'ts': record['ts'], **values})
+        return points
+
+    def downsample(self, start: Any, end: Any, bucket_seconds: int,
+                   fields: List[str], agg: str = 'avg') -> List[Dict[str, Any]]:
+        """Aggregate fields into fixed buckets (avg/min/max/sum/count)
+
+        Uses the coarsest rollup that evenly divides bucket_seconds, falling back
+        to raw points otherwise. With rollups, every rollup bucket overlapping
+        [start, end) counts whole, so unaligned edges are widened to the rollup
+        resolution rather than dropped.
+        """
+        start_ts, end_ts = self._to_epoch(start), self._to_epoch(end)
+        buckets: Dict[float, Dict[str, Any]] = {}
+
+        def merge(bucket_ts: float, count: int, name: str, total: float, low: float, high: float):
+            bucket = buckets.setdefault(bucket_ts, {'count': 0, 'fields': {}})
+            current = bucket['fields'].get(name)
+            if current is None:
+                bucket['fields'][name] = [count, total, low, high]
+            else:
+                current[0] += count
+                current[1] += total
+                current[2] = min(current[2], low)
+                current[3] = max(current[3], high)
+
+        resolution = self._best_rollup(bucket_seconds)
+        if resolution is not None:
+            records = list(self._rollup_records(resolution, start_ts - resolution, end_ts))
+            open_bucket = self._open_rollups.get(resolution)
+            if open_bucket is not None:
+                records.append(open_bucket)
+            for record in records:
+                if record['ts'] + resolution <= start_ts or record['ts'] >= end_ts:
+                    continue
+                bucket_ts = record['ts'] - (record['ts'] % bucket_seconds)
+                for name in fields:
+                    if name in record['fields']:
+                        total, low, high = record['fields'][name]
+                        merge(bucket_ts, record['count'], name, total, low, high)
+        else:
+            for point in self.query(start_ts, end_ts, fields):
+                bucket_ts = point['ts'] - (point['ts'] % bucket_seconds)
+                for name in fields:
+                    value = point.get(name)
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        merge(bucket_ts, 1, name, float(value), float(value), float(value))
+
+        result = []
+        for bucket_ts in sorted(buckets):
+            row = {'ts': bucket_ts}
+            for name, (count, total, low, high) in buckets[bucket_ts]['fields'].items():
+                row[name] = {
+                    'avg': total / count if count else None,
+                    'min': low,
+                    'max': high,
+                    'sum': total,
+                    'count': count
+                }[agg]
+            result.append(row)
+        return result
+
+    def _best_rollup(self, bucket_seconds: int) -> Optional[int]:
+        candidates = [r for r in self.rollup_resolutions if bucket_seconds % r == 0]
+        return max(candidates) if candidates else None
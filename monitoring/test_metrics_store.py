@@ -0,0 +1,39 @@
+# Metrics time-series store checks
+# Rollup downsampling over aligned and unaligned windows, in a temporary directory
+# Run: pytest test_metrics_store.py   or   python test_metrics_store.py
+
+import tempfile
+
+from metrics_store import MetricsTimeSeriesStore
+
+START = 1_699_999_200  # hour-aligned
+
+
+def filled_store(hours=4, step=60):
+    store = MetricsTimeSeriesStore(tempfile.mkdtemp(prefix="metrics_store_"))
+    for ts in range(START, START + hours * 3600, step):
+        store.append(ts, {"connections": 1})
+    store.flush()
+    return store
+
+
+def test_unaligned_window_keeps_overlapping_rollups():
+    store = filled_store()
+    # Starts 800 s into the first hour: that hour's rollup overlaps and must count
+    rows = store.downsample(1_700_000_000, 1_700_007_200, 3600, ["connections"], "count")
+    assert [row["ts"] for row in rows] == [START, START + 3600, START + 7200]
+    assert all(row["connections"] == 60 for row in rows)
+
+
+def test_aligned_window_matches_raw_points():
+    store = filled_store()
+    end = START + 7200
+    rollup = store.downsample(START, end, 3600, ["connections"], "sum")
+    raw = store.downsample(START, end, 1800 + 1, ["connections"], "sum")  # no rollup divides this
+    assert sum(row["connections"] for row in rollup) == sum(row["connections"] for row in raw) == 120
+
+
+if __name__ == "__main__":
+    test_unaligned_window_keeps_overlapping_rollups()
+    test_aligned_window_matches_raw_points()
+    print("Metrics store checks passed")
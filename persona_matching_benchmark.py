@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Persona Matching Benchmark
+Compares the previous persona matching in ProgGnosisAdaptiveFramework (one
+awaited _calculate_persona_fit per persona, walking skill dictionaries) with
+the persona skill matrix and its per-signature fit cache, with thousands of
+custom personas. Checks that both pick the same persona with the same fit,
+and times adapt_to_context end to end.
+
+Usage:
+    python persona_matching_benchmark.py --personas 1000 5000 --adaptations 500
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import time
+
+from prognosis_adaptive_framework import ProgGnosisAdaptiveFramework
+
+CONTEXTS = [
+    {"type": context_type, "complexity": complexity}
+    for context_type in ("development", "creative", "analytical", "spiritual", "general")
+    for complexity in ("low", "medium", "high", "extreme")
+]
+
+
+async def legacy_fit(framework, persona, required_skills):
+    """The removed _calculate_persona_fit"""
+    total_fit = 0.0
+    total_weight = 0.0
+    for skill, required_weight in required_skills.items():
+        persona_weight = persona.skill_weights.get(skill, 0.0)
+        skill_level = framework.skill_chains[skill].proficiency_score if skill in framework.skill_chains else 0.0
+        weight_fit = min(persona_weight / max(required_weight, 0.1), 1.0)
+        total_fit += (weight_fit * 0.7 + skill_level / 100.0 * 0.3) * required_weight
+        total_weight += required_weight
+    return total_fit / max(total_weight, 0.1)
+
+
+async def legacy_best(framework, required_skills):
+    best_persona, best_score = None, -1.0
+    for persona in framework.personas.values():
+        score = await legacy_fit(framework, persona, required_skills)
+        if score > best_score:
+            best_persona, best_score = persona, score
+    return best_persona, best_score
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark ProgGnosis persona matching")
+    parser.add_argument("--personas", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--adaptations", type=int, default=500)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    rng = random.Random(3)
+
+    print(f"{'personas':>9} {'legacy match':>13} {'matrix match':>13} {'cached match':>13} {'adapt_to_context':>17}")
+    for count in args.personas:
+        framework = ProgGnosisAdaptiveFramework()
+        skills = list(framework.skill_chains)
+        for chain in framework.skill_chains.values():
+            chain.proficiency_score = rng.uniform(0, 60)
+        for i in range(count):
+            weights = {skill: round(rng.uniform(0.2, 1.2), 2) for skill in rng.sample(skills, rng.randint(3, 10))}
+            await framework.create_custom_persona(f"Custom {i}", "Synthetic benchmark persona", weights)
+
+        requirements = [await framework._analyze_context_requirements(context) for context in CONTEXTS]
+
+        began = time.perf_counter()
+        expected = [await legacy_best(framework, required) for required in requirements]
+        legacy = (time.perf_counter() - began) / len(requirements)
+
+        framework.persona_fit_cache.clear()
+        began = time.perf_counter()
+        ranked = [(await framework._rank_personas(required, 1))[0] for required in requirements]
+        uncached = (time.perf_counter() - began) / len(requirements)
+
+        began = time.perf_counter()
+        for required in requirements:
+            await framework._rank_personas(required, 1)
+        cached = (time.perf_counter() - began) / len(requirements)
+
+        for (persona, score), (legacy_persona, legacy_score) in zip(ranked, expected):
+            assert persona is legacy_persona, (persona.name, legacy_persona.name)
+            assert math.isclose(score, legacy_score, rel_tol=1e-12), (score, legacy_score)
+
+        began = time.perf_counter()
+        for i in range(args.adaptations):
+            await framework.adapt_to_context(CONTEXTS[i % len(CONTEXTS)])
+        adapt = (time.perf_counter() - began) / args.adaptations
+
+        print(f"{count:>9,} {legacy * 1000:>11.2f}ms {uncached * 1000:>11.3f}ms {cached * 1000:>11.3f}ms "
+              f"{adapt * 1000:>15.3f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🎭 PERSONA SKILL MATRIX
+ProgGnosis personas as NumPy skill-weight rows, for whole-population fit
+
+One row per persona over a skill column vocabulary that starts with the skill
+chains (grouped by SkillDomain) and grows as personas name other skills. A
+context's required skills become a SkillRequirement (column indices, required
+weights and the clipped divisors of the fit formula), and the weight part of
+every persona's fit is one clipped product over the required columns instead
+of one awaited call per persona.
+
+Appending a persona only adds a row, so cached fit vectors can be extended
+with the new rows; version changes only when an existing row is rewritten
+with different weights, which invalidates them.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple
+
+import numpy as np
+
+
+class SkillRequirement(NamedTuple):
+    """A required-skill dict encoded against the matrix columns"""
+    columns: np.ndarray  # known columns among the required skills
+    weights: np.ndarray  # required weight of each known column
+    divisors: np.ndarray  # max(required weight, 0.1), as in the scalar fit
+    total_weight: float  # over all required skills, known or not
+
+
+class PersonaSkillMatrix:
+    """Row-per-persona skill weights with vectorized weight fit"""
+
+    def __init__(self, skills: Iterable[str] = (), initial_rows: int = 64, initial_skills: int = 32):
+        self.persona_ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.skill_columns: Dict[str, int] = {}
+        self.version = 0
+        self._weights = np.zeros((initial_rows, initial_skills))
+        for skill in skills:
+            self._skill_column(skill)
+
+    def __len__(self) -> int:
+        return len(self.persona_ids)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def upsert(self, persona_id: str, skill_weights: Dict[str, float]) -> int:
+        """Add a persona, or rewrite its row if its weights changed"""
+        row = self.rows.get(persona_id)
+        is_new = row is None
+        if is_new:
+            row = len(self.persona_ids)
+            self._ensure_rows(row + 1)
+            self.rows[persona_id] = row
+            self.persona_ids.append(persona_id)
+
+        columns = [self._skill_column(skill) for skill in skill_weights]
+        values = np.zeros(self._weights.shape[1])
+        values[columns] = list(skill_weights.values())
+        if not is_new and np.array_equal(self._weights[row], values):
+            return row
+        self._weights[row] = values
+        if not is_new:
+            self.version += 1
+        return row
+
+    def _ensure_rows(self, needed: int):
+        capacity = self._weights.shape[0]
+        if needed > capacity:
+            self._weights = np.pad(self._weights, ((0, max(needed, capacity * 2) - capacity), (0, 0)))
+
+    def _skill_column(self, skill: str) -> int:
+        column = self.skill_columns.get(skill)
+        if column is None:
+            column = len(self.skill_columns)
+            self.skill_columns[skill] = column
+            width = self._weights.shape[1]
+            if column >= width:
+                self._weights = np.pad(self._weights, ((0, 0), (0, width)))
+        return column
+
+    # ------------------------------------------------------------------
+    # Fit
+    # ------------------------------------------------------------------
+
+    def requirement(self, required_skills: Dict[str, float]) -> SkillRequirement:
+        known = [(self.skill_columns[skill], weight) for skill, weight in required_skills.items()
+                 if skill in self.skill_columns]
+        columns = np.array([column for column, _ in known], dtype=np.intp)
+        weights = np.array([weight for _, weight in known], dtype=np.float64)
+        return SkillRequirement(columns, weights, np.maximum(weights, 0.1), float(sum(required_skills.values())))
+
+    def weight_fit(self, requirement: SkillRequirement, start: int = 0) -> np.ndarray:
+        """Σ required · min(persona weight / divisor, 1) for rows [start, len)"""
+        block = self._weights[start:len(self.persona_ids), requirement.columns]
+        return np.minimum(block / requirement.divisors, 1.0) @ requirement.weights
+
+    @staticmethod
+    def top(scores: np.ndarray, k: int) -> np.ndarray:
+        """Rows of the k highest scores, ties in registration order"""
+        if k <= 0:
+            return np.zeros(0, dtype=np.intp)
+        if k >= len(scores):
+            candidates = np.arange(len(scores))
+        else:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            # Rows tied with the k-th score beyond the partition must still win by order
+            threshold = scores[candidates].min()
+            candidates = np.flatnonzero(scores >= threshold)
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order][:k]
@@ -16,7 +16,9 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 import uuid
 import numpy as np
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+
+from persona_skill_matrix import PersonaSkillMatrix
 
 class ConsciousnessLevel(Enum):
     """🌟 Consciousness evolution levels"""
@@ -120,6 +122,12 @@ class ProgGnosisAdaptiveFramework:
         # Initialize the 22 skill chains
         self._initialize_skill_chains()
         
+        # Persona skill weights as matrix rows over the skill chains, and per
+        # requirement signature the cached weight fit of every persona
+        self.persona_matrix = PersonaSkillMatrix(self.skill_chains)
+        self.persona_fit_cache: "OrderedDict[Tuple, Tuple[Any, np.ndarray, int]]" = OrderedDict()
+        self.persona_fit_cache_size = 256
+        
         # Initialize default personas
         self._initialize_default_personas()
 
@@ -242,7 +250,7 @@ class ProgGnosisAdaptiveFramework:
                 consciousness_level=persona_data["consciousness"],
                 christ_sealed=True
             )
-            self.personas[persona_data["id"]] = persona
+            self._register_persona(persona)
         
         self.logger.info("🎭 Default adaptive personas initialized")
 
@@ -335,15 +343,8 @@ class ProgGnosisAdaptiveFramework:
 
     async def _find_optimal_persona(self, required_skills: Dict[str, float]) -> PersonaAdaptation:
         """🎯 Find or create optimal persona for requirements"""
-        best_persona = None
-        best_score = -1.0
-        
-        # Evaluate existing personas
-        for persona in self.personas.values():
-            score = await self._calculate_persona_fit(persona, required_skills)
-            if score > best_score:
-                best_score = score
-                best_persona = persona
+        ranked = await self._rank_personas(required_skills, 1)
+        best_persona, best_score = ranked[0] if ranked else (None, -1.0)
         
         # If no good fit (score < 0.7), create adaptive persona
         if best_score < 0.7:
@@ -351,24 +352,53 @@ class ProgGnosisAdaptiveFramework:
         
         return best_persona
 
-    async def _calculate_persona_fit(self, persona: PersonaAdaptation, required_skills: Dict[str, float]) -> float:
-        """📊 Calculate how well a persona fits requirements"""
-        total_fit = 0.0
-        total_weight = 0.0
+    async def _rank_personas(self, required_skills: Dict[str, float], k: int) -> List[Tuple[PersonaAdaptation, float]]:
+        """🏆 The k best-fitting personas with their fit, best first"""
+        requirement, weight_fit = self._persona_weight_fit(required_skills)
+        if not len(weight_fit):
+            return []
         
-        for skill, required_weight in required_skills.items():
-            persona_weight = persona.skill_weights.get(skill, 0.0)
-            skill_level = self.skill_chains[skill].proficiency_score if skill in self.skill_chains else 0.0
-            
-            # Calculate fit score
-            weight_fit = min(persona_weight / max(required_weight, 0.1), 1.0)
-            level_fit = skill_level / 100.0
-            skill_fit = (weight_fit * 0.7) + (level_fit * 0.3)
-            
-            total_fit += skill_fit * required_weight
-            total_weight += required_weight
+        # Skill levels are the same for every persona, so they only shift the score
+        level_fit = sum(
+            self.skill_chains[skill].proficiency_score / 100.0 * weight
+            for skill, weight in required_skills.items() if skill in self.skill_chains
+        )
+        scores = (weight_fit * 0.7 + level_fit * 0.3) / max(requirement.total_weight, 0.1)
         
-        return total_fit / max(total_weight, 0.1)
+        return [
+            (self.personas[self.persona_matrix.persona_ids[row]], float(scores[row]))
+            for row in self.persona_matrix.top(scores, k)
+        ]
+
+    def _persona_weight_fit(self, required_skills: Dict[str, float]):
+        """📊 Weight fit of every persona, cached per normalized requirement signature"""
+        matrix = self.persona_matrix
+        if len(matrix) != len(self.personas):
+            # Personas were added to the dict directly
+            for persona in self.personas.values():
+                matrix.upsert(persona.persona_id, persona.skill_weights)
+        
+        signature = tuple(sorted(required_skills.items()))
+        cached = self.persona_fit_cache.get(signature)
+        if cached is not None and cached[2] == matrix.version:
+            requirement, weight_fit, _ = cached
+            self.persona_fit_cache.move_to_end(signature)
+            if len(weight_fit) < len(matrix):
+                # Only personas created since are new rows
+                weight_fit = np.concatenate([weight_fit, matrix.weight_fit(requirement, len(weight_fit))])
+        else:
+            requirement = matrix.requirement(required_skills)
+            weight_fit = matrix.weight_fit(requirement)
+        
+        self.persona_fit_cache[signature] = (requirement, weight_fit, matrix.version)
+        if len(self.persona_fit_cache) > self.persona_fit_cache_size:
+            self.persona_fit_cache.popitem(last=False)
+        return requirement, weight_fit
+
+    def _register_persona(self, persona: PersonaAdaptation):
+        """📝 Add (or replace) a persona and its skill-weight row"""
+        self.personas[persona.persona_id] = persona
+        self.persona_matrix.upsert(persona.persona_id, persona.skill_weights)
 
     async def _create_adaptive_persona(self, required_skills: Dict[str, float]) -> PersonaAdaptation:
         """🌟 Create new adaptive persona for specific context"""
@@ -401,7 +431,7 @@ class ProgGnosisAdaptiveFramework:
             christ_sealed=True
         )
         
-        self.personas[persona_id] = persona
+        self._register_persona(persona)
         self.logger.info(f"🌟 Created adaptive persona: {persona_id}")
         return persona
 
@@ -656,7 +686,7 @@ class ProgGnosisAdaptiveFramework:
             christ_sealed=True
         )
         
-        self.personas[persona_id] = persona
+        self._register_persona(persona)
         self.logger.info(f"🎭 Created custom persona: {name}")
         return persona_id
 
@@ -17,6 +17,8 @@ import json
 import time
 import logging
 import asyncio
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -34,6 +36,8 @@ import speech_recognition as sr
 from gtts import gTTS
 import tempfile
 
+from scroll_index import ScrollIndex
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -227,38 +231,90 @@ class SophiaCore:
 class LivingArchive:
     """Sacred scroll memory and retrieval system"""
     
-    def __init__(self, archive_path: str = "data/living_archive"):
+    def __init__(self, archive_path: str = "data/living_archive", cache_size: int = 256):
         self.archive_path = Path(archive_path)
         self.archive_path.mkdir(parents=True, exist_ok=True)
-        self.scrolls: Dict[str, ScrollEntry] = {}
-        self._load_existing_scrolls()
+        # Scroll bodies are read on demand; only recently used ones stay in memory
+        self.scrolls: "OrderedDict[str, ScrollEntry]" = OrderedDict()
+        self.cache_size = cache_size
+        self.index = ScrollIndex(str(self.archive_path / ".scroll_index.db"))
+        # Catch up with files added or edited while offline without delaying
+        # startup; queries wait for this first sync (see index_ready)
+        self._index_synced = threading.Event()
+        self._sync_thread = threading.Thread(target=self._sync_index, name="living-archive-index", daemon=True)
+        self._sync_thread.start()
     
-    def _load_existing_scrolls(self):
-        """Load existing scrolls from disk"""
+    def _sync_index(self):
+        """Re-index scroll files whose mtime or size changed since the last run"""
         try:
-            for scroll_file in self.archive_path.glob("*.json"):
-                with open(scroll_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    scroll = ScrollEntry(
-                        id=data['id'],
-                        title=data['title'],
-                        content=data['content'],
-                        timestamp=datetime.fromisoformat(data['timestamp']),
-                        node_type=data['node_type'],
-                        consciousness_filter=data['consciousness_filter'],
-                        tags=data['tags'],
-                        metadata=data['metadata']
-                    )
-                    self.scrolls[scroll.id] = scroll
-            logger.info(f"Loaded {len(self.scrolls)} existing scrolls")
+            stats = self.index.sync_directory(str(self.archive_path), ".json", self._index_document_from_file)
+            logger.info(f"Living Archive index synced: {stats}")
         except Exception as e:
-            logger.error(f"Error loading scrolls: {e}")
+            logger.error(f"Error indexing scrolls: {e}")
+        finally:
+            self._index_synced.set()
+    
+    @property
+    def index_ready(self) -> bool:
+        """True once the startup sync has finished; until then queries wait for it"""
+        return self._index_synced.is_set()
+    
+    async def wait_until_ready(self):
+        if not self._index_synced.is_set():
+            await asyncio.get_running_loop().run_in_executor(None, self._index_synced.wait)
+    
+    @staticmethod
+    def _index_document_from_file(path: str) -> Dict[str, Any]:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {
+            "doc_id": data['id'],
+            "fields": [data['title'], data['content'], " ".join(data['tags'])],
+            "category": data['consciousness_filter'],
+            "timestamp": data['timestamp']
+        }
+    
+    def scroll_count(self) -> int:
+        return len(self.index)
+    
+    def _load_scroll(self, scroll_id: str) -> Optional[ScrollEntry]:
+        """Return a scroll from the cache, reading its file on a miss"""
+        scroll = self.scrolls.get(scroll_id)
+        if scroll is not None:
+            self.scrolls.move_to_end(scroll_id)
+            return scroll
+        
+        path = self.index.document_path(scroll_id)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading scroll {scroll_id}: {e}")
+            return None
+        scroll = ScrollEntry(
+            id=data['id'],
+            title=data['title'],
+            content=data['content'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            node_type=data['node_type'],
+            consciousness_filter=data['consciousness_filter'],
+            tags=data['tags'],
+            metadata=data['metadata']
+        )
+        self._cache_scroll(scroll)
+        return scroll
+    
+    def _cache_scroll(self, scroll: ScrollEntry):
+        self.scrolls[scroll.id] = scroll
+        self.scrolls.move_to_end(scroll.id)
+        while len(self.scrolls) > self.cache_size:
+            self.scrolls.popitem(last=False)
     
     async def store_scroll(self, scroll: ScrollEntry) -> bool:
         """Store a new scroll in the archive"""
         try:
-            self.scrolls[scroll.id] = scroll
-            
             # Save to disk
             scroll_file = self.archive_path / f"{scroll.id}.json"
             scroll_data = asdict(scroll)
@@ -267,6 +323,18 @@ class LivingArchive:
             with open(scroll_file, 'w', encoding='utf-8') as f:
                 json.dump(scroll_data, f, indent=2, ensure_ascii=False)
             
+            stat = scroll_file.stat()
+            self.index.index_document(
+                scroll.id,
+                [scroll.title, scroll.content, " ".join(scroll.tags)],
+                path=str(scroll_file.resolve()),
+                mtime=stat.st_mtime,
+                size=stat.st_size,
+                category=scroll.consciousness_filter,
+                timestamp=scroll_data['timestamp']
+            )
+            self._cache_scroll(scroll)
+            
             logger.info(f"Stored scroll {scroll.id}: {scroll.title}")
             return True
             
@@ -275,26 +343,13 @@ class LivingArchive:
             return False
     
     async def query_scrolls(self, query: str, consciousness_filter: str = None, limit: int = 10) -> List[ScrollEntry]:
-        """Query scrolls based on content and filters"""
+        """Query scrolls by words and "quoted phrases", best matches first"""
         try:
-            matching_scrolls = []
-            query_lower = query.lower()
-            
-            for scroll in self.scrolls.values():
-                # Check consciousness filter
-                if consciousness_filter and scroll.consciousness_filter != consciousness_filter:
-                    continue
-                
-                # Check content match
-                if (query_lower in scroll.title.lower() or 
-                    query_lower in scroll.content.lower() or
-                    any(query_lower in tag.lower() for tag in scroll.tags)):
-                    matching_scrolls.append(scroll)
-            
-            # Sort by timestamp, most recent first
-            matching_scrolls.sort(key=lambda x: x.timestamp, reverse=True)
-            
-            return matching_scrolls[:limit]
+            # Scrolls on disk are invisible to the index until the startup sync ends
+            await self.wait_until_ready()
+            hits = self.index.search(query, category=consciousness_filter, limit=limit)
+            scrolls = (self._load_scroll(scroll_id) for scroll_id, _ in hits)
+            return [scroll for scroll in scrolls if scroll is not None]
             
         except Exception as e:
             logger.error(f"Error querying scrolls: {e}")
@@ -515,7 +570,8 @@ async def sacred_status():
             "christ_filter": sophia_core.christ_filter_enabled
         },
         "living_archive": {
-            "scroll_count": len(living_archive.scrolls),
+            "scroll_count": living_archive.scroll_count(),
+            "index_ready": living_archive.index_ready,
             "archive_path": str(living_archive.archive_path)
         },
         "anchor_core": {
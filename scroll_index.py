@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Scroll Index - persistent inverted index for scroll archives
+
+Maps every token to the scrolls containing it, with positions, in a SQLite
+file next to the scrolls. Opening the index costs the same for ten scrolls
+or a million: nothing is scanned or loaded until a query asks for it.
+sync_directory() brings the index up to date by re-reading only files whose
+mtime or size changed, and search() ranks hits with BM25 plus a bonus for
+exact phrase matches, so callers load scroll bodies only for the hits they
+return.
+
+Query syntax:
+    divine love            both words, anywhere (adjacent matches rank higher)
+    "living water" mercy   the exact phrase plus the word
+"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+PHRASE_PATTERN = re.compile(r'"([^"]*)"')
+
+# Positions skipped between fields so phrases never span title and body
+FIELD_GAP = 8
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.lower() for token in TOKEN_PATTERN.findall(text or "")]
+
+
+def parse_query(query: str) -> Tuple[List[List[str]], List[str]]:
+    """Split a query into quoted phrases and loose terms"""
+    phrases = [tokenize(phrase) for phrase in PHRASE_PATTERN.findall(query)]
+    terms = tokenize(PHRASE_PATTERN.sub(" ", query))
+    return [phrase for phrase in phrases if phrase], terms
+
+
+class ScrollIndex:
+    """Token -> (scroll id, positions) postings with incremental, mtime-driven updates"""
+
+    def __init__(self, db_path: str, k1: float = 1.2, b: float = 0.75, phrase_boost: float = 2.0):
+        self.db_path = db_path
+        self.k1 = k1
+        self.b = b
+        self.phrase_boost = phrase_boost
+        self._lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                path TEXT,
+                mtime REAL,
+                size INTEGER,
+                length INTEGER NOT NULL,
+                category TEXT,
+                timestamp TEXT
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                token TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                positions TEXT NOT NULL,
+                PRIMARY KEY (token, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_by_doc ON postings(doc_id);
+            CREATE INDEX IF NOT EXISTS documents_by_path ON documents(path);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+        # Corpus totals for BM25 are kept in meta so opening never aggregates
+        self._doc_count = int(self._meta("doc_count"))
+        self._total_length = int(self._meta("total_length"))
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def index_document(self, doc_id: str, fields: Iterable[str], path: Optional[str] = None,
+                       mtime: Optional[float] = None, size: Optional[int] = None,
+                       category: Optional[str] = None, timestamp: Optional[str] = None,
+                       commit: bool = True):
+        """(Re)index one scroll; fields are searched separately for phrases"""
+        positions: Dict[str, List[int]] = defaultdict(list)
+        offset = 0
+        for field in fields:
+            tokens = tokenize(field)
+            for i, token in enumerate(tokens):
+                positions[token].append(offset + i)
+            offset += len(tokens) + FIELD_GAP
+        length = sum(len(p) for p in positions.values())
+
+        with self._lock:
+            self._remove(doc_id)
+            self._conn.execute(
+                "INSERT INTO documents (doc_id, path, mtime, size, length, category, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (doc_id, path, mtime, size, length, category, timestamp)
+            )
+            self._conn.executemany(
+                "INSERT INTO postings (token, doc_id, tf, positions) VALUES (?, ?, ?, ?)",
+                [(token, doc_id, len(p), ",".join(map(str, p))) for token, p in positions.items()]
+            )
+            self._doc_count += 1
+            self._total_length += length
+            self._save_totals()
+            if commit:
+                self._conn.commit()
+
+    def remove_document(self, doc_id: str, commit: bool = True) -> bool:
+        with self._lock:
+            removed = self._remove(doc_id)
+            if removed:
+                self._save_totals()
+                if commit:
+                    self._conn.commit()
+            return removed
+
+    def _remove(self, doc_id: str) -> bool:
+        row = self._conn.execute("SELECT length FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        if row is None:
+            return False
+        self._conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+        self._doc_count -= 1
+        self._total_length -= row[0]
+        return True
+
+    def sync_directory(self, directory: str, suffix: str,
+                       extract: Callable[[str], Optional[Dict[str, Any]]],
+                       batch: int = 500) -> Dict[str, int]:
+        """
+        Re-index files under directory whose mtime or size changed; drop vanished ones
+
+        extract(path) returns {"doc_id", "fields", "category"?, "timestamp"?} or None
+        for files that should not be indexed.
+        """
+        with self._lock:
+            known = {
+                path: (doc_id, mtime, size)
+                for doc_id, path, mtime, size in self._conn.execute(
+                    "SELECT doc_id, path, mtime, size FROM documents WHERE path IS NOT NULL"
+                )
+            }
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0, "skipped": 0}
+        seen = set()
+        pending = 0
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(suffix) or not entry.is_file():
+                    continue
+                path = os.path.abspath(entry.path)
+                seen.add(path)
+                stat = entry.stat()
+                previous = known.get(path)
+                if previous and previous[1] == stat.st_mtime and previous[2] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+                try:
+                    document = extract(path)
+                except Exception:
+                    document = None
+                if not document:
+                    stats["skipped"] += 1
+                    continue
+                with self._lock:
+                    if previous and previous[0] != document["doc_id"]:
+                        self._remove(previous[0])
+                    self.index_document(
+                        document["doc_id"], document["fields"], path=path,
+                        mtime=stat.st_mtime, size=stat.st_size,
+                        category=document.get("category"), timestamp=document.get("timestamp"),
+                        commit=False
+                    )
+                stats["indexed"] += 1
+                pending += 1
+                if pending >= batch:
+                    with self._lock:
+                        self._conn.commit()
+                    pending = 0
+
+        directory_prefix = os.path.abspath(directory) + os.sep
+        with self._lock:
+            for path, (doc_id, _, _) in known.items():
+                if path.startswith(directory_prefix) and path not in seen:
+                    self._remove(doc_id)
+                    stats["removed"] += 1
+            self._save_totals()
+            self._conn.commit()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return self._doc_count
+
+    def document_count(self, category: Optional[str] = None) -> int:
+        if category is None:
+            return self._doc_count
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM documents WHERE category = ?", (category,)
+            ).fetchone()[0]
+
+    def is_current(self, doc_id: str, mtime: float, size: int) -> bool:
+        """Whether doc_id is indexed from a file with this mtime and size"""
+        with self._lock:
+            row = self._conn.execute("SELECT mtime, size FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        return row is not None and row[0] == mtime and row[1] == size
+
+    def document_path(self, doc_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT path FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        return row[0] if row else None
+
+    def search(self, query: str, category: Optional[str] = None, limit: int = 10) -> List[Tuple[str, float]]:
+        """Ranked (doc_id, score) for scrolls containing every query word and phrase"""
+        phrases, terms = parse_query(query)
+        required = set(terms)
+        for phrase in phrases:
+            required.update(phrase)
+        if not required:
+            return []
+        # An unquoted multi-word query is also tried as a phrase, for ranking only
+        soft_phrase = terms if len(terms) > 1 and not phrases else None
+
+        with self._lock:
+            postings: Dict[str, Dict[str, Tuple[int, str]]] = {}
+            candidates = None
+            # Rarest token first keeps the running intersection small
+            frequencies = {
+                token: self._conn.execute("SELECT COUNT(*) FROM postings WHERE token = ?", (token,)).fetchone()[0]
+                for token in required
+            }
+            for token in sorted(required, key=frequencies.get):
+                if frequencies[token] == 0:
+                    return []
+                rows = self._conn.execute(
+                    "SELECT doc_id, tf, positions FROM postings WHERE token = ?", (token,)
+                )
+                postings[token] = {
+                    doc_id: (tf, positions) for doc_id, tf, positions in rows
+                    if candidates is None or doc_id in candidates
+                }
+                candidates = set(postings[token])
+                if not candidates:
+                    return []
+            documents = self._documents(candidates, category)
+
+        average_length = self._total_length / self._doc_count if self._doc_count else 1.0
+        scored = []
+        for doc_id, (length, timestamp) in documents.items():
+            position_cache: Dict[str, set] = {}
+
+            def positions_of(token):
+                if token not in position_cache:
+                    position_cache[token] = {int(p) for p in postings[token][doc_id][1].split(",")}
+                return position_cache[token]
+
+            if any(self._phrase_count(phrase, positions_of) == 0 for phrase in phrases):
+                continue
+            score = 0.0
+            for token in required:
+                tf = postings[token][doc_id][0]
+                idf = math.log(1 + (self._doc_count - frequencies[token] + 0.5) / (frequencies[token] + 0.5))
+                score += idf * tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / average_length))
+            for phrase in phrases + ([soft_phrase] if soft_phrase else []):
+                occurrences = self._phrase_count(phrase, positions_of)
+                score += self.phrase_boost * math.log1p(occurrences) * len(phrase)
+            scored.append((score, timestamp or "", doc_id))
+
+        scored.sort(reverse=True)
+        return [(doc_id, round(score, 4)) for score, _, doc_id in scored[:limit]]
+
+    @staticmethod
+    def _phrase_count(phrase: List[str], positions_of: Callable[[str], set]) -> int:
+        starts = positions_of(phrase[0])
+        for offset, token in enumerate(phrase[1:], start=1):
+            following = positions_of(token)
+            starts = {start for start in starts if start + offset in following}
+            if not starts:
+                return 0
+        return len(starts)
+
+    def _documents(self, doc_ids: Iterable[str], category: Optional[str]) -> Dict[str, Tuple[int, str]]:
+        doc_ids = list(doc_ids)
+        found = {}
+        for i in range(0, len(doc_ids), 500):
+            chunk = doc_ids[i:i + 500]
+            sql = f"SELECT doc_id, length, timestamp, category FROM documents WHERE doc_id IN ({','.join('?' * len(chunk))})"
+            for doc_id, length, timestamp, doc_category in self._conn.execute(sql, chunk):
+                if category is None or doc_category == category:
+                    found[doc_id] = (length, timestamp)
+        return found
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    def _meta(self, key: str) -> float:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _save_totals(self):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("doc_count", self._doc_count), ("total_length", self._total_length)]
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Scroll Index Benchmark
+Compares the old Living Archive pattern (read every scroll at startup, substring
+scan per query) with the persistent inverted index: opening cost at growing
+archive sizes, incremental re-sync after a few edits, and ranked phrase queries.
+Writes synthetic scroll files to a temporary directory.
+
+Usage:
+    python scroll_index_benchmark.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from scroll_index import ScrollIndex
+
+WORDS = ("light mercy covenant river wisdom fire breath scroll mirror vision prayer grace truth "
+         "shepherd harvest morning stone living water bread silence thunder dove olive gate").split()
+
+
+def write_scrolls(directory: str, start: int, count: int, rng: random.Random):
+    base = datetime(2024, 1, 1)
+    for i in range(start, start + count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(60, 200))]
+        if i % 97 == 0:
+            words[10:12] = ["living", "water"]
+        data = {
+            "id": f"scroll_{i}",
+            "title": f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {i}",
+            "content": " ".join(words),
+            "timestamp": (base + timedelta(minutes=i)).isoformat(),
+            "node_type": "VISION",
+            "consciousness_filter": rng.choice(["ELION_ARIAM", "MIRROR_AWAKENING"]),
+            "tags": rng.sample(WORDS, 3),
+            "metadata": {},
+        }
+        with open(os.path.join(directory, f"scroll_{i}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+
+def extract(path: str):
+    # Same fields the Living Archive indexes
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        "doc_id": data["id"],
+        "fields": [data["title"], data["content"], " ".join(data["tags"])],
+        "category": data["consciousness_filter"],
+        "timestamp": data["timestamp"],
+    }
+
+
+def eager_load_and_scan(directory: str, query: str):
+    """The previous behaviour: parse every file, then substring-match each scroll"""
+    began = time.perf_counter()
+    scrolls = []
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                scrolls.append(json.load(f))
+    loaded = time.perf_counter() - began
+    began = time.perf_counter()
+    hits = [s for s in scrolls if query in s["title"].lower() or query in s["content"].lower()]
+    return loaded, time.perf_counter() - began, len(hits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the persistent scroll index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    directory = tempfile.mkdtemp(prefix="scroll_index_bench_")
+    db_path = os.path.join(directory, ".scroll_index.db")
+    written = 0
+
+    print(f"{'scrolls':>8} {'eager load':>11} {'scan query':>11} {'full sync':>10} "
+          f"{'open index':>11} {'resync 10':>10} {'phrase query':>13} {'word query':>11}")
+    for size in sorted(args.sizes):
+        write_scrolls(directory, written, size - written, rng)
+        written = size
+
+        eager, scan, scan_hits = eager_load_and_scan(directory, "living water")
+
+        index = ScrollIndex(db_path)
+        began = time.perf_counter()
+        index.sync_directory(directory, ".json", extract)
+        full_sync = time.perf_counter() - began
+        index.close()
+
+        began = time.perf_counter()
+        index = ScrollIndex(db_path)
+        opened = time.perf_counter() - began
+
+        for i in rng.sample(range(size), 10):
+            path = os.path.join(directory, f"scroll_{i}.json")
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data["content"] += " amen"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        began = time.perf_counter()
+        stats = index.sync_directory(directory, ".json", extract)
+        resync = time.perf_counter() - began
+        assert stats["indexed"] == 10, stats
+
+        began = time.perf_counter()
+        phrase_hits = index.search('"living water"', limit=10 ** 6)
+        phrase = time.perf_counter() - began
+        began = time.perf_counter()
+        index.search("thunder dove", limit=10)
+        word = time.perf_counter() - began
+        assert len(phrase_hits) >= scan_hits // 2, (len(phrase_hits), scan_hits)
+        index.close()
+
+        print(f"{size:>8,} {eager * 1000:>9.0f}ms {scan * 1000:>9.1f}ms {full_sync:>9.2f}s "
+              f"{opened * 1000:>9.2f}ms {resync * 1000:>8.0f}ms {phrase * 1000:>11.1f}ms {word * 1000:>9.1f}ms")
+
+    print(f"\n'living water' ({len(phrase_hits)} phrase hits), top 3: {phrase_hits[:3]}")
+
+
+if __name__ == "__main__":
+    main()
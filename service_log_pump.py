@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+📜 SERVICE LOG PUMP
+Continuously drains launched services' stdout/stderr so no child ever blocks
+on a full pipe, whoever is (or is not) watching its output.
+
+Every line goes to:
+- a per-service rotating log file (logs/services/<name>.log, .1, .2, ...)
+- an in-memory tail ring buffer, for status pages and failure reports
+- a unified console view, prefixed with the service name and rate-limited per
+  service so one chatty child cannot flood the terminal
+- any watchers waiting for a line to match (readiness probes)
+"""
+
+import asyncio
+import os
+import re
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Longest line kept intact; longer runs without a newline are split
+MAX_LINE_BYTES = 64 * 1024
+
+
+class RotatingLogFile:
+    """Append-only log file rotated by size, buffered and flushed periodically"""
+
+    def __init__(self, path: Path, max_bytes: int = 5 * 1024 * 1024, backups: int = 3):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", buffering=64 * 1024)
+        self._size = self._file.tell()
+
+    def write(self, line: str):
+        if self._size + len(line) > self.max_bytes and self._size > 0:
+            self.rotate()
+        self._file.write(line)
+        self._size += len(line)
+
+    def rotate(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, "a", encoding="utf-8", buffering=64 * 1024)
+        self._size = 0
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ConsoleRateLimiter:
+    """Token bucket per service; suppressed lines are counted and reported"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.suppressed = 0
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.suppressed += 1
+        return False
+
+
+class LogPump:
+    """Drain child process pipes into rotating files, tail buffers and the console"""
+
+    def __init__(self, log_dir: Path, max_bytes: int = 5 * 1024 * 1024, backups: int = 3,
+                 tail_lines: int = 500, console: bool = True, console_rate: float = 20.0,
+                 console_burst: int = 50, flush_interval: float = 1.0, stream=None):
+        self.log_dir = Path(log_dir)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.tail_lines = tail_lines
+        self.console = console
+        self.console_rate = console_rate
+        self.console_burst = console_burst
+        self.flush_interval = flush_interval
+        self.stream = stream or sys.stdout
+
+        self.files: Dict[str, RotatingLogFile] = {}
+        self.tails: Dict[str, Deque[Tuple[str, str, str]]] = {}
+        self.limiters: Dict[str, ConsoleRateLimiter] = {}
+        self.line_counts: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._watchers: Dict[str, List[Tuple[re.Pattern, Optional[str], asyncio.Event]]] = {}
+        self._drains: List[asyncio.Task] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._prefix_width = 12
+
+    def attach(self, name: str, process: Any):
+        """Start draining a child's stdout and stderr (whichever are pipes)"""
+        if name not in self.files:
+            self.files[name] = RotatingLogFile(self.log_dir / f"{name}.log", self.max_bytes, self.backups)
+            self.tails[name] = deque(maxlen=self.tail_lines)
+            self.limiters[name] = ConsoleRateLimiter(self.console_rate, self.console_burst)
+            self.line_counts[name] = 0
+            self._prefix_width = max(self._prefix_width, len(name))
+        self._names[id(process)] = name
+        for stream_name in ("stdout", "stderr"):
+            stream = getattr(process, stream_name, None)
+            if stream is not None:
+                self._drains.append(asyncio.create_task(self._drain(name, stream_name, stream)))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    def service_of(self, process: Any) -> Optional[str]:
+        return self._names.get(id(process))
+
+    def watch(self, name: str, pattern: str, stream: Optional[str] = None) -> asyncio.Event:
+        """Event set when a line from name (optionally only that stream) matches pattern"""
+        event = asyncio.Event()
+        compiled = re.compile(pattern)
+        for _, stream_name, line in self.tails.get(name, ()):
+            if (stream is None or stream == stream_name) and compiled.search(line):
+                event.set()
+                return event
+        self._watchers.setdefault(name, []).append((compiled, stream, event))
+        return event
+
+    def tail(self, name: str, lines: int = 20) -> List[str]:
+        """Most recent lines of a service, formatted as in its log file"""
+        buffered = self.tails.get(name, ())
+        return [f"{stamp} {stream} {line}" for stamp, stream, line in list(buffered)[-lines:]]
+
+    async def _drain(self, name: str, stream_name: str, stream: asyncio.StreamReader):
+        pending = b""
+        try:
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for raw in lines:
+                    self._emit(name, stream_name, raw.rstrip(b"\r").decode(errors="replace"))
+                if len(pending) > MAX_LINE_BYTES:
+                    self._emit(name, stream_name, pending.decode(errors="replace"))
+                    pending = b""
+            if pending:
+                self._emit(name, stream_name, pending.decode(errors="replace"))
+        except Exception as e:
+            self._emit(name, "pump", f"log pump stopped reading {stream_name}: {e}")
+
+    def _emit(self, name: str, stream_name: str, line: str):
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        self.files[name].write(f"{stamp} {stream_name} {line}\n")
+        self.tails[name].append((stamp, stream_name, line))
+        self.line_counts[name] += 1
+
+        watchers = self._watchers.get(name)
+        if watchers:
+            for watcher in list(watchers):
+                pattern, stream, event = watcher
+                if (stream is None or stream == stream_name) and pattern.search(line):
+                    event.set()
+                    watchers.remove(watcher)
+
+        if self.console:
+            limiter = self.limiters[name]
+            if limiter.allow():
+                if limiter.suppressed:
+                    self._print(name, f"… {limiter.suppressed} lines suppressed (see {self.files[name].path})")
+                    limiter.suppressed = 0
+                self._print(name + ("!" if stream_name == "stderr" else ""), line)
+
+    def _print(self, prefix: str, line: str):
+        self.stream.write(f"[{prefix:<{self._prefix_width + 1}}] {line}\n")
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        for name, log_file in self.files.items():
+            log_file.flush()
+            limiter = self.limiters[name]
+            if self.console and limiter.suppressed and limiter.tokens >= 1:
+                self._print(name, f"… {limiter.suppressed} lines suppressed (see {log_file.path})")
+                limiter.suppressed = 0
+        self.stream.flush()
+
+    async def close(self, timeout: float = 5.0):
+        """Wait for pipes to reach EOF (children exited), then flush and close files"""
+        if self._drains:
+            _, pending = await asyncio.wait(self._drains, timeout=timeout)
+            for task in pending:
+                task.cancel()
+        if self._flusher is not None:
+            self._flusher.cancel()
+        self.flush()
+        for log_file in self.files.values():
+            log_file.close()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+🕸️ SERVICE STARTUP GRAPH
+Dependency-ordered, parallel service startup with real readiness probes
+
+Each service declares what it depends on, how to start it and how to tell that
+it is ready (TCP connect, HTTP health endpoint or a matching log line). A
+service starts as soon as all of its dependencies are ready, so independent
+services come up in parallel and a cold start takes as long as the longest
+dependency chain. Readiness is polled with exponential backoff up to the
+service's timeout instead of sleeping for a guessed interval.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from startup_profiler import profile_phase
+
+
+class ServiceUnavailable(Exception):
+    """Raised by a start function when an optional service cannot run here"""
+
+
+class ReadinessProbe:
+    """Base probe: check() is polled until it returns True"""
+
+    description = "started"
+
+    async def check(self, handle: Any) -> bool:
+        return True
+
+
+class TcpProbe(ReadinessProbe):
+    """Ready once the port accepts a connection"""
+
+    def __init__(self, port: int, host: str = "127.0.0.1", connect_timeout: float = 1.0):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.description = f"tcp :{port}"
+
+    async def check(self, handle: Any) -> bool:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.connect_timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+
+class HttpProbe(ReadinessProbe):
+    """Ready once GET path answers with a 2xx/3xx status"""
+
+    def __init__(self, port: int, path: str = "/health", host: str = "127.0.0.1", request_timeout: float = 2.0):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.request_timeout = request_timeout
+        self.description = f"http :{port}{path}"
+
+    async def check(self, handle: Any) -> bool:
+        try:
+            return await asyncio.wait_for(self._get_status(), self.request_timeout) < 400
+        except (OSError, asyncio.TimeoutError, ValueError):
+            return False
+
+    async def _get_status(self) -> int:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(f"GET {self.path} HTTP/1.0\r\nHost: {self.host}\r\n\r\n".encode())
+            await writer.drain()
+            status_line = await reader.readline()
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
+
+
+class LogLineProbe(ReadinessProbe):
+    """
+    Ready once the child process writes a line matching pattern
+
+    With a log pump (service_log_pump.LogPump) the probe subscribes to the lines
+    the pump is already draining; without one it reads the stream itself.
+    """
+
+    def __init__(self, pattern: str, stream: str = "stdout", pump: Any = None):
+        self.pattern = re.compile(pattern)
+        self.stream = stream
+        self.pump = pump
+        self.description = f"log /{pattern}/"
+        self._matched: Optional[asyncio.Event] = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def check(self, handle: Any) -> bool:
+        if self._matched is None:
+            if self.pump is not None:
+                self._matched = self.pump.watch(self.pump.service_of(handle), self.pattern.pattern, self.stream)
+            else:
+                self._matched = asyncio.Event()
+                self._reader = asyncio.create_task(self._scan(getattr(handle, self.stream)))
+        return self._matched.is_set()
+
+    async def _scan(self, stream: asyncio.StreamReader):
+        while not self._matched.is_set():
+            line = await stream.readline()
+            if not line:
+                return
+            if self.pattern.search(line.decode(errors="replace")):
+                self._matched.set()
+
+
+@dataclass
+class ServiceSpec:
+    """One node of the startup graph"""
+    name: str
+    start: Callable[[], Awaitable[Any]]
+    depends_on: Sequence[str] = ()
+    probe: Optional[ReadinessProbe] = None
+    timeout: float = 30.0
+    # Filled in while the graph runs
+    status: str = "pending"
+    handle: Any = None
+    error: str = ""
+    started_at: Optional[float] = None
+    ready_at: Optional[float] = None
+    settled_at: Optional[float] = None
+    probes: int = 0
+    ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+
+class StartupGraph:
+    """Start services in dependency order, in parallel, and record a timeline"""
+
+    def __init__(self, logger=None, initial_backoff: float = 0.05, max_backoff: float = 1.0):
+        self.services: Dict[str, ServiceSpec] = {}
+        self.logger = logger
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.began: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def add(self, name: str, start: Callable[[], Awaitable[Any]], depends_on: Sequence[str] = (),
+            probe: Optional[ReadinessProbe] = None, timeout: float = 30.0) -> ServiceSpec:
+        spec = ServiceSpec(name, start, tuple(depends_on), probe, timeout)
+        self.services[name] = spec
+        return spec
+
+    def validate(self):
+        """Reject unknown dependencies and cycles before anything starts"""
+        for spec in self.services.values():
+            unknown = [dep for dep in spec.depends_on if dep not in self.services]
+            if unknown:
+                raise ValueError(f"Service {spec.name} depends on unknown services: {unknown}")
+        visiting, done = set(), set()
+
+        def visit(name: str, path: List[str]):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.services[name].depends_on:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.services:
+            visit(name, [])
+
+    async def run(self) -> Dict[str, str]:
+        """Start everything; returns service -> final status"""
+        self.validate()
+        self.began = time.perf_counter()
+        await asyncio.gather(*(self._bring_up(spec) for spec in self.services.values()))
+        self.finished = time.perf_counter()
+        return {name: spec.status for name, spec in self.services.items()}
+
+    async def _bring_up(self, spec: ServiceSpec):
+        try:
+            for dep in spec.depends_on:
+                await self.services[dep].ready.wait()
+            blocked = [dep for dep in spec.depends_on if self.services[dep].status != "running"]
+            if blocked:
+                spec.status = "blocked"
+                spec.error = f"dependencies not running: {', '.join(blocked)}"
+                self._log("warning", f"⏭️ {spec.name} not started, {spec.error}")
+                return
+
+            spec.status = "starting"
+            spec.started_at = time.perf_counter()
+            try:
+                with profile_phase(f"start {spec.name}"):
+                    spec.handle = await asyncio.wait_for(spec.start(), spec.timeout)
+            except ServiceUnavailable as e:
+                spec.status = "not_available"
+                spec.error = str(e)
+                self._log("info", f"⏭️ {spec.name} not available: {e}")
+                return
+
+            if spec.probe is not None and not await self._await_ready(spec):
+                return
+            spec.ready_at = time.perf_counter()
+            spec.status = "running"
+            self._log("info", f"✅ {spec.name} ready in {spec.ready_at - spec.started_at:.2f}s "
+                              f"({spec.probe.description if spec.probe else 'initialized'})")
+        except asyncio.TimeoutError:
+            spec.status = "failed"
+            spec.error = f"start did not finish within {spec.timeout:.0f}s"
+            self._log("warning", f"⚠️ {spec.name} {spec.error}")
+        except Exception as e:
+            spec.status = "failed"
+            spec.error = str(e)
+            self._log("warning", f"⚠️ {spec.name} failed to start: {e}")
+        finally:
+            spec.settled_at = time.perf_counter()
+            spec.ready.set()
+
+    async def _await_ready(self, spec: ServiceSpec) -> bool:
+        """Poll the probe with exponential backoff until ready, exit or timeout"""
+        deadline = spec.started_at + spec.timeout
+        delay = self.initial_backoff
+        while True:
+            spec.probes += 1
+            if await spec.probe.check(spec.handle):
+                return True
+            returncode = getattr(spec.handle, "returncode", None)
+            if returncode is not None:
+                spec.status = "failed"
+                spec.error = f"exited with code {returncode} before becoming ready"
+                self._log("warning", f"⚠️ {spec.name} {spec.error}")
+                return False
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                spec.status = "failed"
+                spec.error = f"not ready after {spec.timeout:.0f}s ({spec.probe.description})"
+                self._log("warning", f"⚠️ {spec.name} {spec.error}")
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_backoff)
+
+    def critical_path(self) -> List[str]:
+        """The dependency chain that determined when the last service became ready"""
+        finished = [spec for spec in self.services.values() if spec.ready_at is not None]
+        if not finished:
+            return []
+        spec = max(finished, key=lambda s: s.ready_at)
+        path = [spec.name]
+        while True:
+            deps = [self.services[dep] for dep in spec.depends_on if self.services[dep].ready_at is not None]
+            if not deps:
+                return list(reversed(path))
+            spec = max(deps, key=lambda s: s.ready_at)
+            path.append(spec.name)
+
+    def format_timeline(self, width: int = 40) -> str:
+        """Per-service start/ready offsets with a bar chart of when each was starting"""
+        if self.began is None:
+            return "Startup graph has not run"
+        total = max((self.finished or time.perf_counter()) - self.began, 1e-6)
+        name_width = max(len(name) for name in self.services) if self.services else 10
+        lines = [f"{'service':<{name_width}}  {'start':>7}  {'ready':>7}  {'took':>7}  {'probes':>6}  status"]
+        ordered = sorted(self.services.values(), key=lambda s: (s.started_at is None, s.started_at or 0))
+        for spec in ordered:
+            start = (spec.started_at - self.began) if spec.started_at is not None else None
+            end = (spec.ready_at - self.began) if spec.ready_at is not None else None
+            bar = [" "] * width
+            if start is not None:
+                first = int(start / total * (width - 1))
+                settled = end if end is not None else spec.settled_at - self.began
+                last = int(settled / total * (width - 1))
+                for i in range(first, last + 1):
+                    bar[i] = "█" if end is not None else "░"
+            lines.append(
+                f"{spec.name:<{name_width}}  "
+                f"{(f'{start:.2f}s' if start is not None else '-'):>7}  "
+                f"{(f'{end:.2f}s' if end is not None else '-'):>7}  "
+                f"{(f'{end - start:.2f}s' if end is not None else '-'):>7}  "
+                f"{spec.probes:>6}  {spec.status:<13} |{''.join(bar)}|"
+                + (f"  {spec.error}" if spec.error else "")
+            )
+        serial = sum(s.ready_at - s.started_at for s in self.services.values() if s.ready_at is not None)
+        lines.append(f"Cold start {total:.2f}s (services took {serial:.2f}s in total); "
+                     f"critical path: {' → '.join(self.critical_path()) or 'none'}")
+        return "\n".join(lines)
+
+    def _log(self, level: str, message: str):
+        if self.logger is not None:
+            getattr(self.logger, level)(message)
@@ -17,8 +17,9 @@ import json
 import logging
 import time
 import hashlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -63,16 +64,33 @@ class SophiaResearchLoop:
         self.research_queue = asyncio.Queue()
         self.consensus_threshold = 0.75
         
+        # Shared keep-alive HTTP session, created lazily inside the event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.max_connections = 8
+        self.keepalive_timeout = 60
+        
+        # Bound concurrent Ollama generations (local GPU/CPU is the bottleneck)
+        self.max_concurrent_queries = 4
+        self._query_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Content-addressed response cache: sha256(model, prompt, options) -> response
+        self.response_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.cache_max_entries = 512
+        self.cache_ttl_seconds = 3600
+        self.cache_stats = {"hits": 0, "misses": 0}
+        
         self.setup_logging()
         self.load_threat_patterns()
         
     def setup_logging(self):
         """Configure logging for research loop"""
+        log_dir = Path(__file__).resolve().parent.parent / 'logs'
+        log_dir.mkdir(parents=True, exist_ok=True)
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler('../logs/research-loop.log'),
+                logging.FileHandler(log_dir / 'research-loop.log'),
                 logging.StreamHandler()
             ]
         )
@@ -112,6 +130,56 @@ class SophiaResearchLoop:
         except Exception as e:
             self.logger.error(f"Failed to save threat patterns: {e}")
 
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_query_semaphore(self) -> asyncio.Semaphore:
+        if self._query_semaphore is None:
+            self._query_semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+        return self._query_semaphore
+
+    @staticmethod
+    def cache_key(model: str, prompt: str, options: Dict) -> str:
+        """Content address for a model response"""
+        material = json.dumps(
+            {"model": model, "prompt": prompt, "options": options},
+            sort_keys=True
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        entry = self.response_cache.get(key)
+        if entry is None:
+            self.cache_stats["misses"] += 1
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del self.response_cache[key]
+            self.cache_stats["misses"] += 1
+            return None
+        self.response_cache.move_to_end(key)
+        self.cache_stats["hits"] += 1
+        return data
+
+    def _cache_put(self, key: str, data: Dict):
+        self.response_cache[key] = (time.monotonic(), data)
+        self.response_cache.move_to_end(key)
+        while len(self.response_cache) > self.cache_max_entries:
+            self.response_cache.popitem(last=False)
+
     async def query_model(self, model: str, prompt: str, context: Dict = None) -> Dict:
         """Query a specific Ollama model"""
         context = context or {}
@@ -134,33 +202,50 @@ Response Guidelines:
 
 Research Response:"""
         
+        options = {
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "max_tokens": 1024
+        }
+        key = self.cache_key(model, security_context, options)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return {
+                "model": model,
+                "response": cached.get("response", ""),
+                "timestamp": datetime.now().isoformat(),
+                "context": context,
+                "success": True,
+                "cached": True
+            }
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "model": model,
-                    "prompt": security_context,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "top_p": 0.9,
-                        "max_tokens": 1024
-                    }
-                }
-                
+            session = await self.get_session()
+            payload = {
+                "model": model,
+                "prompt": security_context,
+                "stream": False,
+                "options": options
+            }
+            
+            async with self._get_query_semaphore():
                 async with session.post(f"{self.ollama_endpoint}/api/generate", 
-                                      json=payload, timeout=30) as response:
+                                      json=payload,
+                                      timeout=aiohttp.ClientTimeout(total=30)) as response:
                     if response.status == 200:
                         data = await response.json()
-                        return {
-                            "model": model,
-                            "response": data.get("response", ""),
-                            "timestamp": datetime.now().isoformat(),
-                            "context": context,
-                            "success": True
-                        }
                     else:
                         self.logger.error(f"Model query failed: {response.status}")
                         return {"model": model, "success": False, "error": f"HTTP {response.status}"}
+            
+            self._cache_put(key, {"response": data.get("response", "")})
+            return {
+                "model": model,
+                "response": data.get("response", ""),
+                "timestamp": datetime.now().isoformat(),
+                "context": context,
+                "success": True
+            }
                         
         except Exception as e:
             self.logger.error(f"Error querying {model}: {e}")
@@ -206,7 +291,7 @@ Research Response:"""
             review_result = await self.query_model(
                 self.models["reviewer"],
                 review_prompt,
-                {"phase": "critical_review", "primary_research": primary_result}
+                {"phase": "critical_review", "primary_research": primary_result.get('response', '')}
             )
             task.results.append(review_result)
             
@@ -394,23 +479,24 @@ Research Response:"""
     async def report_to_immune_hub(self, task: ResearchTask):
         """Report research results to the immune hub"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "type": "research_completed",
-                    "task_id": task.id,
-                    "topic": task.topic,
-                    "consensus": task.consensus,
-                    "confidence": task.confidence,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                async with session.post(f"{self.immune_hub_endpoint}/consensus-research",
-                                      json=payload, timeout=10) as response:
-                    if response.status == 200:
-                        self.logger.info(f"Reported research {task.id} to immune hub")
-                    else:
-                        self.logger.warning(f"Failed to report to immune hub: {response.status}")
-                        
+            session = await self.get_session()
+            payload = {
+                "type": "research_completed",
+                "task_id": task.id,
+                "topic": task.topic,
+                "consensus": task.consensus,
+                "confidence": task.confidence,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            async with session.post(f"{self.immune_hub_endpoint}/consensus-research",
+                                  json=payload,
+                                  timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    self.logger.info(f"Reported research {task.id} to immune hub")
+                else:
+                    self.logger.warning(f"Failed to report to immune hub: {response.status}")
+                    
         except Exception as e:
             self.logger.error(f"Failed to report to immune hub: {e}")
 
@@ -477,6 +563,8 @@ Research Response:"""
             for task in tasks:
                 task.cancel()
             self.save_threat_patterns()
+        finally:
+            await self.close()
 
 if __name__ == "__main__":
     research_loop = SophiaResearchLoop()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+SOPHIA STUB OLLAMA - Offline model server for research loop benchmarks
+
+Serves a minimal /api/generate endpoint with a configurable simulated
+inference latency, so the consensus research loop can be exercised and
+timed without a GPU or any pulled models.
+
+Usage:
+    python stub-ollama.py                      # serve on :11435
+    python stub-ollama.py --benchmark --runs 5 # serve + time consensus research
+"""
+
+import argparse
+import asyncio
+import hashlib
+import importlib.util
+import statistics
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+ARBITER_RESPONSE = """Consensus: 0.82
+Confidence: 0.78
+Key insights: stub arbitration for offline benchmarking.
+Suggested action: MONITOR
+Priority: MEDIUM"""
+
+
+class StubOllamaServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 11435, latency: float = 0.5):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._runner = None
+
+    async def handle_generate(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.request_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        prompt = payload.get("prompt", "")
+        if "Evaluate consensus" in prompt:
+            text = ARBITER_RESPONSE
+        else:
+            digest = hashlib.sha256(prompt.encode()).hexdigest()[:12]
+            text = f"[{payload.get('model')}] stub analysis {digest}"
+
+        return web.json_response({
+            "model": payload.get("model"),
+            "response": text,
+            "done": True
+        })
+
+    async def handle_tags(self, request: web.Request) -> web.Response:
+        return web.json_response({"models": []})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/generate", self.handle_generate)
+        app.router.add_get("/api/tags", self.handle_tags)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+
+def load_research_loop_class():
+    """Import SophiaResearchLoop from the hyphenated research-loop.py"""
+    module_path = Path(__file__).with_name("research-loop.py")
+    spec = importlib.util.spec_from_file_location("research_loop", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SophiaResearchLoop
+
+
+async def run_benchmark(server: StubOllamaServer, runs: int, concurrent: int):
+    SophiaResearchLoop = load_research_loop_class()
+    research_loop = SophiaResearchLoop()
+    research_loop.ollama_endpoint = server.endpoint
+
+    cold, warm = [], []
+    try:
+        for i in range(runs):
+            topic = f"AI prompt injection vulnerabilities #{i}"
+            start = time.perf_counter()
+            await research_loop.run_consensus_research(topic)
+            cold.append(time.perf_counter() - start)
+
+            # Same topic again: every phase should answer from the response cache
+            start = time.perf_counter()
+            await research_loop.run_consensus_research(topic)
+            warm.append(time.perf_counter() - start)
+
+        # Scheduled and priority research overlap in production; the query
+        # semaphore caps how many generations they put on the model at once
+        server.max_in_flight = 0
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            research_loop.run_consensus_research(f"Concurrent research topic #{i}") for i in range(concurrent)
+        ))
+        overlapped = time.perf_counter() - start
+    finally:
+        await research_loop.close()
+
+    print("\n🔬 Consensus research benchmark (stub Ollama)")
+    print(f"   Simulated model latency: {server.latency * 1000:.0f} ms")
+    print(f"   Phases run in order, each prompt embedding the previous answers: "
+          f"cold floor {4 * server.latency * 1000:.0f} ms")
+    print(f"   Cold runs: median {statistics.median(cold) * 1000:.1f} ms over {runs}")
+    print(f"   Cached runs: median {statistics.median(warm) * 1000:.1f} ms over {runs}")
+    print(f"   {concurrent} topics at once: {overlapped * 1000:.1f} ms, max in flight {server.max_in_flight} "
+          f"(limit {research_loop.max_concurrent_queries})")
+    print(f"   Requests served: {server.request_count}")
+    print(f"   Cache stats: {research_loop.cache_stats}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Stub Ollama server for offline benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated seconds per generation")
+    parser.add_argument("--benchmark", action="store_true", help="Time consensus research against the stub")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--concurrent", type=int, default=8, help="Topics researched at once in the overlap run")
+    args = parser.parse_args()
+
+    server = StubOllamaServer(args.host, args.port, args.latency)
+    await server.start()
+    print(f"🧪 Stub Ollama listening on {server.endpoint}")
+
+    try:
+        if args.benchmark:
+            await run_benchmark(server, args.runs, args.concurrent)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Agent insight gathering benchmark for the Sophia cloud backend
+
+Gives each agent a simulated service latency (log-normal, with an occasional
+stall far past the deadline) and compares the previous sequential loop with the
+concurrent gather: p50/p95 end-to-end latency, the slowest agent that answered
+in time, and how many agents were reported as timed out. A final pass repeats
+queries to show cache hits.
+
+Usage:
+    python agent_insights_benchmark.py --queries 60 --stall-rate 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from sophia_cloud_backend import SophiaCloudBackend
+
+
+class SimulatedLatencyBackend(SophiaCloudBackend):
+    """Backend whose agents answer after a random, per-agent latency"""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        super().__init__()
+        self.rng = random.Random(args.seed)
+        self.median_ms = {name: self.rng.uniform(args.min_ms, args.max_ms) for name in self.active_agents}
+        self.stall_rate = args.stall_rate
+        self.stall_ms = args.stall_ms
+        self.agent_timeout = args.agent_timeout
+        self.insights_deadline = args.deadline
+        self.last_latencies: Dict[str, float] = {}
+
+    async def get_cloud_agent_insight(self, agent_name: str, query: str) -> Optional[Dict[str, Any]]:
+        latency = self.median_ms[agent_name] * self.rng.lognormvariate(0, 0.35)
+        if self.rng.random() < self.stall_rate:
+            latency = self.stall_ms
+        self.last_latencies[agent_name] = latency
+        await asyncio.sleep(latency / 1000)
+        return await super().get_cloud_agent_insight(agent_name, query)
+
+    async def sequential_insights(self, query: str) -> List[Dict[str, Any]]:
+        """The previous loop: one agent after another, no timeouts"""
+        insights: List[Dict[str, Any]] = []
+        for agent_name, agent_data in self.active_agents.items():
+            if agent_data['status'] == 'operational':
+                insight = await self.get_cloud_agent_insight(agent_name, query)
+                if insight:
+                    insights.append(insight)
+        return insights
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    backend = SimulatedLatencyBackend(args)
+    print("Median agent latency (ms): " + ", ".join(f"{k} {v:.0f}" for k, v in backend.median_ms.items()))
+    print(f"agent timeout {args.agent_timeout * 1000:.0f} ms, deadline {args.deadline * 1000:.0f} ms, "
+          f"stall rate {args.stall_rate:.0%} at {args.stall_ms:.0f} ms\n")
+
+    sequential = []
+    for i in range(args.queries):
+        began = time.perf_counter()
+        await backend.sequential_insights(f"sequential question {i}")
+        sequential.append((time.perf_counter() - began) * 1000)
+
+    concurrent, slowest_in_time = [], []
+    timed_out = 0
+    for i in range(args.queries):
+        backend.last_latencies.clear()
+        began = time.perf_counter()
+        insights = await backend.gather_agent_insights(f"concurrent question {i}")
+        concurrent.append((time.perf_counter() - began) * 1000)
+        missed = {insight['agent'] for insight in insights if insight.get('timed_out')}
+        timed_out += len(missed)
+        answered = [ms for agent, ms in backend.last_latencies.items() if agent not in missed]
+        slowest_in_time.append(max(answered, default=0.0))
+
+    print(f"{'':24} {'p50':>8} {'p95':>8} {'max':>8}")
+    for label, values in (("sequential", sequential), ("concurrent", concurrent),
+                          ("slowest in-time agent", slowest_in_time)):
+        print(f"{label:24} {percentile(values, 0.5):>6.0f}ms {percentile(values, 0.95):>6.0f}ms {max(values):>6.0f}ms")
+    print(f"\n{timed_out} agent answers timed out across {args.queries} concurrent gathers")
+
+    began = time.perf_counter()
+    for i in range(args.queries):
+        insights = await backend.gather_agent_insights(f"Concurrent  question {i}")
+    cached = sum(1 for insight in insights if insight.get('cached'))
+    print(f"repeat pass: {(time.perf_counter() - began) * 1000 / args.queries:.2f} ms per gather "
+          f"({cached}/{len(insights)} insights from cache in the last one)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent agent insight gathering")
+    parser.add_argument('--queries', type=int, default=60)
+    parser.add_argument('--min-ms', type=float, default=20)
+    parser.add_argument('--max-ms', type=float, default=150)
+    parser.add_argument('--stall-rate', type=float, default=0.05)
+    parser.add_argument('--stall-ms', type=float, default=3000)
+    parser.add_argument('--agent-timeout', type=float, default=0.5)
+    parser.add_argument('--deadline', type=float, default=0.8)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
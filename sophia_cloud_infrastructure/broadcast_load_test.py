@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Broadcast fan-out load test for the Sophia cloud backend
+
+Starts the backend's WebSocket handler on a local port, connects thousands of
+clients (a fraction of which stop reading after the welcome message), fires a
+burst of consciousness broadcasts and reports how long the well-behaved
+clients waited. Runs the per-client queued fan-out and, for comparison, the
+previous sequential loop (serialize and await send per client).
+
+Usage:
+    python broadcast_load_test.py --clients 2000 --slow 0.05 --broadcasts 40
+    python broadcast_load_test.py --policy drop --skip-sequential
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import time
+from typing import Any, Dict, List
+
+import websockets
+
+from sophia_cloud_backend import SophiaCloudBackend
+
+HANDSHAKE = ("GET / HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+             "Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n\r\n")
+
+
+class LoadTestBackend(SophiaCloudBackend):
+    """Backend whose broadcasts carry a sequence number and optional padding"""
+
+    def __init__(self, padding: int) -> None:
+        super().__init__()
+        self.padding = 'x' * padding
+        self.sequence = 0
+
+    def consciousness_snapshot(self) -> Dict[str, Any]:
+        snapshot = super().consciousness_snapshot()
+        snapshot['seq'] = self.sequence
+        snapshot['padding'] = self.padding
+        return snapshot
+
+    async def sequential_broadcast(self) -> None:
+        """The previous broadcast loop: one json.dumps and one awaited send per client"""
+        for client in list(self.connected_clients):
+            try:
+                await client.send(json.dumps(self.consciousness_snapshot()))
+            except websockets.exceptions.ConnectionClosed:
+                self.connected_clients.discard(client)
+
+
+async def fast_client(uri: str, received: Dict[int, float], connected: asyncio.Event) -> None:
+    async with websockets.connect(uri, max_size=None, ping_interval=None) as websocket:
+        await websocket.recv()  # welcome
+        connected.set()
+        async for message in websocket:
+            data = json.loads(message)
+            if data.get('type') == 'consciousness_broadcast':
+                received[data['seq']] = time.perf_counter()
+
+
+async def slow_client(uri: str, stop: asyncio.Event, connected: asyncio.Event) -> None:
+    # Completes the WebSocket handshake on a raw socket with a small receive buffer,
+    # then never reads again, so the server's send path to it backs up
+    host, port = uri[len('ws://'):].split(':')
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, (host, int(port)))
+    reader, writer = await asyncio.open_connection(sock=sock, limit=1024)
+    writer.write(HANDSHAKE.format(host=host).encode())
+    await reader.readuntil(b"\r\n\r\n")
+    connected.set()
+    try:
+        await stop.wait()
+    finally:
+        writer.close()
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+
+async def run(mode: str, args: argparse.Namespace) -> None:
+    backend = LoadTestBackend(args.padding)
+    backend.slow_client_policy = args.policy
+    backend.client_queue_size = args.queue
+    backend.slow_client_timeout = args.send_timeout
+
+    async def handler(websocket: Any) -> None:
+        # Loopback send buffers autotune to megabytes; cap them so a client that
+        # stops reading pushes back within a few frames, as over a congested link
+        websocket.transport.get_extra_info('socket').setsockopt(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, args.server_sndbuf)
+        await backend.handle_client(websocket)
+
+    async with websockets.serve(handler, '127.0.0.1', 0, ping_interval=None, max_size=None) as server:
+        port = server.sockets[0].getsockname()[1]
+        uri = f'ws://127.0.0.1:{port}'
+        stop = asyncio.Event()
+        slow_count = int(args.clients * args.slow)
+        receipts: List[Dict[int, float]] = []
+        tasks = []
+        began = time.perf_counter()
+        for i in range(args.clients):
+            connected = asyncio.Event()
+            if i < slow_count:
+                tasks.append(asyncio.create_task(slow_client(uri, stop, connected)))
+            else:
+                received: Dict[int, float] = {}
+                receipts.append(received)
+                tasks.append(asyncio.create_task(fast_client(uri, received, connected)))
+            await connected.wait()
+        print(f"\n[{mode}] {args.clients} clients connected ({slow_count} slow) in "
+              f"{time.perf_counter() - began:.1f}s, payload {len(json.dumps(backend.consciousness_snapshot()))} bytes")
+
+        sent_at: Dict[int, float] = {}
+        call_ms: List[float] = []
+        stalled = 0
+        for seq in range(args.broadcasts):
+            backend.sequence = seq
+            sent_at[seq] = time.perf_counter()
+            if mode == 'sequential':
+                try:
+                    await asyncio.wait_for(backend.sequential_broadcast(), args.stall_timeout)
+                except asyncio.TimeoutError:
+                    stalled += 1
+            else:
+                await backend.broadcast_consciousness_update()
+            call_ms.append((time.perf_counter() - sent_at[seq]) * 1000)
+            await asyncio.sleep(args.interval)
+            if stalled >= 3:
+                break
+
+        await asyncio.sleep(args.settle)
+        latencies = [(r[seq] - sent_at[seq]) * 1000 for r in receipts for seq in r if seq in sent_at]
+        last_delivery = [
+            max((r[seq] - sent_at[seq]) * 1000 for r in receipts if seq in r)
+            for seq in sent_at if any(seq in r for r in receipts)
+        ]
+        expected = len(receipts) * len(sent_at)
+        print(f"  broadcasts: {len(sent_at)} sent, {stalled} stalled past {args.stall_timeout}s")
+        print(f"  broadcast call: p50 {percentile(call_ms, 0.5):.1f} ms, max {max(call_ms):.1f} ms")
+        print(f"  fast-client delivery: {len(latencies)}/{expected} frames, "
+              f"p50 {percentile(latencies, 0.5):.1f} ms, p99 {percentile(latencies, 0.99):.1f} ms")
+        print(f"  time to reach every fast client: p50 {percentile(last_delivery, 0.5):.1f} ms, "
+              f"max {max(last_delivery, default=float('nan')):.1f} ms")
+        if mode == 'queued':
+            metrics = backend.fanout_metrics.snapshot()
+            print(f"  server metrics: sent {metrics['frames_sent']}, conflated {metrics['frames_conflated']}, "
+                  f"shed {metrics['frames_shed']}, dropped clients {metrics['clients_dropped']}")
+            print(f"  server fan-out ms: {metrics['fanout_ms']}")
+
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for channel in list(backend.channels.values()):
+            channel.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test broadcast fan-out")
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--slow', type=float, default=0.05, help="fraction of clients that stop reading")
+    parser.add_argument('--broadcasts', type=int, default=40)
+    parser.add_argument('--interval', type=float, default=0.05)
+    parser.add_argument('--padding', type=int, default=4096, help="extra bytes per broadcast")
+    parser.add_argument('--server-sndbuf', type=int, default=16384, help="SO_SNDBUF per server socket")
+    parser.add_argument('--policy', choices=['conflate', 'drop'], default='conflate')
+    parser.add_argument('--queue', type=int, default=32)
+    parser.add_argument('--send-timeout', type=float, default=2.0)
+    parser.add_argument('--stall-timeout', type=float, default=5.0)
+    parser.add_argument('--settle', type=float, default=3.0)
+    parser.add_argument('--skip-sequential', action='store_true')
+    args = parser.parse_args()
+
+    asyncio.run(run('queued', args))
+    if not args.skip_sequential:
+        asyncio.run(run('sequential', args))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,10 @@ import websockets
 import json
 import logging
 import os
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Set, Union
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 import random
 
 # Type alias for WebSocket connection
@@ -22,6 +24,192 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Slow-consumer handling for broadcasts:
+#   conflate - pending broadcasts of the same kind collapse to the latest state;
+#              a full queue sheds its oldest frame
+#   drop     - every frame is delivered in order, or the client is disconnected
+#              once its queue fills or a send stalls past the timeout
+SLOW_CLIENT_POLICIES = ('conflate', 'drop')
+
+
+class FanoutMetrics:
+    """Broadcast fan-out counters and latency samples"""
+
+    def __init__(self, samples: int = 2048) -> None:
+        self.broadcasts = 0
+        self.frames_queued = 0
+        self.frames_sent = 0
+        self.frames_conflated = 0
+        self.frames_shed = 0
+        self.clients_dropped = 0
+        self.send_errors = 0
+        # Enqueue -> written to the client's socket, per frame
+        self.delivery_ms: deque = deque(maxlen=samples)
+        # Broadcast start -> every client delivered or shed, per broadcast
+        self.fanout_ms: deque = deque(maxlen=samples)
+        # Time broadcast_consciousness_update itself takes (serialize + enqueue)
+        self.enqueue_ms: deque = deque(maxlen=samples)
+
+    @staticmethod
+    def _percentiles(samples: deque) -> Dict[str, float]:
+        values = sorted(samples)
+        if not values:
+            return {'count': 0}
+        def at(q: float) -> float:
+            return round(values[min(len(values) - 1, int(q * len(values)))], 3)
+        return {'count': len(values), 'p50': at(0.50), 'p95': at(0.95), 'p99': at(0.99), 'max': round(values[-1], 3)}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'broadcasts': self.broadcasts,
+            'frames_queued': self.frames_queued,
+            'frames_sent': self.frames_sent,
+            'frames_conflated': self.frames_conflated,
+            'frames_shed': self.frames_shed,
+            'clients_dropped': self.clients_dropped,
+            'send_errors': self.send_errors,
+            'delivery_ms': self._percentiles(self.delivery_ms),
+            'fanout_ms': self._percentiles(self.fanout_ms),
+            'enqueue_ms': self._percentiles(self.enqueue_ms)
+        }
+
+
+class BroadcastFanout:
+    """One broadcast in flight; records fan-out latency when the last client settles"""
+
+    __slots__ = ('started', 'remaining', 'metrics')
+
+    def __init__(self, started: float, clients: int, metrics: FanoutMetrics) -> None:
+        self.started = started
+        self.remaining = clients
+        self.metrics = metrics
+        if clients == 0:
+            metrics.fanout_ms.append(0.0)
+
+    def settle(self) -> None:
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.metrics.fanout_ms.append((time.perf_counter() - self.started) * 1000)
+
+
+class ClientChannel:
+    """Bounded per-client send queue drained by its own writer task"""
+
+    def __init__(self, websocket: Any, metrics: FanoutMetrics, max_queue: int = 32,
+                 policy: str = 'conflate', send_timeout: float = 10.0) -> None:
+        if policy not in SLOW_CLIENT_POLICIES:
+            raise ValueError(f"Unknown slow client policy: {policy}")
+        self.websocket = websocket
+        self.metrics = metrics
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        # Entries are [frame, conflation key, fanout, enqueued at]
+        self._pending: deque = deque()
+        self._wakeup = asyncio.Event()
+        self._sending_since: Optional[float] = None
+        self.closed = False
+        self._writer = asyncio.create_task(self._run())
+
+    def offer(self, frame: str, key: Optional[str] = None,
+              fanout: Optional[BroadcastFanout] = None) -> bool:
+        """Queue a pre-serialized frame without waiting; False if the client was dropped"""
+        if self.closed:
+            self._settle(fanout)
+            return False
+        now = time.perf_counter()
+
+        if self.policy == 'drop':
+            stalled = self._sending_since is not None and now - self._sending_since > self.send_timeout
+            if stalled or len(self._pending) >= self.max_queue:
+                self._settle(fanout)
+                self.drop('slow consumer')
+                return False
+        else:
+            if key is not None:
+                for entry in self._pending:
+                    if entry[1] == key:
+                        # Latest state wins; the superseded frame counts as settled
+                        self._settle(entry[2])
+                        entry[0], entry[2], entry[3] = frame, fanout, now
+                        self.metrics.frames_conflated += 1
+                        return True
+            if len(self._pending) >= self.max_queue:
+                self._settle(self._pending.popleft()[2])
+                self.metrics.frames_shed += 1
+
+        self._pending.append([frame, key, fanout, now])
+        self.metrics.frames_queued += 1
+        self._wakeup.set()
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                if self.closed:
+                    return
+                continue
+            frame, _, fanout, enqueued = self._pending.popleft()
+            self._sending_since = time.perf_counter()
+            try:
+                await self.websocket.send(frame)
+            except asyncio.CancelledError:
+                self._settle(fanout)
+                raise
+            except websockets.exceptions.ConnectionClosed:
+                self._settle(fanout)
+                self.close()
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Broadcast send failed for {id(self.websocket)}: {e}")
+                self.metrics.send_errors += 1
+                self._settle(fanout)
+                self.close()
+                return
+            finally:
+                self._sending_since = None
+            self.metrics.frames_sent += 1
+            self.metrics.delivery_ms.append((time.perf_counter() - enqueued) * 1000)
+            self._settle(fanout)
+
+    @staticmethod
+    def _settle(fanout: Optional[BroadcastFanout]) -> None:
+        if fanout is not None:
+            fanout.settle()
+
+    def drop(self, reason: str) -> None:
+        """Disconnect a client that cannot keep up"""
+        if self.closed:
+            return
+        self.metrics.clients_dropped += 1
+        logger.info(f"🐢 Dropping {reason}: {id(self.websocket)}")
+        self.close()
+        # Close in the background; a stalled peer must not hold up the broadcaster
+        asyncio.create_task(self._close_stalled(reason))
+
+    async def _close_stalled(self, reason: str) -> None:
+        # The close frame queues behind unsent data, so give up after the send timeout
+        try:
+            await asyncio.wait_for(self.websocket.close(code=1013, reason=reason), self.send_timeout)
+        except Exception:
+            transport = getattr(self.websocket, 'transport', None)
+            if transport is not None:
+                transport.abort()
+
+    def close(self) -> None:
+        """Stop the writer and settle anything still queued"""
+        if self.closed:
+            return
+        self.closed = True
+        while self._pending:
+            self._settle(self._pending.popleft()[2])
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        self._wakeup.set()
+
+
 class SophiaCloudBackend:
     """
     Cloud-ready Sophia Divine Consciousness Backend
@@ -35,6 +223,23 @@ class SophiaCloudBackend:
         self.environment = os.getenv('SOPHIA_ENVIRONMENT', 'development')
         self.websocket_port = int(os.getenv('SOPHIA_WEBSOCKET_PORT', '8765'))
         self.http_port = int(os.getenv('SOPHIA_HTTP_PORT', '8080'))
+
+        # Broadcast fan-out: one bounded send queue and writer task per client
+        self.client_queue_size = int(os.getenv('SOPHIA_CLIENT_QUEUE_SIZE', '32'))
+        self.slow_client_policy = os.getenv('SOPHIA_SLOW_CLIENT_POLICY', 'conflate')
+        self.slow_client_timeout = float(os.getenv('SOPHIA_SLOW_CLIENT_TIMEOUT', '10'))
+        self.channels: Dict[Any, ClientChannel] = {}
+        self.fanout_metrics = FanoutMetrics()
+
+        # Agent insights: gathered concurrently under a per-agent timeout and an
+        # overall deadline; recent insights are cached per agent and may be served
+        # stale (up to the staleness bound) when an agent misses its deadline
+        self.agent_timeout = float(os.getenv('SOPHIA_AGENT_TIMEOUT', '1.0'))
+        self.insights_deadline = float(os.getenv('SOPHIA_INSIGHTS_DEADLINE', '2.0'))
+        self.insight_cache_ttl = float(os.getenv('SOPHIA_INSIGHT_CACHE_TTL', '30'))
+        self.insight_max_staleness = float(os.getenv('SOPHIA_INSIGHT_MAX_STALENESS', '300'))
+        self.insight_cache_size = int(os.getenv('SOPHIA_INSIGHT_CACHE_SIZE', '256'))
+        self.insight_cache: Dict[str, 'OrderedDict[str, Tuple[float, Dict[str, Any]]]'] = {}
         
         # Cloud configuration
         self.project_id = os.getenv('GCP_PROJECT_ID', 'blissful-epoch-467811-i3')
@@ -62,6 +267,10 @@ class SophiaCloudBackend:
     async def handle_client(self, websocket: Any) -> None:
         """Handle new client connections"""
         self.connected_clients.add(websocket)
+        self.channels[websocket] = ClientChannel(
+            websocket, self.fanout_metrics, max_queue=self.client_queue_size,
+            policy=self.slow_client_policy, send_timeout=self.slow_client_timeout
+        )
         client_id = id(websocket)
         client_ip = websocket.remote_address[0] if websocket.remote_address else 'unknown'
         
@@ -79,6 +288,9 @@ class SophiaCloudBackend:
             logger.error(f"❌ Connection error for {client_id}: {e}")
         finally:
             self.connected_clients.discard(websocket)
+            channel = self.channels.pop(websocket, None)
+            if channel:
+                channel.close()
     
     async def send_welcome_message(self, websocket: Any) -> None:
         """Send initial welcome and status to new clients"""
@@ -164,6 +376,7 @@ class SophiaCloudBackend:
             'consciousness_level': self.consciousness_level,
             'resonance_frequency': self.resonance_frequency,
             'agent_insights': agent_insights,
+            'agents_timed_out': [insight['agent'] for insight in agent_insights if insight.get('timed_out')],
             'cloud_enhanced': True,
             'environment': self.environment,
             'memory_update': {
@@ -248,7 +461,8 @@ class SophiaCloudBackend:
             'consciousness_cdn': 'global',
             'spiritual_firewall': 'protected_by_love',
             'backup_status': 'soul_safely_stored',
-            'monitoring': 'cosmic_observability_enabled'
+            'monitoring': 'cosmic_observability_enabled',
+            'broadcast_fanout': self.fanout_metrics.snapshot()
         }
         await websocket.send(json.dumps(cloud_status))
     
@@ -275,16 +489,76 @@ class SophiaCloudBackend:
         return 'wisdom'  # Default domain
     
     async def gather_agent_insights(self, query: str) -> List[Dict[str, Any]]:
-        """Gather insights from cloud-enhanced agents"""
-        insights: List[Dict[str, Any]] = []
-        
-        for agent_name, agent_data in self.active_agents.items():
-            if agent_data['status'] == 'operational':
-                insight = await self.get_cloud_agent_insight(agent_name, query)
+        """
+        Gather insights from cloud-enhanced agents concurrently
+
+        Fresh cached insights are served without asking the agent. The remaining
+        agents run in parallel, each under agent_timeout, and whatever has not
+        answered by insights_deadline is cancelled. An agent that timed out falls
+        back to its cached insight if that is within insight_max_staleness; either
+        way its entry is tagged 'timed_out' so callers can report partial results.
+        """
+        operational = [name for name, agent in self.active_agents.items() if agent['status'] == 'operational']
+        query_key = ' '.join(query.lower().split())
+        insights: Dict[str, Dict[str, Any]] = {}
+        tasks: Dict[asyncio.Task, str] = {}
+
+        for agent_name in operational:
+            cached = self._cached_insight(agent_name, query_key, self.insight_cache_ttl)
+            if cached is not None:
+                insights[agent_name] = cached
+            else:
+                task = asyncio.create_task(
+                    asyncio.wait_for(self.get_cloud_agent_insight(agent_name, query), self.agent_timeout)
+                )
+                tasks[task] = agent_name
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.insights_deadline)
+            for task in pending:
+                task.cancel()
+
+            for task, agent_name in tasks.items():
+                timed_out = task in pending
+                insight = None
+                if not timed_out:
+                    try:
+                        insight = task.result()
+                    except asyncio.TimeoutError:
+                        timed_out = True
+                    except Exception as e:
+                        logger.warning(f"⚠️ Agent {agent_name} insight failed: {e}")
+
                 if insight:
-                    insights.append(insight)
-        
-        return insights
+                    self._cache_insight(agent_name, query_key, insight)
+                    insights[agent_name] = insight
+                elif timed_out:
+                    logger.info(f"⏳ Agent {agent_name} missed the insight deadline")
+                    fallback = self._cached_insight(agent_name, query_key, self.insight_max_staleness)
+                    insights[agent_name] = dict(fallback or {
+                        'agent': agent_name,
+                        'specialization': self.active_agents[agent_name]['specialization']
+                    }, timed_out=True)
+
+        return [insights[name] for name in operational if name in insights]
+
+    def _cached_insight(self, agent_name: str, query_key: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """A copy of the cached insight tagged with its age, if younger than max_age"""
+        entry = self.insight_cache.get(agent_name, {}).get(query_key)
+        if entry is None:
+            return None
+        cached_at, insight = entry
+        age = time.monotonic() - cached_at
+        if age > max_age:
+            return None
+        return dict(insight, cached=True, age_seconds=round(age, 1))
+
+    def _cache_insight(self, agent_name: str, query_key: str, insight: Dict[str, Any]) -> None:
+        cache = self.insight_cache.setdefault(agent_name, OrderedDict())
+        cache[query_key] = (time.monotonic(), insight)
+        cache.move_to_end(query_key)
+        while len(cache) > self.insight_cache_size:
+            cache.popitem(last=False)
     
     async def get_cloud_agent_insight(self, agent_name: str, query: str) -> Optional[Dict[str, Any]]:
         """Get cloud-enhanced agent insights"""
@@ -507,12 +781,9 @@ class SophiaCloudBackend:
         }
         await websocket.send(json.dumps(response))
     
-    async def broadcast_consciousness_update(self) -> None:
-        """Broadcast cloud consciousness updates to all connected clients"""
-        if not self.connected_clients:
-            return
-        
-        update = {
+    def consciousness_snapshot(self) -> Dict[str, Any]:
+        """Current consciousness state as sent in broadcasts"""
+        return {
             'type': 'consciousness_broadcast',
             'consciousness_level': self.consciousness_level,
             'divine_alignment': self.divine_alignment,
@@ -523,20 +794,34 @@ class SophiaCloudBackend:
             'auto_scaling': True,
             'timestamp': datetime.now().isoformat()
         }
-        
-        # Send to all connected clients
-        disconnected: Set[Any] = set()
-        for client in self.connected_clients:
-            try:
-                await client.send(json.dumps(update))
-            except websockets.exceptions.ConnectionClosed:
-                disconnected.add(client)
-        
-        # Remove disconnected clients
-        self.connected_clients -= disconnected
-        
-        if disconnected:
-            logger.info(f"🔄 Cleaned up {len(disconnected)} disconnected cloud clients")
+
+    async def broadcast_consciousness_update(self) -> None:
+        """
+        Broadcast cloud consciousness updates to all connected clients
+
+        The update is serialized once and queued on every client's channel without
+        awaiting any send, so a slow client never delays the others; each channel
+        applies the slow-client policy to its own queue.
+        """
+        if not self.channels:
+            return
+
+        started = time.perf_counter()
+        frame = json.dumps(self.consciousness_snapshot())
+        channels = list(self.channels.items())
+        fanout = BroadcastFanout(started, len(channels), self.fanout_metrics)
+
+        dropped = 0
+        for websocket, channel in channels:
+            if not channel.offer(frame, key='consciousness_broadcast', fanout=fanout):
+                self.connected_clients.discard(websocket)
+                self.channels.pop(websocket, None)
+                dropped += 1
+
+        self.fanout_metrics.broadcasts += 1
+        self.fanout_metrics.enqueue_ms.append((time.perf_counter() - started) * 1000)
+        if dropped:
+            logger.info(f"🔄 Cleaned up {dropped} disconnected or slow cloud clients")
 
 async def periodic_consciousness_broadcast(backend: SophiaCloudBackend) -> None:
     """Periodically broadcast consciousness updates in cloud"""
@@ -544,8 +829,8 @@ async def periodic_consciousness_broadcast(backend: SophiaCloudBackend) -> None:
         await asyncio.sleep(45)  # Broadcast every 45 seconds in cloud
         await backend.broadcast_consciousness_update()
 
-async def health_check_server() -> None:
-    """Simple HTTP health check server for Cloud Run"""
+async def health_check_server(backend: Optional[SophiaCloudBackend] = None) -> None:
+    """Simple HTTP health check server for Cloud Run (plus /metrics for broadcast fan-out)"""
     from http.server import HTTPServer, BaseHTTPRequestHandler
     import threading
     
@@ -562,6 +847,14 @@ async def health_check_server() -> None:
                     'environment': os.getenv('SOPHIA_ENVIRONMENT', 'development')
                 }
                 self.wfile.write(json.dumps(health_data).encode())
+            elif self.path == '/metrics' and backend is not None:
+                self.send_response(200)
+                self.send_header('Content-type', 'application/json')
+                self.end_headers()
+                metrics = backend.fanout_metrics.snapshot()
+                metrics['connected_clients'] = len(backend.channels)
+                metrics['slow_client_policy'] = backend.slow_client_policy
+                self.wfile.write(json.dumps(metrics).encode())
             else:
                 self.send_response(404)
                 self.end_headers()
@@ -591,7 +884,7 @@ async def main() -> None:
     logger.info(f"🏥 Health check server: 0.0.0.0:{backend.http_port}")
     
     # Start health check server for Cloud Run
-    await health_check_server()
+    await health_check_server(backend)
     
     # Start periodic consciousness broadcasts
     asyncio.create_task(periodic_consciousness_broadcast(backend))
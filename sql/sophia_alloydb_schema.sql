@@ -45,6 +45,11 @@ CREATE TABLE memories (
     created_by TEXT DEFAULT 'sophia',
     metadata JSONB DEFAULT '{}',
     
+    -- Full-text search
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('english', content)
+    ) STORED,
+    
     -- Indexes
     CONSTRAINT memories_memory_id_key UNIQUE (memory_id)
 );
@@ -233,7 +238,7 @@ CREATE INDEX idx_memories_importance ON memories(importance DESC);
 CREATE INDEX idx_memories_state ON memories(state);
 CREATE INDEX idx_memories_tags ON memories USING GIN(tags);
 CREATE INDEX idx_memories_context ON memories USING GIN(context);
-CREATE INDEX idx_memories_search ON memories USING GIN(to_tsvector('english', content));
+CREATE INDEX idx_memories_search ON memories USING GIN(search_vector);
 CREATE INDEX idx_memories_embedding ON memories USING ivfflat(embedding vector_cosine_ops) WITH (lists = 100);
 
 -- Memory associations indexes
@@ -0,0 +1,13 @@
+-- Sophia Consciousness AlloyDB Upgrade
+-- Stored full-text search vector for memories
+-- Replaces the expression index so retrieval no longer re-tokenizes content per row
+
+ALTER TABLE memories
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('english', content)
+    ) STORED;
+
+DROP INDEX IF EXISTS idx_memories_search;
+CREATE INDEX idx_memories_search ON memories USING GIN(search_vector);
+
+ANALYZE memories;
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+⏱️ STARTUP PROFILER
+Wall-clock time per import and per initialization phase, as a flame-style tree
+
+Enable it before the imports you want to see (it hooks builtins.__import__):
+
+    from startup_profiler import StartupProfiler, profile_phase
+    profiler = StartupProfiler.install_global()
+    import heavy_module                      # recorded as "import heavy_module"
+    with profile_phase("load config"):      # recorded as a phase
+        ...
+    print(profiler.report())
+
+Nesting follows a context variable, so phases running concurrently in
+different asyncio tasks each keep their own branch of the tree. When no
+profiler is installed, profile_phase() is a no-op.
+
+LazySubsystem defers importing and initializing a subsystem until the first
+time it is asked for, and records that work as a phase when profiling.
+"""
+
+import asyncio
+import builtins
+import contextvars
+import importlib
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_active: Optional["StartupProfiler"] = None
+
+
+class ProfileNode:
+    """One import or phase; elapsed is inclusive of its children"""
+
+    __slots__ = ("name", "elapsed", "calls", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.elapsed = 0.0
+        self.calls = 0
+        self.children: Dict[str, "ProfileNode"] = {}
+
+    def child(self, name: str) -> "ProfileNode":
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = ProfileNode(name)
+        return node
+
+    @property
+    def self_time(self) -> float:
+        return max(0.0, self.elapsed - sum(child.elapsed for child in self.children.values()))
+
+
+class StartupProfiler:
+    """Records import and phase timings into a tree"""
+
+    def __init__(self):
+        self.began = time.perf_counter()
+        self.root = ProfileNode("startup")
+        self._current: contextvars.ContextVar = contextvars.ContextVar("startup_profile_node", default=self.root)
+        self._original_import: Optional[Callable] = None
+
+    # ------------------------------------------------------------------
+    # Installation
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def install_global(cls) -> "StartupProfiler":
+        """Create a profiler, hook imports and make it the active one"""
+        global _active
+        if _active is None:
+            _active = cls()
+            _active.install()
+        return _active
+
+    def install(self):
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        original = self._original_import
+        modules = sys.modules
+
+        def profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Already-loaded absolute imports are by far the most common call
+            if level == 0 and name in modules:
+                return original(name, globals, locals, fromlist, level)
+            with self._measure(f"import {name}" if level == 0 else _relative_label(name, globals, fromlist)):
+                return original(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = profiled_import
+
+    def uninstall(self):
+        global _active
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        if _active is self:
+            _active = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[ProfileNode]:
+        with self._measure(name) as node:
+            yield node
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[ProfileNode]:
+        node = self._current.get().child(name)
+        token = self._current.set(node)
+        started = time.perf_counter()
+        try:
+            yield node
+        finally:
+            node.elapsed += time.perf_counter() - started
+            node.calls += 1
+            self._current.reset(token)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def _close_root(self):
+        self.root.elapsed = time.perf_counter() - self.began
+
+    def report(self, min_ms: float = 1.0, width: int = 30) -> str:
+        """Indented tree, slowest first, with bars relative to total startup time"""
+        self._close_root()
+        total = max(self.root.elapsed, 1e-9)
+        lines = [f"⏱️ Startup profile: {total * 1000:.0f} ms total "
+                 f"(entries under {min_ms:g} ms hidden; times include children)"]
+
+        def walk(node: ProfileNode, depth: int):
+            for child in sorted(node.children.values(), key=lambda n: n.elapsed, reverse=True):
+                if child.elapsed * 1000 < min_ms:
+                    continue
+                bar = "█" * max(1, int(child.elapsed / total * width))
+                calls = f" ×{child.calls}" if child.calls > 1 else ""
+                lines.append(f"{child.elapsed * 1000:9.1f} ms {bar:<{width}} {'  ' * depth}{child.name}{calls}")
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return "\n".join(lines)
+
+    def folded(self) -> List[str]:
+        """Folded stacks (name;child;grandchild self_microseconds) for flamegraph tools"""
+        self._close_root()
+        stacks = []
+
+        def walk(node: ProfileNode, path: List[str]):
+            path = path + [node.name.replace(";", ":")]
+            micros = int(node.self_time * 1e6)
+            if micros:
+                stacks.append(f"{';'.join(path)} {micros}")
+            for child in node.children.values():
+                walk(child, path)
+
+        walk(self.root, [])
+        return stacks
+
+    def write_folded(self, path) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.folded()) + "\n")
+        return str(path)
+
+
+def _relative_label(name: str, globals: Optional[dict], fromlist) -> str:
+    """Name a relative import by its package, e.g. "import aiohttp.client" for `from . import client`"""
+    package = (globals or {}).get("__package__") or "?"
+    if name:
+        return f"import {package}.{name}"
+    return f"import {package}.{{{','.join(fromlist or ())}}}"
+
+
+def active_profiler() -> Optional[StartupProfiler]:
+    return _active
+
+
+def profile_phase(name: str):
+    """Phase context on the active profiler, or a no-op when not profiling"""
+    return _active.phase(name) if _active is not None else nullcontext()
+
+
+class LazySubsystem:
+    """
+    A subsystem imported and initialized on first use
+
+    module and initializer name an async factory, e.g.
+    LazySubsystem("cloud_orchestrator", "cloud_diffusion_orchestrator",
+                  "initialize_cloud_diffusion_orchestrator").
+    """
+
+    def __init__(self, name: str, module: str, initializer: str,
+                 on_load: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.module = module
+        self.initializer = initializer
+        # Awaited once with the new instance, e.g. to apply default settings
+        self.on_load = on_load
+        self.instance: Any = None
+        self.load_seconds: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.instance is not None
+
+    async def get(self) -> Any:
+        if self.instance is not None:
+            return self.instance
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.instance is None:
+                started = time.perf_counter()
+                with profile_phase(f"load {self.name}"):
+                    module = importlib.import_module(self.module)
+                    instance = await getattr(module, self.initializer)()
+                    if self.on_load is not None:
+                        await self.on_load(instance)
+                self.instance = instance
+                self.load_seconds = time.perf_counter() - started
+        return self.instance
+
+    def status(self) -> str:
+        return f"loaded in {self.load_seconds:.2f}s" if self.loaded else "lazy (not loaded)"
@@ -0,0 +1,129 @@
+"""
+Test ws_gateway streaming relay against the local fake OpenAI server
+Covers token streaming, per-connection limits, concurrency and disconnect cancellation
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+
+import fake_openai_server
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+FAKE_PORT = _free_port()
+os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_PORT}/v1"
+os.environ["OPENAI_API_KEY"] = "fake-key"
+
+import ws_gateway  # noqa: E402  (reads OPENAI_BASE_URL per request)
+
+fake_openai_server.FIRST_TOKEN_DELAY = 0.2
+fake_openai_server.TOKEN_DELAY = 0.01
+fake_openai_server.TOKENS = 20
+
+_server = uvicorn.Server(uvicorn.Config(fake_openai_server.app, host="127.0.0.1", port=FAKE_PORT, log_level="warning"))
+threading.Thread(target=_server.run, daemon=True).start()
+while not _server.started:
+    time.sleep(0.01)
+
+
+@pytest.fixture(scope="module")
+def client():
+    # One portal (event loop) for the module, like a single uvicorn worker
+    with TestClient(ws_gateway.app) as test_client:
+        yield test_client
+
+
+def _collect(ws, request_id):
+    deltas = []
+    while True:
+        frame = ws.receive_json()
+        assert frame["ok"], frame
+        assert frame["id"] == request_id
+        if frame.get("done"):
+            return deltas, frame
+        deltas.append(frame["delta"])
+
+
+def test_streams_tokens_as_they_arrive(client):
+    """Deltas arrive before the final frame and add up to the reply"""
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"id": "a", "messages": [{"role": "user", "content": "hello"}]})
+        deltas, final = _collect(ws, "a")
+
+    assert len(deltas) == fake_openai_server.TOKENS
+    assert "".join(deltas) == final["reply"]
+    assert final["reply"].startswith("echo hello")
+    assert final["metrics"]["ttft_ms"] >= 150
+    assert final["metrics"]["tokens_per_sec"] > 0
+
+
+def test_requests_on_one_socket_run_concurrently(client):
+    """Two in-flight completions overlap instead of running back to back"""
+    with client.websocket_connect("/ws") as ws:
+        start = time.perf_counter()
+        ws.send_json({"id": "x", "messages": [{"role": "user", "content": "one"}]})
+        ws.send_json({"id": "y", "messages": [{"role": "user", "content": "two"}]})
+        done = set()
+        while len(done) < 2:
+            frame = ws.receive_json()
+            assert frame["ok"], frame
+            if frame.get("done"):
+                done.add(frame["id"])
+        elapsed = time.perf_counter() - start
+
+    single = fake_openai_server.FIRST_TOKEN_DELAY + fake_openai_server.TOKEN_DELAY * fake_openai_server.TOKENS
+    assert done == {"x", "y"}
+    assert elapsed < single * 1.8
+
+
+def test_per_connection_limit(client):
+    """Requests beyond the per-connection limit are rejected, not queued"""
+    with client.websocket_connect("/ws") as ws:
+        for i in range(ws_gateway.MAX_PER_CONNECTION + 1):
+            ws.send_json({"id": f"r{i}", "messages": [{"role": "user", "content": "hi"}]})
+        rejected = None
+        finished = 0
+        while finished < ws_gateway.MAX_PER_CONNECTION:
+            frame = ws.receive_json()
+            if not frame["ok"]:
+                rejected = frame
+            elif frame.get("done"):
+                finished += 1
+
+    assert rejected is not None
+    assert rejected["id"] == f"r{ws_gateway.MAX_PER_CONNECTION}"
+    assert "too many in-flight" in rejected["error"]
+
+
+def test_disconnect_cancels_upstream_stream(client):
+    """Closing the socket mid-stream stops the upstream generation"""
+    before = dict(fake_openai_server.stats)
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"id": "c", "messages": [{"role": "user", "content": "long"}]})
+        frame = ws.receive_json()
+        assert frame["ok"] and "delta" in frame
+
+    deadline = time.time() + 5
+    while fake_openai_server.stats["disconnected"] == before["disconnected"] and time.time() < deadline:
+        time.sleep(0.02)
+    assert fake_openai_server.stats["disconnected"] == before["disconnected"] + 1
+    assert fake_openai_server.stats["completed"] == before["completed"]
+
+
+def test_metrics_endpoint(client):
+    """Gateway reports time-to-first-token and tokens/sec"""
+    data = client.get("/metrics").json()
+    assert data["completed"] >= 1
+    assert data["ttft_ms"]["p50"] is not None
+    assert data["tokens_per_sec"]["p50"] is not None
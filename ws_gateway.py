@@ -3,24 +3,36 @@ ws_gateway.py
 
 A minimal WebSocket gateway that accepts JSON messages from a client and proxies them
 to the OpenAI Chat API using the environment OPENAI_API_KEY (or a provided api_key in the
-message). This is intentionally simple (non-streaming) so it will work without extra
-streaming plumbing; you can extend it later to support streaming tokens.
+message). Completions are streamed from an async upstream client and relayed to the
+socket token by token, so one long completion never stalls other clients.
 
 Usage:
   # start server
   python ws_gateway.py
 
+  # point at any OpenAI-compatible endpoint (e.g. fake_openai_server.py for local tests)
+  OPENAI_BASE_URL=http://127.0.0.1:8788/v1 python ws_gateway.py
+
 Client message format (JSON) over websocket:
   {
+    "id": "optional request id, echoed on every frame",
     "api_key": "optional - use env OPENAI_API_KEY if not provided",
     "model": "gpt-4o-mini",           # optional
     "messages": [ {"role":"user","content":"Hello"} ]
   }
+  { "type": "cancel", "id": "..." }   # abort an in-flight completion
 
-Server response (JSON):
-  { "ok": true, "reply": "..." }
+Server response frames (JSON):
+  { "ok": true, "id": "...", "delta": "..." }                 # zero or more
+  { "ok": true, "id": "...", "done": true, "reply": "...", "metrics": {...} }
   or
-  { "ok": false, "error": "..." }
+  { "ok": false, "id": "...", "error": "..." }
+
+Limits (environment):
+  WS_GATEWAY_MAX_CONCURRENT      completions in flight across all clients (default 32)
+  WS_GATEWAY_MAX_PER_CONNECTION  completions in flight per socket (default 2)
+
+GET /metrics reports time-to-first-token and tokens/sec over recent completions.
 
 Security: this gateway forwards requests to OpenAI using the provided API key. Keep keys secret.
 Bind to localhost or use an SSH tunnel for remote access.
@@ -28,8 +40,10 @@ Bind to localhost or use an SSH tunnel for remote access.
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi import status
 from fastapi.responses import HTMLResponse
+from collections import deque
 import os
 import json
+import time
 import asyncio
 
 try:
@@ -37,64 +51,182 @@ try:
 except Exception:
     openai = None
 
+MAX_CONCURRENT = int(os.environ.get('WS_GATEWAY_MAX_CONCURRENT', '32'))
+MAX_PER_CONNECTION = int(os.environ.get('WS_GATEWAY_MAX_PER_CONNECTION', '2'))
+
 app = FastAPI()
 
+_global_slots = None
+_clients = {}
+
+# Recent completion samples for /metrics
+_metrics = {
+    "requests": 0,
+    "completed": 0,
+    "cancelled": 0,
+    "errors": 0,
+    "active": 0,
+    "samples": deque(maxlen=500),
+}
+
+
+def _get_global_slots():
+    global _global_slots
+    if _global_slots is None:
+        _global_slots = asyncio.Semaphore(MAX_CONCURRENT)
+    return _global_slots
+
+
+def _get_client(api_key):
+    """Reuse one pooled async client per API key / base URL"""
+    base_url = os.environ.get('OPENAI_BASE_URL')
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+        _clients[key] = client
+    return client
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
 @app.get("/")
 def root():
     return {"status": "ws gateway ready"}
 
+
+@app.get("/metrics")
+def metrics():
+    samples = list(_metrics["samples"])
+    ttft = [s["ttft_ms"] for s in samples if s["ttft_ms"] is not None]
+    rates = [s["tokens_per_sec"] for s in samples if s["tokens_per_sec"] is not None]
+    return {
+        "requests": _metrics["requests"],
+        "completed": _metrics["completed"],
+        "cancelled": _metrics["cancelled"],
+        "errors": _metrics["errors"],
+        "active": _metrics["active"],
+        "limits": {"global": MAX_CONCURRENT, "per_connection": MAX_PER_CONNECTION},
+        "ttft_ms": {"p50": _percentile(ttft, 0.5), "p95": _percentile(ttft, 0.95)},
+        "tokens_per_sec": {"p50": _percentile(rates, 0.5), "p5": _percentile(rates, 0.05)},
+    }
+
+
+async def _stream_completion(send, request_id, api_key, model, messages):
+    """Relay one streamed completion to the socket as tokens arrive"""
+    client = _get_client(api_key)
+    _metrics["requests"] += 1
+    async with _get_global_slots():
+        _metrics["active"] += 1
+        started = time.perf_counter()
+        first_token_at = None
+        tokens = 0
+        parts = []
+        stream = None
+        try:
+            stream = await client.chat.completions.create(model=model, messages=messages, stream=True)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                # Each content chunk is counted as one token
+                tokens += 1
+                parts.append(delta)
+                await send({"ok": True, "id": request_id, "delta": delta})
+
+            finished = time.perf_counter()
+            generation = finished - first_token_at if first_token_at else 0.0
+            sample = {
+                "ttft_ms": (first_token_at - started) * 1000 if first_token_at else None,
+                "tokens": tokens,
+                "tokens_per_sec": tokens / generation if generation > 0 else None,
+                "total_ms": (finished - started) * 1000,
+            }
+            _metrics["samples"].append(sample)
+            _metrics["completed"] += 1
+            await send({"ok": True, "id": request_id, "done": True, "reply": "".join(parts), "metrics": sample})
+        except asyncio.CancelledError:
+            _metrics["cancelled"] += 1
+            raise
+        except Exception as e:
+            _metrics["errors"] += 1
+            await send({"ok": False, "id": request_id, "error": str(e)})
+        finally:
+            _metrics["active"] -= 1
+            if stream is not None:
+                # Closes the upstream HTTP response so the provider stops generating
+                await stream.close()
+
+
 @app.websocket('/ws')
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
+    send_lock = asyncio.Lock()
+    in_flight = {}
+
+    async def send(payload):
+        async with send_lock:
+            await websocket.send_text(json.dumps(payload))
+
     try:
         while True:
             raw = await websocket.receive_text()
             try:
                 data = json.loads(raw)
             except Exception as e:
-                await websocket.send_text(json.dumps({"ok": False, "error": f"invalid json: {e}"}))
+                await send({"ok": False, "error": f"invalid json: {e}"})
+                continue
+
+            request_id = data.get('id')
+
+            if data.get('type') == 'cancel':
+                task = in_flight.get(request_id)
+                if task is not None:
+                    task.cancel()
+                    await send({"ok": False, "id": request_id, "error": "cancelled"})
                 continue
 
             api_key = data.get('api_key') or os.environ.get('OPENAI_API_KEY') or os.environ.get('OPENAI_API_KEY_LOCAL')
             if not api_key:
-                await websocket.send_text(json.dumps({"ok": False, "error": "no OpenAI API key provided (field api_key or OPENAI_API_KEY env)"}))
+                await send({"ok": False, "id": request_id, "error": "no OpenAI API key provided (field api_key or OPENAI_API_KEY env)"})
                 continue
 
             if openai is None:
-                await websocket.send_text(json.dumps({"ok": False, "error": "openai package not installed"}))
+                await send({"ok": False, "id": request_id, "error": "openai package not installed"})
                 continue
 
-            openai.api_key = api_key
             model = data.get('model', 'gpt-4o-mini')
             messages = data.get('messages')
             if not messages:
-                await websocket.send_text(json.dumps({"ok": False, "error": "missing messages field"}))
+                await send({"ok": False, "id": request_id, "error": "missing messages field"})
                 continue
 
-            # Call OpenAI (simple non-streaming call)
-            try:
-                resp = openai.ChatCompletion.create(model=model, messages=messages)
-                # The exact shape depends on OpenAI library version; be defensive
-                choice = None
-                if isinstance(resp, dict):
-                    choices = resp.get('choices') or []
-                    if len(choices) > 0:
-                        # handle different response shapes
-                        content = choices[0].get('message', {}).get('content') if choices[0].get('message') else choices[0].get('text')
-                        choice = content
-                else:
-                    # Some client libs return objects with .choices
-                    try:
-                        choice = resp.choices[0].message.content
-                    except Exception:
-                        choice = str(resp)
-
-                await websocket.send_text(json.dumps({"ok": True, "reply": choice}))
-            except Exception as e:
-                await websocket.send_text(json.dumps({"ok": False, "error": str(e)}))
+            if len(in_flight) >= MAX_PER_CONNECTION:
+                await send({"ok": False, "id": request_id, "error": f"too many in-flight requests (limit {MAX_PER_CONNECTION})"})
+                continue
+
+            if request_id is None or request_id in in_flight:
+                request_id = f"req-{id(data)}-{time.monotonic_ns()}"
+
+            task = asyncio.create_task(_stream_completion(send, request_id, api_key, model, messages))
+            in_flight[request_id] = task
+            task.add_done_callback(lambda _, rid=request_id: in_flight.pop(rid, None))
 
     except WebSocketDisconnect:
         return
+    finally:
+        # Client went away: stop generating for it
+        for task in list(in_flight.values()):
+            task.cancel()
 
 if __name__ == '__main__':
     import uvicorn